@@ -1,5 +1,8 @@
-from flask import Flask, Response, jsonify
+from http import HTTPStatus
 
+from flask import Flask, Response, jsonify, request
+
+from bas_metadata_library import MetadataRecordConfig
 from bas_metadata_library.standards.iso_19115_1_v1 import (
     MetadataRecordConfig as ISO19115_1_MetadataRecordConfig,
     MetadataRecord as ISO19115_1_MetadataRecord,
@@ -30,6 +33,33 @@ from tests.standards.test_standard import (
 )
 
 
+def _record_response(record_class: type, configuration: MetadataRecordConfig) -> Response:
+    """
+    Returns a record generated from a configuration, unless the client already has it
+
+    The fingerprint of the configuration is used as a weak entity tag (ETag), as records from configurations with the
+    same fingerprint are equivalent, but may list some elements (e.g. topics) in a different order. Where a request
+    includes the same tag (using 'If-None-Match'), the configuration is unchanged, so a 'Not Modified' response is
+    returned without generating the record.
+
+    :type record_class: type
+    :param record_class: MetadataRecord class for the standard
+    :type configuration: MetadataRecordConfig
+    :param configuration: record configuration
+
+    :rtype Response
+    :return: record, or 'Not Modified' response
+    """
+    fingerprint = configuration.fingerprint()
+    if request.if_none_match.contains_weak(fingerprint):
+        response = Response(status=HTTPStatus.NOT_MODIFIED)
+    else:
+        record = record_class(configuration)
+        response = Response(record.generate_xml_document(), mimetype="text/xml")
+    response.set_etag(fingerprint, weak=True)
+    return response
+
+
 def create_app():
     app = Flask(__name__)
 
@@ -46,9 +76,7 @@ def create_app():
 
         configuration_object = test_metadata_standard_configs[configuration]
         configuration = TestStandardMetadataRecordConfig(**configuration_object)
-        record = TestStandardMetadataRecord(configuration)
-
-        return Response(record.generate_xml_document(), mimetype="text/xml")
+        return _record_response(record_class=TestStandardMetadataRecord, configuration=configuration)
 
     @app.route("/standards/iso-19115-1/<configuration>")
     def standard_iso_19115_1_v1(configuration: str):
@@ -64,9 +92,7 @@ def create_app():
             configuration = ISO19115_1_UKPDCDiscoveryMetadataRecordConfig(**configuration_object)
         else:
             configuration = ISO19115_1_MetadataRecordConfig(**configuration_object)
-        record = ISO19115_1_MetadataRecord(configuration)
-
-        return Response(record.generate_xml_document(), mimetype="text/xml")
+        return _record_response(record_class=ISO19115_1_MetadataRecord, configuration=configuration)
 
     @app.route("/standards/iso-19115-2/<configuration>")
     def standard_iso_19115_2_v1(configuration: str):
@@ -83,8 +109,6 @@ def create_app():
             configuration = ISO19115_2_UKPDCDiscoveryMetadataRecordConfig(**configuration_object)
         else:
             configuration = ISO19115_2_MetadataRecordConfig(**configuration_object)
-        record = ISO19115_2_MetadataRecord(configuration)
-
-        return Response(record.generate_xml_document(), mimetype="text/xml")
+        return _record_response(record_class=ISO19115_2_MetadataRecord, configuration=configuration)
 
     return app
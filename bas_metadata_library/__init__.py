@@ -1,18 +1,102 @@
-import json
+import re
 
-from typing import Optional
+from functools import partial
+from pathlib import Path
+from typing import BinaryIO, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
 
-from jsonschema import validate
+from jsonschema.exceptions import ValidationError, best_match
 
 # Exempting Bandit security issue (Using Element to parse untrusted XML data is known to be vulnerable to XML attacks)
 #
 # We don't currently allow untrusted/user-provided XML so this is not a risk
-from lxml.etree import Element, ElementTree, tostring as element_string, fromstring  # nosec
+from lxml.etree import Element, ElementTree, tostring as element_string, fromstring, xmlfile  # nosec
 
+from bas_metadata_library.batch import process_chunks
+from bas_metadata_library.cache import ValidationCache, config_fingerprint
+from bas_metadata_library.citations import CitationResolver
+from bas_metadata_library.schemas import SchemaRegistry, iter_changed_errors, schema_registry
 
 # Base classes
 
 
+class NamespaceMap(dict):
+    """
+    Read-only dictionary of XML namespaces indexed by prefix
+
+    A dict subclass (rather than e.g. a `MappingProxyType`) so it can be passed directly to lxml (e.g. as `nsmap` or
+    `namespaces`), which requires a dict. As it can't be changed, a single instance can be shared rather than copied.
+    """
+
+    def _read_only(self, *args, **kwargs):
+        raise TypeError("Namespace map is read-only.")
+
+    __setitem__ = __delitem__ = __ior__ = clear = pop = popitem = setdefault = update = _read_only
+
+    def __reduce__(self):
+        # pickled and copied as a new instance, rather than by setting each item
+        return type(self), (dict(self),)
+
+
+class QualifiedNames(object):
+    """
+    Qualified names, in Clark notation, for elements and attributes in an XML namespace
+
+    Names are accessed as attributes, e.g. `QualifiedNames("http://www.w3.org/1999/xlink").href` returns
+    '{http://www.w3.org/1999/xlink}href', or as items for names that aren't valid Python identifiers (e.g. `['pass']`).
+    Each name is formatted the first time it's used and then kept, so later uses are a plain attribute lookup
+    returning the same string. Instances are otherwise read-only.
+    """
+
+    def __init__(self, namespace: str):
+        """
+        :type namespace: str
+        :param namespace: namespace URI
+        """
+        object.__setattr__(self, "namespace", namespace)
+
+    def __getattr__(self, name: str) -> str:
+        # only called for names not yet used
+        if name.startswith("_"):
+            raise AttributeError(name)
+
+        qualified_name = f"{{{self.namespace}}}{name}"
+        self.__dict__[name] = qualified_name
+        return qualified_name
+
+    def __getitem__(self, name: str) -> str:
+        try:
+            return self.__dict__[name]
+        except KeyError:
+            return self.__getattr__(name)
+
+    def __setattr__(self, name: str, value) -> None:
+        raise AttributeError("Qualified names are read-only.")
+
+
+class NamespaceRegistry(object):
+    """
+    Read-only set of XML namespaces, with qualified names for each namespace
+
+    Intended to be created once per standard, at module level, and shared by all records and elements, rather than
+    computing namespace maps and qualified names for each element.
+
+    E.g. for a registry with a 'gmd' prefix, `registry.gmd.CI_ResponsibleParty` returns
+    '{http://www.isotc211.org/2005/gmd}CI_ResponsibleParty' and `registry.nsmap` returns {'gmd': '...', ...}.
+    """
+
+    def __init__(self, namespaces: dict):
+        """
+        :type namespaces: dict
+        :param namespaces: namespaces indexed by prefix
+        """
+        object.__setattr__(self, "nsmap", NamespaceMap(namespaces))
+        for prefix, namespace in self.nsmap.items():
+            object.__setattr__(self, prefix, QualifiedNames(namespace=namespace))
+
+    def __setattr__(self, name: str, value) -> None:
+        raise AttributeError("Namespace registry is read-only.")
+
+
 class Namespaces(object):
     """
     Gathers all XML namespaces used in a standard
@@ -21,16 +105,17 @@ class Namespaces(object):
     a XML document.
 
     This class is intended to be overridden in each metadata standard's module. See existing standards for examples.
+    Where `_namespaces` is set as a class attribute, using a `NamespaceMap`, it is shared by all instances.
     """
 
     _schema_locations = {}
+    _namespaces = {}
 
     def __init__(self, namespaces: dict = None):
         """
         @type namespaces: dict
         @param namespaces: dictionary of namespaces to add
         """
-        self._namespaces = {}
         if namespaces is not None:
             self._namespaces = {**self._namespaces, **namespaces}
 
@@ -40,8 +125,13 @@ class Namespaces(object):
 
         E.g. {'xlink': 'http://www.w3.org/1999/xlink'}
 
+        Where namespaces are a (read-only) `NamespaceMap`, they are returned as is, rather than copied.
+
         :return: dictionary of Namespaces indexed by prefix
         """
+        if isinstance(self._namespaces, NamespaceMap):
+            return self._namespaces
+
         nsmap = {}
         for prefix, namespace in self._namespaces.items():
             nsmap[prefix] = namespace
@@ -74,8 +164,29 @@ class MetadataRecordConfig(object):
 
     The structure and values of this configuration are specified by a JSON schema, and which should be used to validate
     configuration instances using the 'validate()' method.
+
+    References to other schemas (e.g. from a profile to the standard it extends) are resolved using a schema registry.
+    By default this is a registry of the schemas included in this package, set `schema_registry` to use another.
+
+    Configurations are validated using jsonschema by default. Set `validation_engine` to 'compiled' to instead check
+    configurations using schemas compiled into Python functions, which is faster for valid configurations. Where a
+    configuration is invalid, jsonschema is still used to determine the relevant error. Set `default_validation_engine`
+    to set the engine for all configurations of a class. Supported engines are listed in `validation_engines`, setting
+    any other engine raises a ValueError.
+
+    Set `validation_cache` to a `bas_metadata_library.cache.ValidationCache` to cache the results of validating
+    configurations, so that configurations with the same content are only validated once.
+
+    Lists in the configuration whose order isn't significant (e.g. topics) are listed in `set_like_paths`, and are
+    ignored when computing a fingerprint of the configuration (see `fingerprint()`).
     """
 
+    schema_registry: SchemaRegistry = schema_registry
+    validation_engines: Tuple[str, ...] = ("jsonschema", "compiled")
+    default_validation_engine: str = "jsonschema"
+    validation_cache: Optional[ValidationCache] = None
+    set_like_paths: Tuple[str, ...] = ()
+
     def __init__(self, **kwargs: dict):
         """
         :type kwargs: dict
@@ -83,16 +194,169 @@ class MetadataRecordConfig(object):
         """
         self.config = kwargs
         self.schema = None
+        self.validation_engine = self.default_validation_engine
+
+    @property
+    def validation_engine(self) -> str:
+        """
+        Engine used to validate the configuration, one of `validation_engines`
+
+        :rtype str
+        :return: validation engine
+        """
+        return self._validation_engine
+
+    @validation_engine.setter
+    def validation_engine(self, validation_engine: str) -> None:
+        if validation_engine not in self.validation_engines:
+            raise ValueError(f"Validation engine '{validation_engine}' is not supported.")
+        self._validation_engine = validation_engine
 
     def validate(self) -> None:
         """
         Ensures the configuration is valid against the relevant JSON Schema
 
         Where the configuration is invalid, a relevant exception will be raised.
+
+        Validators are cached by the schema registry, so the schema is only compiled and checked once. Validators accept
+        Python dates and datetimes as strings, so the configuration is validated as is, without serialising it first.
+
+        If a validation cache is set, and the configuration has been validated before, the cached result is used.
+        """
+        if self.schema is None:
+            return
+
+        if self.validation_cache is None:
+            error = self._validation_error()
+        else:
+            error = self.validation_cache.result(
+                schema=self.schema, config=self.config, validate=self._validation_error
+            )
+        if error is not None:
+            raise error
+
+    def _validation_error(self) -> Optional[ValidationError]:
+        """
+        Validates the configuration using the selected validation engine
+
+        :rtype ValidationError or None
+        :return: most relevant validation error, or None if the configuration is valid
+        """
+        if self.validation_engine == "compiled" and self.is_valid():
+            return None
+
+        return best_match(self.iter_errors())
+
+    def is_valid(self) -> bool:
         """
-        if self.schema is not None:
-            _config = json.loads(json.dumps(self.config, default=str))
-            return validate(instance=_config, schema=self.schema)
+        Checks whether the configuration is valid against the relevant JSON Schema, using the selected validation engine
+
+        :rtype bool
+        :return: whether the configuration is valid
+        """
+        if self.schema is None:
+            return True
+        if self.validation_engine == "compiled":
+            return self.schema_registry.compiled_validator(schema=self.schema)(self.config)
+
+        return self.schema_registry.validator(schema=self.schema).is_valid(self.config)
+
+    def iter_errors(self) -> Iterator[ValidationError]:
+        """
+        Lazily yields each error in the configuration against the relevant JSON Schema
+
+        Unlike `validate()`, which raises the most relevant error only, this returns all errors in the configuration.
+
+        :rtype iterator
+        :return: JSON Schema validation errors
+        """
+        if self.schema is None:
+            return iter([])
+
+        return self.schema_registry.validator(schema=self.schema).iter_errors(self.config)
+
+    def fingerprint(self) -> str:
+        """
+        Computes a canonical fingerprint of the configuration, for detecting changes
+
+        Fingerprints are the same for configurations with the same content, regardless of the order of properties, the
+        way dates are represented or the order of lists in `set_like_paths`. They include the version of the fingerprint
+        format and the identifier of the schema for the configuration. See
+        `bas_metadata_library.cache.config_fingerprint()` for details.
+
+        Where a fingerprint matches one stored from a previous run, the content of the configuration hasn't changed
+        (though lists in `set_like_paths` may be in a different order), so generating the record again can be skipped.
+
+        :rtype str
+        :return: fingerprint
+        """
+        schema_id = self.schema.get("$id") if self.schema is not None else None
+        return config_fingerprint(config=self.config, schema_id=schema_id, set_like_paths=self.set_like_paths)
+
+    def validate_changes(self, previous: dict, changes: Iterable[Union[str, Sequence]]) -> None:
+        """
+        Ensures the configuration is valid, given a previous valid version and the values that have changed since
+
+        Changes are JSON Pointers to values in the configuration that have been added, removed or replaced (e.g.
+        '/resource/abstract', or '/resource/dates/0/date'). Only the parts of the JSON Schema that apply to these
+        values are used, unless a change could affect a rule depending on other values (such as a required property
+        being removed), in which case the relevant part, or all, of the configuration is validated instead. See
+        `bas_metadata_library.schemas.iter_changed_errors()` for details.
+
+        This is intended for configurations that are edited and validated repeatedly, where validating the whole
+        configuration after each edit would be slow. Where the configuration is invalid, a relevant exception will be
+        raised, as per `validate()`.
+
+        :type previous: dict
+        :param previous: previous version of the configuration, which must have been valid
+        :type changes: iterable
+        :param changes: JSON Pointers (or sequences of keys and indexes) to changed values
+        """
+        if self.schema is None:
+            return
+
+        validator = self.schema_registry.validator(schema=self.schema)
+        error = best_match(iter_changed_errors(validator, instance=self.config, previous=previous, changes=changes))
+        if error is not None:
+            raise error
+
+    @classmethod
+    def validate_many(
+        cls, configs: Iterable[dict], workers: int = 1, chunk_size: int = 100
+    ) -> Iterator[Tuple[Optional[str], Optional[List[dict]], Optional[dict]]]:
+        """
+        Validates many record configurations, optionally using a pool of processes
+
+        For each configuration, a tuple of its file identifier (or None if not set), a list of validation errors (empty
+        if valid, or None if it can't be validated) and an error (or None if it was validated) is yielded, in the same
+        order as configurations are given. Results aren't indexed by file identifier, as these may be missing or
+        repeated, use the position of each result instead (e.g. using `enumerate()`).
+
+        Validation errors are represented as dicts, with the path to the invalid value, an error message and the name
+        of the JSON Schema keyword that failed (e.g. 'required'), see `validation_error_report()`. Where a configuration
+        can't be validated (e.g. it isn't a dict), the error is represented as a dict with the type of exception raised
+        (e.g. 'TypeError') and a message, as in `MetadataRecord.make_config_many()`, and other configurations are still
+        validated.
+
+        Results are yielded as they become available and configurations are read from `configs` as needed, so large
+        numbers of configurations (e.g. from a generator) can be validated without holding them all in memory.
+
+        :type configs: iterable
+        :param configs: record configurations
+        :type workers: int
+        :param workers: number of processes to use, if 1, configurations are validated in the current process
+        :type chunk_size: int
+        :param chunk_size: number of configurations sent to a process at once
+
+        :rtype iterator
+        :return: file identifier, list of validation errors and error for each configuration
+        """
+        yield from process_chunks(
+            function=partial(_validate_configs, cls),
+            items=configs,
+            workers=workers,
+            chunk_size=chunk_size,
+        )
 
 
 class MetadataRecord(object):
@@ -106,14 +370,19 @@ class MetadataRecord(object):
 
     These processes are designed to be lossless, meaning if a record is made from a configuration object, that record
     should be able to create exactly the same configuration object again without loosing any information.
+
+    `config_class` is the MetadataRecordConfig class for the standard, used where configurations are given as dicts.
     """
 
-    def __init__(self, configuration: MetadataRecordConfig = None, record: str = None):
+    config_class: type = MetadataRecordConfig
+
+    def __init__(self, configuration: MetadataRecordConfig = None, record: Union[str, bytes] = None):
         """
         :type configuration: MetadataRecordConfig
         :param configuration: Metadata record configuration object
-        :type record: str
-        :param record: XML document string representing a record
+        :type record: str or bytes
+        :param record: XML document string representing a record, or bytes, decoded using the encoding set in the
+        document's XML declaration (UTF-8 by default)
         """
         self.ns = Namespaces()
         self.attributes = {}
@@ -124,7 +393,9 @@ class MetadataRecord(object):
             self.attributes = configuration.config
 
         if record is not None:
-            self.record = fromstring(record.encode())
+            if isinstance(record, str):
+                record = record.encode()
+            self.record = fromstring(record)
 
     def make_config(self) -> MetadataRecordConfig:
         """
@@ -163,19 +434,144 @@ class MetadataRecord(object):
 
         return element_string(document, pretty_print=True, xml_declaration=True, encoding="utf-8")
 
+    def write_to(self, file: BinaryIO) -> None:
+        """
+        Generates an XML document and tree from an XML element defining a record, and writes it to a file
+
+        The XML document is the same as `generate_xml_document()`, but is written directly to the file, rather than
+        returned as a string first.
+
+        :type file: file
+        :param file: binary file object to write to
+        """
+        self.record = self.make_element()
+
+        with xmlfile(file, encoding="utf-8") as document:
+            document.write_declaration()
+            document.write(self.record, pretty_print=True)
+
+    @classmethod
+    def generate_many(
+        cls,
+        configs: Iterable[dict],
+        config_class: type = None,
+        workers: int = 1,
+        chunk_size: int = 10,
+        max_in_flight: int = None,
+        output_path: Union[str, Path] = None,
+        citation_resolver: CitationResolver = None,
+    ) -> Iterator[Union[bytes, str]]:
+        """
+        Generates XML documents for many record configurations, optionally using a pool of processes
+
+        Configurations are given as dicts, which are cheaper to send to other processes than configuration objects (as
+        these include their schema). Each process loads the configuration schema, and creates a validator for it, once
+        before generating any records. Settings for `config_class` (e.g. the validation engine) are inherited by other
+        processes where they are forked, rather than spawned.
+
+        If `output_path` is not set, the XML document for each configuration is yielded as bytes (as per
+        `generate_xml_document()`), in the same order as configurations are given. Otherwise, documents are written to
+        files in this directory by each process, named after the file identifier of each configuration (or its
+        position if not set, or not a safe file name), and the path to each file is yielded instead. Where two
+        configurations would be written to the same file, a ValueError is raised rather than overwriting it. As names
+        are checked before any documents are written, all configurations are read from `configs` first in this case.
+
+        Otherwise, configurations are read from `configs` as needed, with no more than `max_in_flight` chunks of records
+        pending at once, so large numbers of records can be generated without holding them all in memory.
+
+        For standards including citations for DOIs (e.g. ISO 19115), `citation_resolver` is used to get them, see the
+        `citation_resolver` parameter of the MetadataRecord class for the standard. Where records are generated by other
+        processes, the resolver is copied to each process, with any citations it has cached (e.g. by `prefetch()`).
+
+        :type configs: iterable
+        :param configs: record configurations
+        :type config_class: type
+        :param config_class: MetadataRecordConfig class for the standard or profile configurations are for, by default
+        `config_class`
+        :type workers: int
+        :param workers: number of processes to use, if 1, records are generated in the current process
+        :type chunk_size: int
+        :param chunk_size: number of configurations sent to a process at once
+        :type max_in_flight: int
+        :param max_in_flight: maximum number of chunks pending at once, by default twice the number of workers
+        :type output_path: str or Path
+        :param output_path: directory to write documents to, if not set documents are returned
+        :type citation_resolver: CitationResolver
+        :param citation_resolver: resolver for citations of DOIs, if not set the default for the standard is used
+
+        :rtype iterator
+        :return: XML document, or path to the file written, for each configuration
+        """
+        if config_class is None:
+            config_class = cls.config_class
+        items = ((None, config) for config in configs)
+        if output_path is not None:
+            output_path = str(output_path)
+            items = _document_names(configs=configs)
+
+        yield from process_chunks(
+            function=partial(_generate_records, cls, config_class, output_path, citation_resolver),
+            items=items,
+            workers=workers,
+            chunk_size=chunk_size,
+            max_in_flight=max_in_flight,
+            initializer=_load_validator,
+            initargs=(config_class,),
+        )
+
+    @classmethod
+    def make_config_many(
+        cls, paths: Iterable[Union[str, Path]], workers: int = 1, chunk_size: int = 100
+    ) -> Iterator[Tuple[str, Optional[dict], Optional[dict]]]:
+        """
+        Builds configurations for many records, read from files, optionally using a pool of processes
+
+        For each record, a tuple of its path, its configuration (or None if it can't be parsed) and an error (or None
+        if it was parsed) is yielded, in the same order as paths are given. Errors are represented as dicts, with the
+        type of exception raised (e.g. 'XMLSyntaxError') and a message.
+
+        Records are read by the process parsing them, so only paths and configurations are passed between processes.
+        Files are read as bytes, using the encoding set in each record's XML declaration (UTF-8 by default).
+        Results are yielded as they become available and paths are read from `paths` as needed, so large numbers of
+        records (e.g. from a generator listing a directory) can be converted without holding them all in memory.
+
+        :type paths: iterable
+        :param paths: paths to files containing an XML record each
+        :type workers: int
+        :param workers: number of processes to use, if 1, records are parsed in the current process
+        :type chunk_size: int
+        :param chunk_size: number of records sent to a process at once
+
+        :rtype iterator
+        :return: path, configuration and error for each record
+        """
+        yield from process_chunks(
+            function=partial(_make_configs, cls),
+            items=(str(path) for path in paths),
+            workers=workers,
+            chunk_size=chunk_size,
+        )
+
 
 class MetadataRecordElement(object):
     """
     Creates an XML element
+
+    Namespaces (`ns`) are shared by all instances of an element class, rather than created for each element. As many
+    elements are created for each record, slots are used rather than a dict for each element's attributes. Derived
+    classes should also set `__slots__`, listing any attributes they add.
     """
 
+    __slots__ = ("record", "attributes", "parent_element", "element_attributes")
+
+    ns = Namespaces()  # type: Namespaces
+
     def __init__(
         self,
         record: MetadataRecord,
         attributes: dict,
         parent_element: Element = None,
         element_attributes: dict = None,
-        xpath: str = None,
     ):
         """
         :type record: MetadataRecord
@@ -186,29 +582,185 @@ class MetadataRecordElement(object):
         :param parent_element: immediate parent of the current element
         :type element_attributes: dict
         :param element_attributes: attributes for the current element, taken from a record's configuration
-        :type xpath: str
-        :param xpath: Absolute XML XPath selecting the value of the element created
         """
-        self.ns = Namespaces()
         self.record = record
         self.attributes = attributes
         self.parent_element = parent_element
         self.element_attributes = element_attributes
-        self.xpath = xpath
 
         if self.parent_element is None:
             self.parent_element = self.record
         if self.element_attributes is None:
             self.element_attributes = self.attributes
 
-    def make_config(self) -> None:
-        """
-        Parses an XML element to reverse engineer a partial configuration object
-        """
-        pass
-
     def make_element(self) -> None:
         """
         Builds an XML element
         """
         pass
+
+
+# Utility functions
+
+
+def validation_error_report(error: ValidationError) -> dict:
+    """
+    Summarises a JSON Schema validation error as a dict
+
+    E.g. {'path': ['resource', 'dates', 0, 'date_type'], 'message': "'foo' is not one of [...]", 'validator': 'enum'}
+
+    :type error: ValidationError
+    :param error: JSON Schema validation error
+
+    :rtype dict
+    :return: path to the invalid value, error message and failing JSON Schema keyword
+    """
+    return {"path": list(error.absolute_path), "message": error.message, "validator": error.validator}
+
+
+def _validate_configs(
+    config_class: type, configs: List[dict]
+) -> List[Tuple[Optional[str], Optional[List[dict]], Optional[dict]]]:
+    """
+    Validates a list of record configurations
+
+    Used by `MetadataRecordConfig.validate_many()`, this function is run in other processes and so must be picklable.
+
+    :type config_class: type
+    :param config_class: MetadataRecordConfig class for the standard or profile configurations are for
+    :type configs: list
+    :param configs: record configurations
+
+    :rtype list
+    :return: file identifier (if set), list of validation errors (if validated) and error (if not validated) for each
+    configuration
+    """
+    reports = []
+    for config in configs:
+        file_identifier = config.get("file_identifier") if isinstance(config, dict) else None
+        try:
+            errors = [validation_error_report(error) for error in config_class(**config).iter_errors()]
+            reports.append((file_identifier, errors, None))
+        except Exception as e:
+            reports.append((file_identifier, None, {"type": type(e).__name__, "message": str(e)}))
+
+    return reports
+
+
+def _make_configs(record_class: type, paths: List[str]) -> List[Tuple[str, Optional[dict], Optional[dict]]]:
+    """
+    Builds configurations for a list of records, read from files
+
+    Used by `MetadataRecord.make_config_many()`, this function is run in other processes and so must be picklable.
+
+    :type record_class: type
+    :param record_class: MetadataRecord class for the standard records use
+    :type paths: list
+    :param paths: paths to files containing an XML record each
+
+    :rtype list
+    :return: path, configuration (if parsed) and error (if not parsed) for each record
+    """
+    results = []
+    for path in paths:
+        try:
+            with open(path, mode="rb") as record_file:
+                config = record_class(record=record_file.read()).make_config().config
+            results.append((path, config, None))
+        except Exception as e:
+            results.append((path, None, {"type": type(e).__name__, "message": str(e)}))
+
+    return results
+
+
+def _load_validator(config_class: type) -> None:
+    """
+    Loads the schema for a MetadataRecordConfig class and creates a validator for it, ready to validate configurations
+
+    Used by `MetadataRecord.generate_many()` to prepare each process before generating records.
+
+    :type config_class: type
+    :param config_class: MetadataRecordConfig class for a standard or profile
+    """
+    config_class().is_valid()
+
+
+# file names for generated documents, where based on file identifiers, limited to a single path component
+_document_name_pattern = re.compile(r"[A-Za-z0-9][A-Za-z0-9._-]*")
+
+
+def _document_names(configs: Iterable[dict]) -> List[Tuple[str, dict]]:
+    """
+    Names the files documents for record configurations are written to
+
+    Used by `MetadataRecord.generate_many()`, files are named after the file identifier of each configuration, or its
+    position if not set or if not a safe file name (e.g. '../record' or 'a/b'). Names are compared ignoring case, as
+    some file systems do. All names are checked before returning, so no documents are written where any would clash.
+
+    :type configs: iterable
+    :param configs: record configurations
+
+    :rtype list
+    :return: file name (without extension) and configuration for each record
+    """
+    names = {}
+    documents = []
+    for index, config in enumerate(configs):
+        name = config.get("file_identifier")
+        if not isinstance(name, str) or _document_name_pattern.fullmatch(name) is None:
+            name = str(index)
+
+        if name.lower() in names:
+            raise ValueError(
+                f"Configurations {names[name.lower()]} and {index} would both be written to '{name}.xml', file "
+                f"identifiers must be unique."
+            )
+        names[name.lower()] = index
+        documents.append((name, config))
+
+    return documents
+
+
+def _generate_records(
+    record_class: type,
+    config_class: type,
+    output_path: Optional[str],
+    citation_resolver: Optional[CitationResolver],
+    configs: List[Tuple[Optional[str], dict]],
+) -> List[Union[bytes, str]]:
+    """
+    Generates XML documents for a list of record configurations
+
+    Used by `MetadataRecord.generate_many()`, this function is run in other processes and so must be picklable.
+
+    :type record_class: type
+    :param record_class: MetadataRecord class for the standard records use
+    :type config_class: type
+    :param config_class: MetadataRecordConfig class for the standard or profile configurations are for
+    :type output_path: str
+    :param output_path: directory to write documents to, if None documents are returned
+    :type citation_resolver: CitationResolver
+    :param citation_resolver: resolver for citations of DOIs, if None the default for the standard is used
+    :type configs: list
+    :param configs: file name (without extension, if written to a file) and record configuration for each record
+
+    :rtype list
+    :return: XML document, or path to the file written, for each configuration
+    """
+    record_options = {}
+    if citation_resolver is not None:
+        record_options["citation_resolver"] = citation_resolver
+
+    results = []
+    for name, config in configs:
+        document = record_class(configuration=config_class(**config), **record_options).generate_xml_document()
+        if output_path is None:
+            results.append(document)
+            continue
+
+        document_path = str(Path(output_path) / f"{name}.xml")
+        with open(document_path, mode="wb") as document_file:
+            document_file.write(document)
+        results.append(document_path)
+
+    return results
@@ -0,0 +1,140 @@
+import threading
+
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from itertools import islice
+from typing import Callable, Iterable, Iterator, List
+
+# initializers already called by the current worker (process or thread), see `_initialized_function()`
+_initialized = threading.local()
+
+
+def chunked(items: Iterable, chunk_size: int) -> Iterator[list]:
+    """
+    Splits an iterable into lists of up to a given size
+
+    Items are consumed from the iterable as each chunk is needed, rather than all at once.
+
+    :type items: iterable
+    :param items: items to split
+    :type chunk_size: int
+    :param chunk_size: maximum number of items in each chunk
+
+    :rtype iterator
+    :return: lists of items
+    """
+    if chunk_size < 1:
+        raise ValueError("Chunk size must be at least 1.")
+
+    items = iter(items)
+    chunk = list(islice(items, chunk_size))
+    while chunk:
+        yield chunk
+        chunk = list(islice(items, chunk_size))
+
+
+def _initialized_function(function: Callable, initializer: Callable, initargs: tuple, chunk: list) -> List:
+    """
+    Calls a function for a chunk of items, calling an initializer first if not yet called by the current worker
+
+    Executors only support initializers from Python 3.7, so workers are initialised when they process their first
+    chunk instead. Initializers are tracked per thread, as each process in a process pool uses a single thread.
+
+    :type function: callable
+    :param function: function to apply to the chunk of items
+    :type initializer: callable
+    :param initializer: function to call once in each worker before processing chunks
+    :type initargs: tuple
+    :param initargs: arguments for the initializer function
+    :type chunk: list
+    :param chunk: items to process
+
+    :rtype list
+    :return: results for each item
+    """
+    if not hasattr(_initialized, "initializers"):
+        _initialized.initializers = set()
+    if (initializer, initargs) not in _initialized.initializers:
+        initializer(*initargs)
+        _initialized.initializers.add((initializer, initargs))
+
+    return function(chunk)
+
+
+def process_chunks(
+    function: Callable[[list], List],
+    items: Iterable,
+    workers: int = 1,
+    chunk_size: int = 100,
+    max_in_flight: int = None,
+    initializer: Callable = None,
+    initargs: tuple = (),
+    threads: bool = False,
+) -> Iterator:
+    """
+    Applies a function to chunks of items using a pool of processes, yielding results in the same order as items
+
+    The function is called with a list of items and must return a list of results. It must be picklable (i.e. a
+    module level function or a `functools.partial` of one) so it can be sent to other processes.
+
+    Items are read and submitted to the pool as results are consumed, with no more than `max_in_flight` chunks pending
+    at once (by default twice the number of workers). This means memory use depends on the chunk size rather than the
+    number of items.
+
+    If given, `initializer` is called with `initargs` once in each process before any chunks are processed (e.g. to
+    load resources needed by the function). Like the function, it must be picklable, as must `initargs`, which must
+    also be hashable.
+
+    If a single worker is used, chunks are processed in the current process without creating a pool.
+
+    Set `threads` to use a pool of threads instead, for functions which mostly wait for I/O (e.g. reading the start of
+    many files). Threads avoid the cost of starting processes and of sending items and results between them.
+
+    :type function: callable
+    :param function: function to apply to each chunk of items
+    :type items: iterable
+    :param items: items to process
+    :type workers: int
+    :param workers: number of processes to use
+    :type chunk_size: int
+    :param chunk_size: number of items sent to a process at once
+    :type max_in_flight: int
+    :param max_in_flight: maximum number of chunks submitted to the pool but not yet consumed
+    :type initializer: callable
+    :param initializer: function to call in each process before processing chunks
+    :type initargs: tuple
+    :param initargs: arguments for the initializer function
+    :type threads: bool
+    :param threads: whether to use a pool of threads rather than processes
+
+    :rtype iterator
+    :return: results for each item
+    """
+    if workers < 1:
+        raise ValueError("Number of workers must be at least 1.")
+
+    chunks = chunked(items=items, chunk_size=chunk_size)
+
+    if workers == 1:
+        if initializer is not None:
+            initializer(*initargs)
+        for chunk in chunks:
+            yield from function(chunk)
+        return
+
+    if max_in_flight is None:
+        max_in_flight = workers * 2
+
+    if initializer is not None:
+        function = partial(_initialized_function, function, initializer, initargs)
+
+    executor_class = ThreadPoolExecutor if threads else ProcessPoolExecutor
+    with executor_class(max_workers=workers) as executor:
+        pending = deque()
+        for chunk in chunks:
+            pending.append(executor.submit(function, chunk))
+            if len(pending) >= max_in_flight:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
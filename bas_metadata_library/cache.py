@@ -0,0 +1,262 @@
+import json
+import threading
+
+from collections import OrderedDict
+from datetime import date, datetime
+from hashlib import sha256
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+from uuid import UUID
+
+from jsonschema import ValidationError
+
+# Prefix for values that can't be represented in JSON directly, when computing digests, see `_DigestEncoder`
+_tag = "\x00"
+
+
+class _DigestEncoder(json.JSONEncoder):
+    """
+    Encodes record configurations as canonical JSON when computing digests
+
+    Values that can't be represented in JSON directly are encoded as they are written in records (e.g. dates as ISO
+    8601 strings, keeping any timezone offset), prefixed with a tag and their type (e.g. '\x00date:2018-01-01'). This
+    means values written differently (e.g. the same time with different offsets), or of different types (e.g. a date
+    and the equivalent string), have different digests.
+
+    So that no string in a configuration can be encoded the same as a tagged value, strings starting with the tag are
+    escaped by repeating it.
+    """
+
+    def __init__(self):
+        super().__init__(sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+
+    def encode(self, o) -> str:
+        return super().encode(_escape_strings(o))
+
+    def default(self, o) -> str:
+        if isinstance(o, datetime):
+            return f"{_tag}datetime:{o.isoformat()}"
+        if isinstance(o, date):
+            return f"{_tag}date:{o.isoformat()}"
+        if isinstance(o, UUID):
+            return f"{_tag}uuid:{o}"
+
+        return super().default(o)
+
+
+def _escape_strings(value):
+    """
+    Escapes strings starting with the tag used for encoded values, see `_DigestEncoder`
+
+    :type value: any
+    :param value: value to escape
+
+    :rtype any
+    :return: value, with a copy of each list or dict containing strings
+    """
+    if isinstance(value, str):
+        return _tag + value if value.startswith(_tag) else value
+    if isinstance(value, dict):
+        return {key: _escape_strings(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_escape_strings(item) for item in value]
+    return value
+
+
+def config_digest(config: dict) -> str:
+    """
+    Computes a canonical digest of a record configuration
+
+    The configuration is serialised as JSON with sorted keys and encoded dates (see `_DigestEncoder`), so that
+    configurations with the same content have the same digest regardless of the order properties were set in.
+
+    A TypeError is raised for values that can't be encoded (e.g. a Decimal).
+
+    :type config: dict
+    :param config: record configuration
+
+    :rtype str
+    :return: SHA-256 hex digest
+    """
+    return sha256(_DigestEncoder().encode(config).encode()).hexdigest()
+
+
+# Version of the format used for configuration fingerprints
+#
+# This should be increased whenever fingerprints for the same configuration would change, or where records generated
+# from the same configuration would differ (e.g. where an element is added), so that previous fingerprints don't match.
+fingerprint_version = 1
+
+
+def config_fingerprint(config: dict, schema_id: str = None, set_like_paths: Iterable[str] = ()) -> str:
+    """
+    Computes a canonical, versioned, fingerprint of a record configuration, for detecting changes
+
+    Where a fingerprint matches a previous fingerprint, the configuration has the same content, ignoring the order of
+    lists in `set_like_paths`. Fingerprints are computed using `config_digest()`, so they don't depend on the order
+    properties were set in.
+
+    Lists whose order isn't significant (e.g. topics) are also sorted, so they don't depend on the order of their
+    items. As these lists are written to records in the order given, records generated from configurations with the
+    same fingerprint may list these items in a different order, but are otherwise the same. These lists are given as
+    paths, with a key for each level of the configuration separated by '.'. Where a path passes through a list, the
+    path applies to each item in it (e.g. 'resource.contacts.role' for the roles of each contact). The configuration
+    isn't changed.
+
+    Fingerprints include the version of the fingerprint format (`fingerprint_version`) and the identifier of the schema
+    for the configuration, so fingerprints from other versions of this library, or for other standards or profiles,
+    don't match.
+
+    :type config: dict
+    :param config: record configuration
+    :type schema_id: str
+    :param schema_id: identifier (`$id`) of the schema for the configuration
+    :type set_like_paths: iterable
+    :param set_like_paths: paths to lists whose order isn't significant
+
+    :rtype str
+    :return: fingerprint, as a version prefix and SHA-256 hex digest (e.g. 'v1:...')
+    """
+    for path in set_like_paths:
+        config = _sort_set_like(value=config, keys=path.split("."))
+
+    digest = config_digest({"version": fingerprint_version, "schema": schema_id, "config": config})
+    return f"v{fingerprint_version}:{digest}"
+
+
+def _sort_set_like(value, keys: List[str]):
+    """
+    Sorts a list within a value, returning a copy of each list or dict containing it
+
+    Items are sorted by their canonical JSON representation. Values not matching the path are returned as is.
+
+    :type value: any
+    :param value: value containing the list
+    :type keys: list
+    :param keys: keys to the list, applied to each item where a list is reached before the last key
+
+    :rtype any
+    :return: value, with the list sorted
+    """
+    if isinstance(value, list):
+        if len(keys) > 0:
+            return [_sort_set_like(value=item, keys=keys) for item in value]
+        return sorted(value, key=_DigestEncoder().encode)
+    if isinstance(value, dict) and len(keys) > 0 and keys[0] in value:
+        return {**value, keys[0]: _sort_set_like(value=value[keys[0]], keys=keys[1:])}
+    return value
+
+
+class ValidationCache(object):
+    """
+    Caches the results of validating record configurations
+
+    Results are indexed by the identifier (`$id`) of the schema a configuration was validated against and a digest of
+    the configuration (see `config_digest()`), so configurations with the same content are only validated once. Results
+    are either None (valid), or the validation error raised.
+
+    The cache holds up to `maxsize` results, with the least recently used discarded first. Hits and misses are counted
+    for monitoring.
+
+    The schema each result was made against is tracked, if a different schema is used for the same identifier (e.g.
+    where a new version is registered), results for that schema are discarded. Results can also be discarded using
+    `invalidate()`.
+    """
+
+    def __init__(self, maxsize: int = 1024):
+        """
+        :type maxsize: int
+        :param maxsize: maximum number of results to hold
+        """
+        if maxsize < 1:
+            raise ValueError("Cache size must be at least 1.")
+
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._results = OrderedDict()  # type: OrderedDict[Tuple[str, str], Optional[ValidationError]]
+        self._schemas = {}  # type: Dict[str, dict]
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._results)
+
+    def result(
+        self, schema: dict, config: dict, validate: Callable[[], Optional[ValidationError]]
+    ) -> Optional[ValidationError]:
+        """
+        Returns the result of validating a configuration against a schema, validating it only if not already cached
+
+        Schemas without an identifier (`$id`), and configurations that can't be digested (e.g. containing a Decimal),
+        are not cached.
+
+        :type schema: dict
+        :param schema: JSON Schema
+        :type config: dict
+        :param config: record configuration
+        :type validate: callable
+        :param validate: function returning the result of validating the configuration, if not cached
+
+        :rtype ValidationError or None
+        :return: validation error, or None if the configuration is valid
+        """
+        schema_id = schema.get("$id")
+        if schema_id is None:
+            return validate()
+        try:
+            key = (schema_id, config_digest(config))
+        except (TypeError, ValueError):
+            return validate()
+        with self._lock:
+            if self._schemas.get(schema_id) is not schema:
+                self._invalidate(schema_id=schema_id)
+                self._schemas[schema_id] = schema
+            if key in self._results:
+                self.hits += 1
+                self._results.move_to_end(key)
+                return self._copy(self._results[key])
+            self.misses += 1
+
+        error = validate()
+        with self._lock:
+            if self._schemas.get(schema_id) is schema:
+                self._results[key] = error
+                self._results.move_to_end(key)
+                while len(self._results) > self.maxsize:
+                    self._results.popitem(last=False)
+
+        return self._copy(error)
+
+    def invalidate(self, schema_id: str = None) -> None:
+        """
+        Discards cached results, either for a schema or all results
+
+        :type schema_id: str
+        :param schema_id: identifier (`$id`) of the schema to discard results for, if None all results are discarded
+        """
+        with self._lock:
+            self._invalidate(schema_id=schema_id)
+
+    def _invalidate(self, schema_id: str = None) -> None:
+        if schema_id is None:
+            self._results.clear()
+            self._schemas.clear()
+            return
+
+        self._schemas.pop(schema_id, None)
+        for key in [key for key in self._results.keys() if key[0] == schema_id]:
+            del self._results[key]
+
+    @staticmethod
+    def _copy(error: Optional[ValidationError]) -> Optional[ValidationError]:
+        """
+        Copies a cached validation error, so that each caller raises a separate exception
+
+        :type error: ValidationError or None
+        :param error: cached validation error
+
+        :rtype ValidationError or None
+        :return: copy of validation error
+        """
+        if error is None:
+            return None
+        return ValidationError.create_from(error)
@@ -0,0 +1,327 @@
+import os
+import sqlite3
+import threading
+
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from time import time
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+import requests
+
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+class CitationResolver(ABC):
+    """
+    Gets a formatted citation for a DOI
+
+    This class is intended to be overridden to provide citations from a source, see `CrossCiteCitationResolver`.
+    """
+
+    @abstractmethod
+    def resolve(self, doi: str, style: str = "apa", locale: str = "en-GB") -> str:
+        """
+        Gets a formatted citation for a DOI
+
+        :type doi: str
+        :param doi: DOI to get citation for, as a URL (e.g. 'https://doi.org/10.7939/R3QZ22K64')
+        :type style: str
+        :param style: citation style (e.g. 'apa'), as a Citation Style Language (CSL) style name
+        :type locale: str
+        :param locale: locale for the citation (e.g. 'en-GB')
+
+        :rtype str
+        :return: formatted citation
+        """
+
+
+class CrossCiteCitationResolver(CitationResolver):
+    """
+    Gets formatted citations for DOIs from the DOI resolver, using CrossCite content negotiation
+
+    See https://citation.crosscite.org/docs.html for more information.
+    """
+
+    def __init__(self, timeout: float = 10, session: requests.Session = None):
+        """
+        :type timeout: float
+        :param timeout: seconds to wait for the DOI resolver to respond
+        :type session: requests.Session
+        :param session: session to make requests with (e.g. from `make_session()`), if None a new connection is used
+        for each request
+        """
+        self.timeout = timeout
+        self.session = session
+
+    def resolve(self, doi: str, style: str = "apa", locale: str = "en-GB") -> str:
+        client = self.session if self.session is not None else requests
+        citation_response = client.get(
+            doi, headers={"Accept": f"text/x-bibliography; style={style}; locale={locale}"}, timeout=self.timeout
+        )
+        citation_response.raise_for_status()
+        return citation_response.text
+
+
+class StubCitationResolver(CitationResolver):
+    """
+    Returns predefined citations for DOIs, without making any requests
+
+    Intended for use in tests and for building records offline. Calls are recorded in `requests` for inspection.
+    """
+
+    def __init__(self, citations: Dict[str, str] = None, default: str = None):
+        """
+        :type citations: dict
+        :param citations: citations indexed by DOI
+        :type default: str
+        :param default: citation for any DOI not in `citations`, if None a RuntimeError is raised for these DOIs
+        """
+        self.citations = citations if citations is not None else {}
+        self.default = default
+        self.requests = []  # type: List[Tuple[str, str, str]]
+
+    def resolve(self, doi: str, style: str = "apa", locale: str = "en-GB") -> str:
+        self.requests.append((doi, style, locale))
+        if doi in self.citations:
+            return self.citations[doi]
+        if self.default is not None:
+            return self.default
+
+        raise RuntimeError(f"Citation for DOI '{doi}' is not available.")
+
+
+class CachedCitationResolver(CitationResolver):
+    """
+    Caches citations from another resolver, in memory and optionally on disk
+
+    Citations are indexed by DOI, style and locale. Recently used citations are held in memory, up to `maxsize`
+    citations, with the least recently used discarded first. If a path is set, citations are also stored in an SQLite
+    database, so they can be reused between processes and across runs (e.g. in a nightly rebuild of many records).
+
+    Citations are used for `ttl` seconds after being resolved, after which they are resolved again.
+
+    In offline mode, citations are only read from the cache (including expired citations) and the resolver is never
+    called. A RuntimeError is raised for citations not in the cache.
+    """
+
+    def __init__(
+        self,
+        resolver: CitationResolver,
+        path: Union[str, Path] = None,
+        ttl: float = 60 * 60 * 24 * 30,
+        maxsize: int = 1024,
+        offline: bool = False,
+    ):
+        """
+        :type resolver: CitationResolver
+        :param resolver: resolver for citations not in the cache
+        :type path: str or Path
+        :param path: path to an SQLite database to store citations in, if None citations are only cached in memory
+        :type ttl: float
+        :param ttl: number of seconds citations are cached for, 30 days by default
+        :type maxsize: int
+        :param maxsize: maximum number of citations to hold in memory
+        :type offline: bool
+        :param offline: whether to only use cached citations
+        """
+        if maxsize < 1:
+            raise ValueError("Cache size must be at least 1.")
+
+        self.resolver = resolver
+        self.path = path
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self.offline = offline
+
+        self._citations = OrderedDict()  # type: OrderedDict[Tuple[str, str, str], Tuple[str, float]]
+        self._lock = threading.Lock()
+        self._connection = None  # type: Optional[sqlite3.Connection]
+        self._connection_pid = None  # type: Optional[int]
+
+    def __getstate__(self) -> dict:
+        # copied to other processes (e.g. by `MetadataRecord.generate_many()`) with cached citations, but without the
+        # lock or database connection, which can't be shared between processes
+        state = self.__dict__.copy()
+        del state["_lock"]
+        state["_connection"] = None
+        state["_connection_pid"] = None
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def resolve(self, doi: str, style: str = "apa", locale: str = "en-GB") -> str:
+        key = (doi, style, locale)
+        cached = self._get(key=key)
+        if cached is not None:
+            citation, resolved = cached
+            if self.offline or resolved > time() - self.ttl:
+                return citation
+        if self.offline:
+            raise RuntimeError(f"Citation for DOI '{doi}' is not cached and offline mode is enabled.")
+
+        citation = self.resolver.resolve(doi=doi, style=style, locale=locale)
+        self._set(key=key, citation=citation, resolved=time())
+        return citation
+
+    def prefetch(
+        self, dois: Iterable[str], style: str = "apa", locale: str = "en-GB", workers: int = 8
+    ) -> Dict[str, Exception]:
+        """
+        Resolves citations for many DOIs concurrently, so they are cached before generating records
+
+        DOIs are de-duplicated, and those already cached are not resolved again. Up to `workers` citations are resolved
+        at once, using a pool of threads. Errors are returned rather than raised, so that one DOI failing does not
+        prevent others being cached.
+
+        :type dois: iterable
+        :param dois: DOIs to get citations for, as URLs
+        :type style: str
+        :param style: citation style (e.g. 'apa'), as a Citation Style Language (CSL) style name
+        :type locale: str
+        :param locale: locale for the citation (e.g. 'en-GB')
+        :type workers: int
+        :param workers: maximum number of citations to resolve at once
+
+        :rtype dict
+        :return: errors for DOIs that could not be resolved, indexed by DOI
+        """
+        if workers < 1:
+            raise ValueError("Number of workers must be at least 1.")
+
+        def _resolve(doi: str) -> Optional[Exception]:
+            try:
+                self.resolve(doi=doi, style=style, locale=locale)
+            except Exception as e:
+                return e
+            return None
+
+        dois = list(OrderedDict.fromkeys(dois))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            errors = executor.map(_resolve, dois)
+            return {doi: error for doi, error in zip(dois, errors) if error is not None}
+
+    def _get(self, key: Tuple[str, str, str]) -> Optional[Tuple[str, float]]:
+        """
+        Gets a citation, and the time it was resolved, from memory or the database
+
+        :type key: tuple
+        :param key: DOI, style and locale
+
+        :rtype tuple or None
+        :return: citation and time resolved, or None if not cached
+        """
+        with self._lock:
+            if key in self._citations:
+                self._citations.move_to_end(key)
+                return self._citations[key]
+            if self.path is None:
+                return None
+
+            row = (
+                self._database()
+                .execute("SELECT citation, resolved FROM citations WHERE doi = ? AND style = ? AND locale = ?", key)
+                .fetchone()
+            )
+            if row is None:
+                return None
+            self._remember(key=key, citation=row[0], resolved=row[1])
+            return row[0], row[1]
+
+    def _set(self, key: Tuple[str, str, str], citation: str, resolved: float) -> None:
+        """
+        Stores a citation in memory and the database
+
+        :type key: tuple
+        :param key: DOI, style and locale
+        :type citation: str
+        :param citation: formatted citation
+        :type resolved: float
+        :param resolved: time the citation was resolved, as a Unix timestamp
+        """
+        with self._lock:
+            self._remember(key=key, citation=citation, resolved=resolved)
+            if self.path is None:
+                return
+
+            with self._database() as connection:
+                connection.execute(
+                    "INSERT OR REPLACE INTO citations (doi, style, locale, citation, resolved) VALUES (?, ?, ?, ?, ?)",
+                    (*key, citation, resolved),
+                )
+
+    def _remember(self, key: Tuple[str, str, str], citation: str, resolved: float) -> None:
+        self._citations[key] = (citation, resolved)
+        self._citations.move_to_end(key)
+        while len(self._citations) > self.maxsize:
+            self._citations.popitem(last=False)
+
+    def _database(self) -> sqlite3.Connection:
+        """
+        Returns a connection to the database, creating the database if needed
+
+        Connections can't be shared between processes, so a new connection is made if this process has been forked
+        (e.g. by `MetadataRecord.generate_many()`).
+
+        :rtype sqlite3.Connection
+        :return: database connection
+        """
+        if self._connection is None or self._connection_pid != os.getpid():
+            self._connection = sqlite3.connect(str(self.path), check_same_thread=False)
+            self._connection_pid = os.getpid()
+            with self._connection as connection:
+                connection.execute(
+                    "CREATE TABLE IF NOT EXISTS citations (doi TEXT, style TEXT, locale TEXT, citation TEXT, "
+                    "resolved REAL, PRIMARY KEY (doi, style, locale))"
+                )
+        return self._connection
+
+
+def make_session(pool_size: int = 8, retries: int = 3, backoff_factor: float = 0.5) -> requests.Session:
+    """
+    Creates a session for requesting citations, reusing connections and retrying failed requests
+
+    Requests are retried where a connection fails, or the DOI resolver responds with a rate limit (429) or server
+    (5xx) error, waiting `backoff_factor` seconds before the first retry and doubling this for each retry after.
+
+    :type pool_size: int
+    :param pool_size: maximum number of connections to keep open for each host, should be at least the number of
+    threads making requests
+    :type retries: int
+    :param retries: maximum number of times to retry each request
+    :type backoff_factor: float
+    :param backoff_factor: seconds to wait before retrying
+
+    :rtype requests.Session
+    :return: session
+    """
+    retry = Retry(total=retries, backoff_factor=backoff_factor, status_forcelist=(429, 500, 502, 503, 504))
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+    session = requests.Session()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def citation_dois(configs: Iterable[dict]) -> List[str]:
+    """
+    Gets DOIs for required citations in many record configurations, without duplicates
+
+    Intended for prefetching citations (using `CachedCitationResolver.prefetch()`) before generating records.
+
+    :type configs: iterable
+    :param configs: record configurations, as dicts
+    :rtype list
+    :return: DOIs, in the order they first appear
+    """
+    dois = OrderedDict()  # type: OrderedDict[str, None]
+    for config in configs:
+        for constraint in config.get("resource", {}).get("constraints", {}).get("usage", []):
+            if "doi" in constraint.get("required_citation", {}):
+                dois[constraint["required_citation"]["doi"]] = None
+    return list(dois)
@@ -0,0 +1,385 @@
+import re
+
+from numbers import Number
+from typing import Callable, Dict, List, Tuple
+
+from jsonschema import Draft7Validator, RefResolver
+from jsonschema.validators import validator_for
+
+
+def _is_number(instance) -> bool:
+    return isinstance(instance, Number) and not isinstance(instance, bool)
+
+
+def _is_integer(instance) -> bool:
+    return isinstance(instance, int) and not isinstance(instance, bool)
+
+
+def _is_string(instance) -> bool:
+    # values without a JSON type (e.g. dates) are encoded as strings, as per `bas_metadata_library.schemas.is_string()`
+    return isinstance(instance, str) or not isinstance(instance, (dict, list, tuple, int, float, type(None)))
+
+
+def _unbool(instance, true=object(), false=object()):
+    # distinguishes booleans from 1 and 0, as per jsonschema
+    if instance is True:
+        return true
+    if instance is False:
+        return false
+    return instance
+
+
+def _in_enum(instance, enums: list) -> bool:
+    if instance == 0 or instance == 1:
+        return any(_unbool(instance) == _unbool(each) for each in enums)
+    return instance in enums
+
+
+def _unique(instance: list) -> bool:
+    unbooled = [_unbool(item) for item in instance]
+    for index, item in enumerate(unbooled):
+        if item in unbooled[index + 1 :]:
+            return False
+    return True
+
+
+# Python expressions checking a value is of a JSON Schema type, strings include Python dates and datetimes and arrays
+# include tuples, as per `bas_metadata_library.schemas.native_validator_class()`
+_type_checks = {
+    "array": "isinstance({value}, (list, tuple))",
+    "boolean": "isinstance({value}, bool)",
+    "integer": "_is_integer({value})",
+    "null": "{value} is None",
+    "number": "_is_number({value})",
+    "object": "isinstance({value}, dict)",
+    "string": "_is_string({value})",
+}
+# JSON Schema keywords that don't affect validation
+_annotation_keywords = {"$id", "$schema", "$comment", "title", "description", "default", "examples", "definitions"}
+
+
+class SchemaCompiler(object):
+    """
+    Compiles a JSON Schema into a Python function checking whether an instance is valid
+
+    Rather than interpreting a schema for each instance, as jsonschema validators do, Python source code is generated
+    for each (sub-)schema, with the checks for each keyword written out directly (e.g. `isinstance(x, dict)` for
+    `"type": "object"`). References (`$ref`) are resolved once, when compiling, and become calls to the function
+    compiled for the referenced schema.
+
+    Compiled functions return whether an instance is valid, without details of any errors. Where an instance is
+    invalid, a jsonschema validator should be used to determine why.
+
+    Only JSON Schema draft 7 is supported. As with jsonschema validators created by the schema registry, formats are
+    not checked, Python dates and datetimes are accepted as strings and tuples as arrays.
+    """
+
+    def __init__(self, resolver: RefResolver):
+        """
+        :type resolver: RefResolver
+        :param resolver: resolver for references in schemas, typically from a schema registry
+        """
+        self.resolver = resolver
+        self._lines = []  # type: List[str]
+        self._namespace = {}  # type: Dict[str, object]
+        self._functions = {}  # type: Dict[Tuple[str, int], str]
+        self._references = {}  # type: Dict[str, str]
+
+    def compile(self, schema: dict) -> Callable[[object], bool]:
+        """
+        Compiles a schema into a function
+
+        :type schema: dict
+        :param schema: JSON Schema
+
+        :rtype callable
+        :return: function taking an instance and returning whether it is valid against the schema
+        """
+        if validator_for(schema, default=Draft7Validator) is not Draft7Validator:
+            raise ValueError(f"Schema '{schema.get('$schema')}' is not supported, only JSON Schema draft 7 is.")
+
+        name = self._function(schema=schema)
+        namespace = {
+            "re": re,
+            "_is_number": _is_number,
+            "_is_integer": _is_integer,
+            "_is_string": _is_string,
+            "_in_enum": _in_enum,
+            "_unique": _unique,
+            **self._namespace,
+        }
+        exec(compile("\n".join(self._lines), "<compiled schema>", "exec"), namespace)  # nosec
+
+        return namespace[name]
+
+    def source(self) -> str:
+        """
+        Returns the Python source code generated for compiled schemas, useful for debugging
+
+        :rtype str
+        :return: Python source code
+        """
+        return "\n".join(self._lines)
+
+    def _constant(self, value) -> str:
+        """
+        Adds a value to the namespace compiled functions are run in
+
+        :type value: any
+        :param value: value, e.g. a list of enumerated values
+
+        :rtype str
+        :return: name of the value in the namespace
+        """
+        name = f"_c{len(self._namespace)}"
+        self._namespace[name] = value
+        return name
+
+    def _function(self, schema) -> str:
+        """
+        Generates a function for a (sub-)schema, if one hasn't already been generated
+
+        Functions are generated per schema and resolution scope, as relative references in the same schema may
+        resolve differently in different scopes.
+
+        :type schema: dict or bool
+        :param schema: JSON Schema
+
+        :rtype str
+        :return: name of the function
+        """
+        key = (self.resolver.resolution_scope, id(schema))
+        if key in self._functions:
+            return self._functions[key]
+
+        name = f"_v{len(self._functions)}"
+        self._functions[key] = name
+
+        if isinstance(schema, dict) and "$id" in schema:
+            with self.resolver.in_scope(schema["$id"]):
+                body = self._body(schema=schema)
+        else:
+            body = self._body(schema=schema)
+
+        self._lines += [f"def {name}(x):", *[f"    {line}" for line in body], "    return True", ""]
+        return name
+
+    def _reference(self, reference: str) -> str:
+        """
+        Generates a function for the schema a reference resolves to, if one hasn't already been generated
+
+        :type reference: str
+        :param reference: reference (`$ref`) value, resolved relative to the current resolution scope
+
+        :rtype str
+        :return: name of the function
+        """
+        url, resolved = self.resolver.resolve(reference)
+        if url not in self._references:
+            self.resolver.push_scope(url)
+            try:
+                self._references[url] = self._function(schema=resolved)
+            finally:
+                self.resolver.pop_scope()
+
+        return self._references[url]
+
+    def _body(self, schema) -> List[str]:
+        """
+        Generates the statements of a function checking an instance (`x`) against a (sub-)schema
+
+        Each statement returns False if a check fails. Keywords for specific types (e.g. `required`) are wrapped in a
+        check for that type, as they don't apply to other types.
+
+        :type schema: dict or bool
+        :param schema: JSON Schema
+
+        :rtype list
+        :return: lines of Python source code
+        """
+        if not isinstance(schema, dict) or "$ref" in schema:
+            return [f"if not ({self._check(schema=schema, value='x')}): return False"]
+
+        lines = []
+        simple = {keyword: schema[keyword] for keyword in ["type", "enum", "const"] if keyword in schema}
+        if simple:
+            lines.append(f"if not ({self._check(schema=simple, value='x')}): return False")
+
+        # where an instance must be of a single type, keywords for that type don't need to check the type again
+        types = schema.get("type", [])
+        types = types if isinstance(types, list) else [types]
+        lines += self._indented(
+            condition="isinstance(x, dict)", lines=self._object_body(schema=schema), checked=types == ["object"]
+        )
+        lines += self._indented(
+            condition="isinstance(x, (list, tuple))", lines=self._array_body(schema=schema), checked=types == ["array"]
+        )
+        lines += self._indented(condition="_is_number(x)", lines=self._number_body(schema=schema), checked=False)
+        lines += self._indented(condition="_is_string(x)", lines=self._string_body(schema=schema), checked=False)
+
+        for subschema in schema.get("allOf", []):
+            lines.append(f"if not ({self._check(schema=subschema, value='x')}): return False")
+        if "anyOf" in schema:
+            checks = " or ".join(f"({self._check(schema=subschema, value='x')})" for subschema in schema["anyOf"])
+            lines.append(f"if not ({checks}): return False")
+        if "oneOf" in schema:
+            checks = ", ".join(f"bool({self._check(schema=subschema, value='x')})" for subschema in schema["oneOf"])
+            lines.append(f"if [{checks}].count(True) != 1: return False")
+        if "not" in schema:
+            lines.append(f"if {self._check(schema=schema['not'], value='x')}: return False")
+        if "if" in schema:
+            condition = f"({self._check(schema=schema['if'], value='x')})"
+            if "then" in schema:
+                lines.append(f"if {condition} and not ({self._check(schema=schema['then'], value='x')}): return False")
+            if "else" in schema:
+                lines.append(
+                    f"if not {condition} and not ({self._check(schema=schema['else'], value='x')}): return False"
+                )
+
+        return lines
+
+    def _check(self, schema, value: str) -> str:
+        """
+        Generates a Python expression checking a value against a (sub-)schema
+
+        Simple schemas (such as `{"type": "string"}`) are checked inline, otherwise a function is generated for the
+        schema and called.
+
+        :type schema: dict or bool
+        :param schema: JSON Schema
+        :type value: str
+        :param value: Python expression for the value to check (e.g. 'x["name"]')
+
+        :rtype str
+        :return: Python expression
+        """
+        if schema is True:
+            return "True"
+        if schema is False:
+            return "False"
+        if "$ref" in schema:
+            return f"{self._reference(reference=schema['$ref'])}({value})"
+
+        keywords = set(schema.keys()) - _annotation_keywords
+        if not keywords:
+            return "True"
+        if not keywords.issubset({"type", "enum", "const"}):
+            return f"{self._function(schema=schema)}({value})"
+
+        checks = []
+        if "type" in schema:
+            types = schema["type"] if isinstance(schema["type"], list) else [schema["type"]]
+            checks.append(" or ".join(_type_checks[_type].format(value=value) for _type in types))
+        if "enum" in schema:
+            checks.append(f"_in_enum({value}, {self._constant(schema['enum'])})")
+        if "const" in schema:
+            checks.append(f"_in_enum({value}, {self._constant([schema['const']])})")
+        return " and ".join(f"({check})" for check in checks)
+
+    def _object_body(self, schema: dict) -> List[str]:
+        lines = []
+        if "required" in schema:
+            lines += [f"if {repr(name)} not in x: return False" for name in schema["required"]]
+        if "minProperties" in schema:
+            lines.append(f"if len(x) < {schema['minProperties']}: return False")
+        if "maxProperties" in schema:
+            lines.append(f"if len(x) > {schema['maxProperties']}: return False")
+
+        properties = schema.get("properties", {})
+        patterns = schema.get("patternProperties", {})
+        additional = schema.get("additionalProperties", True)
+        if additional is False and not patterns:
+            lines.append(f"if not {self._constant(frozenset(properties.keys()))}.issuperset(x): return False")
+            additional = True
+
+        for name, subschema in properties.items():
+            check = self._check(schema=subschema, value=f"x[{repr(name)}]")
+            if check != "True":
+                lines.append(f"if {repr(name)} in x and not ({check}): return False")
+
+        if patterns or "propertyNames" in schema or additional is not True:
+            lines.append("for k, v in x.items():")
+            if "propertyNames" in schema:
+                lines.append(f"    if not ({self._check(schema=schema['propertyNames'], value='k')}): return False")
+            if patterns or additional is not True:
+                lines.append(f"    additional = k not in {self._constant(frozenset(properties.keys()))}")
+            for pattern, subschema in patterns.items():
+                regex = self._constant(re.compile(pattern))
+                lines.append(f"    if {regex}.search(k):")
+                lines.append("        additional = False")
+                lines.append(f"        if not ({self._check(schema=subschema, value='v')}): return False")
+            if additional is not True:
+                lines.append(f"    if additional and not ({self._check(schema=additional, value='v')}): return False")
+
+        for name, dependency in schema.get("dependencies", {}).items():
+            if isinstance(dependency, list):
+                condition = " or ".join(f"{repr(_name)} not in x" for _name in dependency) or "False"
+            else:
+                condition = f"not ({self._check(schema=dependency, value='x')})"
+            lines.append(f"if {repr(name)} in x and ({condition}): return False")
+
+        return lines
+
+    def _array_body(self, schema: dict) -> List[str]:
+        lines = []
+        if "minItems" in schema:
+            lines.append(f"if len(x) < {schema['minItems']}: return False")
+        if "maxItems" in schema:
+            lines.append(f"if len(x) > {schema['maxItems']}: return False")
+        if schema.get("uniqueItems", False):
+            lines.append("if not _unique(x): return False")
+
+        items = schema.get("items", True)
+        if isinstance(items, list):
+            for index, subschema in enumerate(items):
+                check = self._check(schema=subschema, value=f"x[{index}]")
+                lines.append(f"if len(x) > {index} and not ({check}): return False")
+            additional = schema.get("additionalItems", True)
+            if additional is not True:
+                check = self._check(schema=additional, value="item")
+                lines.append(f"if not all({check} for item in x[{len(items)}:]): return False")
+        elif self._check(schema=items, value="item") != "True":
+            lines.append(f"if not all({self._check(schema=items, value='item')} for item in x): return False")
+
+        if "contains" in schema:
+            lines.append(
+                f"if not any({self._check(schema=schema['contains'], value='item')} for item in x): return False"
+            )
+
+        return lines
+
+    @staticmethod
+    def _number_body(schema: dict) -> List[str]:
+        lines = []
+        comparisons = {"minimum": "<", "maximum": ">", "exclusiveMinimum": "<=", "exclusiveMaximum": ">="}
+        for keyword, operator in comparisons.items():
+            if keyword in schema:
+                lines.append(f"if x {operator} {repr(schema[keyword])}: return False")
+        if "multipleOf" in schema:
+            multiple = schema["multipleOf"]
+            if isinstance(multiple, float):
+                lines.append(f"if int(x / {repr(multiple)}) != x / {repr(multiple)}: return False")
+            else:
+                lines.append(f"if x % {repr(multiple)}: return False")
+
+        return lines
+
+    def _string_body(self, schema: dict) -> List[str]:
+        lines = []
+        if "minLength" in schema:
+            lines.append(f"if len(s) < {schema['minLength']}: return False")
+        if "maxLength" in schema:
+            lines.append(f"if len(s) > {schema['maxLength']}: return False")
+        if "pattern" in schema:
+            lines.append(f"if not {self._constant(re.compile(schema['pattern']))}.search(s): return False")
+
+        # values encoded as strings (e.g. dates) are checked as they would be encoded
+        if lines:
+            lines.insert(0, "s = x if isinstance(x, str) else str(x)")
+        return lines
+
+    @staticmethod
+    def _indented(condition: str, lines: List[str], checked: bool) -> List[str]:
+        if not lines or checked:
+            return lines
+        return [f"if {condition}:", *[f"    {line}" for line in lines]]
@@ -0,0 +1,273 @@
+from copy import deepcopy
+from typing import Union
+from urllib.parse import urldefrag, urljoin
+
+from jsonschema import RefResolver
+
+# JSON Schema keywords with a schema as their value
+_schema_keywords = {"additionalItems", "additionalProperties", "contains", "propertyNames", "not", "if", "then", "else"}
+# JSON Schema keywords with a list of schemas as their value
+_schema_list_keywords = {"allOf", "anyOf", "oneOf"}
+# JSON Schema keywords with a dict of schemas as their value
+_schema_dict_keywords = {"properties", "patternProperties", "definitions"}
+# JSON Schema keywords that don't affect validation, values from the first schema are kept when merging
+_annotation_keywords = {"$id", "$schema", "$comment", "title", "description", "default", "examples"}
+# JSON Schema keywords for objects that depend on each other (e.g. which properties are additional)
+_object_keywords = {"properties", "patternProperties", "additionalProperties"}
+# JSON Schema keywords for arrays that depend on each other (e.g. which items are additional)
+_array_keywords = {"items", "additionalItems"}
+
+
+def flattened_schema_id(schema_id: str) -> str:
+    """
+    Returns the identifier for the flattened version of a schema
+
+    E.g. 'https://example.com/profile.json' becomes 'https://example.com/profile.json?flattened'.
+
+    :type schema_id: str
+    :param schema_id: identifier (`$id`) of the composed schema
+
+    :rtype str
+    :return: identifier for the flattened schema
+    """
+    return f"{urldefrag(schema_id)[0]}?flattened"
+
+
+class SchemaFlattener(object):
+    """
+    Flattens a JSON Schema composed of other schemas (using `allOf`) into a single schema
+
+    Schemas for profiles extend the schema of the standard (or profile) they are based on using `allOf`, with a
+    reference to the base schema and an overlay of additional rules. For example, an overlay may set a property as
+    required, using a definition in the profile schema that overrides a definition in the base schema. Validating
+    against the composed schema means walking the configuration once for the base schema and again for each overlay.
+
+    This class merges the base schema and overlays into a single schema, so a configuration is walked once. Overlays
+    are merged into the base schema where they apply, with references in the base schema replaced by the schemas they
+    refer to where an overlay changes them (so the overlay only applies where the profile references it). Properties
+    are merged recursively, required properties are combined, and where rules can't be merged (e.g. two different
+    `enum` values) both are kept in an `allOf` at that point, which has the same result.
+
+    References in the flattened schema are made absolute, as parts of it come from different schemas. The flattened
+    schema is given its own identifier (see `flattened_schema_id()`), so it isn't mistaken for the composed schema
+    where validators or results are indexed by schema identifier.
+
+    A flattened schema gives the same validation results as the composed schema, though errors may be found in a
+    different order and so `jsonschema.exceptions.best_match()` may select a different (equally relevant) error where
+    a configuration has multiple errors.
+    """
+
+    def __init__(self, resolver: RefResolver):
+        """
+        :type resolver: RefResolver
+        :param resolver: resolver for references in schemas, typically from a schema registry
+        """
+        self.resolver = resolver
+
+    def flatten(self, schema: dict) -> dict:
+        """
+        Flattens a schema composed using `allOf`
+
+        Schemas not using `allOf` are returned as is.
+
+        :type schema: dict
+        :param schema: JSON Schema
+
+        :rtype dict
+        :return: flattened JSON Schema
+        """
+        if "allOf" not in schema:
+            return schema
+
+        flattened = self._flatten_document(schema=schema, url=self.resolver.resolution_scope)
+        if isinstance(flattened, bool):
+            # boolean schemas can't have an identifier, so are converted to equivalent object schemas
+            flattened = {} if flattened else {"not": {}}
+        for keyword in ["$comment", "description", "title", "$schema"]:
+            if keyword in schema:
+                flattened = {keyword: schema[keyword], **flattened}
+        if "$id" in schema:
+            flattened = {"$id": flattened_schema_id(schema_id=schema["$id"]), **flattened}
+        return flattened
+
+    def _flatten_document(self, schema: dict, url: str) -> dict:
+        """
+        Merges the members of a schema's `allOf` composition, and any other keywords, into a single schema
+
+        :type schema: dict
+        :param schema: JSON Schema document
+        :type url: str
+        :param url: URL of the schema document, used to make references absolute
+
+        :rtype dict
+        :return: flattened JSON Schema, without annotations or definitions
+        """
+        own = {
+            keyword: value
+            for keyword, value in schema.items()
+            if keyword not in _annotation_keywords and keyword not in {"allOf", "definitions"}
+        }
+        flattened = True
+        for member in [*schema.get("allOf", []), own]:
+            member = self._absolute(schema=member, url=url)
+            if isinstance(member, dict) and "$ref" in member:
+                member = self._dereference(schema=member)
+            flattened = self._merge(flattened, member)
+
+        return flattened
+
+    def _absolute(self, schema: Union[dict, bool], url: str) -> Union[dict, bool]:
+        """
+        Copies a schema, making references absolute
+
+        :type schema: dict or bool
+        :param schema: JSON Schema
+        :type url: str
+        :param url: URL references are relative to (updated by any `$id` in the schema)
+
+        :rtype dict or bool
+        :return: JSON Schema with absolute references
+        """
+        if not isinstance(schema, dict):
+            return schema
+
+        url = urljoin(url, schema.get("$id", ""))
+        copy = {}
+        for keyword, value in schema.items():
+            if keyword == "$ref" and isinstance(value, str):
+                copy[keyword] = urljoin(url, value)
+            elif keyword in _schema_keywords:
+                copy[keyword] = self._absolute(schema=value, url=url)
+            elif keyword in _schema_list_keywords or (keyword == "items" and isinstance(value, list)):
+                copy[keyword] = [self._absolute(schema=item, url=url) for item in value]
+            elif keyword in _schema_dict_keywords or (keyword == "dependencies" and isinstance(value, dict)):
+                copy[keyword] = {
+                    name: self._absolute(schema=item, url=url) if not isinstance(item, list) else item
+                    for name, item in value.items()
+                }
+            elif keyword == "items":
+                copy[keyword] = self._absolute(schema=value, url=url)
+            else:
+                copy[keyword] = deepcopy(value)
+
+        return copy
+
+    def _dereference(self, schema: dict) -> Union[dict, bool]:
+        """
+        Replaces a reference with the (flattened) schema it refers to
+
+        In JSON Schema draft 7, other keywords alongside `$ref` are ignored, and so are dropped.
+
+        :type schema: dict
+        :param schema: JSON Schema with an absolute reference
+
+        :rtype dict or bool
+        :return: referenced schema, with absolute references
+        """
+        url, resolved = self.resolver.resolve(schema["$ref"])
+        document_url, fragment = urldefrag(url)
+        if fragment == "" and isinstance(resolved, dict):
+            return self._flatten_document(schema=resolved, url=document_url)
+
+        return self._absolute(schema=resolved, url=url)
+
+    def _merge(self, schema: Union[dict, bool], overlay: Union[dict, bool]) -> Union[dict, bool]:
+        """
+        Merges two schemas into a single schema, equivalent to `{"allOf": [schema, overlay]}`
+
+        :type schema: dict or bool
+        :param schema: JSON Schema, with absolute references
+        :type overlay: dict or bool
+        :param overlay: JSON Schema, with absolute references
+
+        :rtype dict or bool
+        :return: merged JSON Schema
+        """
+        if schema is False or overlay is False:
+            return False
+        if overlay is True or overlay == {}:
+            return schema
+        if schema is True or schema == {}:
+            return overlay
+        if "$ref" in overlay:
+            overlay = self._dereference(schema=overlay)
+            return self._merge(schema, overlay)
+        if "$ref" in schema:
+            schema = self._dereference(schema=schema)
+            return self._merge(schema, overlay)
+
+        merged = dict(schema)
+        unmerged = {}
+        if not self._can_merge_objects(schema=schema, overlay=overlay):
+            unmerged.update({keyword: overlay[keyword] for keyword in _object_keywords if keyword in overlay})
+        if not self._can_merge_arrays(schema=schema, overlay=overlay):
+            unmerged.update({keyword: overlay[keyword] for keyword in _array_keywords if keyword in overlay})
+
+        for keyword, value in overlay.items():
+            if keyword in unmerged:
+                continue
+            if keyword not in merged:
+                merged[keyword] = value
+            elif keyword in _annotation_keywords or merged[keyword] == value:
+                continue
+            elif keyword == "properties":
+                merged[keyword] = {**merged[keyword]}
+                for name, subschema in value.items():
+                    merged[keyword][name] = self._merge(merged[keyword].get(name, True), subschema)
+            elif keyword == "items":
+                merged[keyword] = self._merge(merged[keyword], value)
+            elif keyword == "required":
+                merged[keyword] = [*merged[keyword], *[name for name in value if name not in merged[keyword]]]
+            elif keyword == "allOf":
+                merged[keyword] = [*merged[keyword], *value]
+            else:
+                unmerged[keyword] = value
+
+        if unmerged:
+            merged["allOf"] = [*merged.get("allOf", []), unmerged]
+        return merged
+
+    @staticmethod
+    def _can_merge_objects(schema: dict, overlay: dict) -> bool:
+        """
+        Checks whether object keywords in two schemas can be merged without changing which properties are additional
+
+        :type schema: dict
+        :param schema: JSON Schema
+        :type overlay: dict
+        :param overlay: JSON Schema
+
+        :rtype bool
+        :return: whether the object keywords in the overlay can be merged into the schema
+        """
+        if "patternProperties" in schema or "patternProperties" in overlay:
+            return False
+        if schema.get("additionalProperties", True) != overlay.get("additionalProperties", True):
+            if "additionalProperties" in schema and "additionalProperties" in overlay:
+                return False
+
+        properties = set(schema.get("properties", {}).keys())
+        overlay_properties = set(overlay.get("properties", {}).keys())
+        if schema.get("additionalProperties", True) is not True and not overlay_properties.issubset(properties):
+            return False
+        if overlay.get("additionalProperties", True) is not True and not properties.issubset(overlay_properties):
+            return False
+        return True
+
+    @staticmethod
+    def _can_merge_arrays(schema: dict, overlay: dict) -> bool:
+        """
+        Checks whether array keywords in two schemas can be merged, which is only the case for single `items` schemas
+
+        :type schema: dict
+        :param schema: JSON Schema
+        :type overlay: dict
+        :param overlay: JSON Schema
+
+        :rtype bool
+        :return: whether the array keywords in the overlay can be merged into the schema
+        """
+        for _schema in [schema, overlay]:
+            if isinstance(_schema.get("items"), list) or "additionalItems" in _schema:
+                return False
+        return True
@@ -0,0 +1,630 @@
+import json
+import re
+import threading
+
+from functools import lru_cache
+from typing import Callable, Dict, Iterable, Iterator, List, Sequence, Union
+
+from importlib_resources import path as resource_path
+from jsonschema import RefResolver, ValidationError
+from jsonschema.validators import extend, validator_for
+
+from bas_metadata_library.compiler import SchemaCompiler
+from bas_metadata_library.flattener import SchemaFlattener
+
+bundled_schema_packages = [
+    "bas_metadata_library.standards_schemas.iso_19115_1_v1",
+    "bas_metadata_library.standards_schemas.iso_19115_1_v1.profiles.inspire_v1_3",
+    "bas_metadata_library.standards_schemas.iso_19115_1_v1.profiles.uk_pdc_discovery_v1",
+    "bas_metadata_library.standards_schemas.iso_19115_2_v1",
+    "bas_metadata_library.standards_schemas.iso_19115_2_v1.profiles.inspire_v1_3",
+    "bas_metadata_library.standards_schemas.iso_19115_2_v1.profiles.uk_pdc_discovery_v1",
+]
+
+# JSON Schema keywords that don't constrain the members of an object or array (either because they are annotations,
+# or only apply to scalar values)
+_non_member_keywords = {
+    "$id",
+    "$schema",
+    "$comment",
+    "title",
+    "description",
+    "default",
+    "examples",
+    "readOnly",
+    "writeOnly",
+    "definitions",
+    "type",
+    "format",
+    "contentMediaType",
+    "contentEncoding",
+    "minLength",
+    "maxLength",
+    "pattern",
+    "minimum",
+    "maximum",
+    "exclusiveMinimum",
+    "exclusiveMaximum",
+    "multipleOf",
+}
+# JSON Schema keywords that apply to each member of an object or array individually
+_member_keywords = {"properties", "patternProperties", "additionalProperties", "items", "additionalItems", "allOf"}
+# JSON Schema keywords that can only be affected by members being added or removed
+_structural_keywords = {
+    "required",
+    "minProperties",
+    "maxProperties",
+    "propertyNames",
+    "dependencies",
+    "minItems",
+    "maxItems",
+}
+# Any other keyword (e.g. `contains`, `uniqueItems`, `enum`, `anyOf`) depends on members in combination
+
+_missing = object()
+
+
+@lru_cache(maxsize=None)
+def load_schema(package: str, resource: str = "configuration-schema.json") -> dict:
+    """
+    Loads a JSON Schema included as a resource file within a package
+
+    Schemas are loaded once and cached, the same schema object is returned for each call and so must not be modified.
+
+    :type package: str
+    :param package: dotted name of the package containing the schema, e.g. 'bas_metadata_library.standards_schemas.foo'
+    :type resource: str
+    :param resource: file name of the schema within the package
+
+    :rtype dict
+    :return: JSON Schema
+    """
+    with resource_path(package, resource) as schema_file_path:
+        with open(schema_file_path) as schema_file:
+            return json.load(schema_file)
+
+
+# Python types encoded as themselves when serialised as JSON, other values (e.g. dates and UUIDs) are encoded as strings
+_json_types = (dict, list, tuple, str, int, float, type(None))
+
+
+def is_string(checker, instance) -> bool:
+    """
+    JSON Schema type check for strings that also accepts values encoded as strings, such as Python dates and datetimes
+
+    Dates in configurations are Python date or datetime objects, but are defined as strings in configuration schemas
+    (as they are encoded as strings when serialised as JSON). This allows configurations to be validated without first
+    serialising them. Other values without a JSON type (e.g. UUIDs) are also encoded as strings, using `str()`.
+
+    :type checker: jsonschema.TypeChecker
+    :param checker: type checker
+    :type instance: any
+    :param instance: value to check
+
+    :rtype bool
+    :return: whether the value is a string, or a value encoded as a string
+    """
+    return isinstance(instance, str) or not isinstance(instance, _json_types)
+
+
+def is_array(checker, instance) -> bool:
+    """
+    JSON Schema type check for arrays that also accepts Python tuples
+
+    Tuples are encoded as arrays when serialised as JSON.
+
+    :type checker: jsonschema.TypeChecker
+    :param checker: type checker
+    :type instance: any
+    :param instance: value to check
+
+    :rtype bool
+    :return: whether the value is a list or tuple
+    """
+    return isinstance(instance, (list, tuple))
+
+
+def _string_keyword(keyword_validator: Callable) -> Callable:
+    """
+    Wraps a JSON Schema keyword validator for strings (e.g. `pattern`) to check values as they would be encoded
+
+    Keyword validators for strings assume values are `str` objects. Values accepted as strings by `is_string()` (e.g.
+    dates) are converted using `str()` before being checked, as when serialised as JSON.
+
+    :type keyword_validator: callable
+    :param keyword_validator: jsonschema keyword validator
+
+    :rtype callable
+    :return: keyword validator
+    """
+
+    def _validate(validator, value, instance, schema):
+        if not isinstance(instance, str) and validator.is_type(instance, "string"):
+            instance = str(instance)
+        return keyword_validator(validator, value, instance, schema)
+
+    return _validate
+
+
+@lru_cache(maxsize=None)
+def native_validator_class(validator_class):
+    """
+    Extends a JSON Schema validator class to validate Python values as they would be encoded as JSON
+
+    Dates, datetimes and other values encoded as strings (see `is_string()`) are validated as strings, including by
+    string keywords such as `pattern`. Tuples are validated as arrays.
+
+    :type validator_class: jsonschema validator class
+    :param validator_class: validator class to extend
+
+    :rtype jsonschema validator class
+    :return: validator class using the `is_string()` and `is_array()` type checks
+    """
+    return extend(
+        validator_class,
+        validators={
+            keyword: _string_keyword(validator_class.VALIDATORS[keyword])
+            for keyword in ["minLength", "maxLength", "pattern"]
+        },
+        type_checker=validator_class.TYPE_CHECKER.redefine_many({"string": is_string, "array": is_array}),
+    )
+
+
+class SchemaRegistry(object):
+    """
+    Indexes JSON Schemas by their identifier (`$id`)
+
+    Schemas for standards and profiles reference each other using absolute URIs (e.g. a profile schema will `$ref` the
+    schema of the standard it extends). These URIs resolve to copies of schemas published on the BAS Metadata Standards
+    website, however the same schemas are included as resource files in this package.
+
+    This registry maps each schema's `$id` to its bundled copy so references are resolved from memory. If a reference
+    is not in the registry it will be fetched remotely, unless the registry is set to offline mode, in which case a
+    `jsonschema.exceptions.RefResolutionError` will be raised instead.
+
+    Schemas in packages given to this registry are loaded when first needed.
+
+    The registry also compiles schemas into validators, which are cached and shared by all configurations using the
+    same schema. As jsonschema reference resolvers track their resolution scope while validating, validators are cached
+    per thread.
+
+    Schemas can also be compiled into Python functions (see `bas_metadata_library.compiler.SchemaCompiler`), which are
+    cached and shared across threads.
+
+    Schemas composed of other schemas (such as profiles) can be flattened into a single schema (see
+    `bas_metadata_library.flattener.SchemaFlattener`), which are also cached.
+    """
+
+    def __init__(self, packages: List[str] = None, offline: bool = False):
+        """
+        :type packages: list
+        :param packages: dotted names of packages containing schemas to register
+        :type offline: bool
+        :param offline: if True, references to schemas not in the registry will not be fetched remotely
+        """
+        self._offline = offline
+        self._packages = []
+        self._schemas = None
+        self._checked_schemas = {}
+        self._compiled = {}
+        self._flattened = {}
+        self._local = threading.local()
+
+        if packages is not None:
+            self._packages = packages
+
+    @property
+    def offline(self) -> bool:
+        """
+        Whether references to schemas not in the registry will be refused rather than fetched remotely
+
+        :rtype bool
+        :return: offline mode
+        """
+        return self._offline
+
+    @offline.setter
+    def offline(self, offline: bool) -> None:
+        self._offline = offline
+        self._compiled = {}
+        self._local = threading.local()
+
+    @property
+    def schemas(self) -> Dict[str, dict]:
+        """
+        Registered schemas indexed by their identifier
+
+        :rtype dict
+        :return: registered schemas
+        """
+        if self._schemas is None:
+            self._schemas = {}
+            for package in self._packages:
+                self.register(schema=load_schema(package=package))
+
+        return self._schemas
+
+    def register(self, schema: dict) -> None:
+        """
+        Adds a schema to the registry, replacing any existing schema with the same identifier
+
+        :type schema: dict
+        :param schema: JSON Schema, which must include an `$id` property
+        """
+        if "$id" not in schema:
+            raise ValueError("Schema cannot be registered as it does not have an identifier ('$id').")
+
+        self.schemas[schema["$id"].rstrip("#")] = schema
+        self._compiled = {}
+        self._flattened = {}
+        self._local = threading.local()
+
+    def get(self, schema_id: str) -> dict:
+        """
+        Returns a schema from the registry
+
+        :type schema_id: str
+        :param schema_id: schema identifier (`$id`)
+
+        :rtype dict
+        :return: JSON Schema
+        """
+        return self.schemas[schema_id.rstrip("#")]
+
+    def __contains__(self, schema_id: str) -> bool:
+        return schema_id.rstrip("#") in self.schemas
+
+    def resolver(self, schema: dict) -> RefResolver:
+        """
+        Creates a JSON Schema reference resolver for a schema using registered schemas
+
+        :type schema: dict
+        :param schema: JSON Schema references will be resolved relative to
+
+        :rtype RefResolver
+        :return: reference resolver
+        """
+        handlers = {}
+        if self.offline:
+            handlers = {"http": self._refuse_remote, "https": self._refuse_remote}
+
+        return RefResolver.from_schema(schema, store=self.schemas, handlers=handlers)
+
+    def validator(self, schema: dict):
+        """
+        Returns a validator for a schema
+
+        Validators for schemas with an identifier (`$id`) are compiled once per thread and then reused. Schemas are
+        checked against their meta-schema once when first compiled. Where a schema is invalid, a
+        `jsonschema.exceptions.SchemaError` exception will be raised.
+
+        :type schema: dict
+        :param schema: JSON Schema
+
+        :rtype jsonschema validator
+        :return: validator for schema, using a reference resolver for registered schemas
+        """
+        schema_id = schema.get("$id")
+        if schema_id is None:
+            return self._compile(schema=schema)
+
+        # load registered schemas first, as registering schemas resets cached validators
+        _ = self.schemas
+        if not hasattr(self._local, "validators"):
+            self._local.validators = {}
+        validator = self._local.validators.get(schema_id)
+        if validator is None or validator.schema is not schema:
+            validator = self._compile(schema=schema)
+            self._local.validators[schema_id] = validator
+
+        return validator
+
+    def compiled_validator(self, schema: dict) -> Callable[[object], bool]:
+        """
+        Returns a compiled validation function for a schema
+
+        Functions for schemas with an identifier (`$id`) are compiled once and then reused. Compiled functions only
+        return whether an instance is valid, use `validator()` to find any errors.
+
+        :type schema: dict
+        :param schema: JSON Schema
+
+        :rtype callable
+        :return: function taking an instance and returning whether it is valid against the schema
+        """
+        schema_id = schema.get("$id")
+        if schema_id is None:
+            return SchemaCompiler(resolver=self.resolver(schema=schema)).compile(schema=schema)
+
+        # load registered schemas first, as registering schemas resets compiled functions
+        _ = self.schemas
+        compiled = self._compiled.get(schema_id)
+        if compiled is None or compiled[0] is not schema:
+            compiled = (schema, SchemaCompiler(resolver=self.resolver(schema=schema)).compile(schema=schema))
+            self._compiled[schema_id] = compiled
+
+        return compiled[1]
+
+    def flattened(self, schema: dict) -> dict:
+        """
+        Returns a flattened version of a schema composed of other schemas using `allOf`
+
+        Flattened schemas for schemas with an identifier (`$id`) are created once and then reused. Schemas not using
+        `allOf` are returned as is.
+
+        :type schema: dict
+        :param schema: JSON Schema
+
+        :rtype dict
+        :return: flattened JSON Schema
+        """
+        schema_id = schema.get("$id")
+        if schema_id is None:
+            return SchemaFlattener(resolver=self.resolver(schema=schema)).flatten(schema=schema)
+
+        # load registered schemas first, as registering schemas resets flattened schemas
+        _ = self.schemas
+        flattened = self._flattened.get(schema_id)
+        if flattened is None or flattened[0] is not schema:
+            flattened = (schema, SchemaFlattener(resolver=self.resolver(schema=schema)).flatten(schema=schema))
+            self._flattened[schema_id] = flattened
+
+        return flattened[1]
+
+    def _compile(self, schema: dict):
+        """
+        Creates a validator for a schema, checking the schema is valid if it hasn't been checked before
+
+        Validators accept Python dates and datetimes as strings, see `native_validator_class()`.
+
+        :type schema: dict
+        :param schema: JSON Schema
+
+        :rtype jsonschema validator
+        :return: validator for schema
+        """
+        validator_class = native_validator_class(validator_for(schema))
+
+        schema_id = schema.get("$id")
+        if schema_id is None or self._checked_schemas.get(schema_id) is not schema:
+            validator_class.check_schema(schema)
+            if schema_id is not None:
+                self._checked_schemas[schema_id] = schema
+
+        return validator_class(schema, resolver=self.resolver(schema=schema))
+
+    @staticmethod
+    def _refuse_remote(uri: str) -> None:
+        """
+        Handler for remote references used in offline mode
+
+        The exception raised is re-raised by jsonschema as a `RefResolutionError`.
+
+        :type uri: str
+        :param uri: URI of the schema that would otherwise be fetched
+        """
+        raise RuntimeError(f"Schema '{uri}' is not in the schema registry and remote resolution is disabled.")
+
+
+schema_registry = SchemaRegistry(packages=bundled_schema_packages)
+
+
+def parse_json_pointer(pointer: Union[str, Sequence]) -> List[str]:
+    """
+    Splits a JSON Pointer (RFC 6901) into its reference tokens
+
+    E.g. '/resource/dates/0/date' becomes ['resource', 'dates', '0', 'date'].
+
+    If a sequence is given, it is assumed to already be a list of tokens and is returned as a list of strings.
+
+    :type pointer: str or sequence
+    :param pointer: JSON Pointer, or sequence of reference tokens
+
+    :rtype list
+    :return: reference tokens
+    """
+    if not isinstance(pointer, str):
+        return [str(token) for token in pointer]
+    if pointer == "":
+        return []
+    if not pointer.startswith("/"):
+        raise ValueError(f"JSON Pointer '{pointer}' is invalid, it must be empty or start with '/'.")
+
+    return [token.replace("~1", "/").replace("~0", "~") for token in pointer[1:].split("/")]
+
+
+def iter_changed_errors(
+    validator, instance, previous, changes: Iterable[Union[str, Sequence]]
+) -> Iterator[ValidationError]:
+    """
+    Yields errors in an instance that was valid before the values at some paths were changed
+
+    Rather than validating the whole instance, only the parts of the schema that apply to the changed values are used.
+    Where a change could affect a rule that depends on other values in the instance, the object or array containing
+    those values is validated instead. For example, where a property is added or removed from an object with required
+    properties, or an item in an array with a `contains` rule is changed. Where this applies to the root of the
+    instance (or the path to a change can't be followed), the whole instance is validated.
+
+    This means the time taken to validate a change depends on the size of the change, and the nesting of rules that
+    apply to it, rather than the size of the instance.
+
+    Changes are JSON Pointers to values that have been added, removed or replaced, as used in JSON Patch documents
+    (e.g. '/resource/abstract'). If the previous instance wasn't valid, errors in unchanged values may not be found.
+
+    Errors are the same as would be returned by `validator.iter_errors(instance)`, except their schema paths are
+    relative to the part of the schema used to validate them.
+
+    :type validator: jsonschema validator
+    :param validator: validator for the schema the instance is validated against
+    :type instance: any
+    :param instance: instance to validate
+    :type previous: any
+    :param previous: previous, valid, version of the instance
+    :type changes: iterable
+    :param changes: JSON Pointers (or sequences of reference tokens) to changed values
+
+    :rtype iterator
+    :return: JSON Schema validation errors
+    """
+    seen = set()
+    for change in changes:
+        errors = _changed_errors(
+            validator=validator,
+            schema=validator.schema,
+            instance=instance,
+            previous=previous,
+            tokens=parse_json_pointer(change),
+            path=[],
+        )
+        for error in errors:
+            key = (tuple(error.absolute_path), error.validator, error.message)
+            if key not in seen:
+                seen.add(key)
+                yield error
+
+
+def _changed_errors(validator, schema, instance, previous, tokens: List[str], path: list) -> List[ValidationError]:
+    """
+    Validates the parts of an instance affected by a change using the parts of a schema that apply to it
+
+    See `iter_changed_errors()` for details. This function calls itself for each level of the path to the change.
+
+    Errors are returned as a list, rather than yielded, so that references are resolved (which changes the scope of
+    the resolver) and validated against within the same context.
+
+    :type validator: jsonschema validator
+    :param validator: validator for the overall schema, used for its resolver
+    :type schema: dict or bool
+    :param schema: (sub-)schema that applies to the instance
+    :type instance: any
+    :param instance: (part of the) instance
+    :type previous: any
+    :param previous: (part of the) previous instance, or `_missing` if this part of the instance was added
+    :type tokens: list
+    :param tokens: remaining reference tokens to the changed value, relative to the instance
+    :type path: list
+    :param path: path to the instance from the root of the overall instance
+
+    :rtype list
+    :return: JSON Schema validation errors
+    """
+    if isinstance(schema, dict) and "$ref" in schema:
+        with validator.resolver.resolving(schema["$ref"]) as resolved:
+            return _changed_errors(
+                validator=validator, schema=resolved, instance=instance, previous=previous, tokens=tokens, path=path
+            )
+
+    member = None
+    if tokens and isinstance(schema, dict) and previous is not _missing:
+        member = _member(instance=instance, previous=previous, token=tokens[0])
+    if member is None:
+        return _subschema_errors(validator=validator, schema=schema, instance=instance, path=path)
+
+    key, value, previous_value = member
+    keywords = set(schema.keys()) - _non_member_keywords
+    structural_change = value is _missing or previous_value is _missing
+    if not keywords.issubset(_member_keywords | _structural_keywords) or (
+        structural_change and not keywords.isdisjoint(_structural_keywords)
+    ):
+        return _subschema_errors(validator=validator, schema=schema, instance=instance, path=path)
+
+    errors = []
+    for subschema in schema.get("allOf", []):
+        errors += _changed_errors(
+            validator=validator, schema=subschema, instance=instance, previous=previous, tokens=tokens, path=path
+        )
+    if value is _missing:
+        return errors
+
+    for subschema in _member_schemas(schema=schema, instance=instance, key=key):
+        errors += _changed_errors(
+            validator=validator,
+            schema=subschema,
+            instance=value,
+            previous=previous_value,
+            tokens=tokens[1:],
+            path=[*path, key],
+        )
+    return errors
+
+
+def _member(instance, previous, token: str):
+    """
+    Finds the member of an object or array a reference token refers to, in an instance and its previous version
+
+    For arrays, the member is only returned if the array has the same length in both versions, as otherwise the
+    positions of other items will have changed.
+
+    :type instance: any
+    :param instance: instance
+    :type previous: any
+    :param previous: previous version of instance
+    :type token: str
+    :param token: reference token
+
+    :rtype tuple or None
+    :return: key (or index), member value and previous member value (or `_missing` if not set), or None where the
+    path to the member can't be followed
+    """
+    if isinstance(instance, dict) and isinstance(previous, dict):
+        return token, instance.get(token, _missing), previous.get(token, _missing)
+    if isinstance(instance, list) and isinstance(previous, list) and len(instance) == len(previous):
+        if token.isdigit() and int(token) < len(instance):
+            return int(token), instance[int(token)], previous[int(token)]
+    return None
+
+
+def _member_schemas(schema: dict, instance, key: Union[str, int]) -> List[Union[dict, bool]]:
+    """
+    Returns the subschemas that apply to a member of an object or array
+
+    :type schema: dict
+    :param schema: schema for the object or array
+    :type instance: dict or list
+    :param instance: object or array
+    :type key: str or int
+    :param key: property name or item index of the member
+
+    :rtype list
+    :return: subschemas
+    """
+    if isinstance(instance, list):
+        items = schema.get("items", True)
+        if isinstance(items, list):
+            return [items[key]] if key < len(items) else [schema.get("additionalItems", True)]
+        return [items]
+
+    subschemas = []
+    if key in schema.get("properties", {}):
+        subschemas.append(schema["properties"][key])
+    for pattern, subschema in schema.get("patternProperties", {}).items():
+        if re.search(pattern, key):
+            subschemas.append(subschema)
+    if not subschemas:
+        subschemas.append(schema.get("additionalProperties", True))
+    return subschemas
+
+
+def _subschema_errors(validator, schema, instance, path: list) -> List[ValidationError]:
+    """
+    Validates (part of) an instance against a (sub-)schema
+
+    The validator's resolver is used, so any relative references are resolved in its current scope. Error paths are
+    made absolute by prefixing them with the path to the instance.
+
+    :type validator: jsonschema validator
+    :param validator: validator for the overall schema
+    :type schema: dict or bool
+    :param schema: (sub-)schema
+    :type instance: any
+    :param instance: (part of the) instance
+    :type path: list
+    :param path: path to the instance from the root of the overall instance
+
+    :rtype list
+    :return: JSON Schema validation errors
+    """
+    errors = list(type(validator)(schema, resolver=validator.resolver).iter_errors(instance))
+    for error in errors:
+        error.path.extendleft(reversed(path))
+    return errors
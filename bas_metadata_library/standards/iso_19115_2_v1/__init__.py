@@ -1,6 +1,4 @@
-import json
-
-from importlib_resources import path as resource_path
+from typing import List, Union
 
 # Exempting Bandit security issue (Using Element to parse untrusted XML data is known to be vulnerable to XML attacks)
 #
@@ -8,7 +6,10 @@ from importlib_resources import path as resource_path
 from lxml.etree import Element, fromstring  # nosec
 
 from bas_metadata_library import MetadataRecordConfig as _MetadataRecordConfig, MetadataRecord as _MetadataRecord
-from bas_metadata_library.standards.iso_19115_common import Namespaces
+from bas_metadata_library.citations import CitationResolver
+from bas_metadata_library.schemas import load_schema
+from bas_metadata_library.standards.iso_19115_common import Namespaces, tags
+from bas_metadata_library.standards.iso_19115_common.reader import LazyRecordConfig, read_record, read_record_lazy
 from bas_metadata_library.standards.iso_19115_common.root_element import ISOMetadataRecord
 
 
@@ -19,17 +20,14 @@ class MetadataRecordConfig(_MetadataRecordConfig):
     Defines the JSON Schema used for this metadata standard
     """
 
+    set_like_paths = ("contacts.role", "resource.contacts.role", "resource.topics")
+
     def __init__(self, **kwargs: dict):
         super().__init__(**kwargs)
 
         self.config = kwargs
 
-        with resource_path(
-            "bas_metadata_library.standards_schemas.iso_19115_2_v1", "configuration-schema.json"
-        ) as configuration_schema_file_path:
-            with open(configuration_schema_file_path) as configuration_schema_file:
-                configuration_schema_data = json.load(configuration_schema_file)
-        self.schema = configuration_schema_data
+        self.schema = load_schema(package="bas_metadata_library.standards_schemas.iso_19115_2_v1")
 
 
 class MetadataRecord(_MetadataRecord):
@@ -39,27 +37,71 @@ class MetadataRecord(_MetadataRecord):
     Defines the root element, and it's sub-elements, for this metadata standard
     """
 
-    def __init__(self, configuration: MetadataRecordConfig = None, record: str = None):
+    config_class = MetadataRecordConfig
+
+    def __init__(
+        self,
+        configuration: MetadataRecordConfig = None,
+        record: Union[str, bytes] = None,
+        citation_resolver: CitationResolver = None,
+    ):
+        """
+        :type configuration: MetadataRecordConfig
+        :param configuration: Metadata record configuration object
+        :type record: str or bytes
+        :param record: XML document string representing a record, or bytes, decoded using the encoding set in the
+        document's XML declaration (UTF-8 by default)
+        :type citation_resolver: CitationResolver
+        :param citation_resolver: resolver for citations of DOIs in required citations, by default citations are
+        requested from the DOI resolver each time a record is generated
+        """
         self.ns = Namespaces()
         self.attributes = {}
         self.record = Element(
-            f"{{{self.ns.gmi}}}MI_Metadata",
-            attrib={f"{{{self.ns.xsi}}}schemaLocation": self.ns.schema_locations()},
+            tags.gmi.MI_Metadata,
+            attrib={tags.xsi.schemaLocation: self.ns.schema_locations()},
             nsmap=self.ns.nsmap(),
         )
-        self.xpath = "/gmi:MI_Metadata"
 
         if configuration is not None:
             configuration.validate()
             self.attributes = configuration.config
 
         if record is not None:
-            self.record = fromstring(record.encode())
+            if isinstance(record, str):
+                record = record.encode()
+            self.record = fromstring(record)
 
-        self.metadata_record = ISOMetadataRecord(record=self.record, attributes=self.attributes, xpath=self.xpath)
+        self.metadata_record = ISOMetadataRecord(
+            record=self.record, attributes=self.attributes, citation_resolver=citation_resolver
+        )
 
-    def make_config(self) -> MetadataRecordConfig:
-        return MetadataRecordConfig(**self.metadata_record.make_config())
+    def make_config(
+        self, lazy: bool = False, fields: List[str] = None
+    ) -> Union[MetadataRecordConfig, LazyRecordConfig]:
+        """
+        Builds a metadata configuration object by parsing an existing XML record
+
+        Where lazy, a read-only view of the configuration is returned instead, parsing each section of the record only
+        when first accessed (see `LazyRecordConfig`). This is quicker where only some values are needed.
+
+        Where fields are set (e.g. ['file_identifier', 'resource.keywords']), only the parts of the record needed for
+        these values are parsed, and the configuration object contains only these values (see
+        `LazyRecordConfig.select()`). Partial configurations will not usually be valid.
+
+        :type lazy: bool
+        :param lazy: whether to return a view parsing each section of the record as needed
+        :type fields: list
+        :param fields: paths to values to include, if None all values are included
+
+        :rtype: MetadataRecordConfig or LazyRecordConfig
+        :return: Metadata record configuration object, or view
+        """
+        if lazy and fields is not None:
+            raise ValueError("Fields can't be set for a lazy configuration, use `select()` on the view instead.")
+        if lazy:
+            return read_record_lazy(record=self.record, root_tag=tags.gmi.MI_Metadata)
+        return MetadataRecordConfig(**read_record(record=self.record, root_tag=tags.gmi.MI_Metadata, fields=fields))
 
     def make_element(self) -> Element:
         return self.metadata_record.make_element()
@@ -1,8 +1,5 @@
-import json
-
-from importlib_resources import path as resource_path
-
 from bas_metadata_library import MetadataRecordConfig as _MetadataRecordConfig
+from bas_metadata_library.schemas import load_schema
 
 
 # Base classes
@@ -13,6 +10,9 @@ class MetadataRecordConfig(_MetadataRecordConfig):
     Overloaded base MetadataRecordConfig class
 
     Defines the JSON Schema used for this metadata standard
+
+    The profile schema is flattened into a single schema, rather than composing the schemas it extends, see
+    `bas_metadata_library.flattener.SchemaFlattener` for details.
     """
 
     def __init__(self, **kwargs: dict):
@@ -20,9 +20,6 @@ class MetadataRecordConfig(_MetadataRecordConfig):
 
         self.config = kwargs
 
-        with resource_path(
-            "bas_metadata_library.standards_schemas.iso_19115_2_v1.profiles.inspire_v1_3", "configuration-schema.json"
-        ) as configuration_schema_file_path:
-            with open(configuration_schema_file_path) as configuration_schema_file:
-                configuration_schema_data = json.load(configuration_schema_file)
-        self.schema = configuration_schema_data
+        self.schema = self.schema_registry.flattened(
+            schema=load_schema(package="bas_metadata_library.standards_schemas.iso_19115_2_v1.profiles.inspire_v1_3")
+        )
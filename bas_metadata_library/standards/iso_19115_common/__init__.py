@@ -1,9 +1,13 @@
+from typing import FrozenSet, Optional
+
 # Exempting Bandit security issue (Using Element to parse untrusted XML data is known to be vulnerable to XML attacks)
 #
 # We don't currently allow untrusted/user-provided XML so this is not a risk
 from lxml.etree import Element, SubElement  # nosec
 
 from bas_metadata_library import (
+    NamespaceMap,
+    NamespaceRegistry,
     Namespaces as _Namespaces,
     MetadataRecordElement as _MetadataRecordElement,
     MetadataRecord as _MetadataRecord,
@@ -40,21 +44,26 @@ class Namespaces(_Namespaces):
         "gts": "https://standards.iso.org/iso/19139/Schemas/gts/gts.xsd",
     }
 
-    def __init__(self):
-        self._namespaces = {
-            "gmd": self.gmd,
-            "gco": self.gco,
-            "gml": self.gml,
-            "gmx": self.gmx,
-            "srv": self.srv,
-            "xlink": self.xlink,
-            "xsi": self.xsi,
-            "gmi": self.gmi,
-            "gss": self.gss,
-            "gsr": self.gsr,
-            "gts": self.gts,
+    _namespaces = NamespaceMap(
+        {
+            "gmd": gmd,
+            "gco": gco,
+            "gml": gml,
+            "gmx": gmx,
+            "srv": srv,
+            "xlink": xlink,
+            "xsi": xsi,
+            "gmi": gmi,
+            "gss": gss,
+            "gsr": gsr,
+            "gts": gts,
         }
-        super().__init__(namespaces=self._namespaces)
+    )
+
+
+# Namespaces and qualified names (e.g. `tags.gmd.MD_Metadata`) shared by all ISO 19115 records and elements
+tags = NamespaceRegistry(namespaces=Namespaces._namespaces)
+namespaces = Namespaces()
 
 
 class MetadataRecordElement(_MetadataRecordElement):
@@ -64,61 +73,37 @@ class MetadataRecordElement(_MetadataRecordElement):
     Sets the type hint of the record attribute to the MetadataRecord class for this metadata standard
     """
 
+    __slots__ = ()
+
+    ns = namespaces  # type: Namespaces
+
     def __init__(
         self,
         record: _MetadataRecord,
         attributes: dict,
         parent_element: Element = None,
         element_attributes: dict = None,
-        xpath: str = None,
     ):
         super().__init__(
-            record=record,
-            attributes=attributes,
-            parent_element=parent_element,
-            element_attributes=element_attributes,
-            xpath=xpath,
+            record=record, attributes=attributes, parent_element=parent_element, element_attributes=element_attributes
         )
-        self.ns = Namespaces()
 
 
 class CodeListElement(MetadataRecordElement):
     """
     Derived MetadataRecordElement class defining an ISO code list element
+
+    The code list, its allowed values and the elements and configuration attribute used are the same for all instances
+    of each code list element, and so are set as class attributes in each derived class.
     """
 
-    def __init__(
-        self,
-        record: _MetadataRecord,
-        attributes: dict,
-        parent_element: Element = None,
-        element_attributes: dict = None,
-        xpath: str = None,
-    ):
-        super().__init__(
-            record=record,
-            attributes=attributes,
-            parent_element=parent_element,
-            element_attributes=element_attributes,
-            xpath=xpath,
-        )
-        self.code_list_values = []
-        self.code_list = None
-        self.element = None
-        self.element_code = None
-        self.attribute = None
-
-    def make_config(self) -> str:
-        _ = ""
-
-        value = self.record.xpath(
-            f"{self.xpath}[@codeList = '{self.code_list}']/@codeListValue",
-            namespaces=self.ns.nsmap(),
-        )
-        if len(value) == 1:
-            _ = value[0]
+    __slots__ = ()
 
-        return _
+    code_list_values = frozenset()  # type: FrozenSet[str]
+    code_list = None  # type: Optional[str]
+    element = None  # type: Optional[str]
+    element_code = None  # type: Optional[str]
+    attribute = None  # type: Optional[str]
 
     def make_element(self):
         code_list_element = SubElement(self.parent_element, self.element)
@@ -0,0 +1,114 @@
+from sys import intern
+from typing import Dict, FrozenSet, Iterator
+
+from importlib_resources import path as resource_path
+
+# Exempting Bandit security issue (Using Element to parse untrusted XML data is known to be vulnerable to XML attacks)
+#
+# The code list catalogue is a resource file within this package, rather than untrusted/user-provided XML
+from lxml.etree import parse  # nosec
+
+from bas_metadata_library.standards.iso_19115_common import tags
+
+gmx_code_lists_url = intern(
+    "http://standards.iso.org/ittf/PubliclyAvailableStandards/ISO_19139_Schemas/resources/codelist/gmxCodelists.xml"
+)
+cat_code_lists_url = intern("https://standards.iso.org/iso/19115/resources/Codelists/cat/codelists.xml")
+language_code_list_url = intern("http://www.loc.gov/standards/iso639-2/php/code_list.php")
+
+# URLs for code lists not referenced from the ISO 19139 code list catalogue (i.e. '{gmx_code_lists_url}#{name}')
+code_list_urls = {
+    "CI_DateTypeCode": f"{cat_code_lists_url}#CI_DateTypeCode",
+    "CI_RoleCode": f"{cat_code_lists_url}#CI_RoleCode",
+    "LanguageCode": language_code_list_url,
+}
+
+
+class CodeList(object):
+    """
+    An ISO code list, identified by its name (e.g. 'MD_ScopeCode'), with the URL used to reference it in records
+    (`codeList` attributes) and its allowed values (`codeListValue` attributes)
+    """
+
+    __slots__ = ("name", "url", "values")
+
+    def __init__(self, name: str, url: str, values: FrozenSet[str]):
+        """
+        :type name: str
+        :param name: code list name
+        :type url: str
+        :param url: code list URL
+        :type values: frozenset
+        :param values: allowed values
+        """
+        self.name = name
+        self.url = url
+        self.values = values
+
+
+class CodeListRegistry(object):
+    """
+    Read-only set of ISO code lists, indexed by name
+
+    Code lists are loaded from a code list catalogue (in the format used for the ISO 19139 `gmxCodelists.xml`) once,
+    and shared by all elements that use them. Allowed values are held as frozensets, so checking a value is allowed
+    takes the same time however many values a code list has. Names, URLs and values are interned strings.
+    """
+
+    def __init__(self, code_lists: Dict[str, CodeList]):
+        """
+        :type code_lists: dict
+        :param code_lists: code lists indexed by name
+        """
+        self._code_lists = code_lists
+
+    def __getitem__(self, name: str) -> CodeList:
+        return self._code_lists[name]
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._code_lists
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._code_lists)
+
+    def __len__(self) -> int:
+        return len(self._code_lists)
+
+    @classmethod
+    def load(
+        cls, package: str = "bas_metadata_library.standards.iso_19115_common", resource: str = "gmxCodelists.xml"
+    ) -> "CodeListRegistry":
+        """
+        Loads code lists from a code list catalogue included as a resource file within a package
+
+        Each code list dictionary in the catalogue is loaded as a code list, using the identifier of each definition
+        as an allowed value. URLs are set from `code_list_urls` or the ISO 19139 code list catalogue.
+
+        :type package: str
+        :param package: dotted name of the package containing the catalogue
+        :type resource: str
+        :param resource: file name of the catalogue within the package
+
+        :rtype CodeListRegistry
+        :return: code list registry
+        """
+        with resource_path(package, resource) as catalogue_path:
+            catalogue = parse(str(catalogue_path)).getroot()
+
+        code_lists = {}
+        for dictionary in catalogue.iterfind(f"{tags.gmx.codelistItem}/{tags.gmx.CodeListDictionary}"):
+            name = intern(dictionary.findtext(tags.gml.identifier))
+            values = frozenset(
+                intern(identifier.text)
+                for identifier in dictionary.iterfind(
+                    f"{tags.gmx.codeEntry}/{tags.gmx.CodeDefinition}/{tags.gml.identifier}"
+                )
+            )
+            url = intern(code_list_urls.get(name, f"{gmx_code_lists_url}#{name}"))
+            code_lists[name] = CodeList(name=name, url=url, values=values)
+
+        return cls(code_lists=code_lists)
+
+
+# Code lists shared by all ISO 19115 records and elements
+code_lists = CodeListRegistry.load()
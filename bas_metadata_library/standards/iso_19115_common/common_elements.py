@@ -1,4 +1,3 @@
-from copy import deepcopy
 from datetime import datetime
 
 # Exempting Bandit security issue (Using Element to parse untrusted XML data is known to be vulnerable to XML attacks)
@@ -6,221 +5,40 @@ from datetime import datetime
 # We don't currently allow untrusted/user-provided XML so this is not a risk
 from lxml.etree import SubElement, Element  # nosec
 
-from bas_metadata_library import MetadataRecord as _MetadataRecord, MetadataRecord
-from bas_metadata_library.standards.iso_19115_common import MetadataRecordElement, CodeListElement
+from bas_metadata_library import MetadataRecord
+from bas_metadata_library.standards.iso_19115_common import MetadataRecordElement, CodeListElement, tags
+from bas_metadata_library.standards.iso_19115_common.code_lists import code_lists
 from bas_metadata_library.standards.iso_19115_common.utils import format_date_string
 
 
 class Language(CodeListElement):
-    def __init__(
-        self,
-        record: MetadataRecord,
-        attributes: dict,
-        parent_element: Element = None,
-        element_attributes: dict = None,
-        xpath: str = None,
-    ):
-        super().__init__(
-            record=record,
-            attributes=attributes,
-            parent_element=parent_element,
-            element_attributes=element_attributes,
-            xpath=f"{xpath}/gmd:LanguageCode",
-        )
-        self.code_list_values = ["eng"]
-        self.code_list = "http://www.loc.gov/standards/iso639-2/php/code_list.php"
-        self.element = f"{{{self.ns.gmd}}}language"
-        self.element_code = f"{{{self.ns.gmd}}}LanguageCode"
-        self.attribute = "language"
+    __slots__ = ()
 
-
-class CharacterSet(CodeListElement):
-    def __init__(
-        self,
-        record: MetadataRecord,
-        attributes: dict,
-        parent_element: Element = None,
-        element_attributes: dict = None,
-        xpath: str = None,
-    ):
-        super().__init__(
-            record=record,
-            attributes=attributes,
-            parent_element=parent_element,
-            element_attributes=element_attributes,
-            xpath=f"{xpath}/gmd:MD_CharacterSetCode",
-        )
-        self.code_list_values = ["utf-8"]
-        self.code_list = (
-            "http://standards.iso.org/ittf/PubliclyAvailableStandards/ISO_19139_Schemas/resources/"
-            "codelist/gmxCodelists.xml#MD_CharacterSetCode"
-        )
-        self.element = f"{{{self.ns.gmd}}}characterSet"
-        self.element_code = f"{{{self.ns.gmd}}}MD_CharacterSetCode"
-        self.attribute = "character_set"
+    code_list_values = code_lists["LanguageCode"].values
+    code_list = code_lists["LanguageCode"].url
+    element = tags.gmd.language
+    element_code = tags.gmd.LanguageCode
+    attribute = "language"
 
 
-class ResponsibleParty(MetadataRecordElement):
-    def __init__(
-        self,
-        record: _MetadataRecord,
-        attributes: dict,
-        parent_element: Element = None,
-        element_attributes: dict = None,
-        xpath: str = None,
-    ):
-        super().__init__(record, attributes, parent_element, element_attributes, xpath)
-
-    def make_config(self) -> dict:
-        _ = {}
-
-        individual_name = self.record.xpath(
-            f"{ self.xpath }/gmd:CI_ResponsibleParty/gmd:individualName/gmx:Anchor/text() | "
-            f"{ self.xpath }/gmd:CI_ResponsibleParty/gmd:individualName/gco:CharacterString/text()",
-            namespaces=self.ns.nsmap(),
-        )
-        if len(individual_name) > 0:
-            if "individual" not in _.keys():
-                _["individual"] = {}
-            _["individual"]["name"] = individual_name[0]
-
-        individual_href = self.record.xpath(
-            f"{ self.xpath }/gmd:CI_ResponsibleParty/gmd:individualName/gmx:Anchor/@xlink:href",
-            namespaces=self.ns.nsmap(),
-        )
-        if len(individual_href) > 0:
-            if "individual" not in _.keys():  # pragma: no cover
-                _["individual"] = {}
-            _["individual"]["href"] = individual_href[0]
-
-        individual_title = self.record.xpath(
-            f"{ self.xpath }/gmd:CI_ResponsibleParty/gmd:individualName/gmx:Anchor/@xlink:title",
-            namespaces=self.ns.nsmap(),
-        )
-        if len(individual_title) > 0:
-            if "individual" not in _.keys():  # pragma: no cover
-                _["individual"] = {}
-            _["individual"]["title"] = individual_title[0]
-
-        organisation_name = self.record.xpath(
-            f"{ self.xpath }/gmd:CI_ResponsibleParty/gmd:organisationName/gmx:Anchor/text() | "
-            f"{ self.xpath }/gmd:CI_ResponsibleParty/gmd:organisationName/gco:CharacterString/text()",
-            namespaces=self.ns.nsmap(),
-        )
-        if len(organisation_name) > 0:
-            if "organisation" not in _.keys():  # pragma: no cover
-                _["organisation"] = {}
-            _["organisation"]["name"] = organisation_name[0]
-
-        organisation_href = self.record.xpath(
-            f"{ self.xpath }/gmd:CI_ResponsibleParty/gmd:organisationName/gmx:Anchor/@xlink:href",
-            namespaces=self.ns.nsmap(),
-        )
-        if len(organisation_href) > 0:
-            if "organisation" not in _.keys():  # pragma: no cover
-                _["organisation"] = {}
-            _["organisation"]["href"] = organisation_href[0]
-
-        organisation_title = self.record.xpath(
-            f"{ self.xpath }/gmd:CI_ResponsibleParty/gmd:organisationName/gmx:Anchor/@xlink:title",
-            namespaces=self.ns.nsmap(),
-        )
-        if len(organisation_title) > 0:
-            if "organisation" not in _.keys():  # pragma: no cover
-                _["organisation"] = {}
-            _["organisation"]["title"] = organisation_title[0]
-
-        phone_value = self.record.xpath(
-            f"{self.xpath}/gmd:CI_ResponsibleParty/gmd:contactInfo/gmd:CI_Contact/gmd:phone/"
-            f"gmd:CI_Telephone/gmd:voice/gco:CharacterString/text()",
-            namespaces=self.ns.nsmap(),
-        )
-        if len(phone_value) > 0:
-            _["phone"] = phone_value[0]
+class CharacterSet(CodeListElement):
+    __slots__ = ()
 
-        delivery_point_value = self.record.xpath(
-            f"{self.xpath}/gmd:CI_ResponsibleParty/gmd:contactInfo/gmd:CI_Contact/gmd:address/"
-            f"gmd:CI_Address/gmd:deliveryPoint/gco:CharacterString/text()",
-            namespaces=self.ns.nsmap(),
-        )
-        if len(delivery_point_value) > 0:
-            if "address" not in _.keys():
-                _["address"] = {}
-            _["address"]["delivery_point"] = delivery_point_value[0]
-
-        city_value = self.record.xpath(
-            f"{self.xpath}/gmd:CI_ResponsibleParty/gmd:contactInfo/gmd:CI_Contact/gmd:address/"
-            f"gmd:CI_Address/gmd:city/gco:CharacterString/text()",
-            namespaces=self.ns.nsmap(),
-        )
-        if len(city_value) > 0:
-            if "address" not in _.keys():  # pragma: no cover
-                _["address"] = {}
-            _["address"]["city"] = city_value[0]
-
-        administrative_area_value = self.record.xpath(
-            f"{self.xpath}/gmd:CI_ResponsibleParty/gmd:contactInfo/gmd:CI_Contact/gmd:address/"
-            f"gmd:CI_Address/gmd:administrativeArea/gco:CharacterString/text()",
-            namespaces=self.ns.nsmap(),
-        )
-        if len(administrative_area_value) > 0:
-            if "address" not in _.keys():  # pragma: no cover
-                _["address"] = {}
-            _["address"]["administrative_area"] = administrative_area_value[0]
-
-        postal_code_value = self.record.xpath(
-            f"{self.xpath}/gmd:CI_ResponsibleParty/gmd:contactInfo/gmd:CI_Contact/gmd:address/"
-            f"gmd:CI_Address/gmd:postalCode/gco:CharacterString/text()",
-            namespaces=self.ns.nsmap(),
-        )
-        if len(postal_code_value) > 0:
-            if "address" not in _.keys():  # pragma: no cover
-                _["address"] = {}
-            _["address"]["postal_code"] = postal_code_value[0]
-
-        country_value = self.record.xpath(
-            f"{self.xpath}/gmd:CI_ResponsibleParty/gmd:contactInfo/gmd:CI_Contact/gmd:address/"
-            f"gmd:CI_Address/gmd:country/gco:CharacterString/text()",
-            namespaces=self.ns.nsmap(),
-        )
-        if len(country_value) > 0:
-            if "address" not in _.keys():  # pragma: no cover
-                _["address"] = {}
-            _["address"]["country"] = country_value[0]
-
-        email_value = self.record.xpath(
-            f"{self.xpath}/gmd:CI_ResponsibleParty/gmd:contactInfo/gmd:CI_Contact/gmd:address/"
-            f"gmd:CI_Address/gmd:electronicMailAddress/gco:CharacterString/text()",
-            namespaces=self.ns.nsmap(),
-        )
-        if len(email_value) > 0:
-            _["email"] = email_value[0]
+    code_list_values = code_lists["MD_CharacterSetCode"].values
+    code_list = code_lists["MD_CharacterSetCode"].url
+    element = tags.gmd.characterSet
+    element_code = tags.gmd.MD_CharacterSetCode
+    attribute = "character_set"
 
-        online_resource = OnlineResource(
-            record=self.record,
-            attributes=self.attributes,
-            xpath=f"{self.xpath}/gmd:CI_ResponsibleParty/gmd:contactInfo/gmd:CI_Contact/gmd:onlineResource",
-        )
-        _online_resource = online_resource.make_config()
-        if list(_online_resource.keys()) == ["function"] and _online_resource["function"] == "":  # pragma: no cover
-            _online_resource = {}
-        if bool(_online_resource):
-            _["online_resource"] = _online_resource
-
-        role = Role(
-            record=self.record, attributes=self.attributes, xpath=f"{self.xpath}/gmd:CI_ResponsibleParty/gmd:role"
-        )
-        _role = role.make_config()
-        if _role != "":
-            _["role"] = [_role]
 
-        return _
+class ResponsibleParty(MetadataRecordElement):
+    __slots__ = ()
 
     def make_element(self):
-        responsible_party_element = SubElement(self.parent_element, f"{{{self.ns.gmd}}}CI_ResponsibleParty")
+        responsible_party_element = SubElement(self.parent_element, tags.gmd.CI_ResponsibleParty)
 
         if "individual" in self.element_attributes and "name" in self.element_attributes["individual"]:
-            individual_element = SubElement(responsible_party_element, f"{{{self.ns.gmd}}}individualName")
+            individual_element = SubElement(responsible_party_element, tags.gmd.individualName)
             if "href" in self.element_attributes["individual"]:
                 anchor = AnchorElement(
                     record=self.record,
@@ -231,11 +49,11 @@ class ResponsibleParty(MetadataRecordElement):
                 )
                 anchor.make_element()
             else:
-                individual_value = SubElement(individual_element, f"{{{self.ns.gco}}}CharacterString")
+                individual_value = SubElement(individual_element, tags.gco.CharacterString)
                 individual_value.text = self.element_attributes["individual"]["name"]
 
         if "organisation" in self.element_attributes and "name" in self.element_attributes["organisation"]:
-            organisation_element = SubElement(responsible_party_element, f"{{{self.ns.gmd}}}organisationName")
+            organisation_element = SubElement(responsible_party_element, tags.gmd.organisationName)
             if "href" in self.element_attributes["organisation"]:
                 anchor = AnchorElement(
                     record=self.record,
@@ -246,7 +64,7 @@ class ResponsibleParty(MetadataRecordElement):
                 )
                 anchor.make_element()
             else:
-                organisation_name_value = SubElement(organisation_element, f"{{{self.ns.gco}}}CharacterString")
+                organisation_name_value = SubElement(organisation_element, tags.gco.CharacterString)
                 organisation_name_value.text = self.element_attributes["organisation"]["name"]
 
         if (
@@ -255,59 +73,55 @@ class ResponsibleParty(MetadataRecordElement):
             or "email" in self.element_attributes
             or "online_resource" in self.element_attributes
         ):
-            contact_wrapper = SubElement(responsible_party_element, f"{{{self.ns.gmd}}}contactInfo")
-            contact_element = SubElement(contact_wrapper, f"{{{self.ns.gmd}}}CI_Contact")
+            contact_wrapper = SubElement(responsible_party_element, tags.gmd.contactInfo)
+            contact_element = SubElement(contact_wrapper, tags.gmd.CI_Contact)
 
             if "phone" in self.element_attributes:
-                phone_wrapper = SubElement(contact_element, f"{{{self.ns.gmd}}}phone")
-                phone_element = SubElement(phone_wrapper, f"{{{self.ns.gmd}}}CI_Telephone")
-                phone_voice = SubElement(phone_element, f"{{{self.ns.gmd}}}voice")
-                phone_voice_value = SubElement(phone_voice, f"{{{self.ns.gco}}}CharacterString")
+                phone_wrapper = SubElement(contact_element, tags.gmd.phone)
+                phone_element = SubElement(phone_wrapper, tags.gmd.CI_Telephone)
+                phone_voice = SubElement(phone_element, tags.gmd.voice)
+                phone_voice_value = SubElement(phone_voice, tags.gco.CharacterString)
                 phone_voice_value.text = self.element_attributes["phone"]
 
             if "address" in self.element_attributes or "email" in self.element_attributes:
-                address_wrapper = SubElement(contact_element, f"{{{self.ns.gmd}}}address")
-                address_element = SubElement(address_wrapper, f"{{{self.ns.gmd}}}CI_Address")
+                address_wrapper = SubElement(contact_element, tags.gmd.address)
+                address_element = SubElement(address_wrapper, tags.gmd.CI_Address)
 
                 if "address" in self.element_attributes:
                     if "delivery_point" in self.element_attributes["address"]:
-                        delivery_point_element = SubElement(address_element, f"{{{self.ns.gmd}}}deliveryPoint")
-                        delivery_point_value = SubElement(delivery_point_element, f"{{{self.ns.gco}}}CharacterString")
+                        delivery_point_element = SubElement(address_element, tags.gmd.deliveryPoint)
+                        delivery_point_value = SubElement(delivery_point_element, tags.gco.CharacterString)
                         delivery_point_value.text = self.element_attributes["address"]["delivery_point"]
                     if "city" in self.element_attributes["address"]:
-                        city_element = SubElement(address_element, f"{{{self.ns.gmd}}}city")
-                        city_value = SubElement(city_element, f"{{{self.ns.gco}}}CharacterString")
+                        city_element = SubElement(address_element, tags.gmd.city)
+                        city_value = SubElement(city_element, tags.gco.CharacterString)
                         city_value.text = self.element_attributes["address"]["city"]
                     if "administrative_area" in self.element_attributes["address"]:
-                        administrative_area_element = SubElement(
-                            address_element, f"{{{self.ns.gmd}}}administrativeArea"
-                        )
-                        administrative_area_value = SubElement(
-                            administrative_area_element, f"{{{self.ns.gco}}}CharacterString"
-                        )
+                        administrative_area_element = SubElement(address_element, tags.gmd.administrativeArea)
+                        administrative_area_value = SubElement(administrative_area_element, tags.gco.CharacterString)
                         administrative_area_value.text = self.element_attributes["address"]["administrative_area"]
                     if "postal_code" in self.element_attributes["address"]:
-                        postal_code_element = SubElement(address_element, f"{{{self.ns.gmd}}}postalCode")
-                        postal_code_value = SubElement(postal_code_element, f"{{{self.ns.gco}}}CharacterString")
+                        postal_code_element = SubElement(address_element, tags.gmd.postalCode)
+                        postal_code_value = SubElement(postal_code_element, tags.gco.CharacterString)
                         postal_code_value.text = self.element_attributes["address"]["postal_code"]
                     if "country" in self.element_attributes["address"]:
-                        country_element = SubElement(address_element, f"{{{self.ns.gmd}}}country")
-                        country_value = SubElement(country_element, f"{{{self.ns.gco}}}CharacterString")
+                        country_element = SubElement(address_element, tags.gmd.country)
+                        country_value = SubElement(country_element, tags.gco.CharacterString)
                         country_value.text = self.element_attributes["address"]["country"]
 
                 if "email" in self.element_attributes:
-                    email_element = SubElement(address_element, f"{{{self.ns.gmd}}}electronicMailAddress")
-                    email_value = SubElement(email_element, f"{{{self.ns.gco}}}CharacterString")
+                    email_element = SubElement(address_element, tags.gmd.electronicMailAddress)
+                    email_value = SubElement(email_element, tags.gco.CharacterString)
                     email_value.text = self.element_attributes["email"]
                 else:
                     SubElement(
                         address_element,
-                        f"{{{self.ns.gmd}}}electronicMailAddress",
-                        attrib={f"{{{self.ns.gco}}}nilReason": "unknown"},
+                        tags.gmd.electronicMailAddress,
+                        attrib={tags.gco.nilReason: "unknown"},
                     )
 
             if "online_resource" in self.element_attributes:
-                online_resource_wrapper = SubElement(contact_element, f"{{{self.ns.gmd}}}onlineResource")
+                online_resource_wrapper = SubElement(contact_element, tags.gmd.onlineResource)
                 online_resource = OnlineResource(
                     record=self.record,
                     attributes=self.attributes,
@@ -327,45 +141,10 @@ class ResponsibleParty(MetadataRecordElement):
 
 
 class OnlineResource(MetadataRecordElement):
-    def make_config(self) -> dict:
-        _ = {}
-
-        linkage = Linkage(
-            record=self.record,
-            attributes=self.attributes,
-            xpath=f"{ self.xpath }/gmd:CI_OnlineResource/gmd:linkage",
-        )
-        _linkage = linkage.make_config()
-        if "href" in _linkage.keys():
-            _["href"] = _linkage["href"]
-
-        name_value = self.record.xpath(
-            f"{self.xpath}/gmd:CI_OnlineResource/gmd:name/gco:CharacterString/text()",
-            namespaces=self.ns.nsmap(),
-        )
-        if len(name_value) > 0:
-            _["title"] = name_value[0]
-
-        description_value = self.record.xpath(
-            f"{self.xpath}/gmd:CI_OnlineResource/gmd:description/gco:CharacterString/text()",
-            namespaces=self.ns.nsmap(),
-        )
-        if len(description_value) > 0:
-            _["description"] = description_value[0]
-
-        function = OnlineRole(
-            record=self.record,
-            attributes=self.attributes,
-            xpath=f"{self.xpath}/gmd:CI_OnlineResource/gmd:function",
-        )
-        _function = function.make_config()
-        if _function != "":
-            _["function"] = _function
-
-        return _
+    __slots__ = ()
 
     def make_element(self):
-        online_resource_element = SubElement(self.parent_element, f"{{{self.ns.gmd}}}CI_OnlineResource")
+        online_resource_element = SubElement(self.parent_element, tags.gmd.CI_OnlineResource)
 
         if "href" in self.element_attributes:
             linkage = Linkage(
@@ -377,13 +156,13 @@ class OnlineResource(MetadataRecordElement):
             linkage.make_element()
 
         if "title" in self.element_attributes:
-            title_wrapper = SubElement(online_resource_element, f"{{{self.ns.gmd}}}name")
-            title_element = SubElement(title_wrapper, f"{{{self.ns.gco}}}CharacterString")
+            title_wrapper = SubElement(online_resource_element, tags.gmd.name)
+            title_element = SubElement(title_wrapper, tags.gco.CharacterString)
             title_element.text = self.element_attributes["title"]
 
         if "description" in self.element_attributes:
-            title_wrapper = SubElement(online_resource_element, f"{{{self.ns.gmd}}}description")
-            title_element = SubElement(title_wrapper, f"{{{self.ns.gco}}}CharacterString")
+            title_wrapper = SubElement(online_resource_element, tags.gmd.description)
+            title_element = SubElement(title_wrapper, tags.gco.CharacterString)
             title_element.text = self.element_attributes["description"]
 
         if "function" in self.element_attributes:
@@ -397,137 +176,40 @@ class OnlineResource(MetadataRecordElement):
 
 
 class Linkage(MetadataRecordElement):
-    def make_config(self) -> dict:
-        _ = {}
-
-        url_value = self.record.xpath(
-            f"{self.xpath}/gmd:URL/text()",
-            namespaces=self.ns.nsmap(),
-        )
-        if len(url_value) > 0:
-            _["href"] = url_value[0]
-
-        return _
+    __slots__ = ()
 
     def make_element(self):
-        linkage_element = SubElement(self.parent_element, f"{{{self.ns.gmd}}}linkage")
+        linkage_element = SubElement(self.parent_element, tags.gmd.linkage)
         if "href" in self.element_attributes:
-            url_value = SubElement(linkage_element, f"{{{self.ns.gmd}}}URL")
+            url_value = SubElement(linkage_element, tags.gmd.URL)
             url_value.text = self.element_attributes["href"]
 
 
 class Role(CodeListElement):
-    def __init__(
-        self,
-        record: MetadataRecord,
-        attributes: dict,
-        parent_element: Element = None,
-        element_attributes: dict = None,
-        xpath: str = None,
-    ):
-        super().__init__(
-            record=record,
-            attributes=attributes,
-            parent_element=parent_element,
-            element_attributes=element_attributes,
-            xpath=f"{xpath}/gmd:CI_RoleCode",
-        )
-        self.code_list_values = [
-            "author",
-            "custodian",
-            "distributor",
-            "originator",
-            "owner",
-            "pointOfContact",
-            "principalInvestigator",
-            "processor",
-            "publisher",
-            "resourceProvider",
-            "sponsor",
-            "user",
-            "coAuthor",
-            "collaborator",
-            "contributor",
-            "editor",
-            "funder",
-            "mediator",
-            "rightsHolder",
-            "stakeholder",
-        ]
-        self.code_list = "https://standards.iso.org/iso/19115/resources/Codelists/cat/codelists.xml#CI_RoleCode"
-        self.element = f"{{{self.ns.gmd}}}role"
-        self.element_code = f"{{{self.ns.gmd}}}CI_RoleCode"
-        self.attribute = "role"
+    __slots__ = ()
 
-
-class OnlineRole(CodeListElement):
-    def __init__(
-        self,
-        record: MetadataRecord,
-        attributes: dict,
-        parent_element: Element = None,
-        element_attributes: dict = None,
-        xpath: str = None,
-    ):
-        super().__init__(
-            record=record,
-            attributes=attributes,
-            parent_element=parent_element,
-            element_attributes=element_attributes,
-            xpath=f"{xpath}/gmd:CI_OnLineFunctionCode",
-        )
-        self.code_list_values = ["download", "information", "offlineAccess", "order", "search"]
-        self.code_list = (
-            "http://standards.iso.org/ittf/PubliclyAvailableStandards/ISO_19139_Schemas/resources/"
-            "codelist/gmxCodelists.xml#CI_OnLineFunctionCode"
-        )
-        self.element = f"{{{self.ns.gmd}}}function"
-        self.element_code = f"{{{self.ns.gmd}}}CI_OnLineFunctionCode"
-        self.attribute = "function"
+    code_list_values = code_lists["CI_RoleCode"].values
+    code_list = code_lists["CI_RoleCode"].url
+    element = tags.gmd.role
+    element_code = tags.gmd.CI_RoleCode
+    attribute = "role"
 
 
-class MaintenanceInformation(MetadataRecordElement):
-    def __init__(
-        self,
-        record: _MetadataRecord,
-        attributes: dict,
-        parent_element: Element = None,
-        element_attributes: dict = None,
-        xpath: str = None,
-    ):
-        super().__init__(
-            record=record,
-            attributes=attributes,
-            parent_element=parent_element,
-            element_attributes=element_attributes,
-            xpath=f"{xpath}/gmd:MD_MaintenanceInformation",
-        )
-
-    def make_config(self) -> dict:
-        _ = {}
+class OnlineRole(CodeListElement):
+    __slots__ = ()
 
-        maintenance_frequency = MaintenanceAndUpdateFrequency(
-            record=self.record,
-            attributes=self.attributes,
-            xpath=f"{self.xpath}/gmd:maintenanceAndUpdateFrequency",
-        )
-        _maintenance_frequency = maintenance_frequency.make_config()
-        if _maintenance_frequency != "":
-            _["maintenance_frequency"] = _maintenance_frequency
+    code_list_values = code_lists["CI_OnLineFunctionCode"].values
+    code_list = code_lists["CI_OnLineFunctionCode"].url
+    element = tags.gmd.function
+    element_code = tags.gmd.CI_OnLineFunctionCode
+    attribute = "function"
 
-        progress = MaintenanceProgress(
-            record=self.record,
-            attributes=self.attributes,
-            xpath=f"{self.xpath}/gmd:maintenanceNote",
-        )
-        _progress = progress.make_config()
-        if _progress != "":
-            _["progress"] = _progress
 
-        return _
+class MaintenanceInformation(MetadataRecordElement):
+    __slots__ = ()
 
     def make_element(self):
-        maintenance_element = SubElement(self.parent_element, f"{{{self.ns.gmd}}}MD_MaintenanceInformation")
+        maintenance_element = SubElement(self.parent_element, tags.gmd.MD_MaintenanceInformation)
 
         if "maintenance_frequency" in self.element_attributes:
             maintenance_and_update_frequency = MaintenanceAndUpdateFrequency(
@@ -549,167 +231,33 @@ class MaintenanceInformation(MetadataRecordElement):
 
 
 class MaintenanceAndUpdateFrequency(CodeListElement):
-    def __init__(
-        self,
-        record: MetadataRecord,
-        attributes: dict,
-        parent_element: Element = None,
-        element_attributes: dict = None,
-        xpath: str = None,
-    ):
-        super().__init__(
-            record=record,
-            attributes=attributes,
-            parent_element=parent_element,
-            element_attributes=element_attributes,
-            xpath=f"{xpath}/gmd:MD_MaintenanceFrequencyCode",
-        )
-        self.code_list_values = [
-            "continual",
-            "daily",
-            "weekly",
-            "fortnightly",
-            "monthly",
-            "quarterly",
-            "biannually",
-            "annually",
-            "asNeeded",
-            "irregular",
-            "notPlanned",
-            "unknown",
-        ]
-        self.code_list = (
-            "http://standards.iso.org/ittf/PubliclyAvailableStandards/ISO_19139_Schemas/resources/"
-            "codelist/gmxCodelists.xml#MD_MaintenanceFrequencyCode"
-        )
-        self.element = f"{{{self.ns.gmd}}}maintenanceAndUpdateFrequency"
-        self.element_code = f"{{{self.ns.gmd}}}MD_MaintenanceFrequencyCode"
-        self.attribute = "maintenance_frequency"
+    __slots__ = ()
 
+    code_list_values = code_lists["MD_MaintenanceFrequencyCode"].values
+    code_list = code_lists["MD_MaintenanceFrequencyCode"].url
+    element = tags.gmd.maintenanceAndUpdateFrequency
+    element_code = tags.gmd.MD_MaintenanceFrequencyCode
+    attribute = "maintenance_frequency"
 
-class MaintenanceProgress(CodeListElement):
-    def __init__(
-        self,
-        record: MetadataRecord,
-        attributes: dict,
-        parent_element: Element = None,
-        element_attributes: dict = None,
-        xpath: str = None,
-    ):
-        super().__init__(
-            record=record,
-            attributes=attributes,
-            parent_element=parent_element,
-            element_attributes=element_attributes,
-            xpath=f"{xpath}/gmd:MD_ProgressCode",
-        )
-        self.code_list_values = [
-            "completed",
-            "historicalArchive",
-            "obsolete",
-            "onGoing",
-            "planned",
-            "required",
-            "underDevelopment",
-        ]
-        self.code_list = (
-            "http://standards.iso.org/ittf/PubliclyAvailableStandards/ISO_19139_Schemas/resources/"
-            "codelist/gmxCodelists.xml#MD_ProgressCode"
-        )
-        self.element = f"{{{self.ns.gmd}}}maintenanceNote"
-        self.element_code = f"{{{self.ns.gmd}}}MD_ProgressCode"
-        self.attribute = "progress"
 
+class MaintenanceProgress(CodeListElement):
+    __slots__ = ()
 
-class Citation(MetadataRecordElement):
-    def __init__(
-        self,
-        record: _MetadataRecord,
-        attributes: dict,
-        parent_element: Element = None,
-        element_attributes: dict = None,
-        xpath: str = None,
-    ):
-        super().__init__(
-            record=record,
-            attributes=attributes,
-            parent_element=parent_element,
-            element_attributes=element_attributes,
-            xpath=f"{xpath}/gmd:CI_Citation",
-        )
+    code_list_values = code_lists["MD_ProgressCode"].values
+    code_list = code_lists["MD_ProgressCode"].url
+    element = tags.gmd.maintenanceNote
+    element_code = tags.gmd.MD_ProgressCode
+    attribute = "progress"
 
-    def make_config(self) -> dict:
-        _ = {}
 
-        title_value = self.record.xpath(
-            f"{self.xpath}/gmd:title/gco:CharacterString/text() | {self.xpath}/gmd:title/gmx:Anchor/text()",
-            namespaces=self.ns.nsmap(),
-        )
-        if len(title_value) == 1:
-            if "title" not in _.keys():
-                _["title"] = {}
-            _["title"]["value"] = title_value[0]
-
-        title_href = self.record.xpath(f"{self.xpath}/gmd:title/gmx:Anchor/@xlink:href", namespaces=self.ns.nsmap())
-        if len(title_href) == 1:
-            if "title" not in _.keys():  # pragma: no cover
-                _["title"] = {}
-            _["title"]["href"] = title_href[0]
-
-        _dates = []
-        dates_length = int(
-            self.record.xpath(
-                f"count({self.xpath}/gmd:date)",
-                namespaces=self.ns.nsmap(),
-            )
-        )
-        for date_index in range(1, dates_length + 1):
-            date_ = Date(record=self.record, attributes=self.attributes, xpath=f"({self.xpath}/gmd:date)[{date_index}]")
-            _date = date_.make_config()
-            if bool(_date):
-                _dates.append(_date)
-        if len(_dates) > 0:
-            _["dates"] = _dates
-
-        edition_value = self.record.xpath(
-            f"{self.xpath}/gmd:edition/gco:CharacterString/text()", namespaces=self.ns.nsmap()
-        )
-        if len(edition_value) == 1:
-            _["edition"] = edition_value[0]
-
-        _identifiers = []
-        identifiers_length = int(
-            self.record.xpath(
-                f"count({self.xpath}/gmd:identifier)",
-                namespaces=self.ns.nsmap(),
-            )
-        )
-        for identifier_index in range(1, identifiers_length + 1):
-            identifier = Identifier(
-                record=self.record,
-                attributes=self.attributes,
-                xpath=f"({self.xpath}/gmd:identifier)[{identifier_index}]",
-            )
-            _identifier = identifier.make_config()
-            if bool(_identifier):
-                _identifiers.append(_identifier)
-        if len(_identifiers) > 0:
-            _["identifiers"] = _identifiers
-
-        cited_responsible_party = ResponsibleParty(
-            record=self.record, attributes=self.attributes, xpath=f"{self.xpath}/gmd:citedResponsibleParty"
-        )
-        _cited_responsible_party = cited_responsible_party.make_config()
-        if bool(_cited_responsible_party):
-            _["contact"] = _cited_responsible_party
-
-        return _
+class Citation(MetadataRecordElement):
+    __slots__ = ()
 
     def make_element(self):
-        citation_element = SubElement(self.parent_element, f"{{{self.ns.gmd}}}CI_Citation")
+        citation_element = SubElement(self.parent_element, tags.gmd.CI_Citation)
 
         if "title" in self.element_attributes:
-            title_element = SubElement(citation_element, f"{{{self.ns.gmd}}}title")
+            title_element = SubElement(citation_element, tags.gmd.title)
             if "href" in self.element_attributes["title"]:
                 anchor = AnchorElement(
                     record=self.record,
@@ -720,7 +268,7 @@ class Citation(MetadataRecordElement):
                 )
                 anchor.make_element()
             else:
-                title_value = SubElement(title_element, f"{{{self.ns.gco}}}CharacterString")
+                title_value = SubElement(title_element, tags.gco.CharacterString)
                 title_value.text = self.element_attributes["title"]["value"]
 
         if "dates" in self.element_attributes:
@@ -734,8 +282,8 @@ class Citation(MetadataRecordElement):
                 citation_date.make_element()
 
         if "edition" in self.element_attributes:
-            edition_element = SubElement(citation_element, f"{{{self.ns.gmd}}}edition")
-            edition_value = SubElement(edition_element, f"{{{self.ns.gco}}}CharacterString")
+            edition_element = SubElement(citation_element, tags.gmd.edition)
+            edition_value = SubElement(edition_element, tags.gco.CharacterString)
             edition_value.text = str(self.element_attributes["edition"])
 
         if "identifiers" in self.element_attributes:
@@ -749,15 +297,17 @@ class Citation(MetadataRecordElement):
                 identifier.make_element()
 
         if "contact" in self.element_attributes:
-            citated_responsible_party_element = SubElement(citation_element, f"{{{self.ns.gmd}}}citedResponsibleParty")
+            citated_responsible_party_element = SubElement(citation_element, tags.gmd.citedResponsibleParty)
 
             # Citations can only have a single contact so collapse roles array down to a single value
             _contact_element_attributes = self.element_attributes["contact"]
             if type(self.element_attributes["contact"]["role"]) is list:
                 if len(self.element_attributes["contact"]["role"]) > 1:
                     raise ValueError("Contacts can only have a single role. Citations can only have a single contact.")
-                _contact_element_attributes = deepcopy(self.element_attributes["contact"])
-                _contact_element_attributes["role"] = _contact_element_attributes["role"][0]
+                _contact_element_attributes = {
+                    **self.element_attributes["contact"],
+                    "role": self.element_attributes["contact"]["role"][0],
+                }
 
             responsible_party = ResponsibleParty(
                 record=self.record,
@@ -769,59 +319,17 @@ class Citation(MetadataRecordElement):
 
 
 class Date(MetadataRecordElement):
-    def __init__(
-        self,
-        record: _MetadataRecord,
-        attributes: dict,
-        parent_element: Element = None,
-        element_attributes: dict = None,
-        xpath: str = None,
-    ):
-        super().__init__(
-            record=record,
-            attributes=attributes,
-            parent_element=parent_element,
-            element_attributes=element_attributes,
-            xpath=f"{xpath}/gmd:CI_Date",
-        )
-
-    def make_config(self) -> dict:
-        _ = {}
-
-        date_value = self.record.xpath(f"{self.xpath}/gmd:date/gco:Date/text()", namespaces=self.ns.nsmap())
-        if len(date_value) == 1:
-            try:
-                if len(date_value[0]) == 4:
-                    # Assume a year only date
-                    date_value[0] = f"{date_value[0]}-01-01"
-                    _["date_precision"] = "year"
-
-                _["date"] = datetime.fromisoformat(date_value[0]).date()
-            except ValueError:  # pragma: no cover
-                raise RuntimeError("Date could not be parsed as an ISO date value")
-
-        date_time_value = self.record.xpath(f"{self.xpath}/gmd:date/gco:DateTime/text()", namespaces=self.ns.nsmap())
-        if len(date_time_value) == 1:
-            try:
-                _["date"] = datetime.fromisoformat(date_time_value[0])
-            except ValueError:  # pragma: no cover
-                raise RuntimeError("Date could not be parsed as an ISO datetime value")
-
-        date_type = DateType(record=self.record, attributes=self.attributes, xpath=f"{self.xpath}/gmd:dateType")
-        _date_type = date_type.make_config()
-        _["date_type"] = _date_type
-
-        return _
+    __slots__ = ()
 
     def make_element(self):
-        date_container_wrapper = SubElement(self.parent_element, f"{{{self.ns.gmd}}}date")
-        date_container_element = SubElement(date_container_wrapper, f"{{{self.ns.gmd}}}CI_Date")
+        date_container_wrapper = SubElement(self.parent_element, tags.gmd.date)
+        date_container_element = SubElement(date_container_wrapper, tags.gmd.CI_Date)
 
-        date_element = SubElement(date_container_element, f"{{{self.ns.gmd}}}date")
+        date_element = SubElement(date_container_element, tags.gmd.date)
 
-        date_value_element = f"{{{self.ns.gco}}}Date"
+        date_value_element = tags.gco.Date
         if type(self.element_attributes["date"]) is datetime:
-            date_value_element = f"{{{self.ns.gco}}}DateTime"
+            date_value_element = tags.gco.DateTime
 
         date_value = SubElement(date_element, date_value_element)
         date_value.text = format_date_string(self.element_attributes["date"])
@@ -840,88 +348,22 @@ class Date(MetadataRecordElement):
 
 
 class DateType(CodeListElement):
-    def __init__(
-        self,
-        record: MetadataRecord,
-        attributes: dict,
-        parent_element: Element = None,
-        element_attributes: dict = None,
-        xpath: str = None,
-    ):
-        super().__init__(
-            record=record,
-            attributes=attributes,
-            parent_element=parent_element,
-            element_attributes=element_attributes,
-            xpath=f"{xpath}/gmd:CI_DateTypeCode",
-        )
-        self.code_list_values = [
-            "creation",
-            "publication",
-            "revision",
-            "expiry",
-            "lastUpdate",
-            "lastRevision",
-            "nextUpdate",
-            "unavailable",
-            "inForce",
-            "adopted",
-            "deprecated",
-            "superseded",
-            "validityBegins",
-            "validityExpires",
-            "released",
-            "distribution",
-        ]
-        self.code_list = "https://standards.iso.org/iso/19115/resources/Codelists/cat/codelists.xml#CI_DateTypeCode"
-        self.element = f"{{{self.ns.gmd}}}dateType"
-        self.element_code = f"{{{self.ns.gmd}}}CI_DateTypeCode"
-        self.attribute = "date_type"
+    __slots__ = ()
 
+    code_list_values = code_lists["CI_DateTypeCode"].values
+    code_list = code_lists["CI_DateTypeCode"].url
+    element = tags.gmd.dateType
+    element_code = tags.gmd.CI_DateTypeCode
+    attribute = "date_type"
 
-class Identifier(MetadataRecordElement):
-    def __init__(
-        self,
-        record: _MetadataRecord,
-        attributes: dict,
-        parent_element: Element = None,
-        element_attributes: dict = None,
-        xpath: str = None,
-    ):
-        super().__init__(
-            record=record,
-            attributes=attributes,
-            parent_element=parent_element,
-            element_attributes=element_attributes,
-            xpath=f"{xpath}/gmd:MD_Identifier",
-        )
-
-    def make_config(self) -> dict:
-        _ = {}
-
-        identifier_value = self.record.xpath(
-            f"{self.xpath}/gmd:code/gco:CharacterString/text() | {self.xpath}/gmd:code/gmx:Anchor/text()",
-            namespaces=self.ns.nsmap(),
-        )
-        if len(identifier_value) == 1:
-            _["identifier"] = identifier_value[0]
 
-        identifier_href = self.record.xpath(f"{self.xpath}/gmd:code/gmx:Anchor/@xlink:href", namespaces=self.ns.nsmap())
-        if len(identifier_href) == 1:
-            _["href"] = identifier_href[0]
-
-        identifier_title = self.record.xpath(
-            f"{self.xpath}/gmd:code/gmx:Anchor/@xlink:title", namespaces=self.ns.nsmap()
-        )
-        if len(identifier_title) == 1:
-            _["title"] = identifier_title[0]
-
-        return _
+class Identifier(MetadataRecordElement):
+    __slots__ = ()
 
     def make_element(self):
-        identifier_container = SubElement(self.parent_element, f"{{{self.ns.gmd}}}identifier")
-        identifier_wrapper = SubElement(identifier_container, f"{{{self.ns.gmd}}}MD_Identifier")
-        identifier_element = SubElement(identifier_wrapper, f"{{{self.ns.gmd}}}code")
+        identifier_container = SubElement(self.parent_element, tags.gmd.identifier)
+        identifier_wrapper = SubElement(identifier_container, tags.gmd.MD_Identifier)
+        identifier_element = SubElement(identifier_wrapper, tags.gmd.code)
 
         if "href" in self.element_attributes:
             anchor = AnchorElement(
@@ -933,11 +375,13 @@ class Identifier(MetadataRecordElement):
             )
             anchor.make_element()
         else:
-            identifier_value = SubElement(identifier_element, f"{{{self.ns.gco}}}CharacterString")
+            identifier_value = SubElement(identifier_element, tags.gco.CharacterString)
             identifier_value.text = self.element_attributes["identifier"]
 
 
 class AnchorElement(MetadataRecordElement):
+    __slots__ = ("text",)
+
     def __init__(
         self,
         record: MetadataRecord,
@@ -955,11 +399,11 @@ class AnchorElement(MetadataRecordElement):
         attributes = {}
 
         if "href" in self.element_attributes:
-            attributes[f"{{{self.ns.xlink}}}href"] = self.element_attributes["href"]
-            attributes[f"{{{self.ns.xlink}}}actuate"] = "onRequest"
+            attributes[tags.xlink.href] = self.element_attributes["href"]
+            attributes[tags.xlink.actuate] = "onRequest"
         if "title" in self.element_attributes:
-            attributes[f"{{{self.ns.xlink}}}title"] = self.element_attributes["title"]
+            attributes[tags.xlink.title] = self.element_attributes["title"]
 
-        anchor = SubElement(self.parent_element, f"{{{self.ns.gmx}}}Anchor", attrib=attributes)
+        anchor = SubElement(self.parent_element, tags.gmx.Anchor, attrib=attributes)
         if self.text is not None:
             anchor.text = self.text
@@ -1,15 +1,12 @@
-import requests
-
-from copy import deepcopy
-from datetime import datetime
-
 # Exempting Bandit security issue (Using Element to parse untrusted XML data is known to be vulnerable to XML attacks)
 #
 # We don't currently allow untrusted/user-provided XML so this is not a risk
 from lxml.etree import Element, SubElement  # nosec
 
 from bas_metadata_library import MetadataRecord
-from bas_metadata_library.standards.iso_19115_common import MetadataRecordElement, CodeListElement
+from bas_metadata_library.citations import CitationResolver, CrossCiteCitationResolver
+from bas_metadata_library.standards.iso_19115_common import MetadataRecordElement, CodeListElement, tags
+from bas_metadata_library.standards.iso_19115_common.code_lists import code_lists
 from bas_metadata_library.standards.iso_19115_common.common_elements import (
     Citation,
     ResponsibleParty,
@@ -20,180 +17,31 @@ from bas_metadata_library.standards.iso_19115_common.common_elements import (
 )
 from bas_metadata_library.standards.iso_19115_common.utils import format_date_string
 
+# Resolver for citations of DOIs in required citation constraints, used where a record isn't given a resolver
+default_citation_resolver = CrossCiteCitationResolver()
 
-class DataIdentification(MetadataRecordElement):
-    def make_config(self) -> dict:
-        _ = {}
 
-        citation = Citation(
-            record=self.record,
-            attributes=self.attributes,
-            xpath=f"{self.xpath}/gmd:identificationInfo/gmd:MD_DataIdentification/gmd:citation",
-        )
-        _citation = citation.make_config()
-        if bool(_citation):
-            _ = {**_, **_citation}
-
-        abstract = Abstract(
-            record=self.record,
-            attributes=self.attributes,
-            xpath=f"{self.xpath}/gmd:identificationInfo/gmd:MD_DataIdentification/gmd:abstract",
-        )
-        _abstract = abstract.make_config()
-        if _abstract != "":
-            _["abstract"] = _abstract
-
-        _contacts = []
-        contacts_length = int(
-            self.record.xpath(
-                f"count({self.xpath}/gmd:identificationInfo/gmd:MD_DataIdentification/gmd:pointOfContact)",
-                namespaces=self.ns.nsmap(),
-            )
-        )
-        for contact_index in range(1, contacts_length + 1):
-            contact = PointOfContact(
-                record=self.record,
-                attributes=self.attributes,
-                xpath=f"({self.xpath}/gmd:identificationInfo/gmd:MD_DataIdentification/gmd:pointOfContact)"
-                f"[{contact_index}]",
-            )
-            _contact = contact.make_config()
-            if bool(_contact):
-                _contacts.append(_contact)
-        if len(_contacts) > 0:
-            _["contacts"] = _contacts
-
-        resource_maintenance = ResourceMaintenance(
-            record=self.record, attributes=self.attributes, xpath=f"{self.xpath}"
-        )
-        _resource_maintenance = resource_maintenance.make_config()
-        if bool(_resource_maintenance):
-            _["maintenance"] = _resource_maintenance
-
-        _descriptive_keywords = []
-        keywords_length = int(
-            self.record.xpath(
-                f"count({self.xpath}/gmd:identificationInfo/gmd:MD_DataIdentification/gmd:descriptiveKeywords)",
-                namespaces=self.ns.nsmap(),
-            )
-        )
-        for keyword_index in range(1, keywords_length + 1):
-            keywords = DescriptiveKeywords(
-                record=self.record,
-                attributes=self.attributes,
-                xpath=f"({self.xpath}/gmd:identificationInfo/gmd:MD_DataIdentification/gmd:descriptiveKeywords)"
-                f"[{keyword_index}]",
-            )
-            _keywords = keywords.make_config()
-            if bool(_keywords):
-                _descriptive_keywords.append(_keywords)
-        if len(_descriptive_keywords) > 0:
-            _["keywords"] = _descriptive_keywords
-
-        _resource_constraints = {}
-        constraints_length = int(
-            self.record.xpath(
-                f"count({self.xpath}/gmd:identificationInfo/gmd:MD_DataIdentification/gmd:resourceConstraints)",
-                namespaces=self.ns.nsmap(),
-            )
-        )
-        for constraint_index in range(1, constraints_length + 1):
-            constraint = ResourceConstraints(
-                record=self.record,
-                attributes=self.attributes,
-                xpath=f"({self.xpath}/gmd:identificationInfo/gmd:MD_DataIdentification/gmd:resourceConstraints)"
-                f"[{constraint_index}]",
-            )
-            _constraint = constraint.make_config()
-            if bool(_constraint):
-                if "access" in _constraint.keys():
-                    if "access" not in _resource_constraints.keys():
-                        _resource_constraints["access"] = []
-                    _resource_constraints["access"].append(_constraint["access"])
-                elif "usage" in _constraint.keys():
-                    if "usage" not in _resource_constraints.keys():
-                        _resource_constraints["usage"] = []
-                    _resource_constraints["usage"].append(_constraint["usage"])
-        if len(_resource_constraints) > 0:
-            _["constraints"] = _resource_constraints
-
-        spatial_representation_type = SpatialRepresentationType(
-            record=self.record,
-            attributes=self.attributes,
-            xpath=f"{self.xpath}/gmd:identificationInfo/gmd:MD_DataIdentification/gmd:spatialRepresentationType",
-        )
-        _spatial_representation_type = spatial_representation_type.make_config()
-        if _spatial_representation_type != "":
-            _["spatial_representation_type"] = _spatial_representation_type
-
-        spatial_resolution = SpatialResolution(
-            record=self.record,
-            attributes=self.attributes,
-            xpath=f"{self.xpath}/gmd:identificationInfo/gmd:MD_DataIdentification/gmd:spatialResolution",
-        )
-        _spatial_resolution = spatial_resolution.make_config()
-        if _spatial_resolution != "":  # pragma: no cover
-            _["spatial_resolution"] = _spatial_resolution
-
-        language = Language(
-            record=self.record,
-            attributes=self.attributes,
-            xpath=f"{self.xpath}/gmd:identificationInfo/gmd:MD_DataIdentification/gmd:language",
-        )
-        _language = language.make_config()
-        if _language != "":
-            _["language"] = _language
+class DataIdentification(MetadataRecordElement):
+    __slots__ = ("citation_resolver",)
 
-        character_set = CharacterSet(
-            record=self.record,
-            attributes=self.attributes,
-            xpath=f"{self.xpath}/gmd:identificationInfo/gmd:MD_DataIdentification/gmd:characterSet",
-        )
-        _character_set = character_set.make_config()
-        if _character_set != "":  # pragma: no cover
-            _["character_set"] = _character_set
-
-        _topic_categories = []
-        topics_length = int(
-            self.record.xpath(
-                f"count({self.xpath}/gmd:identificationInfo/gmd:MD_DataIdentification/gmd:topicCategory)",
-                namespaces=self.ns.nsmap(),
-            )
-        )
-        for topic_index in range(1, topics_length + 1):
-            topic = TopicCategory(
-                record=self.record,
-                attributes=self.attributes,
-                xpath=f"({self.xpath}/gmd:identificationInfo/gmd:MD_DataIdentification/gmd:topicCategory)"
-                f"[{topic_index}]",
-            )
-            _topic = topic.make_config()
-            if _topic != "":
-                _topic_categories.append(_topic)
-        if len(_topic_categories) > 0:
-            _["topics"] = _topic_categories
-
-        extent = Extent(record=self.record, attributes=self.attributes, xpath=f"{self.xpath}")
-        _extent = extent.make_config()
-        if bool(_extent):
-            _["extent"] = _extent
-
-        supplemental_information = SupplementalInformation(
-            record=self.record,
-            attributes=self.attributes,
-            xpath=f"{self.xpath}/gmd:identificationInfo/gmd:MD_DataIdentification/gmd:supplementalInformation",
+    def __init__(
+        self,
+        record: MetadataRecord,
+        attributes: dict,
+        parent_element: Element = None,
+        element_attributes: dict = None,
+        citation_resolver: CitationResolver = None,
+    ):
+        super().__init__(
+            record=record, attributes=attributes, parent_element=parent_element, element_attributes=element_attributes
         )
-        _supplemental_information = supplemental_information.make_config()
-        if _supplemental_information != "":
-            _["supplemental_information"] = _supplemental_information
-
-        return _
+        self.citation_resolver = citation_resolver
 
     def make_element(self):
-        data_identification_wrapper = SubElement(self.parent_element, f"{{{self.ns.gmd}}}identificationInfo")
-        data_identification_element = SubElement(data_identification_wrapper, f"{{{self.ns.gmd}}}MD_DataIdentification")
+        data_identification_wrapper = SubElement(self.parent_element, tags.gmd.identificationInfo)
+        data_identification_element = SubElement(data_identification_wrapper, tags.gmd.MD_DataIdentification)
 
-        citation_wrapper = SubElement(data_identification_element, f"{{{self.ns.gmd}}}citation")
+        citation_wrapper = SubElement(data_identification_element, tags.gmd.citation)
         citation = Citation(
             record=self.record,
             attributes=self.attributes,
@@ -250,6 +98,7 @@ class DataIdentification(MetadataRecordElement):
                 attributes=self.attributes,
                 parent_element=data_identification_element,
                 element_attributes=self.attributes["resource"]["constraints"],
+                citation_resolver=self.citation_resolver,
             )
             constraints.make_element()
 
@@ -317,30 +166,19 @@ class DataIdentification(MetadataRecordElement):
 
 
 class Abstract(MetadataRecordElement):
-    def make_config(self) -> str:
-        _ = ""
-
-        abstract_value = self.record.xpath(f"{self.xpath}/gco:CharacterString/text()", namespaces=self.ns.nsmap())
-        if len(abstract_value) == 1:
-            _ = abstract_value[0]
-
-        return _
+    __slots__ = ()
 
     def make_element(self):
-        abstract_element = SubElement(self.parent_element, f"{{{self.ns.gmd}}}abstract")
-        abstract_value = SubElement(abstract_element, f"{{{self.ns.gco}}}CharacterString")
+        abstract_element = SubElement(self.parent_element, tags.gmd.abstract)
+        abstract_value = SubElement(abstract_element, tags.gco.CharacterString)
         abstract_value.text = self.element_attributes["abstract"]
 
 
 class PointOfContact(MetadataRecordElement):
-    def make_config(self) -> dict:
-        responsible_party = ResponsibleParty(record=self.record, attributes=self.attributes, xpath=self.xpath)
-        _responsible_party = responsible_party.make_config()
-
-        return _responsible_party
+    __slots__ = ()
 
     def make_element(self):
-        point_of_contact_element = SubElement(self.parent_element, f"{{{self.ns.gmd}}}pointOfContact")
+        point_of_contact_element = SubElement(self.parent_element, tags.gmd.pointOfContact)
 
         responsible_party = ResponsibleParty(
             record=self.record,
@@ -352,16 +190,10 @@ class PointOfContact(MetadataRecordElement):
 
 
 class ResourceMaintenance(MetadataRecordElement):
-    def make_config(self) -> dict:
-        maintenance_information = MaintenanceInformation(
-            record=self.record,
-            attributes=self.attributes,
-            xpath=f"{self.xpath}/gmd:identificationInfo/gmd:MD_DataIdentification/gmd:resourceMaintenance",
-        )
-        return maintenance_information.make_config()
+    __slots__ = ()
 
     def make_element(self):
-        resource_maintenance_element = SubElement(self.parent_element, f"{{{self.ns.gmd}}}resourceMaintenance")
+        resource_maintenance_element = SubElement(self.parent_element, tags.gmd.resourceMaintenance)
         maintenance_information = MaintenanceInformation(
             record=self.record,
             attributes=self.attributes,
@@ -372,53 +204,14 @@ class ResourceMaintenance(MetadataRecordElement):
 
 
 class DescriptiveKeywords(MetadataRecordElement):
-    def make_config(self) -> dict:
-        _ = {}
-
-        _terms = []
-        terms_values = self.record.xpath(
-            f"{self.xpath}/gmd:MD_Keywords/gmd:keyword/gco:CharacterString/text()", namespaces=self.ns.nsmap()
-        )
-        for term in terms_values:
-            _terms.append({"term": term})
-        terms_links = self.record.xpath(
-            f"{self.xpath}/gmd:MD_Keywords/gmd:keyword/gmx:Anchor", namespaces=self.ns.nsmap()
-        )
-        for term in terms_links:
-            _term = {}
-            _term_value = term.xpath("./text()", namespaces=self.ns.nsmap())
-            if len(_term_value) > 0:
-                _term["term"] = _term_value[0]
-            _term_href = term.xpath("./@xlink:href", namespaces=self.ns.nsmap())
-            if len(_term_href) > 0:
-                _term["href"] = _term_href[0]
-            if bool(_term):
-                _terms.append(_term)
-        if bool(_terms):
-            _["terms"] = _terms
-
-        descriptive_keywords_type = DescriptiveKeywordsType(
-            record=self.record, attributes=self.attributes, xpath=f"{self.xpath}/gmd:MD_Keywords/gmd:type"
-        )
-        _descriptive_keywords_type = descriptive_keywords_type.make_config()
-        if _descriptive_keywords_type != "":
-            _["type"] = _descriptive_keywords_type
-
-        thesaurus = Thesaurus(
-            record=self.record, attributes=self.attributes, xpath=f"{self.xpath}/gmd:MD_Keywords/gmd:thesaurusName"
-        )
-        _thesaurus = thesaurus.make_config()
-        if bool(_thesaurus):
-            _["thesaurus"] = _thesaurus
-
-        return _
+    __slots__ = ()
 
     def make_element(self):
-        keywords_wrapper = SubElement(self.parent_element, f"{{{self.ns.gmd}}}descriptiveKeywords")
-        keywords_element = SubElement(keywords_wrapper, f"{{{self.ns.gmd}}}MD_Keywords")
+        keywords_wrapper = SubElement(self.parent_element, tags.gmd.descriptiveKeywords)
+        keywords_element = SubElement(keywords_wrapper, tags.gmd.MD_Keywords)
 
         for term in self.element_attributes["terms"]:
-            term_element = SubElement(keywords_element, f"{{{self.ns.gmd}}}keyword")
+            term_element = SubElement(keywords_element, tags.gmd.keyword)
             if "href" in term:
                 anchor = AnchorElement(
                     record=self.record,
@@ -429,7 +222,7 @@ class DescriptiveKeywords(MetadataRecordElement):
                 )
                 anchor.make_element()
             else:
-                term_value = SubElement(term_element, f"{{{self.ns.gco}}}CharacterString")
+                term_value = SubElement(term_element, tags.gco.CharacterString)
                 term_value.text = term["term"]
 
         if "type" in self.element_attributes:
@@ -452,40 +245,20 @@ class DescriptiveKeywords(MetadataRecordElement):
 
 
 class DescriptiveKeywordsType(CodeListElement):
-    def __init__(
-        self,
-        record: MetadataRecord,
-        attributes: dict,
-        parent_element: Element = None,
-        element_attributes: dict = None,
-        xpath: str = None,
-    ):
-        super().__init__(
-            record=record,
-            attributes=attributes,
-            parent_element=parent_element,
-            element_attributes=element_attributes,
-            xpath=f"{xpath}/gmd:MD_KeywordTypeCode",
-        )
-        self.code_list_values = ["discipline", "place", "stratum", "temporal", "theme"]
-        self.code_list = (
-            "http://standards.iso.org/ittf/PubliclyAvailableStandards/ISO_19139_Schemas/resources/"
-            "codelist/gmxCodelists.xml#MD_KeywordTypeCode"
-        )
-        self.element = f"{{{self.ns.gmd}}}type"
-        self.element_code = f"{{{self.ns.gmd}}}MD_KeywordTypeCode"
-        self.attribute = "type"
+    __slots__ = ()
 
+    code_list_values = code_lists["MD_KeywordTypeCode"].values
+    code_list = code_lists["MD_KeywordTypeCode"].url
+    element = tags.gmd.type
+    element_code = tags.gmd.MD_KeywordTypeCode
+    attribute = "type"
 
-class Thesaurus(MetadataRecordElement):
-    def make_config(self) -> dict:
-        citation = Citation(record=self.record, attributes=self.attributes, xpath=self.xpath)
-        _citation = citation.make_config()
 
-        return _citation
+class Thesaurus(MetadataRecordElement):
+    __slots__ = ()
 
     def make_element(self):
-        thesaurus_element = SubElement(self.parent_element, f"{{{self.ns.gmd}}}thesaurusName")
+        thesaurus_element = SubElement(self.parent_element, tags.gmd.thesaurusName)
 
         citation = Citation(
             record=self.record,
@@ -497,66 +270,28 @@ class Thesaurus(MetadataRecordElement):
 
 
 class ResourceConstraints(MetadataRecordElement):
-    def make_config(self) -> dict:
-        _ = {}
-
-        _id = self.record.xpath(f"{self.xpath}/gmd:MD_LegalConstraints/@id", namespaces=self.ns.nsmap())
-        if len(_id) == 1:
-            _id = _id[0]
+    __slots__ = ("citation_resolver",)
 
-        access_constraint = AccessConstraint(
-            record=self.record,
-            attributes=self.attributes,
-            xpath=f"{self.xpath}/gmd:MD_LegalConstraints/gmd:accessConstraints",
-        )
-        _access_constraint = access_constraint.make_config()
-        if _access_constraint != "":
-            _["access"] = {"restriction_code": _access_constraint}
-
-            other_constraint = OtherConstraints(
-                record=self.record, attributes=self.attributes, xpath=f"{self.xpath}/gmd:MD_LegalConstraints"
-            )
-            _other_constraint = other_constraint.make_config()
-            if _other_constraint != "":
-                _["access"]["statement"] = _other_constraint
-
-        use_constraint = UseLimitation(
-            record=self.record,
-            attributes=self.attributes,
-            xpath=f"{self.xpath}/gmd:MD_LegalConstraints/gmd:useLimitation",
+    def __init__(
+        self,
+        record: MetadataRecord,
+        attributes: dict,
+        parent_element: Element = None,
+        element_attributes: dict = None,
+        citation_resolver: CitationResolver = None,
+    ):
+        super().__init__(
+            record=record, attributes=attributes, parent_element=parent_element, element_attributes=element_attributes
         )
-        _usage_constraint = use_constraint.make_config()
-        if bool(_usage_constraint):
-            _["usage"] = _usage_constraint
-
-            if _id == "copyright":
-                _["usage"] = {"copyright_licence": _usage_constraint}
-                if (
-                    "href" in _usage_constraint
-                    and _usage_constraint["href"]
-                    == "http://www.nationalarchives.gov.uk/doc/open-government-licence/version/3/"
-                ):
-                    # noinspection PyUnresolvedReferences
-                    _["usage"]["copyright_licence"]["code"] = "OGL-UK-3.0"
-            elif _id == "citation":
-                _["usage"] = {"required_citation": _usage_constraint}
-
-        if _id == "InspireLimitationsOnPublicAccess":
-            limitations_on_access = self.record.xpath(
-                f"{self.xpath}/gmd:MD_LegalConstraints/gmd:otherConstraints/gmx:Anchor/text()",
-                namespaces=self.ns.nsmap(),
-            )
-            if len(limitations_on_access) == 1:
-                if "access" in _.keys():
-                    _["access"]["inspire_limitations_on_public_access"] = limitations_on_access[0]
-
-        return _
+        self.citation_resolver = citation_resolver
+        if self.citation_resolver is None:
+            self.citation_resolver = default_citation_resolver
 
     def make_element(self):
         if "access" in self.element_attributes:
             for access_constraint_attributes in self.element_attributes["access"]:
-                constraints_wrapper = SubElement(self.parent_element, f"{{{self.ns.gmd}}}resourceConstraints")
-                constraints_element = SubElement(constraints_wrapper, f"{{{self.ns.gmd}}}MD_LegalConstraints")
+                constraints_wrapper = SubElement(self.parent_element, tags.gmd.resourceConstraints)
+                constraints_element = SubElement(constraints_wrapper, tags.gmd.MD_LegalConstraints)
 
                 access_constraint = AccessConstraint(
                     record=self.record,
@@ -567,7 +302,7 @@ class ResourceConstraints(MetadataRecordElement):
                 access_constraint.make_element()
 
                 if "statement" in access_constraint_attributes:
-                    element_attributes = {"value": deepcopy(access_constraint_attributes["statement"])}
+                    element_attributes = {"value": access_constraint_attributes["statement"]}
 
                     other_constraint = OtherConstraints(
                         record=self.record,
@@ -590,11 +325,11 @@ class ResourceConstraints(MetadataRecordElement):
 
         if "usage" in self.element_attributes:
             for usage_constraint_attributes in self.element_attributes["usage"]:
-                constraints_wrapper = SubElement(self.parent_element, f"{{{self.ns.gmd}}}resourceConstraints")
-                constraints_element = SubElement(constraints_wrapper, f"{{{self.ns.gmd}}}MD_LegalConstraints")
+                constraints_wrapper = SubElement(self.parent_element, tags.gmd.resourceConstraints)
+                constraints_element = SubElement(constraints_wrapper, tags.gmd.MD_LegalConstraints)
 
                 if "statement" in usage_constraint_attributes:
-                    element_attributes = {"value": deepcopy(usage_constraint_attributes["statement"])}
+                    element_attributes = {"value": usage_constraint_attributes["statement"]}
 
                     use_limitation = UseLimitation(
                         record=self.record,
@@ -607,8 +342,10 @@ class ResourceConstraints(MetadataRecordElement):
                 if "copyright_licence" in usage_constraint_attributes:
                     constraints_element.set("id", "copyright")
 
-                    element_attributes = deepcopy(usage_constraint_attributes["copyright_licence"])
-                    element_attributes["value"] = element_attributes["statement"]
+                    element_attributes = {
+                        **usage_constraint_attributes["copyright_licence"],
+                        "value": usage_constraint_attributes["copyright_licence"]["statement"],
+                    }
 
                     use_limitation = UseLimitation(
                         record=self.record,
@@ -636,10 +373,9 @@ class ResourceConstraints(MetadataRecordElement):
                     )
                     use_limitation.make_element()
 
-    @staticmethod
-    def _get_doi_citation(doi: str) -> str:
+    def _get_doi_citation(self, doi: str) -> str:
         """
-        Get citation for a DOI using crosscite.org
+        Get citation for a DOI using the citation resolver (crosscite.org by default)
 
         This is a standalone method to allow for mocking during tests.
 
@@ -649,49 +385,24 @@ class ResourceConstraints(MetadataRecordElement):
         @:rtype: str
         @:return APA style citation for DOI
         """
-        citation_response = requests.get(doi, headers={"Accept": "text/x-bibliography; style=apa; locale=en-GB"})
-        citation_response.raise_for_status()
-        return citation_response.text
+        return self.citation_resolver.resolve(doi=doi, style="apa", locale="en-GB")
 
 
 class AccessConstraint(CodeListElement):
-    def __init__(
-        self,
-        record: MetadataRecord,
-        attributes: dict,
-        parent_element: Element = None,
-        element_attributes: dict = None,
-        xpath: str = None,
-    ):
-        super().__init__(
-            record=record,
-            attributes=attributes,
-            parent_element=parent_element,
-            element_attributes=element_attributes,
-            xpath=f"{xpath}/gmd:MD_RestrictionCode",
-        )
-        self.code_list_values = [
-            "copyright",
-            "patent",
-            "patentPending",
-            "trademark",
-            "license",
-            "intellectualPropertyRights",
-            "restricted",
-            "otherRestrictions",
-        ]
-        self.code_list = (
-            "http://standards.iso.org/ittf/PubliclyAvailableStandards/ISO_19139_Schemas/resources/"
-            "codelist/gmxCodelists.xml#MD_RestrictionCode"
-        )
-        self.element = f"{{{self.ns.gmd}}}accessConstraints"
-        self.element_code = f"{{{self.ns.gmd}}}MD_RestrictionCode"
-        self.attribute = "restriction_code"
+    __slots__ = ()
+
+    code_list_values = code_lists["MD_RestrictionCode"].values
+    code_list = code_lists["MD_RestrictionCode"].url
+    element = tags.gmd.accessConstraints
+    element_code = tags.gmd.MD_RestrictionCode
+    attribute = "restriction_code"
 
 
 class InspireLimitationsOnPublicAccess(MetadataRecordElement):
+    __slots__ = ()
+
     def make_element(self):
-        other_constraints_element = SubElement(self.parent_element, f"{{{self.ns.gmd}}}otherConstraints")
+        other_constraints_element = SubElement(self.parent_element, tags.gmd.otherConstraints)
 
         other_constraints_value = AnchorElement(
             record=self.record,
@@ -707,42 +418,19 @@ class InspireLimitationsOnPublicAccess(MetadataRecordElement):
 
 
 class OtherConstraints(MetadataRecordElement):
-    def make_config(self) -> str:
-        _ = ""
-
-        other_constraint = self.record.xpath(
-            f"{self.xpath}/gmd:otherConstraints/gco:CharacterString/text()", namespaces=self.ns.nsmap()
-        )
-        if len(other_constraint) == 1:
-            _ = other_constraint[0]
-
-        return _
+    __slots__ = ()
 
     def make_element(self):
-        other_constraints_element = SubElement(self.parent_element, f"{{{self.ns.gmd}}}otherConstraints")
-        other_constraints_value = SubElement(other_constraints_element, f"{{{self.ns.gco}}}CharacterString")
+        other_constraints_element = SubElement(self.parent_element, tags.gmd.otherConstraints)
+        other_constraints_value = SubElement(other_constraints_element, tags.gco.CharacterString)
         other_constraints_value.text = self.element_attributes["value"]
 
 
 class UseLimitation(MetadataRecordElement):
-    def make_config(self) -> dict:
-        _ = {}
-
-        use_constraint_statement = self.record.xpath(
-            f"{self.xpath}/gco:CharacterString/text() | {self.xpath}/gmx:Anchor/text()",
-            namespaces=self.ns.nsmap(),
-        )
-        if len(use_constraint_statement) == 1:
-            _["statement"] = use_constraint_statement[0]
-
-        use_constraint_href = self.record.xpath(f"{self.xpath}/gmx:Anchor/@xlink:href", namespaces=self.ns.nsmap())
-        if len(use_constraint_href) == 1:
-            _["href"] = use_constraint_href[0]
-
-        return _
+    __slots__ = ()
 
     def make_element(self):
-        use_limitation_element = SubElement(self.parent_element, f"{{{self.ns.gmd}}}useLimitation")
+        use_limitation_element = SubElement(self.parent_element, tags.gmd.useLimitation)
 
         if "href" in self.element_attributes:
             use_limitation_value = AnchorElement(
@@ -754,130 +442,56 @@ class UseLimitation(MetadataRecordElement):
             )
             use_limitation_value.make_element()
         else:
-            use_limitation_value = SubElement(use_limitation_element, f"{{{self.ns.gco}}}CharacterString")
+            use_limitation_value = SubElement(use_limitation_element, tags.gco.CharacterString)
             use_limitation_value.text = self.element_attributes["value"]
 
 
 class SupplementalInformation(MetadataRecordElement):
-    def make_config(self) -> str:
-        _ = ""
-
-        supplemental_value = self.record.xpath(f"{self.xpath}/gco:CharacterString/text()", namespaces=self.ns.nsmap())
-        if len(supplemental_value) == 1:
-            _ = supplemental_value[0]
-
-        return _
+    __slots__ = ()
 
     def make_element(self):
         if "supplemental_information" in self.element_attributes:
-            supplemental_info_element = SubElement(self.parent_element, f"{{{self.ns.gmd}}}supplementalInformation")
-            supplemental_info_value = SubElement(supplemental_info_element, f"{{{self.ns.gco}}}CharacterString")
+            supplemental_info_element = SubElement(self.parent_element, tags.gmd.supplementalInformation)
+            supplemental_info_value = SubElement(supplemental_info_element, tags.gco.CharacterString)
             supplemental_info_value.text = self.element_attributes["supplemental_information"]
 
 
 class SpatialRepresentationType(CodeListElement):
-    def __init__(
-        self,
-        record: MetadataRecord,
-        attributes: dict,
-        parent_element: Element = None,
-        element_attributes: dict = None,
-        xpath: str = None,
-    ):
-        super().__init__(
-            record=record,
-            attributes=attributes,
-            parent_element=parent_element,
-            element_attributes=element_attributes,
-            xpath=f"{xpath}/gmd:MD_SpatialRepresentationTypeCode",
-        )
-        self.code_list_values = ["vector", "grid", "textTable", "tin", "stereoModel", "video"]
-        self.code_list = (
-            "http://standards.iso.org/ittf/PubliclyAvailableStandards/ISO_19139_Schemas/resources/"
-            "codelist/gmxCodelists.xml#MD_SpatialRepresentationTypeCode"
-        )
-        self.element = f"{{{self.ns.gmd}}}spatialRepresentationType"
-        self.element_code = f"{{{self.ns.gmd}}}MD_SpatialRepresentationTypeCode"
-        self.attribute = "spatial_representation_type"
+    __slots__ = ()
 
+    code_list_values = code_lists["MD_SpatialRepresentationTypeCode"].values
+    code_list = code_lists["MD_SpatialRepresentationTypeCode"].url
+    element = tags.gmd.spatialRepresentationType
+    element_code = tags.gmd.MD_SpatialRepresentationTypeCode
+    attribute = "spatial_representation_type"
 
-class SpatialResolution(MetadataRecordElement):  # pragma: no cover
-    def make_config(self) -> str:
-        _ = ""
 
-        spatial_resolution_value = self.record.xpath(
-            f"{self.xpath}/gmd:MD_Resolution/gco:Distance/text()", namespaces=self.ns.nsmap()
-        )
-        if len(spatial_resolution_value) == 1:
-            _ = spatial_resolution_value[0]
-
-        return _
+class SpatialResolution(MetadataRecordElement):  # pragma: no cover
+    __slots__ = ()
 
     def make_element(self):
-        resolution_wrapper = SubElement(self.parent_element, f"{{{self.ns.gmd}}}spatialResolution")
-        resolution_element = SubElement(resolution_wrapper, f"{{{self.ns.gmd}}}MD_Resolution")
+        resolution_wrapper = SubElement(self.parent_element, tags.gmd.spatialResolution)
+        resolution_element = SubElement(resolution_wrapper, tags.gmd.MD_Resolution)
 
         if self.element_attributes["spatial_resolution"] is None:
-            SubElement(
-                resolution_element, f"{{{self.ns.gco}}}Distance", attrib={f"{{{self.ns.gco}}}nilReason": "inapplicable"}
-            )
+            SubElement(resolution_element, tags.gco.Distance, attrib={tags.gco.nilReason: "inapplicable"})
 
 
 class TopicCategory(MetadataRecordElement):
-    def make_config(self) -> str:
-        _ = ""
-
-        topic_category_value = self.record.xpath(
-            f"{self.xpath}/gmd:MD_TopicCategoryCode/text()", namespaces=self.ns.nsmap()
-        )
-        if len(topic_category_value) == 1:
-            _ = topic_category_value[0]
-
-        return _
+    __slots__ = ()
 
     def make_element(self):
-        topic_element = SubElement(self.parent_element, f"{{{self.ns.gmd}}}topicCategory")
-        topic_value = SubElement(topic_element, f"{{{self.ns.gmd}}}MD_TopicCategoryCode")
+        topic_element = SubElement(self.parent_element, tags.gmd.topicCategory)
+        topic_value = SubElement(topic_element, tags.gmd.MD_TopicCategoryCode)
         topic_value.text = self.element_attributes["topic"]
 
 
 class Extent(MetadataRecordElement):
-    def make_config(self) -> dict:
-        _ = {}
-
-        geographic_extent = GeographicExtent(
-            record=self.record,
-            attributes=self.attributes,
-            xpath=f"{self.xpath}/gmd:identificationInfo/gmd:MD_DataIdentification/gmd:extent/gmd:EX_Extent",
-        )
-        _geographic_extent = geographic_extent.make_config()
-        if bool(_geographic_extent):
-            _["geographic"] = _geographic_extent
-
-        temporal_extent = TemporalExtent(
-            record=self.record,
-            attributes=self.attributes,
-            xpath=f"{self.xpath}/gmd:identificationInfo/gmd:MD_DataIdentification/gmd:extent/gmd:EX_Extent",
-        )
-        _temporal_extent = temporal_extent.make_config()
-        if bool(_temporal_extent):
-            _["temporal"] = _temporal_extent
-
-        vertical_extent = VerticalExtent(
-            record=self.record,
-            attributes=self.attributes,
-            xpath=f"{self.xpath}/gmd:identificationInfo/gmd:MD_DataIdentification/gmd:extent/gmd:EX_Extent/"
-            f"gmd:verticalElement",
-        )
-        _vertical_extent = vertical_extent.make_config()
-        if bool(_vertical_extent):
-            _["vertical"] = _vertical_extent
-
-        return _
+    __slots__ = ()
 
     def make_element(self):
-        extent_wrapper = SubElement(self.parent_element, f"{{{self.ns.gmd}}}extent")
-        extent_element = SubElement(extent_wrapper, f"{{{self.ns.gmd}}}EX_Extent")
+        extent_wrapper = SubElement(self.parent_element, tags.gmd.extent)
+        extent_element = SubElement(extent_wrapper, tags.gmd.EX_Extent)
 
         if "geographic" in self.element_attributes:
             geographic_extent = GeographicExtent(
@@ -908,22 +522,10 @@ class Extent(MetadataRecordElement):
 
 
 class GeographicExtent(MetadataRecordElement):
-    def make_config(self) -> dict:
-        _ = {}
-
-        bounding_box = BoundingBox(
-            record=self.record,
-            attributes=self.attributes,
-            xpath=f"{self.xpath}/gmd:geographicElement",
-        )
-        _bounding_box = bounding_box.make_config()
-        if bool(_bounding_box):
-            _["bounding_box"] = _bounding_box
-
-        return _
+    __slots__ = ()
 
     def make_element(self):
-        geographic_extent_element = SubElement(self.parent_element, f"{{{self.ns.gmd}}}geographicElement")
+        geographic_extent_element = SubElement(self.parent_element, tags.gmd.geographicElement)
 
         if "bounding_box" in self.element_attributes:
             bounding_box = BoundingBox(
@@ -936,98 +538,43 @@ class GeographicExtent(MetadataRecordElement):
 
 
 class BoundingBox(MetadataRecordElement):
-    def make_config(self) -> dict:
-        _ = {}
-
-        west_element_value = self.record.xpath(
-            f"{self.xpath}/gmd:EX_GeographicBoundingBox/gmd:westBoundLongitude/gco:Decimal/text()",
-            namespaces=self.ns.nsmap(),
-        )
-        if len(west_element_value) == 1:
-            _["west_longitude"] = float(west_element_value[0])
-
-        east_element_value = self.record.xpath(
-            f"{self.xpath}/gmd:EX_GeographicBoundingBox/gmd:eastBoundLongitude/gco:Decimal/text()",
-            namespaces=self.ns.nsmap(),
-        )
-        if len(east_element_value) == 1:
-            _["east_longitude"] = float(east_element_value[0])
-
-        south_element_value = self.record.xpath(
-            f"{self.xpath}/gmd:EX_GeographicBoundingBox/gmd:southBoundLatitude/gco:Decimal/text()",
-            namespaces=self.ns.nsmap(),
-        )
-        if len(south_element_value) == 1:
-            _["south_latitude"] = float(south_element_value[0])
-
-        north_element_value = self.record.xpath(
-            f"{self.xpath}/gmd:EX_GeographicBoundingBox/gmd:northBoundLatitude/gco:Decimal/text()",
-            namespaces=self.ns.nsmap(),
-        )
-        if len(north_element_value) == 1:
-            _["north_latitude"] = float(north_element_value[0])
-
-        return _
+    __slots__ = ()
 
     def make_element(self):
-        bounding_box_element = SubElement(self.parent_element, f"{{{self.ns.gmd}}}EX_GeographicBoundingBox")
+        bounding_box_element = SubElement(self.parent_element, tags.gmd.EX_GeographicBoundingBox)
 
-        west_element = SubElement(bounding_box_element, f"{{{self.ns.gmd}}}westBoundLongitude")
-        west_value = SubElement(west_element, f"{{{self.ns.gco}}}Decimal")
+        west_element = SubElement(bounding_box_element, tags.gmd.westBoundLongitude)
+        west_value = SubElement(west_element, tags.gco.Decimal)
         west_value.text = str(self.element_attributes["west_longitude"])
 
-        east_element = SubElement(bounding_box_element, f"{{{self.ns.gmd}}}eastBoundLongitude")
-        east_value = SubElement(east_element, f"{{{self.ns.gco}}}Decimal")
+        east_element = SubElement(bounding_box_element, tags.gmd.eastBoundLongitude)
+        east_value = SubElement(east_element, tags.gco.Decimal)
         east_value.text = str(self.element_attributes["east_longitude"])
 
-        south_element = SubElement(bounding_box_element, f"{{{self.ns.gmd}}}southBoundLatitude")
-        south_value = SubElement(south_element, f"{{{self.ns.gco}}}Decimal")
+        south_element = SubElement(bounding_box_element, tags.gmd.southBoundLatitude)
+        south_value = SubElement(south_element, tags.gco.Decimal)
         south_value.text = str(self.element_attributes["south_latitude"])
 
-        north_element = SubElement(bounding_box_element, f"{{{self.ns.gmd}}}northBoundLatitude")
-        north_value = SubElement(north_element, f"{{{self.ns.gco}}}Decimal")
+        north_element = SubElement(bounding_box_element, tags.gmd.northBoundLatitude)
+        north_value = SubElement(north_element, tags.gco.Decimal)
         north_value.text = str(self.element_attributes["north_latitude"])
 
 
 class VerticalExtent(MetadataRecordElement):
-    def make_config(self) -> dict:
-        _ = {}
-
-        minimum_value = self.record.xpath(
-            f"{self.xpath}/gmd:EX_VerticalExtent/gmd:minimumValue/gco:Real/text()",
-            namespaces=self.ns.nsmap(),
-        )
-        if len(minimum_value) == 1:
-            _["minimum"] = float(minimum_value[0])
-
-        maximum_value = self.record.xpath(
-            f"{self.xpath}/gmd:EX_VerticalExtent/gmd:maximumValue/gco:Real/text()",
-            namespaces=self.ns.nsmap(),
-        )
-        if len(maximum_value) == 1:
-            _["maximum"] = float(maximum_value[0])
-
-        vertical_crs = VerticalCRS(
-            record=self.record, attributes=self.attributes, xpath=f"{self.xpath}/gmd:EX_VerticalExtent"
-        )
-        _vertical_crs = vertical_crs.make_config()
-        if bool(_vertical_crs):
-            _ = {**_, **_vertical_crs}
-
-        return _
+    __slots__ = ()
 
     def make_element(self):
-        vertical_extent_wrapper = SubElement(self.parent_element, f"{{{self.ns.gmd}}}verticalElement")
-        vertical_extent_element = SubElement(vertical_extent_wrapper, f"{{{self.ns.gmd}}}EX_VerticalExtent")
+        vertical_extent_wrapper = SubElement(self.parent_element, tags.gmd.verticalElement)
+        vertical_extent_element = SubElement(vertical_extent_wrapper, tags.gmd.EX_VerticalExtent)
 
         if "minimum" in self.element_attributes:
-            minimum_element = SubElement(vertical_extent_element, f"{{{self.ns.gmd}}}minimumValue")
-            minimum_value = SubElement(minimum_element, f"{{{self.ns.gco}}}Real")
+            minimum_element = SubElement(vertical_extent_element, tags.gmd.minimumValue)
+            minimum_value = SubElement(minimum_element, tags.gco.Real)
             minimum_value.text = str(self.element_attributes["minimum"])
 
         if "maximum" in self.element_attributes:
-            maximum_element = SubElement(vertical_extent_element, f"{{{self.ns.gmd}}}maximumValue")
-            maximum_value = SubElement(maximum_element, f"{{{self.ns.gco}}}Real")
+            maximum_element = SubElement(vertical_extent_element, tags.gmd.maximumValue)
+            maximum_value = SubElement(maximum_element, tags.gco.Real)
             maximum_value.text = str(self.element_attributes["maximum"])
 
         if "code" in self.element_attributes:
@@ -1041,151 +588,62 @@ class VerticalExtent(MetadataRecordElement):
 
 
 class VerticalCRS(MetadataRecordElement):
-    def make_config(self) -> dict:
-        _ = {}
-
-        identifier_value = self.record.xpath(
-            f"{self.xpath}/gmd:verticalCRS/gml:VerticalCRS/@gml:id",
-            namespaces=self.ns.nsmap(),
-        )
-        if len(identifier_value) == 1:
-            _["identifier"] = identifier_value[0]
-
-        code_value = self.record.xpath(
-            f"{self.xpath}/gmd:verticalCRS/gml:VerticalCRS/gml:identifier/text()",
-            namespaces=self.ns.nsmap(),
-        )
-        if len(code_value) == 1:
-            _["code"] = code_value[0]
-
-        name_value = self.record.xpath(
-            f"{self.xpath}/gmd:verticalCRS/gml:VerticalCRS/gml:name/text()",
-            namespaces=self.ns.nsmap(),
-        )
-        if len(name_value) == 1:
-            _["name"] = name_value[0]
-
-        remarks_value = self.record.xpath(
-            f"{self.xpath}/gmd:verticalCRS/gml:VerticalCRS/gml:remarks/text()",
-            namespaces=self.ns.nsmap(),
-        )
-        if len(remarks_value) == 1:
-            _["remarks"] = remarks_value[0]
-
-        domain_of_validity_href = self.record.xpath(
-            f"{self.xpath}/gmd:verticalCRS/gml:VerticalCRS/gml:domainOfValidity/@xlink:href",
-            namespaces=self.ns.nsmap(),
-        )
-        if len(domain_of_validity_href) == 1:
-            _["domain_of_validity"] = {"href": domain_of_validity_href[0]}
-
-        scope_value = self.record.xpath(
-            f"{self.xpath}/gmd:verticalCRS/gml:VerticalCRS/gml:scope/text()",
-            namespaces=self.ns.nsmap(),
-        )
-        if len(scope_value) == 1:
-            _["scope"] = scope_value[0]
-
-        vertical_cs_href = self.record.xpath(
-            f"{self.xpath}/gmd:verticalCRS/gml:VerticalCRS/gml:verticalCS/@xlink:href",
-            namespaces=self.ns.nsmap(),
-        )
-        if len(vertical_cs_href) == 1:
-            _["vertical_cs"] = {"href": vertical_cs_href[0]}
-
-        vertical_datum_href = self.record.xpath(
-            f"{self.xpath}/gmd:verticalCRS/gml:VerticalCRS/gml:verticalDatum/@xlink:href",
-            namespaces=self.ns.nsmap(),
-        )
-        if len(vertical_datum_href) == 1:
-            _["vertical_datum"] = {"href": vertical_datum_href[0]}
-
-        return _
+    __slots__ = ()
 
     def make_element(self):
-        vertical_crs_wrapper = SubElement(self.parent_element, f"{{{self.ns.gmd}}}verticalCRS")
+        vertical_crs_wrapper = SubElement(self.parent_element, tags.gmd.verticalCRS)
         vertical_crs_element = SubElement(
             vertical_crs_wrapper,
-            f"{{{self.ns.gml}}}VerticalCRS",
-            attrib={f"{{{self.ns.gml}}}id": self.element_attributes["identifier"]},
-        )
-        vertical_crs_code = SubElement(
-            vertical_crs_element, f"{{{self.ns.gml}}}identifier", attrib={"codeSpace": "OGP"}
+            tags.gml.VerticalCRS,
+            attrib={tags.gml.id: self.element_attributes["identifier"]},
         )
+        vertical_crs_code = SubElement(vertical_crs_element, tags.gml.identifier, attrib={"codeSpace": "OGP"})
         vertical_crs_code.text = self.element_attributes["code"]
 
-        name = SubElement(vertical_crs_element, f"{{{self.ns.gml}}}name")
+        name = SubElement(vertical_crs_element, tags.gml.name)
         name.text = self.element_attributes["name"]
 
-        remarks = SubElement(vertical_crs_element, f"{{{self.ns.gml}}}remarks")
+        remarks = SubElement(vertical_crs_element, tags.gml.remarks)
         remarks.text = self.element_attributes["remarks"]
 
         SubElement(
             vertical_crs_element,
-            f"{{{self.ns.gml}}}domainOfValidity",
-            attrib={f"{{{self.ns.xlink}}}href": self.element_attributes["domain_of_validity"]["href"]},
+            tags.gml.domainOfValidity,
+            attrib={tags.xlink.href: self.element_attributes["domain_of_validity"]["href"]},
         )
 
-        scope = SubElement(vertical_crs_element, f"{{{self.ns.gml}}}scope")
+        scope = SubElement(vertical_crs_element, tags.gml.scope)
         scope.text = self.element_attributes["scope"]
 
         SubElement(
             vertical_crs_element,
-            f"{{{self.ns.gml}}}verticalCS",
-            attrib={f"{{{self.ns.xlink}}}href": self.element_attributes["vertical_cs"]["href"]},
+            tags.gml.verticalCS,
+            attrib={tags.xlink.href: self.element_attributes["vertical_cs"]["href"]},
         )
 
         SubElement(
             vertical_crs_element,
-            f"{{{self.ns.gml}}}verticalDatum",
-            attrib={f"{{{self.ns.xlink}}}href": self.element_attributes["vertical_datum"]["href"]},
+            tags.gml.verticalDatum,
+            attrib={tags.xlink.href: self.element_attributes["vertical_datum"]["href"]},
         )
 
 
 class TemporalExtent(MetadataRecordElement):
-    def make_config(self) -> dict:
-        _ = {}
-
-        begin_value = self.record.xpath(
-            f"{self.xpath}/gmd:temporalElement/gmd:EX_TemporalExtent/gmd:extent/gml:TimePeriod/gml:beginPosition/"
-            f"text()",
-            namespaces=self.ns.nsmap(),
-        )
-        if len(begin_value) == 1:
-            if "period" not in _.keys():
-                _["period"] = {}
-            try:
-                _["period"]["start"] = datetime.fromisoformat(begin_value[0])
-            except ValueError:  # pragma: no cover
-                raise RuntimeError("date time could not be parsed as an ISO datetime value")
-
-        end_value = self.record.xpath(
-            f"{self.xpath}/gmd:temporalElement/gmd:EX_TemporalExtent/gmd:extent/gml:TimePeriod/gml:endPosition/text()",
-            namespaces=self.ns.nsmap(),
-        )
-        if len(end_value) == 1:
-            if "period" not in _.keys():  # pragma: no cover
-                _["period"] = {}
-            try:
-                _["period"]["end"] = datetime.fromisoformat(end_value[0])
-            except ValueError:  # pragma: no cover
-                raise RuntimeError("date time could not be parsed as an ISO datetime value")
-
-        return _
+    __slots__ = ()
 
     def make_element(self):
-        temporal_extent_container = SubElement(self.parent_element, f"{{{self.ns.gmd}}}temporalElement")
-        temporal_extent_wrapper = SubElement(temporal_extent_container, f"{{{self.ns.gmd}}}EX_TemporalExtent")
-        temporal_extent_element = SubElement(temporal_extent_wrapper, f"{{{self.ns.gmd}}}extent")
+        temporal_extent_container = SubElement(self.parent_element, tags.gmd.temporalElement)
+        temporal_extent_wrapper = SubElement(temporal_extent_container, tags.gmd.EX_TemporalExtent)
+        temporal_extent_element = SubElement(temporal_extent_wrapper, tags.gmd.extent)
 
         if "period" in self.element_attributes:
             time_period_element = SubElement(
                 temporal_extent_element,
-                f"{{{self.ns.gml}}}TimePeriod",
-                attrib={f"{{{self.ns.gml}}}id": "boundingExtent"},
+                tags.gml.TimePeriod,
+                attrib={tags.gml.id: "boundingExtent"},
             )
-            begin_position_element = SubElement(time_period_element, f"{{{self.ns.gml}}}beginPosition")
+            begin_position_element = SubElement(time_period_element, tags.gml.beginPosition)
             begin_position_element.text = format_date_string(self.element_attributes["period"]["start"])
 
-            end_position_element = SubElement(time_period_element, f"{{{self.ns.gml}}}endPosition")
+            end_position_element = SubElement(time_period_element, tags.gml.endPosition)
             end_position_element.text = format_date_string(self.element_attributes["period"]["end"])
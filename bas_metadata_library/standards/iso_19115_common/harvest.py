@@ -0,0 +1,217 @@
+from datetime import date
+from pathlib import Path
+from typing import BinaryIO, Iterable, Iterator, List, NamedTuple, Optional, Tuple, Union
+
+# Exempting Bandit security issue (Using Element to parse untrusted XML data is known to be vulnerable to XML attacks)
+#
+# We don't currently allow untrusted/user-provided XML so this is not a risk
+from lxml.etree import Element, iterparse  # nosec
+
+from bas_metadata_library import MetadataRecordConfig
+from bas_metadata_library.batch import process_chunks
+from bas_metadata_library.standards.iso_19115_1_v1 import MetadataRecordConfig as ISO19115MetadataRecordConfig
+from bas_metadata_library.standards.iso_19115_2_v1 import MetadataRecordConfig as ISO19115_2MetadataRecordConfig
+from bas_metadata_library.standards.iso_19115_common import tags
+from bas_metadata_library.standards.iso_19115_common.reader import _select, _single, _texts, read_record
+
+# Configuration classes for each supported record root element
+record_config_classes = {
+    tags.gmd.MD_Metadata: ISO19115MetadataRecordConfig,
+    tags.gmi.MI_Metadata: ISO19115_2MetadataRecordConfig,
+}
+
+# Names of the standard for each supported record root element
+record_standards = {
+    tags.gmd.MD_Metadata: "iso-19115-1-v1",
+    tags.gmi.MI_Metadata: "iso-19115-2-v1",
+}
+
+# Elements which may appear before the date stamp in a record (in the order set by the ISO 19139 schemas)
+header_tags = frozenset(
+    [
+        tags.gmd.fileIdentifier,
+        tags.gmd.language,
+        tags.gmd.characterSet,
+        tags.gmd.parentIdentifier,
+        tags.gmd.hierarchyLevel,
+        tags.gmd.hierarchyLevelName,
+        tags.gmd.contact,
+        tags.gmd.dateStamp,
+    ]
+)
+
+
+class RecordHeader(NamedTuple):
+    """
+    Values identifying a version of a record, as returned by `scan_header()`
+    """
+
+    file_identifier: Optional[str]
+    date_stamp: Optional[date]
+    standard: str
+
+
+def iter_record_configs(source: Union[str, BinaryIO], fields: List[str] = None) -> Iterator[MetadataRecordConfig]:
+    """
+    Parses each ISO 19115 record in a document containing many records (e.g. a CSW or OAI-PMH harvest)
+
+    Records are found anywhere in the document and converted into a configuration object for the standard they use,
+    determined by their root element (`gmd:MD_Metadata` for ISO 19115, `gmi:MI_Metadata` for ISO 19115-2). Records
+    within other records are treated as part of the outer record. Any other elements are ignored.
+
+    The document is parsed incrementally, with each record (and any elements before it) removed once it has been
+    converted, so memory use depends on the size of the largest record rather than the size of the document.
+
+    Where fields are set (e.g. ['file_identifier', 'resource.extent.geographic']), only the parts of each record needed
+    for these values are parsed, and configurations contain only these values (see `read_record()`).
+
+    :type source: str or file
+    :param source: path to, or a binary file object for, the document to parse
+    :type fields: list
+    :param fields: paths to values to include in each configuration, if None all values are included
+
+    :rtype iterator
+    :return: configuration objects for each record, in document order
+    """
+    depth = 0
+    for event, element in iterparse(source, events=("start", "end"), tag=list(record_config_classes.keys())):
+        if event == "start":
+            depth += 1
+            continue
+
+        depth -= 1
+        if depth > 0:
+            continue
+
+        config = read_record(record=element, root_tag=element.tag, fields=fields)
+        _discard_parsed(element=element)
+        yield record_config_classes[element.tag](**config)
+
+
+def _discard_parsed(element: Element) -> None:
+    """
+    Removes an element, and any elements before it, from a partially parsed document
+
+    Elements before the element (i.e. earlier siblings of the element and each of its ancestors) will already have
+    been parsed, and would otherwise be kept in memory until the whole document had been parsed. Nodes before the root
+    element (e.g. comments) aren't part of the tree and can't be removed, so are kept.
+
+    :type element: Element
+    :param element: fully parsed element
+    """
+    element.clear(keep_tail=True)
+    for node in [element, *element.iterancestors()]:
+        parent = node.getparent()
+        if parent is None:
+            break
+        while node.getprevious() is not None:
+            del parent[0]
+
+
+def scan_header(source: Union[str, Path, BinaryIO]) -> RecordHeader:
+    """
+    Reads the file identifier, date stamp and standard of an ISO 19115 record, without parsing the rest of the record
+
+    Intended for checking whether a record has changed (e.g. in a harvest) before converting it. The record is parsed
+    incrementally and parsing stops at the first element after the date stamp, so only the start of the record is
+    read (usually a few KB). Values are the same as in a configuration for the record, or None where not set.
+
+    Records must use the ISO 19115 (`gmd:MD_Metadata`) or ISO 19115-2 (`gmi:MI_Metadata`) root element, otherwise a
+    ValueError is raised. The standard is returned as a name (e.g. 'iso-19115-2-v1'), as in `record_standards`.
+
+    :type source: str or Path or file
+    :param source: path to, or a binary file object for, the record to scan
+
+    :rtype RecordHeader
+    :return: file identifier, date stamp and standard of the record
+    """
+    if isinstance(source, (str, Path)):
+        with open(str(source), "rb") as record_file:
+            return scan_header(record_file)
+
+    standard = None
+    file_identifiers = []
+    date_stamps = []
+    depth = 0
+    for event, element in iterparse(source, events=("start", "end")):
+        if event == "start":
+            depth += 1
+            if depth == 1:
+                if element.tag not in record_standards:
+                    raise ValueError(f"Record is not an ISO 19115 record, root element is '{element.tag}'.")
+                standard = record_standards[element.tag]
+            if depth == 2 and element.tag not in header_tags:
+                break
+            continue
+
+        depth -= 1
+        if depth != 1:
+            continue
+        if element.tag == tags.gmd.fileIdentifier:
+            file_identifiers += _texts(_select([element], tags.gco.CharacterString))
+        elif element.tag == tags.gmd.dateStamp:
+            date_stamps += _texts(_select([element], tags.gco.Date))
+        element.clear(keep_tail=True)
+
+    date_stamp = _single(date_stamps)
+    if date_stamp is not None:
+        try:
+            date_stamp = date.fromisoformat(date_stamp)
+        except ValueError:
+            raise RuntimeError("Datestamp could not be parsed as an ISO datetime value")
+
+    return RecordHeader(file_identifier=_single(file_identifiers), date_stamp=date_stamp, standard=standard)
+
+
+def scan_headers(
+    paths: Iterable[Union[str, Path]], workers: int = 8, chunk_size: int = 100
+) -> Iterator[Tuple[str, Optional[RecordHeader], Optional[dict]]]:
+    """
+    Reads the file identifier, date stamp and standard of many ISO 19115 records, using a pool of threads
+
+    See `scan_header()` for details. For each record, a tuple of its path, its header (or None if it can't be read)
+    and an error (or None if it was read) is yielded, in the same order as paths are given. Errors are represented as
+    dicts, with the type of exception raised (e.g. 'XMLSyntaxError') and a message, as in `make_config_many()`.
+
+    As only the start of each record is parsed, threads are used rather than processes, so that many files can be
+    opened and read at once where this is slow (e.g. on network storage). Where files are already cached in memory,
+    scanning is limited by parsing and a single thread is as quick. Paths are read as needed, so large numbers of
+    records (e.g. from a generator listing a directory) can be scanned without holding them all in memory.
+
+    :type paths: iterable
+    :param paths: paths to files containing an XML record each
+    :type workers: int
+    :param workers: number of threads to use, if 1, records are scanned in the current thread
+    :type chunk_size: int
+    :param chunk_size: number of records given to a thread at once
+
+    :rtype iterator
+    :return: path, header and error for each record
+    """
+    yield from process_chunks(
+        function=_scan_headers,
+        items=(str(path) for path in paths),
+        workers=workers,
+        chunk_size=chunk_size,
+        threads=True,
+    )
+
+
+def _scan_headers(paths: List[str]) -> List[Tuple[str, Optional[RecordHeader], Optional[dict]]]:
+    """
+    Reads headers for a list of records, used by `scan_headers()`
+
+    :type paths: list
+    :param paths: paths to files containing an XML record each
+
+    :rtype list
+    :return: path, header (if read) and error (if not read) for each record
+    """
+    results = []
+    for path in paths:
+        try:
+            results.append((path, scan_header(path), None))
+        except Exception as e:
+            results.append((path, None, {"type": type(e).__name__, "message": str(e)}))
+
+    return results
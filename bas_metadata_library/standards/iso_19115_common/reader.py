@@ -0,0 +1,1119 @@
+from collections import defaultdict
+from collections.abc import Mapping
+from datetime import date, datetime
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+# Exempting Bandit security issue (Using Element to parse untrusted XML data is known to be vulnerable to XML attacks)
+#
+# We don't currently allow untrusted/user-provided XML so this is not a risk
+from lxml.etree import Element  # nosec
+
+from bas_metadata_library.standards.iso_19115_common import tags
+from bas_metadata_library.standards.iso_19115_common.code_lists import code_lists
+from bas_metadata_library.standards.iso_19115_common.utils import contacts_condense_roles
+
+
+def read_record(record: Element, root_tag: str, fields: Optional[List[str]] = None) -> dict:
+    """
+    Builds a record configuration by walking the elements of an ISO 19115 record once
+
+    Used by `MetadataRecord.make_config()` for both ISO 19115 standards. Rather than selecting each value using a
+    separate XPath expression evaluated from the root of the record, the reader groups the children of each element by
+    tag as it walks down the tree, and dispatches each group to a function for that element, so each element is visited
+    once by its parent. Values are selected with the same semantics as XPath expressions, including where values are
+    ignored because an element is repeated where only one is expected.
+
+    Where fields are set, only the parts of the record needed for these fields are parsed, and a partial configuration
+    is returned. See `LazyRecordConfig.select()` for details.
+
+    :type record: Element
+    :param record: root element of the record
+    :type root_tag: str
+    :param root_tag: expected tag of the root element (e.g. '{http://www.isotc211.org/2005/gmd}MD_Metadata')
+    :type fields: list
+    :param fields: paths to values to include (e.g. 'resource.extent.geographic'), if None all values are included
+
+    :rtype dict
+    :return: record configuration
+    """
+    config = read_record_lazy(record=record, root_tag=root_tag)
+    if fields is not None:
+        return config.select(fields=fields)
+    return config.to_dict()
+
+
+def read_record_lazy(record: Element, root_tag: str) -> "LazyRecordConfig":
+    """
+    Returns a view of the configuration of an ISO 19115 record, parsing each part of the record when first accessed
+
+    See `LazyRecordConfig` for details.
+
+    :type record: Element
+    :param record: root element of the record
+    :type root_tag: str
+    :param root_tag: expected tag of the root element (e.g. '{http://www.isotc211.org/2005/gmd}MD_Metadata')
+
+    :rtype LazyRecordConfig
+    :return: record configuration view
+    """
+    return LazyRecordConfig(sections=_record_sections, nodes=_RecordNodes(record=record, root_tag=root_tag))
+
+
+class _RecordNodes(object):
+    """
+    Children of the main parts of a record, grouped by tag when first used
+
+    Where a record has a different root element than expected, all parts are empty.
+    """
+
+    __slots__ = ("record", "_identification", "_distribution", "_quality")
+
+    def __init__(self, record: Element, root_tag: str):
+        """
+        :type record: Element
+        :param record: root element of the record
+        :type root_tag: str
+        :param root_tag: expected tag of the root element
+        """
+        self.record = _group([record] if record.tag == root_tag else [])
+        self._identification = None  # type: Optional[Dict[str, List[Element]]]
+        self._distribution = None  # type: Optional[Dict[str, List[Element]]]
+        self._quality = None  # type: Optional[Dict[str, List[Element]]]
+
+    @property
+    def identification(self) -> Dict[str, List[Element]]:
+        if self._identification is None:
+            self._identification = _group(
+                _select(self.record[tags.gmd.identificationInfo], tags.gmd.MD_DataIdentification)
+            )
+        return self._identification
+
+    @property
+    def distribution(self) -> Dict[str, List[Element]]:
+        if self._distribution is None:
+            self._distribution = _group(_select(self.record[tags.gmd.distributionInfo], tags.gmd.MD_Distribution))
+        return self._distribution
+
+    @property
+    def quality(self) -> Dict[str, List[Element]]:
+        if self._quality is None:
+            self._quality = _group(_select(self.record[tags.gmd.dataQualityInfo], tags.gmd.DQ_DataQuality))
+        return self._quality
+
+
+# Keys each section of a configuration may contain, and the function returning them from the nodes of a record
+_Sections = List[Tuple[Tuple[str, ...], Callable[[_RecordNodes], dict]]]
+
+
+class LazyRecordConfig(Mapping):
+    """
+    Read-only view of a record configuration, parsing each section of the record when first accessed
+
+    Keys are divided into sections (e.g. 'date_stamp' or 'resource.keywords'), each parsed by a function from the
+    reader. Accessing a key parses only the section containing it, with the result kept for later access. The
+    'resource' key is itself a view, so (for example) a resource title can be read without parsing its keywords,
+    constraints or distribution options.
+
+    Keys are only included where they have a value, as with `read_record()`, except for views within a view, which are
+    always included but may be empty. Iterating over a view (including getting its length or keys) therefore parses
+    all of its sections. Use `to_dict()` to get a plain (and mutable) dict, which is the same as from `read_record()`,
+    or `select()` to get a dict with only some values.
+
+    Values are shared with the view, and so should be copied before being changed. The record is kept in memory for as
+    long as the view is.
+    """
+
+    def __init__(self, sections: _Sections, nodes: _RecordNodes):
+        """
+        :type sections: list
+        :param sections: keys in each section, and the function to parse them
+        :type nodes: _RecordNodes
+        :param nodes: record to parse
+        """
+        self._sections = sections
+        self._nodes = nodes
+        self._keys = {key: index for index, (keys, _) in enumerate(sections) for key in keys}
+        self._values = {}  # type: Dict[int, dict]
+
+    def __getitem__(self, key: str):
+        if key not in self._keys:
+            raise KeyError(key)
+        return self._section(self._keys[key])[key]
+
+    def __iter__(self) -> Iterator[str]:
+        for index in range(0, len(self._sections)):
+            yield from self._section(index)
+
+    def __len__(self) -> int:
+        return sum(len(self._section(index)) for index in range(0, len(self._sections)))
+
+    def __repr__(self) -> str:
+        return f"<LazyRecordConfig {len(self._values)} of {len(self._sections)} sections parsed>"
+
+    def to_dict(self) -> dict:
+        """
+        Parses any remaining sections and returns the configuration as a plain dict
+
+        Views within the configuration are also converted, and omitted if they have no values.
+
+        :rtype dict
+        :return: record configuration
+        """
+        _ = {}
+        for key, value in self.items():
+            if isinstance(value, LazyRecordConfig):
+                value = value.to_dict()
+                if not bool(value):
+                    continue
+            _[key] = value
+        return _
+
+    def select(self, fields: List[str]) -> dict:
+        """
+        Returns a partial configuration as a plain dict, including only some values
+
+        Fields are paths to values, with a key for each level of the configuration separated by '.' (e.g. 'date_stamp'
+        or 'resource.extent.geographic'). Only the sections needed for these values are parsed. Values are returned in
+        the same structure as a full configuration, in the order fields are given. Fields for values not set in the
+        record are ignored.
+
+        Fields must select keys supported by each view (i.e. the top level keys, and the keys of 'resource'), and can't
+        select values within lists (e.g. the terms of each set of keywords).
+
+        :type fields: list
+        :param fields: paths to values to include
+
+        :rtype dict
+        :return: partial record configuration
+        """
+        _ = {}
+        for field in fields:
+            keys = field.split(".")
+            value = self
+            for index, key in enumerate(keys):
+                if isinstance(value, LazyRecordConfig) and key not in value._keys:
+                    raise ValueError(f"Field '{field}' is not supported, '{key}' is not a known key.")
+                if not isinstance(value, Mapping):
+                    raise ValueError(f"Field '{field}' is not supported, '{'.'.join(keys[:index])}' is not an object.")
+                if key not in value:
+                    break
+                value = value[key]
+            else:
+                if isinstance(value, LazyRecordConfig):
+                    value = value.to_dict()
+                    if not bool(value):
+                        continue
+                target = _
+                for key in keys[:-1]:
+                    target = target.setdefault(key, {})
+                target[keys[-1]] = value
+        return _
+
+    def _section(self, index: int) -> dict:
+        if index not in self._values:
+            self._values[index] = self._sections[index][1](self._nodes)
+        return self._values[index]
+
+
+# Record sections
+#
+# Each function takes the nodes of a record and returns the keys for a section of its configuration.
+
+
+def _file_identifier_section(nodes: _RecordNodes) -> dict:
+    _ = {}
+    file_identifier = _single(_texts(_select(nodes.record[tags.gmd.fileIdentifier], tags.gco.CharacterString)))
+    if file_identifier is not None:
+        _["file_identifier"] = file_identifier
+    return _
+
+
+def _language_section(nodes: _RecordNodes) -> dict:
+    _ = {}
+    language = _code_list_value(
+        _select(nodes.record[tags.gmd.language], tags.gmd.LanguageCode), code_lists["LanguageCode"].url
+    )
+    if language != "":
+        _["language"] = language
+    return _
+
+
+def _character_set_section(nodes: _RecordNodes) -> dict:
+    _ = {}
+    character_set = _code_list_value(
+        _select(nodes.record[tags.gmd.characterSet], tags.gmd.MD_CharacterSetCode),
+        code_lists["MD_CharacterSetCode"].url,
+    )
+    if character_set != "":
+        _["character_set"] = character_set
+    return _
+
+
+def _hierarchy_level_section(nodes: _RecordNodes) -> dict:
+    _ = {}
+    hierarchy_level = _code_list_value(
+        _select(nodes.record[tags.gmd.hierarchyLevel], tags.gmd.MD_ScopeCode), code_lists["MD_ScopeCode"].url
+    )
+    if hierarchy_level != "":
+        _["hierarchy_level"] = hierarchy_level
+    return _
+
+
+def _contacts_section(nodes: _RecordNodes) -> dict:
+    _ = {}
+    contacts = []
+    for contact in nodes.record[tags.gmd.contact]:
+        _contact = _responsible_party([contact])
+        if bool(_contact):
+            contacts.append(_contact)
+    if len(contacts) > 0:
+        _["contacts"] = contacts
+    return _
+
+
+def _date_stamp_section(nodes: _RecordNodes) -> dict:
+    _ = {}
+    date_stamp = _single(_texts(_select(nodes.record[tags.gmd.dateStamp], tags.gco.Date)))
+    if date_stamp is not None:
+        try:
+            _["date_stamp"] = date.fromisoformat(date_stamp)
+        except ValueError:  # pragma: no cover
+            raise RuntimeError("Datestamp could not be parsed as an ISO datetime value")
+    return _
+
+
+def _metadata_standard_section(nodes: _RecordNodes) -> dict:
+    _ = {}
+    metadata_standard = {}
+    standard_name = _single(_texts(_select(nodes.record[tags.gmd.metadataStandardName], tags.gco.CharacterString)))
+    if standard_name is not None:
+        metadata_standard["name"] = standard_name
+    standard_version = _single(
+        _texts(_select(nodes.record[tags.gmd.metadataStandardVersion], tags.gco.CharacterString))
+    )
+    if standard_version is not None:
+        metadata_standard["version"] = standard_version
+    if bool(metadata_standard):
+        _["metadata_standard"] = metadata_standard
+    return _
+
+
+def _reference_system_info_section(nodes: _RecordNodes) -> dict:
+    _ = {}
+    reference_system_info = _reference_system_info(nodes.record[tags.gmd.referenceSystemInfo])
+    if bool(reference_system_info):
+        _["reference_system_info"] = reference_system_info
+    return _
+
+
+def _maintenance_section(nodes: _RecordNodes) -> dict:
+    _ = {}
+    maintenance = _maintenance_information(nodes.record[tags.gmd.metadataMaintenance])
+    if bool(maintenance):
+        _["maintenance"] = maintenance
+    return _
+
+
+def _resource_section(nodes: _RecordNodes) -> dict:
+    return {"resource": LazyRecordConfig(sections=_resource_sections, nodes=nodes)}
+
+
+# Resource sections
+
+
+def _resource_citation_section(nodes: _RecordNodes) -> dict:
+    return _citation(nodes.identification[tags.gmd.citation])
+
+
+def _resource_abstract_section(nodes: _RecordNodes) -> dict:
+    _ = {}
+    abstract = _single(_texts(_select(nodes.identification[tags.gmd.abstract], tags.gco.CharacterString)))
+    if abstract is not None:
+        _["abstract"] = abstract
+    return _
+
+
+def _resource_contacts_section(nodes: _RecordNodes) -> dict:
+    _ = {}
+    contacts = []
+    for contact in nodes.identification[tags.gmd.pointOfContact]:
+        _contact = _responsible_party([contact])
+        if bool(_contact):
+            contacts.append(_contact)
+
+    # distributors are merged into the main contacts list
+    for distributor in _select(
+        nodes.distribution[tags.gmd.distributor], tags.gmd.MD_Distributor, tags.gmd.distributorContact
+    ):
+        _distributor = _responsible_party([distributor])
+        if bool(_distributor):
+            contacts.append(_distributor)
+
+    if len(contacts) > 0:
+        _["contacts"] = contacts_condense_roles(contacts=contacts)
+    return _
+
+
+def _resource_maintenance_section(nodes: _RecordNodes) -> dict:
+    _ = {}
+    maintenance = _maintenance_information(nodes.identification[tags.gmd.resourceMaintenance])
+    if bool(maintenance):
+        _["maintenance"] = maintenance
+    return _
+
+
+def _resource_keywords_section(nodes: _RecordNodes) -> dict:
+    _ = {}
+    keywords = []
+    for keyword in nodes.identification[tags.gmd.descriptiveKeywords]:
+        _keywords = _descriptive_keywords([keyword])
+        if bool(_keywords):
+            keywords.append(_keywords)
+    if len(keywords) > 0:
+        _["keywords"] = keywords
+    return _
+
+
+def _resource_constraints_section(nodes: _RecordNodes) -> dict:
+    _ = {}
+    constraints = {}
+    for constraint in nodes.identification[tags.gmd.resourceConstraints]:
+        _constraint = _resource_constraints([constraint])
+        for key in ["access", "usage"]:
+            if key in _constraint.keys():
+                if key not in constraints.keys():
+                    constraints[key] = []
+                constraints[key].append(_constraint[key])
+                break
+    if len(constraints) > 0:
+        _["constraints"] = constraints
+    return _
+
+
+def _resource_spatial_representation_type_section(nodes: _RecordNodes) -> dict:
+    _ = {}
+    spatial_representation_type = _code_list_value(
+        _select(nodes.identification[tags.gmd.spatialRepresentationType], tags.gmd.MD_SpatialRepresentationTypeCode),
+        code_lists["MD_SpatialRepresentationTypeCode"].url,
+    )
+    if spatial_representation_type != "":
+        _["spatial_representation_type"] = spatial_representation_type
+    return _
+
+
+def _resource_spatial_resolution_section(nodes: _RecordNodes) -> dict:
+    _ = {}
+    spatial_resolution = _single(
+        _texts(_select(nodes.identification[tags.gmd.spatialResolution], tags.gmd.MD_Resolution, tags.gco.Distance))
+    )
+    if spatial_resolution is not None:  # pragma: no cover
+        _["spatial_resolution"] = spatial_resolution
+    return _
+
+
+def _resource_language_section(nodes: _RecordNodes) -> dict:
+    _ = {}
+    language = _code_list_value(
+        _select(nodes.identification[tags.gmd.language], tags.gmd.LanguageCode), code_lists["LanguageCode"].url
+    )
+    if language != "":
+        _["language"] = language
+    return _
+
+
+def _resource_character_set_section(nodes: _RecordNodes) -> dict:
+    _ = {}
+    character_set = _code_list_value(
+        _select(nodes.identification[tags.gmd.characterSet], tags.gmd.MD_CharacterSetCode),
+        code_lists["MD_CharacterSetCode"].url,
+    )
+    if character_set != "":  # pragma: no cover
+        _["character_set"] = character_set
+    return _
+
+
+def _resource_topics_section(nodes: _RecordNodes) -> dict:
+    _ = {}
+    topics = []
+    for topic in nodes.identification[tags.gmd.topicCategory]:
+        _topic = _single(_texts(_select([topic], tags.gmd.MD_TopicCategoryCode)))
+        if _topic is not None:
+            topics.append(_topic)
+    if len(topics) > 0:
+        _["topics"] = topics
+    return _
+
+
+def _resource_extent_section(nodes: _RecordNodes) -> dict:
+    _ = {}
+    extent = _extent(_select(nodes.identification[tags.gmd.extent], tags.gmd.EX_Extent))
+    if bool(extent):
+        _["extent"] = extent
+    return _
+
+
+def _resource_supplemental_information_section(nodes: _RecordNodes) -> dict:
+    _ = {}
+    supplemental_information = _single(
+        _texts(_select(nodes.identification[tags.gmd.supplementalInformation], tags.gco.CharacterString))
+    )
+    if supplemental_information is not None:
+        _["supplemental_information"] = supplemental_information
+    return _
+
+
+def _resource_formats_section(nodes: _RecordNodes) -> dict:
+    _ = {}
+    formats = []
+    for distribution_format in nodes.distribution[tags.gmd.distributionFormat]:
+        _format = _distribution_format([distribution_format])
+        if bool(_format):
+            formats.append(_format)
+    if len(formats) > 0:
+        _["formats"] = formats
+    return _
+
+
+def _resource_transfer_options_section(nodes: _RecordNodes) -> dict:
+    _ = {}
+    transfer_options = []
+    for transfer_option in nodes.distribution[tags.gmd.transferOptions]:
+        _transfer_option = _transfer_options([transfer_option])
+        if bool(_transfer_option):
+            transfer_options.append(_transfer_option)
+    if len(transfer_options) > 0:
+        _["transfer_options"] = transfer_options
+    return _
+
+
+def _resource_quality_section(nodes: _RecordNodes) -> dict:
+    _ = {}
+
+    # domain consistency reports are selected at any depth within report elements
+    reports = [
+        report
+        for node in nodes.quality[tags.gmd.report]
+        for report in node.iterdescendants(tags.gmd.DQ_DomainConsistency)
+    ]
+    report = _report(reports)
+    if bool(report):
+        _["measures"] = [report]
+
+    lineage = _single(
+        _texts(
+            _select(nodes.quality[tags.gmd.lineage], tags.gmd.LI_Lineage, tags.gmd.statement, tags.gco.CharacterString)
+        )
+    )
+    if lineage is not None:
+        _["lineage"] = lineage
+
+    return _
+
+
+_record_sections = [
+    (("file_identifier",), _file_identifier_section),
+    (("language",), _language_section),
+    (("character_set",), _character_set_section),
+    (("hierarchy_level",), _hierarchy_level_section),
+    (("contacts",), _contacts_section),
+    (("date_stamp",), _date_stamp_section),
+    (("metadata_standard",), _metadata_standard_section),
+    (("reference_system_info",), _reference_system_info_section),
+    (("maintenance",), _maintenance_section),
+    (("resource",), _resource_section),
+]  # type: _Sections
+
+_resource_sections = [
+    (("title", "dates", "edition", "identifiers", "contact"), _resource_citation_section),
+    (("abstract",), _resource_abstract_section),
+    (("contacts",), _resource_contacts_section),
+    (("maintenance",), _resource_maintenance_section),
+    (("keywords",), _resource_keywords_section),
+    (("constraints",), _resource_constraints_section),
+    (("spatial_representation_type",), _resource_spatial_representation_type_section),
+    (("spatial_resolution",), _resource_spatial_resolution_section),
+    (("language",), _resource_language_section),
+    (("character_set",), _resource_character_set_section),
+    (("topics",), _resource_topics_section),
+    (("extent",), _resource_extent_section),
+    (("supplemental_information",), _resource_supplemental_information_section),
+    (("formats",), _resource_formats_section),
+    (("transfer_options",), _resource_transfer_options_section),
+    (("measures", "lineage"), _resource_quality_section),
+]  # type: _Sections
+
+
+# Element parsers
+#
+# Each function takes the elements matching a path (i.e. an XPath node-set) and returns a partial configuration. Most
+# paths match a single element, where they match more, values are combined in the same way as an XPath expression.
+
+
+def _responsible_party(nodes: List[Element]) -> dict:
+    _ = {}
+    children = _group(_select(nodes, tags.gmd.CI_ResponsibleParty))
+
+    for key, tag in [("individual", tags.gmd.individualName), ("organisation", tags.gmd.organisationName)]:
+        name = _first(_texts(_select_any(children[tag], tags.gmx.Anchor, tags.gco.CharacterString)))
+        if name is not None:
+            _[key] = {"name": name}
+        anchors = _select(children[tag], tags.gmx.Anchor)
+        for attribute, attribute_tag in [("href", tags.xlink.href), ("title", tags.xlink.title)]:
+            value = _first(_attributes(anchors, attribute_tag))
+            if value is not None:
+                if key not in _.keys():  # pragma: no cover
+                    _[key] = {}
+                _[key][attribute] = value
+
+    contact_info = _group(_select(children[tags.gmd.contactInfo], tags.gmd.CI_Contact))
+
+    phone = _first(
+        _texts(_select(contact_info[tags.gmd.phone], tags.gmd.CI_Telephone, tags.gmd.voice, tags.gco.CharacterString))
+    )
+    if phone is not None:
+        _["phone"] = phone
+
+    address = _group(_select(contact_info[tags.gmd.address], tags.gmd.CI_Address))
+    for key, tag in [
+        ("delivery_point", tags.gmd.deliveryPoint),
+        ("city", tags.gmd.city),
+        ("administrative_area", tags.gmd.administrativeArea),
+        ("postal_code", tags.gmd.postalCode),
+        ("country", tags.gmd.country),
+    ]:
+        value = _first(_texts(_select(address[tag], tags.gco.CharacterString)))
+        if value is not None:
+            if "address" not in _.keys():
+                _["address"] = {}
+            _["address"][key] = value
+
+    email = _first(_texts(_select(address[tags.gmd.electronicMailAddress], tags.gco.CharacterString)))
+    if email is not None:
+        _["email"] = email
+
+    online_resource = _online_resource(contact_info[tags.gmd.onlineResource])
+    if list(online_resource.keys()) == ["function"] and online_resource["function"] == "":  # pragma: no cover
+        online_resource = {}
+    if bool(online_resource):
+        _["online_resource"] = online_resource
+
+    role = _code_list_value(_select(children[tags.gmd.role], tags.gmd.CI_RoleCode), code_lists["CI_RoleCode"].url)
+    if role != "":
+        _["role"] = [role]
+
+    return _
+
+
+def _online_resource(nodes: List[Element]) -> dict:
+    _ = {}
+    children = _group(_select(nodes, tags.gmd.CI_OnlineResource))
+
+    href = _first(_texts(_select(children[tags.gmd.linkage], tags.gmd.URL)))
+    if href is not None:
+        _["href"] = href
+
+    title = _first(_texts(_select(children[tags.gmd.name], tags.gco.CharacterString)))
+    if title is not None:
+        _["title"] = title
+
+    description = _first(_texts(_select(children[tags.gmd.description], tags.gco.CharacterString)))
+    if description is not None:
+        _["description"] = description
+
+    function = _code_list_value(
+        _select(children[tags.gmd.function], tags.gmd.CI_OnLineFunctionCode),
+        code_lists["CI_OnLineFunctionCode"].url,
+    )
+    if function != "":
+        _["function"] = function
+
+    return _
+
+
+def _maintenance_information(nodes: List[Element]) -> dict:
+    _ = {}
+    children = _group(_select(nodes, tags.gmd.MD_MaintenanceInformation))
+
+    maintenance_frequency = _code_list_value(
+        _select(children[tags.gmd.maintenanceAndUpdateFrequency], tags.gmd.MD_MaintenanceFrequencyCode),
+        code_lists["MD_MaintenanceFrequencyCode"].url,
+    )
+    if maintenance_frequency != "":
+        _["maintenance_frequency"] = maintenance_frequency
+
+    progress = _code_list_value(
+        _select(children[tags.gmd.maintenanceNote], tags.gmd.MD_ProgressCode), code_lists["MD_ProgressCode"].url
+    )
+    if progress != "":
+        _["progress"] = progress
+
+    return _
+
+
+def _citation(nodes: List[Element]) -> dict:
+    _ = {}
+    children = _group(_select(nodes, tags.gmd.CI_Citation))
+
+    title = _single(_texts(_select_any(children[tags.gmd.title], tags.gco.CharacterString, tags.gmx.Anchor)))
+    if title is not None:
+        _["title"] = {"value": title}
+    title_href = _single(_attributes(_select(children[tags.gmd.title], tags.gmx.Anchor), tags.xlink.href))
+    if title_href is not None:
+        if "title" not in _.keys():  # pragma: no cover
+            _["title"] = {}
+        _["title"]["href"] = title_href
+
+    dates = []
+    for date_ in children[tags.gmd.date]:
+        _date = _date_config([date_])
+        if bool(_date):
+            dates.append(_date)
+    if len(dates) > 0:
+        _["dates"] = dates
+
+    edition = _single(_texts(_select(children[tags.gmd.edition], tags.gco.CharacterString)))
+    if edition is not None:
+        _["edition"] = edition
+
+    identifiers = []
+    for identifier in children[tags.gmd.identifier]:
+        _identifier = _identifier_config([identifier])
+        if bool(_identifier):
+            identifiers.append(_identifier)
+    if len(identifiers) > 0:
+        _["identifiers"] = identifiers
+
+    contact = _responsible_party(children[tags.gmd.citedResponsibleParty])
+    if bool(contact):
+        _["contact"] = contact
+
+    return _
+
+
+def _date_config(nodes: List[Element]) -> dict:
+    _ = {}
+    children = _group(_select(nodes, tags.gmd.CI_Date))
+
+    date_value = _single(_texts(_select(children[tags.gmd.date], tags.gco.Date)))
+    if date_value is not None:
+        try:
+            if len(date_value) == 4:
+                # Assume a year only date
+                date_value = f"{date_value}-01-01"
+                _["date_precision"] = "year"
+
+            _["date"] = datetime.fromisoformat(date_value).date()
+        except ValueError:  # pragma: no cover
+            raise RuntimeError("Date could not be parsed as an ISO date value")
+
+    date_time_value = _single(_texts(_select(children[tags.gmd.date], tags.gco.DateTime)))
+    if date_time_value is not None:
+        try:
+            _["date"] = datetime.fromisoformat(date_time_value)
+        except ValueError:  # pragma: no cover
+            raise RuntimeError("Date could not be parsed as an ISO datetime value")
+
+    _["date_type"] = _code_list_value(
+        _select(children[tags.gmd.dateType], tags.gmd.CI_DateTypeCode), code_lists["CI_DateTypeCode"].url
+    )
+
+    return _
+
+
+def _identifier_config(nodes: List[Element]) -> dict:
+    _ = {}
+    codes = _select(nodes, tags.gmd.MD_Identifier, tags.gmd.code)
+
+    identifier = _single(_texts(_select_any(codes, tags.gco.CharacterString, tags.gmx.Anchor)))
+    if identifier is not None:
+        _["identifier"] = identifier
+
+    anchors = _select(codes, tags.gmx.Anchor)
+    for attribute, attribute_tag in [("href", tags.xlink.href), ("title", tags.xlink.title)]:
+        value = _single(_attributes(anchors, attribute_tag))
+        if value is not None:
+            _[attribute] = value
+
+    return _
+
+
+def _reference_system_info(nodes: List[Element]) -> dict:
+    _ = {}
+    children = _group(
+        _select(nodes, tags.gmd.MD_ReferenceSystem, tags.gmd.referenceSystemIdentifier, tags.gmd.RS_Identifier)
+    )
+
+    authority = _citation(children[tags.gmd.authority])
+    if bool(authority):
+        _["authority"] = authority
+
+    code = _single(_texts(_select_any(children[tags.gmd.code], tags.gco.CharacterString, tags.gmx.Anchor)))
+    if code is not None:
+        _["code"] = {"value": code}
+    code_href = _single(_attributes(_select(children[tags.gmd.code], tags.gmx.Anchor), tags.xlink.href))
+    if code_href is not None:
+        if "code" not in _.keys():  # pragma: no cover
+            _["code"] = {}
+        _["code"]["href"] = code_href
+
+    version = _single(_texts(_select(children[tags.gmd.version], tags.gco.CharacterString)))
+    if version is not None:
+        _["version"] = version
+
+    return _
+
+
+def _descriptive_keywords(nodes: List[Element]) -> dict:
+    _ = {}
+    children = _group(_select(nodes, tags.gmd.MD_Keywords))
+
+    # terms without links are listed before terms with links, regardless of their order in the record
+    terms = [{"term": term} for term in _texts(_select(children[tags.gmd.keyword], tags.gco.CharacterString))]
+    for anchor in _select(children[tags.gmd.keyword], tags.gmx.Anchor):
+        term = {}
+        term_value = _first(_texts([anchor]))
+        if term_value is not None:
+            term["term"] = term_value
+        term_href = anchor.get(tags.xlink.href)
+        if term_href is not None:
+            term["href"] = term_href
+        if bool(term):
+            terms.append(term)
+    if bool(terms):
+        _["terms"] = terms
+
+    keywords_type = _code_list_value(
+        _select(children[tags.gmd.type], tags.gmd.MD_KeywordTypeCode), code_lists["MD_KeywordTypeCode"].url
+    )
+    if keywords_type != "":
+        _["type"] = keywords_type
+
+    thesaurus = _citation(children[tags.gmd.thesaurusName])
+    if bool(thesaurus):
+        _["thesaurus"] = thesaurus
+
+    return _
+
+
+def _resource_constraints(nodes: List[Element]) -> dict:
+    _ = {}
+    legal_constraints = _select(nodes, tags.gmd.MD_LegalConstraints)
+    children = _group(legal_constraints)
+
+    _id = _single(_attributes(legal_constraints, "id"))
+
+    access_constraint = _code_list_value(
+        _select(children[tags.gmd.accessConstraints], tags.gmd.MD_RestrictionCode),
+        code_lists["MD_RestrictionCode"].url,
+    )
+    if access_constraint != "":
+        _["access"] = {"restriction_code": access_constraint}
+
+        other_constraint = _single(_texts(_select(children[tags.gmd.otherConstraints], tags.gco.CharacterString)))
+        if other_constraint is not None:
+            _["access"]["statement"] = other_constraint
+
+    usage_constraint = {}
+    statement = _single(
+        _texts(_select_any(children[tags.gmd.useLimitation], tags.gco.CharacterString, tags.gmx.Anchor))
+    )
+    if statement is not None:
+        usage_constraint["statement"] = statement
+    href = _single(_attributes(_select(children[tags.gmd.useLimitation], tags.gmx.Anchor), tags.xlink.href))
+    if href is not None:
+        usage_constraint["href"] = href
+    if bool(usage_constraint):
+        _["usage"] = usage_constraint
+
+        if _id == "copyright":
+            _["usage"] = {"copyright_licence": usage_constraint}
+            if (
+                "href" in usage_constraint
+                and usage_constraint["href"]
+                == "http://www.nationalarchives.gov.uk/doc/open-government-licence/version/3/"
+            ):
+                usage_constraint["code"] = "OGL-UK-3.0"
+        elif _id == "citation":
+            _["usage"] = {"required_citation": usage_constraint}
+
+    if _id == "InspireLimitationsOnPublicAccess":
+        limitations_on_access = _single(_texts(_select(children[tags.gmd.otherConstraints], tags.gmx.Anchor)))
+        if limitations_on_access is not None:
+            if "access" in _.keys():
+                _["access"]["inspire_limitations_on_public_access"] = limitations_on_access
+
+    return _
+
+
+def _extent(nodes: List[Element]) -> dict:
+    _ = {}
+    children = _group(nodes)
+
+    bounding_box = {}
+    for key, tag in [
+        ("west_longitude", tags.gmd.westBoundLongitude),
+        ("east_longitude", tags.gmd.eastBoundLongitude),
+        ("south_latitude", tags.gmd.southBoundLatitude),
+        ("north_latitude", tags.gmd.northBoundLatitude),
+    ]:
+        value = _single(
+            _texts(
+                _select(children[tags.gmd.geographicElement], tags.gmd.EX_GeographicBoundingBox, tag, tags.gco.Decimal)
+            )
+        )
+        if value is not None:
+            bounding_box[key] = float(value)
+    if bool(bounding_box):
+        _["geographic"] = {"bounding_box": bounding_box}
+
+    temporal_extent = {}
+    time_period = _group(
+        _select(children[tags.gmd.temporalElement], tags.gmd.EX_TemporalExtent, tags.gmd.extent, tags.gml.TimePeriod)
+    )
+    for key, tag in [("start", tags.gml.beginPosition), ("end", tags.gml.endPosition)]:
+        value = _single(_texts(time_period[tag]))
+        if value is not None:
+            if "period" not in temporal_extent.keys():
+                temporal_extent["period"] = {}
+            try:
+                temporal_extent["period"][key] = datetime.fromisoformat(value)
+            except ValueError:  # pragma: no cover
+                raise RuntimeError("date time could not be parsed as an ISO datetime value")
+    if bool(temporal_extent):
+        _["temporal"] = temporal_extent
+
+    vertical_extent = _vertical_extent(_select(children[tags.gmd.verticalElement], tags.gmd.EX_VerticalExtent))
+    if bool(vertical_extent):
+        _["vertical"] = vertical_extent
+
+    return _
+
+
+def _vertical_extent(nodes: List[Element]) -> dict:
+    _ = {}
+    children = _group(nodes)
+
+    for key, tag in [("minimum", tags.gmd.minimumValue), ("maximum", tags.gmd.maximumValue)]:
+        value = _single(_texts(_select(children[tag], tags.gco.Real)))
+        if value is not None:
+            _[key] = float(value)
+
+    vertical_crs_nodes = _select(children[tags.gmd.verticalCRS], tags.gml.VerticalCRS)
+    vertical_crs = _group(vertical_crs_nodes)
+
+    identifier = _single(_attributes(vertical_crs_nodes, tags.gml.id))
+    if identifier is not None:
+        _["identifier"] = identifier
+
+    for key, tag in [("code", tags.gml.identifier), ("name", tags.gml.name), ("remarks", tags.gml.remarks)]:
+        value = _single(_texts(vertical_crs[tag]))
+        if value is not None:
+            _[key] = value
+
+    domain_of_validity = _single(_attributes(vertical_crs[tags.gml.domainOfValidity], tags.xlink.href))
+    if domain_of_validity is not None:
+        _["domain_of_validity"] = {"href": domain_of_validity}
+
+    scope = _single(_texts(vertical_crs[tags.gml.scope]))
+    if scope is not None:
+        _["scope"] = scope
+
+    for key, tag in [("vertical_cs", tags.gml.verticalCS), ("vertical_datum", tags.gml.verticalDatum)]:
+        value = _single(_attributes(vertical_crs[tag], tags.xlink.href))
+        if value is not None:
+            _[key] = {"href": value}
+
+    return _
+
+
+def _distribution_format(nodes: List[Element]) -> dict:
+    _ = {}
+    children = _group(_select(nodes, tags.gmd.MD_Format))
+
+    name = _single(_texts(_select_any(children[tags.gmd.name], tags.gco.CharacterString, tags.gmx.Anchor)))
+    if name is not None:
+        _["format"] = name
+
+    href = _single(_attributes(_select(children[tags.gmd.name], tags.gmx.Anchor), tags.xlink.href))
+    if href is not None:
+        _["href"] = href
+
+    version = _single(_texts(_select(children[tags.gmd.version], tags.gco.CharacterString)))
+    if version is not None:  # pragma: no cover
+        _["version"] = version
+
+    return _
+
+
+def _transfer_options(nodes: List[Element]) -> dict:
+    _ = {}
+    children = _group(_select(nodes, tags.gmd.MD_DigitalTransferOptions))
+
+    size_unit = _single(_texts(_select(children[tags.gmd.unitsOfDistribution], tags.gco.CharacterString)))
+    if size_unit is not None:
+        _["size"] = {"unit": size_unit}
+
+    size_magnitude = _single(_texts(_select(children[tags.gmd.transferSize], tags.gco.Real)))
+    if size_magnitude is not None:
+        if "size" not in _.keys():  # pragma: no cover
+            _["size"] = {}
+        _["size"]["magnitude"] = float(size_magnitude)
+
+    online_resource = _online_resource(children[tags.gmd.onLine])
+    if list(online_resource.keys()) == ["function"] and online_resource["function"] == "":  # pragma: no cover
+        online_resource = {}
+    if bool(online_resource):
+        _["online_resource"] = online_resource
+
+    return _
+
+
+def _report(nodes: List[Element]) -> dict:
+    _ = {}
+    children = _group(nodes)
+
+    identifier = _group(_select(children[tags.gmd.measureIdentification], tags.gmd.RS_Identifier))
+    for key, tag in [("code", tags.gmd.code), ("code_space", tags.gmd.codeSpace)]:
+        value = _single(_texts(_select(identifier[tag], tags.gco.CharacterString)))
+        if value is not None:
+            _[key] = value
+
+    result = _group(_select(children[tags.gmd.result], tags.gmd.DQ_ConformanceResult))
+
+    specification = _citation(result[tags.gmd.specification])
+    if bool(specification):
+        _ = {**_, **specification}
+
+    explanation = _single(_texts(_select(result[tags.gmd.explanation], tags.gco.CharacterString)))
+    if explanation is not None:
+        _["explanation"] = explanation
+
+    result_pass = _single(_texts(_select(result[tags.gmd["pass"]], tags.gco.Boolean)))
+    if result_pass is not None:
+        _["pass"] = bool(result_pass)
+
+    return _
+
+
+# Node-set functions
+#
+# These functions mirror XPath steps, with lists of elements in document order.
+
+
+def _group(nodes: List[Element]) -> Dict[str, List[Element]]:
+    """
+    Groups the children of elements by tag, in document order
+
+    Tags without any children return an empty list.
+
+    :type nodes: list
+    :param nodes: elements
+
+    :rtype dict
+    :return: child elements indexed by tag
+    """
+    children = defaultdict(list)
+    for node in nodes:
+        for child in node:
+            children[child.tag].append(child)
+    return children
+
+
+def _select(nodes: List[Element], *tags: str) -> List[Element]:
+    """
+    Selects child elements by following a path of tags, equivalent to the XPath expression 'a/b/c'
+
+    :type nodes: list
+    :param nodes: elements to select from
+    :type tags: str
+    :param tags: tag for each step
+
+    :rtype list
+    :return: selected elements, in document order
+    """
+    for tag in tags:
+        nodes = [child for node in nodes for child in node.iterchildren(tag)]
+    return nodes
+
+
+def _select_any(nodes: List[Element], *tags: str) -> List[Element]:
+    """
+    Selects child elements with any of a set of tags, equivalent to the XPath expression 'a | b'
+
+    :type nodes: list
+    :param nodes: elements to select from
+    :type tags: str
+    :param tags: tags to select
+
+    :rtype list
+    :return: selected elements, in document order
+    """
+    return [child for node in nodes for child in node.iterchildren(*tags)]
+
+
+def _texts(nodes: List[Element]) -> List[str]:
+    """
+    Returns the text nodes of elements, equivalent to the XPath expression 'text()'
+
+    As well as the text of each element, text following each child element (it's tail) is a separate text node.
+
+    :type nodes: list
+    :param nodes: elements
+
+    :rtype list
+    :return: text values
+    """
+    texts = []
+    for node in nodes:
+        if node.text is not None:
+            texts.append(node.text)
+        for child in node:
+            if child.tail is not None:
+                texts.append(child.tail)
+    return texts
+
+
+def _attributes(nodes: List[Element], name: str) -> List[str]:
+    """
+    Returns an attribute of elements, where set, equivalent to the XPath expression '@name'
+
+    :type nodes: list
+    :param nodes: elements
+    :type name: str
+    :param name: attribute name, in Clark notation where namespaced
+
+    :rtype list
+    :return: attribute values
+    """
+    return [node.get(name) for node in nodes if node.get(name) is not None]
+
+
+def _code_list_value(nodes: List[Element], code_list: str) -> str:
+    """
+    Returns the value of a code list element, where it uses the expected code list and only one value is set
+
+    :type nodes: list
+    :param nodes: code list elements (e.g. 'gmd:LanguageCode')
+    :type code_list: str
+    :param code_list: code list URI
+
+    :rtype str
+    :return: code list value, or an empty string
+    """
+    values = [node.get("codeListValue") for node in nodes if node.get("codeList") == code_list]
+    values = [value for value in values if value is not None]
+    if len(values) == 1:
+        return values[0]
+    return ""
+
+
+def _first(values: List[str]) -> Optional[str]:
+    if len(values) > 0:
+        return values[0]
+    return None
+
+
+def _single(values: List[str]) -> Optional[str]:
+    if len(values) == 1:
+        return values[0]
+    return None
@@ -1,8 +1,5 @@
-import json
-from copy import deepcopy
 from datetime import date, datetime
-from itertools import groupby
-from typing import Union, List
+from typing import Dict, Hashable, List, Set, Union
 
 
 def format_date_string(date_datetime: Union[date, datetime]) -> str:
@@ -41,38 +38,62 @@ def contacts_have_role(contacts: list, role: str) -> bool:
     return False
 
 
-def contacts_condense_roles(contacts: List[dict]):
+def contacts_condense_roles(contacts: List[dict]) -> List[dict]:
     """
     Groups separate contacts with multiple roles into a single contact with multiple roles
 
     I.e. if two contacts are identical but with different, singular, roles, this method will return a single contact
     with multiple roles.
 
-    E.g. a set of contacts: {'name': 'foo', role: ['a']}, {'name': 'foo', role: ['b']}, {'name': 'bar', role: ['a']}
+    E.g. a set of contacts: {'name': 'foo', role: ['a']}, {'name': 'bar', role: ['a']}, {'name': 'foo', role: ['b']}
                with become: {'name': 'foo', role: ['a', 'b']}, {'name': 'bar', role: ['a']}
 
+    Contacts are identical if all their values, other than roles, are equal (regardless of the order of keys). They are
+    grouped wherever they appear in the list (e.g. where distributors and points of contact are interleaved), and are
+    returned in the order each contact first appears, with roles in the order they first appear for that contact.
+
+    Contacts are grouped using a hashable key for each contact, so the time taken grows linearly with the number of
+    contacts. Contacts are not copied, so values other than roles are shared with the contacts given.
+
     :type contacts: list
     :param contacts: list of contacts to be grouped/reduced
 
     :rtype list
     :return list of contacts with merged roles
     """
-    _merged_contacts = []
+    _merged_contacts = {}  # type: Dict[Hashable, dict]
+    _merged_roles = {}  # type: Dict[Hashable, Set[str]]
 
-    _contacts_without_roles = []
     for contact in contacts:
-        _contact = deepcopy(contact)
-        del _contact["role"]
-        _contacts_without_roles.append(
-            {"key": json.dumps(_contact), "key_data": _contact, "role_data": contact["role"][0]}
-        )
-
-    for key, contact in groupby(_contacts_without_roles, key=lambda x: x["key"]):
-        contact = list(contact)
-        _merged_contact = contact[0]["key_data"]
-        _merged_contact["role"] = []
-        for _contact in contact:
-            _merged_contact["role"].append(_contact["role_data"])
-        _merged_contacts.append(_merged_contact)
-
-    return _merged_contacts
+        roles = contact["role"]
+        _contact = {key: value for key, value in contact.items() if key != "role"}
+        key = _contact_key(_contact)
+
+        if key not in _merged_contacts:
+            _contact["role"] = []
+            _merged_contacts[key] = _contact
+            _merged_roles[key] = set()
+        for role in roles:
+            if role not in _merged_roles[key]:
+                _merged_roles[key].add(role)
+                _merged_contacts[key]["role"].append(role)
+
+    return list(_merged_contacts.values())
+
+
+def _contact_key(value) -> Hashable:
+    """
+    Converts a contact, or a value within a contact, into an equivalent hashable value
+
+    Dicts are converted into frozensets of their items, so keys may be in any order, and lists into tuples.
+
+    :param value: contact or value
+
+    :rtype hashable
+    :return: hashable value
+    """
+    if isinstance(value, dict):
+        return frozenset((key, _contact_key(item)) for key, item in value.items())
+    if isinstance(value, list):
+        return tuple(_contact_key(item) for item in value)
+    return value
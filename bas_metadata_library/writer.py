@@ -0,0 +1,77 @@
+from contextlib import ExitStack
+from typing import BinaryIO, Optional, Union
+
+from lxml.etree import xmlfile
+
+from bas_metadata_library import MetadataRecord
+
+
+class RecordsWriter(object):
+    """
+    Writes many metadata records to a file, within a container element, as each record is generated
+
+    The container element (e.g. a CSW `GetRecordsResponse`) is opened once, then the root element of each record is
+    written and flushed to the file as it is added. Records are not kept once written, so memory use depends on the
+    size of the largest record rather than the number of records written.
+
+    This class is a context manager, the container element is opened when the context is entered and closed when it
+    exits. Records can only be written within this context.
+    """
+
+    def __init__(
+        self,
+        output: Union[str, BinaryIO],
+        container: str,
+        container_attributes: dict = None,
+        nsmap: dict = None,
+        pretty_print: bool = True,
+    ):
+        """
+        :type output: str or file
+        :param output: path to, or a binary file object (e.g. from `socket.makefile("wb")`) for, the file to write to
+        :type container: str
+        :param container: tag of the container element, in Clark notation where namespaced (e.g. '{namespace}tag')
+        :type container_attributes: dict
+        :param container_attributes: attributes for the container element
+        :type nsmap: dict
+        :param nsmap: namespaces to declare on the container element, as a dict of prefixes and namespace URIs
+        :type pretty_print: bool
+        :param pretty_print: whether to indent records
+        """
+        self.output = output
+        self.container = container
+        self.container_attributes = container_attributes
+        self.nsmap = nsmap
+        self.pretty_print = pretty_print
+
+        self._file = None
+        self._stack = None  # type: Optional[ExitStack]
+
+    def __enter__(self) -> "RecordsWriter":
+        with ExitStack() as stack:
+            self._file = stack.enter_context(xmlfile(self.output, encoding="utf-8"))
+            self._file.write_declaration()
+            stack.enter_context(self._file.element(self.container, attrib=self.container_attributes, nsmap=self.nsmap))
+            self._stack = stack.pop_all()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> Optional[bool]:
+        stack = self._stack
+        self._stack = None
+        self._file = None
+        return stack.__exit__(exc_type, exc_val, exc_tb)
+
+    def write(self, record: MetadataRecord) -> None:
+        """
+        Generates a record and writes it to the file
+
+        :type record: MetadataRecord
+        :param record: metadata record, with a configuration
+        """
+        if self._file is None:
+            raise RuntimeError("Writer must be used as a context manager.")
+
+        self._file.write(record.make_element(), pretty_print=self.pretty_print)
+        self._file.flush()
+        if hasattr(self.output, "flush"):
+            self.output.flush()
@@ -1,10 +1,40 @@
+import json
 import os
 
+import click
 import requests
 
 from pathlib import Path
 
 from app import create_app
+from bas_metadata_library.standards.iso_19115_1_v1 import MetadataRecord as ISO19115_1_MetadataRecord
+from bas_metadata_library.standards.iso_19115_2_v1 import MetadataRecord as ISO19115_2_MetadataRecord
+from tests.benchmarks.validation import (
+    benchmark_schema_registry,
+    benchmark_validator_cache,
+    benchmark_native_dates,
+    benchmark_validate_many,
+    benchmark_validate_changes,
+    benchmark_validation_engines,
+    benchmark_validation_cache,
+    benchmark_flattened_schemas,
+)
+from tests.benchmarks.records import (
+    benchmark_read_record,
+    benchmark_record_scaling,
+    benchmark_harvest,
+    benchmark_make_config_many,
+    benchmark_generate_many,
+    benchmark_records_writer,
+    benchmark_citation_cache,
+    benchmark_citation_prefetch,
+    benchmark_record_allocations,
+    benchmark_lazy_config,
+    benchmark_config_fields,
+    benchmark_scan_headers,
+    benchmark_condense_roles,
+    benchmark_config_fingerprint,
+)
 
 from tests.resources.configs.iso19115_1_v1_standard import configs_all as iso19115_1_v1_standard_configs
 from tests.resources.configs.iso19115_2_v1_standard import configs_all as iso19115_2_v1_standard_configs
@@ -32,6 +62,61 @@ def capture_test_records():
                 response_file.write(response.text)
 
 
+record_classes = {"iso-19115-1-v1": ISO19115_1_MetadataRecord, "iso-19115-2-v1": ISO19115_2_MetadataRecord}
+
+
+@app.cli.command()
+@click.argument("standard", type=click.Choice(list(record_classes.keys())))
+@click.argument("records_path", type=click.Path(exists=True, file_okay=False))
+@click.option("--output", type=click.File(mode="w"), default="-", help="NDJSON file to write to, stdout by default.")
+@click.option("--workers", type=click.IntRange(min=1), default=1, help="Number of processes to use.")
+@click.option("--chunk-size", type=click.IntRange(min=1), default=100, help="Records sent to a process at once.")
+def convert_records(standard: str, records_path: str, output, workers: int, chunk_size: int):
+    """Convert XML records in a directory into configurations, as NDJSON."""
+    paths = sorted(Path(records_path).glob("*.xml"))
+    results = record_classes[standard].make_config_many(paths=paths, workers=workers, chunk_size=chunk_size)
+    errors = 0
+    for path, config, error in results:
+        result = {"path": path, "config": config} if error is None else {"path": path, "error": error}
+        output.write(json.dumps(result, default=lambda value: value.isoformat()) + "\n")
+        if error is not None:
+            errors += 1
+    click.echo(f"Converted {len(paths) - errors} records, {errors} errors.", err=True)
+
+
+benchmarks = {
+    "schema-registry": benchmark_schema_registry,
+    "validator-cache": benchmark_validator_cache,
+    "native-dates": benchmark_native_dates,
+    "validate-many": benchmark_validate_many,
+    "validate-changes": benchmark_validate_changes,
+    "validation-engines": benchmark_validation_engines,
+    "validation-cache": benchmark_validation_cache,
+    "flattened-schemas": benchmark_flattened_schemas,
+    "read-record": benchmark_read_record,
+    "record-scaling": benchmark_record_scaling,
+    "harvest": benchmark_harvest,
+    "make-config-many": benchmark_make_config_many,
+    "generate-many": benchmark_generate_many,
+    "records-writer": benchmark_records_writer,
+    "citation-cache": benchmark_citation_cache,
+    "citation-prefetch": benchmark_citation_prefetch,
+    "record-allocations": benchmark_record_allocations,
+    "lazy-config": benchmark_lazy_config,
+    "config-fields": benchmark_config_fields,
+    "scan-headers": benchmark_scan_headers,
+    "condense-roles": benchmark_condense_roles,
+    "config-fingerprint": benchmark_config_fingerprint,
+}
+
+
+@app.cli.command()
+@click.argument("name", type=click.Choice(list(benchmarks.keys())))
+def benchmark(name: str):
+    """Run a performance benchmark."""
+    benchmarks[name]()
+
+
 if "PYCHARM_HOSTED" in os.environ:
     # Exempting Bandit security issue (binding to all network interfaces)
     #
@@ -2,9 +2,15 @@ import pytest
 
 from http import HTTPStatus
 
+from unittest.mock import patch
+
 from flask import Flask
 from flask.testing import FlaskClient
 
+from bas_metadata_library.standards.iso_19115_2_v1 import MetadataRecord, MetadataRecordConfig
+
+from tests.resources.configs.iso19115_2_v1_standard import configs_all as configs
+
 
 @pytest.mark.usefixtures("app")
 def test_app(app):
@@ -32,3 +38,21 @@ def test_app_root(app_client: FlaskClient):
     assert response.status_code == HTTPStatus.OK
     assert response.mimetype == "application/json"
     assert response.json == expected_response
+
+
+@pytest.mark.usefixtures("app_client")
+def test_app_record_etag(app_client: FlaskClient):
+    fingerprint = MetadataRecordConfig(**configs["complete"]).fingerprint()
+    response = app_client.get("/standards/iso-19115-2/complete")
+    assert response.status_code == HTTPStatus.OK
+    assert response.get_etag() == (fingerprint, True)
+
+    with patch.object(MetadataRecord, "generate_xml_document") as generate_xml_document:
+        response = app_client.get("/standards/iso-19115-2/complete", headers={"If-None-Match": f'W/"{fingerprint}"'})
+        generate_xml_document.assert_not_called()
+    assert response.status_code == HTTPStatus.NOT_MODIFIED
+    assert response.data == b""
+    assert response.get_etag() == (fingerprint, True)
+
+    response = app_client.get("/standards/iso-19115-2/complete", headers={"If-None-Match": '"v1:other"'})
+    assert response.status_code == HTTPStatus.OK
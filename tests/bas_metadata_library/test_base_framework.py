@@ -1,7 +1,18 @@
 # noinspection PyUnresolvedReferences
 import pytest
 
-from bas_metadata_library import MetadataRecordConfig, MetadataRecord, MetadataRecordElement
+from copy import deepcopy
+from pickle import dumps, loads
+
+from bas_metadata_library import (
+    MetadataRecordConfig,
+    MetadataRecord,
+    MetadataRecordElement,
+    NamespaceMap,
+    NamespaceRegistry,
+    Namespaces,
+    QualifiedNames,
+)
 
 _config = {"foo": "bar"}
 
@@ -9,6 +20,7 @@ _config = {"foo": "bar"}
 def test_config_class():
     configuration = MetadataRecordConfig(**_config)
     assert configuration.schema is None
+    assert list(configuration.iter_errors()) == []
 
 
 def test_record_class_configuration():
@@ -39,4 +51,54 @@ def test_element_class_record():
         record_data = record_file.read()
     record = MetadataRecord(record=record_data)
     element = MetadataRecordElement(record=record, attributes={})
-    element.make_config()
+    with pytest.raises(AttributeError):
+        element.make_config()
+
+
+def test_namespace_map():
+    nsmap = NamespaceMap({"xlink": "http://www.w3.org/1999/xlink"})
+    assert nsmap == {"xlink": "http://www.w3.org/1999/xlink"}
+    with pytest.raises(TypeError) as e:
+        nsmap["xsi"] = "http://www.w3.org/2001/XMLSchema-instance"
+    assert "Namespace map is read-only" in str(e.value)
+    with pytest.raises(TypeError):
+        nsmap.update({"xsi": "http://www.w3.org/2001/XMLSchema-instance"})
+
+    for copied in [loads(dumps(nsmap)), deepcopy(nsmap)]:
+        assert type(copied) == NamespaceMap
+        assert copied == nsmap
+
+
+def test_qualified_names():
+    names = QualifiedNames(namespace="http://www.w3.org/1999/xlink")
+    assert names.href == "{http://www.w3.org/1999/xlink}href"
+    assert names.href is names.href
+    assert names["pass"] == "{http://www.w3.org/1999/xlink}pass"
+    assert names["href"] is names.href
+
+    with pytest.raises(AttributeError):
+        names._private
+    with pytest.raises(AttributeError) as e:
+        names.href = "href"
+    assert "Qualified names are read-only" in str(e.value)
+
+
+def test_namespace_registry():
+    registry = NamespaceRegistry(namespaces={"xlink": "http://www.w3.org/1999/xlink"})
+    assert registry.nsmap == {"xlink": "http://www.w3.org/1999/xlink"}
+    assert type(registry.nsmap) == NamespaceMap
+    assert registry.xlink.href == "{http://www.w3.org/1999/xlink}href"
+    with pytest.raises(AttributeError) as e:
+        registry.xsi = QualifiedNames(namespace="http://www.w3.org/2001/XMLSchema-instance")
+    assert "Namespace registry is read-only" in str(e.value)
+
+
+def test_namespaces_shared():
+    class _Namespaces(Namespaces):
+        _namespaces = NamespaceMap({"xlink": "http://www.w3.org/1999/xlink"})
+
+    assert _Namespaces().nsmap() is _Namespaces().nsmap()
+    assert Namespaces(namespaces={"xlink": "http://www.w3.org/1999/xlink"}).nsmap() == {
+        "xlink": "http://www.w3.org/1999/xlink"
+    }
+    assert Namespaces().nsmap() is not Namespaces().nsmap()
@@ -0,0 +1,265 @@
+# noinspection PyUnresolvedReferences
+import pytest
+
+from copy import deepcopy
+from pathlib import Path
+from threading import current_thread
+
+from jsonschema import ValidationError
+
+from bas_metadata_library.batch import _initialized_function, chunked, process_chunks
+from bas_metadata_library.standards.iso_19115_2_v1 import MetadataRecord, MetadataRecordConfig
+from bas_metadata_library.standards.iso_19115_2_v1.profiles.uk_pdc_discovery_v1 import (
+    MetadataRecordConfig as UKPDCDiscoveryMetadataRecordConfig,
+)
+
+from tests.resources.configs.iso19115_2_v1_standard import configs_all as configs
+
+
+def _double(items: list) -> list:
+    return [item * 2 for item in items]
+
+
+def test_chunked():
+    assert list(chunked(items=range(0, 5), chunk_size=2)) == [[0, 1], [2, 3], [4]]
+
+
+def test_chunked_invalid_size():
+    with pytest.raises(ValueError) as e:
+        list(chunked(items=[], chunk_size=0))
+    assert "Chunk size must be at least 1" in str(e.value)
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_process_chunks(workers):
+    results = process_chunks(function=_double, items=range(0, 25), workers=workers, chunk_size=3, max_in_flight=2)
+    assert list(results) == [item * 2 for item in range(0, 25)]
+
+
+def test_process_chunks_threads():
+    results = process_chunks(
+        function=lambda items: [(item, current_thread().name) for item in items],
+        items=range(0, 25),
+        workers=2,
+        chunk_size=3,
+        threads=True,
+    )
+    results = list(results)
+    assert [item for item, _ in results] == list(range(0, 25))
+    assert current_thread().name not in {thread for _, thread in results}
+
+
+_initialised = None
+
+
+def _initialise(value: str):
+    global _initialised
+    _initialised = value
+
+
+def _initialised_items(items: list) -> list:
+    return [(item, _initialised) for item in items]
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_process_chunks_initializer(workers):
+    results = process_chunks(
+        function=_initialised_items,
+        items=range(0, 5),
+        workers=workers,
+        chunk_size=2,
+        initializer=_initialise,
+        initargs=(f"workers-{workers}",),
+    )
+    assert list(results) == [(item, f"workers-{workers}") for item in range(0, 5)]
+
+
+def test_initialized_function_once_per_worker():
+    initialised = []
+    for chunk in chunked(items=range(0, 5), chunk_size=2):
+        _initialized_function(_double, initialised.append, ("worker",), chunk)
+    assert initialised == ["worker"]
+
+
+def test_process_chunks_initializer_once_per_thread():
+    initialised = []
+    results = process_chunks(
+        function=lambda items: [(item, current_thread().name) for item in items],
+        items=range(0, 25),
+        workers=2,
+        chunk_size=3,
+        initializer=lambda: initialised.append(current_thread().name),
+        threads=True,
+    )
+    results = list(results)
+    assert sorted(initialised) == sorted({thread for _, thread in results})
+
+
+def test_process_chunks_invalid_workers():
+    with pytest.raises(ValueError) as e:
+        list(process_chunks(function=_double, items=[], workers=0))
+    assert "Number of workers must be at least 1" in str(e.value)
+
+
+def _invalid_configs() -> list:
+    config_invalid_type = deepcopy(configs["complete"])
+    config_invalid_type["file_identifier"] = "invalid-type"
+    config_invalid_type["resource"]["dates"][0]["date_type"] = "invalid"
+
+    config_invalid_multiple = deepcopy(configs["minimal"])
+    config_invalid_multiple["file_identifier"] = "invalid-multiple"
+    config_invalid_multiple["date_stamp"] = 2018
+    del config_invalid_multiple["language"]
+
+    config_no_identifier = deepcopy(configs["minimal"])
+    config_no_identifier.pop("file_identifier", None)
+
+    return [configs["complete"], config_invalid_type, config_invalid_multiple, config_no_identifier]
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_validate_many(workers):
+    reports = list(MetadataRecordConfig.validate_many(configs=iter(_invalid_configs()), workers=workers, chunk_size=1))
+    assert [file_identifier for file_identifier, _, _ in reports] == [
+        configs["complete"]["file_identifier"],
+        "invalid-type",
+        "invalid-multiple",
+        None,
+    ]
+    assert [error for _, _, error in reports] == [None] * 4
+
+    assert reports[0][1] == []
+    assert reports[3][1] == []
+    assert reports[1][1] == [
+        {
+            "path": ["resource", "dates", 0, "date_type"],
+            "message": reports[1][1][0]["message"],
+            "validator": "enum",
+        }
+    ]
+    assert sorted(error["validator"] for error in reports[2][1]) == ["required", "type"]
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_validate_many_errors(workers):
+    _configs = [configs["minimal"], None, _invalid_configs()[1], configs["minimal"]]
+    reports = list(MetadataRecordConfig.validate_many(configs=_configs, workers=workers, chunk_size=2))
+    assert [file_identifier for file_identifier, _, _ in reports] == [
+        configs["minimal"].get("file_identifier"),
+        None,
+        "invalid-type",
+        configs["minimal"].get("file_identifier"),
+    ]
+    assert reports[0] == reports[3]
+    assert reports[1][1] is None
+    assert reports[1][2]["type"] == "TypeError"
+    assert [error["validator"] for error in reports[2][1]] == ["enum"]
+
+
+def test_validate_many_matches_validate():
+    config = _invalid_configs()[1]
+    errors = list(MetadataRecordConfig(**config).iter_errors())
+    _, report, _ = next(MetadataRecordConfig.validate_many(configs=[config]))
+    assert [error["message"] for error in report] == [error.message for error in errors]
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_make_config_many(tmp_path, workers):
+    records = sorted(Path("tests/resources/records/iso-19115-2-v1").glob("*.xml"))
+    invalid_record = tmp_path / "invalid-record.xml"
+    invalid_record.write_text("<gmi:MI_Metadata")
+    missing_record = tmp_path / "missing-record.xml"
+    paths = [*records, invalid_record, missing_record]
+
+    results = list(MetadataRecord.make_config_many(paths=iter(paths), workers=workers, chunk_size=2))
+    assert [path for path, _, _ in results] == [str(path) for path in paths]
+    for path, (_, config, error) in zip(records, results):
+        assert config == MetadataRecord(record=path.read_text()).make_config().config
+        assert error is None
+
+    assert [(config, error["type"]) for _, config, error in results[-2:]] == [
+        (None, "XMLSyntaxError"),
+        (None, "FileNotFoundError"),
+    ]
+
+
+def test_make_config_many_encoding(tmp_path):
+    record = Path("tests/resources/records/iso-19115-2-v1/minimal-record.xml").read_text()
+    record = record.replace("encoding='utf-8'", "encoding='ISO-8859-1'").replace("Test Record", "Test Récord")
+    path = tmp_path / "record.xml"
+    path.write_bytes(record.encode("ISO-8859-1"))
+
+    [(_, config, error)] = MetadataRecord.make_config_many(paths=[path])
+    assert error is None
+    assert config["resource"]["title"]["value"] == "Test Récord"
+
+
+def _generate_configs() -> list:
+    config_complete = {**configs["complete"], "file_identifier": "complete"}
+    config_simple = {**configs["base-simple"], "file_identifier": "base-simple"}
+    config_no_identifier = deepcopy(configs["minimal"])
+    config_no_identifier.pop("file_identifier", None)
+
+    return [config_complete, config_simple, config_no_identifier]
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_generate_many(workers):
+    documents = MetadataRecord.generate_many(configs=iter(_generate_configs()), workers=workers, chunk_size=1)
+    assert list(documents) == [
+        MetadataRecord(configuration=MetadataRecordConfig(**config)).generate_xml_document()
+        for config in _generate_configs()
+    ]
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_generate_many_output_path(tmp_path, workers):
+    paths = list(
+        MetadataRecord.generate_many(
+            configs=_generate_configs(), workers=workers, chunk_size=2, max_in_flight=1, output_path=tmp_path
+        )
+    )
+    assert paths == [str(tmp_path / "complete.xml"), str(tmp_path / "base-simple.xml"), str(tmp_path / "2.xml")]
+    for path, config in zip(paths, _generate_configs()):
+        document = MetadataRecord(configuration=MetadataRecordConfig(**config)).generate_xml_document()
+        assert Path(path).read_bytes() == document
+
+
+@pytest.mark.parametrize("file_identifier", ["../record", "a/b", "/tmp/record", ".hidden", ""])
+def test_generate_many_output_path_unsafe_name(tmp_path, file_identifier):
+    config = {**configs["minimal"], "file_identifier": file_identifier}
+    output_path = tmp_path / "output"
+    output_path.mkdir()
+    paths = list(MetadataRecord.generate_many(configs=[config], output_path=output_path))
+    assert paths == [str(output_path / "0.xml")]
+    assert [path.name for path in tmp_path.rglob("*.xml")] == ["0.xml"]
+
+
+@pytest.mark.parametrize("file_identifiers", [["record", "record"], ["record", "RECORD"], ["2", None]])
+def test_generate_many_output_path_duplicate_name(tmp_path, file_identifiers):
+    config_other = {**configs["minimal"], "file_identifier": "other"}
+    config = {**configs["minimal"], "file_identifier": file_identifiers[0]}
+    config_duplicate = {**configs["minimal"], "file_identifier": file_identifiers[1]}
+    with pytest.raises(ValueError) as e:
+        list(
+            MetadataRecord.generate_many(
+                configs=iter([config_other, config, config_duplicate]), chunk_size=1, output_path=tmp_path
+            )
+        )
+    assert "Configurations 1 and 2 would both be written to" in str(e.value)
+    assert list(tmp_path.glob("*.xml")) == []
+
+
+def test_generate_many_config_class():
+    config = configs["uk-pdc-discovery-minimal"]
+    documents = MetadataRecord.generate_many(configs=[config], config_class=UKPDCDiscoveryMetadataRecordConfig)
+    assert list(documents) == [
+        MetadataRecord(configuration=UKPDCDiscoveryMetadataRecordConfig(**config)).generate_xml_document()
+    ]
+
+
+def test_generate_many_invalid_config():
+    config = deepcopy(configs["minimal"])
+    del config["language"]
+    with pytest.raises(ValidationError):
+        list(MetadataRecord.generate_many(configs=[config]))
@@ -0,0 +1,249 @@
+# noinspection PyUnresolvedReferences
+import pytest
+
+from copy import deepcopy
+from decimal import Decimal
+from datetime import date, datetime, timedelta, timezone
+from unittest.mock import Mock
+from uuid import UUID
+
+from jsonschema import ValidationError
+
+from bas_metadata_library import MetadataRecordConfig as BaseMetadataRecordConfig
+from bas_metadata_library.cache import ValidationCache, config_digest, config_fingerprint, fingerprint_version
+from bas_metadata_library.standards.iso_19115_1_v1 import MetadataRecordConfig as ISO19115MetadataRecordConfig
+from bas_metadata_library.standards.iso_19115_2_v1 import MetadataRecord, MetadataRecordConfig
+from bas_metadata_library.standards.iso_19115_2_v1.profiles.inspire_v1_3 import (
+    MetadataRecordConfig as InspireMetadataRecordConfig,
+)
+
+from tests.resources.configs.iso19115_2_v1_standard import configs_all as configs
+
+
+def test_config_digest_key_order():
+    assert config_digest({"a": 1, "b": {"c": 2, "d": 3}}) == config_digest({"b": {"d": 3, "c": 2}, "a": 1})
+
+
+def test_config_digest_content():
+    assert config_digest({"a": 1}) != config_digest({"a": 2})
+    assert config_digest({"a": [1, 2]}) != config_digest({"a": [2, 1]})
+
+
+def test_config_digest_dates():
+    assert config_digest({"a": date(2018, 1, 1)}) == config_digest({"a": date(2018, 1, 1)})
+    assert config_digest({"a": date(2018, 1, 1)}) != config_digest({"a": "2018-01-01"})
+    assert config_digest({"a": date(2018, 1, 1)}) != config_digest({"a": datetime(2018, 1, 1)})
+    assert config_digest({"a": datetime(2018, 1, 1, 12, tzinfo=timezone(timedelta(hours=1)))}) != config_digest(
+        {"a": datetime(2018, 1, 1, 11, tzinfo=timezone.utc)}
+    )
+    assert config_digest({"a": datetime(2018, 1, 1, 11)}) != config_digest(
+        {"a": datetime(2018, 1, 1, 11, tzinfo=timezone.utc)}
+    )
+
+
+def test_config_digest_uuids():
+    assert config_digest({"a": UUID(int=1)}) == config_digest({"a": UUID(int=1)})
+    assert config_digest({"a": UUID(int=1)}) != config_digest({"a": str(UUID(int=1))})
+
+
+def test_config_digest_tagged_strings():
+    assert config_digest({"a": date(2018, 1, 1)}) != config_digest({"a": {"$date": "2018-01-01"}})
+    assert config_digest({"a": date(2018, 1, 1)}) != config_digest({"a": "\x00date:2018-01-01"})
+    assert config_digest({"a": "\x00date:2018-01-01"}) != config_digest({"a": "\x00\x00date:2018-01-01"})
+    assert config_digest({"a": ["\x00", date(2018, 1, 1)]}) == config_digest({"a": ("\x00", date(2018, 1, 1))})
+
+
+def test_config_digest_unsupported_value():
+    with pytest.raises(TypeError) as e:
+        config_digest({"a": object()})
+    assert "Object of type object is not JSON serializable" in str(e.value)
+
+
+def test_config_fingerprint():
+    fingerprint = config_fingerprint({"a": 1})
+    assert fingerprint.startswith(f"v{fingerprint_version}:")
+    assert fingerprint == config_fingerprint({"a": 1})
+    assert fingerprint != config_fingerprint({"a": 2})
+    assert fingerprint != config_fingerprint({"a": 1}, schema_id="https://example.com/schema.json")
+    assert config_fingerprint({"a": 1, "b": date(2018, 1, 1)}) == config_fingerprint({"b": date(2018, 1, 1), "a": 1})
+    assert config_fingerprint({"a": 1, "b": date(2018, 1, 1)}) != config_fingerprint({"b": "2018-01-01", "a": 1})
+
+
+def test_config_fingerprint_records_differ():
+    config = deepcopy(configs["complete"])
+    config["resource"]["dates"][2]["date"] = datetime(2018, 10, 8, 14, 40, 44, tzinfo=timezone.utc)
+    config_offset = deepcopy(config)
+    config_offset["resource"]["dates"][2]["date"] = datetime(
+        2018, 10, 8, 15, 40, 44, tzinfo=timezone(timedelta(hours=1))
+    )
+    assert config["resource"]["dates"][2]["date"] == config_offset["resource"]["dates"][2]["date"]
+
+    document = MetadataRecord(configuration=MetadataRecordConfig(**config)).generate_xml_document()
+    document_offset = MetadataRecord(configuration=MetadataRecordConfig(**config_offset)).generate_xml_document()
+    assert document != document_offset
+    assert MetadataRecordConfig(**config).fingerprint() != MetadataRecordConfig(**config_offset).fingerprint()
+
+
+def test_config_fingerprint_set_like_paths():
+    config = {"a": [2, 1], "b": [{"c": ["y", "x"], "d": 1}, {"d": 2}], "e": {"f": [{"g": 2}, {"g": 1}]}}
+    reordered = {"a": [1, 2], "b": [{"c": ["x", "y"], "d": 1}, {"d": 2}], "e": {"f": [{"g": 1}, {"g": 2}]}}
+    paths = ["a", "b.c", "e.f", "invalid.path", "a.invalid"]
+    assert config_fingerprint(config, set_like_paths=paths) == config_fingerprint(reordered, set_like_paths=paths)
+    assert config_fingerprint(config) != config_fingerprint(reordered)
+    assert config["a"] == [2, 1]
+    assert config["b"][0]["c"] == ["y", "x"]
+
+
+def test_config_fingerprint_lists_not_set_like():
+    config = {"a": [{"b": [1, 2]}, {"b": [3]}]}
+    assert config_fingerprint(config, set_like_paths=["a.b"]) != config_fingerprint(
+        {"a": [{"b": [3]}, {"b": [1, 2]}]}, set_like_paths=["a.b"]
+    )
+
+
+def test_config_fingerprint_method():
+    config = deepcopy(configs["complete"])
+    fingerprint = MetadataRecordConfig(**config).fingerprint()
+    assert fingerprint == MetadataRecordConfig(**deepcopy(configs["complete"])).fingerprint()
+
+    config["resource"]["topics"].reverse()
+    config["resource"]["contacts"][2]["role"].reverse()
+    assert len(config["resource"]["topics"]) > 1
+    assert len(config["resource"]["contacts"][2]["role"]) > 1
+    assert MetadataRecordConfig(**config).fingerprint() == fingerprint
+
+    config["resource"]["contacts"].reverse()
+    assert MetadataRecordConfig(**config).fingerprint() != fingerprint
+
+    assert ISO19115MetadataRecordConfig(**deepcopy(configs["complete"])).fingerprint() != fingerprint
+    assert InspireMetadataRecordConfig(**deepcopy(configs["complete"])).fingerprint() != fingerprint
+    assert BaseMetadataRecordConfig(a=1).fingerprint() == config_fingerprint({"a": 1})
+
+
+def test_cache_invalid_size():
+    with pytest.raises(ValueError) as e:
+        ValidationCache(maxsize=0)
+    assert "Cache size must be at least 1" in str(e.value)
+
+
+def test_cache_hit_miss():
+    schema = {"$id": "https://example.com/schema.json"}
+    cache = ValidationCache()
+    validate = Mock(return_value=None)
+
+    assert cache.result(schema=schema, config={"a": 1}, validate=validate) is None
+    assert cache.result(schema=schema, config={"a": 1}, validate=validate) is None
+    validate.assert_called_once()
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert len(cache) == 1
+
+
+def test_cache_error():
+    schema = {"$id": "https://example.com/schema.json"}
+    cache = ValidationCache()
+    error = ValidationError("invalid", path=["a"])
+
+    assert cache.result(schema=schema, config={"a": 1}, validate=lambda: error).message == "invalid"
+    cached_error = cache.result(schema=schema, config={"a": 1}, validate=Mock())
+    assert cached_error is not error
+    assert cached_error.message == "invalid"
+    assert list(cached_error.path) == ["a"]
+
+
+def test_cache_schema_without_identifier():
+    cache = ValidationCache()
+    validate = Mock(return_value=None)
+    cache.result(schema={}, config={"a": 1}, validate=validate)
+    cache.result(schema={}, config={"a": 1}, validate=validate)
+    assert validate.call_count == 2
+    assert len(cache) == 0
+
+
+def test_cache_config_not_digested():
+    schema = {"$id": "https://example.com/schema.json"}
+    cache = ValidationCache()
+    validate = Mock(return_value=None)
+    cache.result(schema=schema, config={"a": Decimal("1.5")}, validate=validate)
+    cache.result(schema=schema, config={"a": Decimal("1.5")}, validate=validate)
+    assert validate.call_count == 2
+    assert (cache.hits, cache.misses) == (0, 0)
+    assert len(cache) == 0
+
+
+def test_cache_size_bound():
+    schema = {"$id": "https://example.com/schema.json"}
+    cache = ValidationCache(maxsize=2)
+    validate = Mock(return_value=None)
+
+    cache.result(schema=schema, config={"a": 1}, validate=validate)
+    cache.result(schema=schema, config={"a": 2}, validate=validate)
+    cache.result(schema=schema, config={"a": 1}, validate=validate)
+    cache.result(schema=schema, config={"a": 3}, validate=validate)
+    assert len(cache) == 2
+
+    # {"a": 2} was least recently used, so should have been discarded
+    cache.result(schema=schema, config={"a": 1}, validate=validate)
+    cache.result(schema=schema, config={"a": 2}, validate=validate)
+    assert validate.call_count == 4
+
+
+def test_cache_schema_changed():
+    schema = {"$id": "https://example.com/schema.json"}
+    schema_ = {"$id": "https://example.com/schema.json", "type": "object"}
+    other_schema = {"$id": "https://example.com/other-schema.json"}
+    cache = ValidationCache()
+    validate = Mock(return_value=None)
+
+    cache.result(schema=schema, config={"a": 1}, validate=validate)
+    cache.result(schema=other_schema, config={"a": 1}, validate=validate)
+    cache.result(schema=schema_, config={"a": 1}, validate=validate)
+    assert validate.call_count == 3
+    assert len(cache) == 2
+
+
+def test_cache_invalidate():
+    schema = {"$id": "https://example.com/schema.json"}
+    other_schema = {"$id": "https://example.com/other-schema.json"}
+    cache = ValidationCache()
+    validate = Mock(return_value=None)
+
+    cache.result(schema=schema, config={"a": 1}, validate=validate)
+    cache.result(schema=other_schema, config={"a": 1}, validate=validate)
+    cache.invalidate(schema_id="https://example.com/schema.json")
+    assert len(cache) == 1
+    cache.invalidate()
+    assert len(cache) == 0
+
+
+def test_config_validation_cache():
+    cache = ValidationCache()
+    config = deepcopy(configs["complete"])
+    configuration = MetadataRecordConfig(**config)
+    configuration.validation_cache = cache
+
+    configuration.validate()
+    MetadataRecordConfig(**deepcopy(config)).validate()
+    configuration.validate()
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    configuration.config["resource"]["dates"][0]["date_type"] = "invalid"
+    for _ in range(0, 2):
+        with pytest.raises(ValidationError) as e:
+            configuration.validate()
+        assert "'invalid' is not one of" in e.value.message
+    assert (cache.hits, cache.misses) == (2, 2)
+
+
+def test_config_validation_cache_not_digested():
+    config = deepcopy(configs["complete"])
+    config["resource"]["title"]["value"] = Decimal("1.5")
+    configuration = MetadataRecordConfig(**config)
+    configuration.validation_cache = ValidationCache()
+
+    configuration.validate()
+    assert len(configuration.validation_cache) == 0
+
+    config["resource"]["dates"][0]["date_type"] = "invalid"
+    with pytest.raises(ValidationError) as e:
+        configuration.validate()
+    assert "'invalid' is not one of" in e.value.message
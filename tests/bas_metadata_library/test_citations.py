@@ -0,0 +1,299 @@
+# noinspection PyUnresolvedReferences
+import pytest
+import requests
+
+from copy import deepcopy
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from pickle import dumps, loads
+from socketserver import ThreadingMixIn
+from threading import Lock, Thread
+from time import sleep
+from unittest.mock import patch
+
+# Exempting Bandit security issue (Using Element to parse untrusted XML data is known to be vulnerable to XML attacks)
+#
+# This is a testing environment, testing against generated records, so the XML parsed should be safe.
+from lxml.etree import fromstring
+
+from bas_metadata_library.citations import (
+    CachedCitationResolver,
+    CitationResolver,
+    CrossCiteCitationResolver,
+    StubCitationResolver,
+    citation_dois,
+    make_session,
+)
+from bas_metadata_library.standards.iso_19115_1_v1 import MetadataRecord, MetadataRecordConfig, Namespaces
+
+from tests.resources.configs.iso19115_1_v1_standard import configs_all, configs_unsafe as unsafe_configs
+
+doi = "https://doi.org/10.7939/R3QZ22K64"
+citation = (
+    "Campbell, S. (2014). <i>Auster Antarctic aircraft</i>. University of Alberta Libraries. "
+    "https://doi.org/10.7939/R3QZ22K64"
+)
+
+
+class _ThreadingHTTPServer(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+
+
+class _DOIResolverHandler(BaseHTTPRequestHandler):
+    """
+    Stand-in for the DOI resolver, returning a citation for each path
+
+    Paths starting with '/slow' respond after a delay, '/flaky' paths fail on their first request and '/missing'
+    paths are not found. The number of requests for each path, and the most requests handled at once, are recorded.
+    """
+
+    lock = Lock()
+    active = 0
+    max_active = 0
+    requests = {}  # type: dict
+
+    def do_GET(self):
+        cls = type(self)
+        with cls.lock:
+            cls.active += 1
+            cls.max_active = max(cls.max_active, cls.active)
+            cls.requests[self.path] = cls.requests.get(self.path, 0) + 1
+            count = cls.requests[self.path]
+        try:
+            sleep(0.05)
+            if self.path.startswith("/slow"):
+                sleep(1)
+            if self.path.startswith("/flaky") and count == 1:
+                self.send_error(503)
+                return
+            if self.path.startswith("/missing"):
+                self.send_error(404)
+                return
+
+            body = f"Citation for {self.path} ({self.headers['Accept']})".encode()
+            self.send_response(200)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        finally:
+            with cls.lock:
+                cls.active -= 1
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def doi_resolver():
+    _DOIResolverHandler.active = 0
+    _DOIResolverHandler.max_active = 0
+    _DOIResolverHandler.requests = {}
+    server = _ThreadingHTTPServer(("127.0.0.1", 0), _DOIResolverHandler)
+    thread = Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_citation_resolver():
+    with pytest.raises(TypeError):
+        CitationResolver()
+
+
+def test_crosscite_citation_resolver():
+    with patch("bas_metadata_library.citations.requests.get") as requests_get:
+        requests_get.return_value.text = citation
+        assert CrossCiteCitationResolver(timeout=5).resolve(doi=doi, style="harvard", locale="en-US") == citation
+        requests_get.assert_called_once_with(
+            doi, headers={"Accept": "text/x-bibliography; style=harvard; locale=en-US"}, timeout=5
+        )
+        requests_get.return_value.raise_for_status.assert_called_once()
+
+
+def test_crosscite_citation_resolver_session(doi_resolver):
+    resolver = CrossCiteCitationResolver(session=make_session(retries=1, backoff_factor=0))
+    assert resolver.resolve(doi=f"{doi_resolver}/10.1234/a") == (
+        "Citation for /10.1234/a (text/x-bibliography; style=apa; locale=en-GB)"
+    )
+    assert resolver.resolve(doi=f"{doi_resolver}/flaky") == (
+        "Citation for /flaky (text/x-bibliography; style=apa; locale=en-GB)"
+    )
+    assert _DOIResolverHandler.requests["/flaky"] == 2
+
+
+def test_stub_citation_resolver():
+    resolver = StubCitationResolver(citations={doi: citation})
+    assert resolver.resolve(doi=doi) == citation
+    assert resolver.requests == [(doi, "apa", "en-GB")]
+
+    with pytest.raises(RuntimeError) as e:
+        resolver.resolve(doi="https://doi.org/invalid")
+    assert "is not available" in str(e.value)
+
+    assert StubCitationResolver(default="default").resolve(doi=doi) == "default"
+
+
+def test_cached_citation_resolver():
+    stub = StubCitationResolver(citations={doi: citation})
+    resolver = CachedCitationResolver(resolver=stub)
+    assert resolver.resolve(doi=doi) == citation
+    assert resolver.resolve(doi=doi) == citation
+    assert resolver.resolve(doi=doi, style="harvard") == citation
+    assert stub.requests == [(doi, "apa", "en-GB"), (doi, "harvard", "en-GB")]
+
+
+def test_cached_citation_resolver_persisted(tmp_path):
+    path = tmp_path / "citations.db"
+    CachedCitationResolver(resolver=StubCitationResolver(citations={doi: citation}), path=path).resolve(doi=doi)
+
+    stub = StubCitationResolver()
+    assert CachedCitationResolver(resolver=stub, path=path).resolve(doi=doi) == citation
+    assert CachedCitationResolver(resolver=stub, path=str(path), offline=True).resolve(doi=doi) == citation
+    assert stub.requests == []
+
+
+def test_cached_citation_resolver_evicted(tmp_path):
+    stub = StubCitationResolver(default=citation)
+    resolver = CachedCitationResolver(resolver=stub, path=tmp_path / "citations.db", maxsize=1)
+    resolver.resolve(doi=doi)
+    resolver.resolve(doi="https://doi.org/other")
+    resolver.resolve(doi=doi)
+    assert len(stub.requests) == 2
+
+    resolver = CachedCitationResolver(resolver=stub, maxsize=1)
+    resolver.resolve(doi=doi)
+    resolver.resolve(doi="https://doi.org/other")
+    resolver.resolve(doi=doi)
+    assert len(stub.requests) == 5
+
+
+def test_cached_citation_resolver_expired(tmp_path):
+    stub = StubCitationResolver(citations={doi: citation})
+    resolver = CachedCitationResolver(resolver=stub, path=tmp_path / "citations.db", ttl=60)
+    with patch("bas_metadata_library.citations.time", return_value=1000):
+        resolver.resolve(doi=doi)
+    with patch("bas_metadata_library.citations.time", return_value=1030):
+        resolver.resolve(doi=doi)
+    assert len(stub.requests) == 1
+
+    with patch("bas_metadata_library.citations.time", return_value=1090):
+        stub.citations[doi] = "updated"
+        assert resolver.resolve(doi=doi) == "updated"
+    assert len(stub.requests) == 2
+
+    resolver = CachedCitationResolver(resolver=stub, path=tmp_path / "citations.db", ttl=60, offline=True)
+    with patch("bas_metadata_library.citations.time", return_value=9999):
+        assert resolver.resolve(doi=doi) == "updated"
+    assert len(stub.requests) == 2
+
+
+def test_cached_citation_resolver_offline(tmp_path):
+    stub = StubCitationResolver(citations={doi: citation})
+    for path in [None, tmp_path / "citations.db"]:
+        with pytest.raises(RuntimeError) as e:
+            CachedCitationResolver(resolver=stub, path=path, offline=True).resolve(doi=doi)
+        assert "offline mode is enabled" in str(e.value)
+    assert stub.requests == []
+
+
+def test_cached_citation_resolver_forked(tmp_path):
+    stub = StubCitationResolver(citations={doi: citation})
+    resolver = CachedCitationResolver(resolver=stub, path=tmp_path / "citations.db", maxsize=1)
+    resolver.resolve(doi=doi)
+    connection = resolver._connection
+
+    resolver._citations.clear()
+    resolver._connection_pid = -1
+    assert resolver.resolve(doi=doi) == citation
+    assert resolver._connection is not connection
+    assert len(stub.requests) == 1
+
+
+def test_cached_citation_resolver_invalid_size():
+    with pytest.raises(ValueError) as e:
+        CachedCitationResolver(resolver=StubCitationResolver(), maxsize=0)
+    assert "Cache size must be at least 1" in str(e.value)
+
+
+def test_cached_citation_resolver_prefetch(doi_resolver):
+    dois = [f"{doi_resolver}/10.1234/{index}" for index in range(0, 20)]
+    stub = StubCitationResolver()
+    resolver = CachedCitationResolver(
+        resolver=CrossCiteCitationResolver(session=make_session(pool_size=4, retries=0)), maxsize=100
+    )
+    assert resolver.prefetch(dois=dois + dois, workers=4) == {}
+    assert 1 < _DOIResolverHandler.max_active <= 4
+    assert set(_DOIResolverHandler.requests.values()) == {1}
+
+    resolver.resolver = stub
+    assert resolver.prefetch(dois=dois) == {}
+    assert resolver.resolve(doi=dois[0]) == f"Citation for /10.1234/0 (text/x-bibliography; style=apa; locale=en-GB)"
+    assert stub.requests == []
+
+
+def test_cached_citation_resolver_prefetch_errors(doi_resolver):
+    resolver = CachedCitationResolver(
+        resolver=CrossCiteCitationResolver(timeout=0.5, session=make_session(retries=0)), maxsize=100
+    )
+    dois = [f"{doi_resolver}/10.1234/a", f"{doi_resolver}/slow", f"{doi_resolver}/missing"]
+    errors = resolver.prefetch(dois=dois)
+    assert list(errors.keys()) == dois[1:]
+    assert "Read timed out" in str(errors[dois[1]])
+    assert isinstance(errors[dois[2]], requests.exceptions.HTTPError)
+
+
+def test_cached_citation_resolver_prefetch_invalid_workers():
+    with pytest.raises(ValueError) as e:
+        CachedCitationResolver(resolver=StubCitationResolver()).prefetch(dois=[doi], workers=0)
+    assert "Number of workers must be at least 1" in str(e.value)
+
+
+def test_citation_dois():
+    assert citation_dois([configs_all["minimal"], configs_all["complete"]]) == []
+    assert citation_dois([unsafe_configs["minimal-required-doi-citation"]] * 2 + [{}]) == [doi]
+
+
+def _citation_statements(document: bytes) -> list:
+    return fromstring(document).xpath(
+        "//gmd:MD_LegalConstraints[@id = 'citation']/gmd:useLimitation/gco:CharacterString/text()",
+        namespaces=Namespaces().nsmap(),
+    )
+
+
+def test_cached_citation_resolver_pickled(tmp_path):
+    resolver = CachedCitationResolver(resolver=StubCitationResolver(citations={doi: citation}), path=tmp_path / "c.db")
+    resolver.resolve(doi=doi)
+    copy = loads(dumps(resolver))
+    copy.resolver.citations = {}
+    assert copy.resolve(doi=doi) == citation
+    copy._citations.clear()
+    assert copy.resolve(doi=doi) == citation
+    assert copy._connection is not resolver._connection
+
+
+def test_record_citation_resolver():
+    stub = StubCitationResolver(citations={doi: citation})
+    other = StubCitationResolver(default="Other citation")
+    config = unsafe_configs["minimal-required-doi-citation"]
+    record = MetadataRecord(MetadataRecordConfig(**deepcopy(config)), citation_resolver=stub)
+    other_record = MetadataRecord(MetadataRecordConfig(**deepcopy(config)), citation_resolver=other)
+
+    assert _citation_statements(record.generate_xml_document()) == [f'Cite this information as "{citation}"']
+    assert _citation_statements(other_record.generate_xml_document()) == ['Cite this information as "Other citation"']
+    assert stub.requests == [(doi, "apa", "en-GB")]
+    assert other.requests == [(doi, "apa", "en-GB")]
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_generate_many_citation_resolver(workers):
+    resolver = CachedCitationResolver(resolver=StubCitationResolver(citations={doi: citation}))
+    assert resolver.prefetch(dois=[doi]) == {}
+    resolver.resolver = StubCitationResolver()
+
+    configs = [deepcopy(unsafe_configs["minimal-required-doi-citation"]) for _ in range(0, 3)]
+    documents = list(
+        MetadataRecord.generate_many(configs=configs, workers=workers, chunk_size=1, citation_resolver=resolver)
+    )
+    assert [_citation_statements(document) for document in documents] == [
+        [f'Cite this information as "{citation}"']
+    ] * 3
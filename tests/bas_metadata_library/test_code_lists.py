@@ -0,0 +1,58 @@
+# noinspection PyUnresolvedReferences
+import pytest
+
+from pathlib import Path
+from sys import intern
+
+# Exempting Bandit security issue (Using Element to parse untrusted XML data is known to be vulnerable to XML attacks)
+#
+# This is a testing environment, testing against static records, so the XML parsed should be safe.
+from lxml.etree import parse
+
+from bas_metadata_library.standards.iso_19115_common.code_lists import (
+    CodeListRegistry,
+    cat_code_lists_url,
+    code_lists,
+    gmx_code_lists_url,
+    language_code_list_url,
+)
+
+records = sorted(Path("tests/resources/records/iso-19115-1-v1").glob("*.xml")) + sorted(
+    Path("tests/resources/records/iso-19115-2-v1").glob("*.xml")
+)
+
+
+def test_code_lists():
+    assert len(code_lists) == 11
+    assert "MD_ScopeCode" in code_lists
+    assert "invalid" not in code_lists
+
+    scope_code = code_lists["MD_ScopeCode"]
+    assert scope_code.name == "MD_ScopeCode"
+    assert scope_code.url == f"{gmx_code_lists_url}#MD_ScopeCode"
+    assert type(scope_code.values) == frozenset
+    assert "dataset" in scope_code.values
+    assert intern("dataset") is next(value for value in scope_code.values if value == "dataset")
+
+    assert code_lists["CI_RoleCode"].url == f"{cat_code_lists_url}#CI_RoleCode"
+    assert code_lists["LanguageCode"].url == language_code_list_url
+    assert code_lists["LanguageCode"].values == frozenset(["eng"])
+
+    with pytest.raises(KeyError):
+        code_lists["invalid"]
+
+
+def test_code_lists_load():
+    registry = CodeListRegistry.load()
+    assert list(registry) == list(code_lists)
+    assert registry["MD_ScopeCode"].url is code_lists["MD_ScopeCode"].url
+
+
+@pytest.mark.parametrize("path", records, ids=[f"{path.parent.name}/{path.name}" for path in records])
+def test_record_code_lists(path):
+    urls = {code_lists[name].url: code_lists[name] for name in code_lists}
+    elements = parse(str(path)).getroot().xpath("//*[@codeList]")
+    assert len(elements) > 0
+    for element in elements:
+        code_list = urls[element.get("codeList")]
+        assert element.get("codeListValue") in code_list.values
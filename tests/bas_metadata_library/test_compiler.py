@@ -0,0 +1,234 @@
+# noinspection PyUnresolvedReferences
+import pytest
+
+from datetime import date, datetime
+from uuid import UUID
+
+from jsonschema import Draft7Validator, RefResolver, ValidationError
+
+from bas_metadata_library import MetadataRecordConfig as BaseMetadataRecordConfig
+from bas_metadata_library.compiler import SchemaCompiler
+from bas_metadata_library.schemas import SchemaRegistry, bundled_schema_packages, load_schema, native_validator_class
+from bas_metadata_library.standards.iso_19115_1_v1 import MetadataRecordConfig as ISO19115_1_MetadataRecordConfig
+from bas_metadata_library.standards.iso_19115_1_v1.profiles.inspire_v1_3 import (
+    MetadataRecordConfig as ISO19115_1_InspireMetadataRecordConfig,
+)
+from bas_metadata_library.standards.iso_19115_1_v1.profiles.uk_pdc_discovery_v1 import (
+    MetadataRecordConfig as ISO19115_1_UKPDCDiscoveryMetadataRecordConfig,
+)
+from bas_metadata_library.standards.iso_19115_2_v1 import MetadataRecordConfig as ISO19115_2_MetadataRecordConfig
+from bas_metadata_library.standards.iso_19115_2_v1.profiles.inspire_v1_3 import (
+    MetadataRecordConfig as ISO19115_2_InspireMetadataRecordConfig,
+)
+from bas_metadata_library.standards.iso_19115_2_v1.profiles.uk_pdc_discovery_v1 import (
+    MetadataRecordConfig as ISO19115_2_UKPDCDiscoveryMetadataRecordConfig,
+)
+
+from tests.resources.configs.iso19115_1_v1_standard import configs_all as iso19115_1_configs
+from tests.resources.configs.mutations import (
+    add_property_invalid,
+    fixture_config,
+    fixture_configs,
+    remove_contact_email,
+    remove_creation_date,
+    remove_extent,
+    remove_language,
+    set_date_stamp_integer,
+    set_date_type_invalid,
+)
+
+config_classes = {
+    "iso-19115-1": {
+        "standard": ISO19115_1_MetadataRecordConfig,
+        "inspire-minimal": ISO19115_1_InspireMetadataRecordConfig,
+        "uk-pdc-discovery-minimal": ISO19115_1_UKPDCDiscoveryMetadataRecordConfig,
+    },
+    "iso-19115-2": {
+        "standard": ISO19115_2_MetadataRecordConfig,
+        "inspire-minimal": ISO19115_2_InspireMetadataRecordConfig,
+        "uk-pdc-discovery-minimal": ISO19115_2_UKPDCDiscoveryMetadataRecordConfig,
+    },
+}
+
+
+def _make_config(standard: str, config_name: str, config: dict) -> BaseMetadataRecordConfig:
+    config_class = config_classes[standard].get(config_name, config_classes[standard]["standard"])
+    configuration = config_class(**config)
+    configuration.validation_engine = "compiled"
+    return configuration
+
+
+@pytest.mark.parametrize("standard,config_name", fixture_configs)
+def test_compiled_valid_fixtures(standard, config_name):
+    configuration = _make_config(standard, config_name, fixture_config(standard, config_name))
+    assert configuration.is_valid()
+    configuration.validate()
+
+
+def _set_keywords_empty(config: dict):
+    config["resource"]["keywords"] = [{"terms": [{"term": ["invalid"]}]}]
+
+
+@pytest.mark.parametrize("standard,config_name", fixture_configs)
+@pytest.mark.parametrize(
+    "mutation",
+    [
+        set_date_stamp_integer,
+        set_date_type_invalid,
+        remove_language,
+        add_property_invalid,
+        remove_contact_email,
+        remove_creation_date,
+        remove_extent,
+        _set_keywords_empty,
+    ],
+)
+def test_compiled_invalid_fixtures(standard, config_name, mutation):
+    config = fixture_config(standard, config_name)
+    mutation(config)
+    configuration = _make_config(standard, config_name, config)
+    validator = configuration.schema_registry.validator(schema=configuration.schema)
+    assert configuration.is_valid() == validator.is_valid(configuration.config)
+
+    if configuration.is_valid():
+        configuration.validate()
+        return
+
+    configuration.validation_engine = "jsonschema"
+    with pytest.raises(ValidationError) as expected_error:
+        configuration.validate()
+    configuration.validation_engine = "compiled"
+    with pytest.raises(ValidationError) as e:
+        configuration.validate()
+    assert e.value.message == expected_error.value.message
+    assert e.value.path == expected_error.value.path
+
+
+@pytest.mark.parametrize(
+    "schema,instances",
+    [
+        (True, [1, "a", None]),
+        (False, [1, "a", None]),
+        ({"type": "string"}, ["a", date(2018, 1, 1), datetime(2018, 1, 1), UUID(int=0), (), 1, None]),
+        ({"type": ["integer", "null"]}, [1, 1.5, True, None, "1"]),
+        ({"type": "number"}, [1, 1.5, True, "1"]),
+        ({"type": "boolean"}, [True, 0]),
+        ({"type": "array"}, [[], (), {}]),
+        ({"enum": ["a", 1, [1]]}, ["a", "b", 1, True, 1.0, [1], [True]]),
+        ({"enum": [True, 0]}, [True, 1, 0, False]),
+        ({"const": {"a": 1}}, [{"a": 1}, {"a": 2}, {}]),
+        ({"required": ["a", "b"]}, [{"a": 1, "b": 2}, {"a": 1}, []]),
+        ({"minProperties": 1, "maxProperties": 2}, [{}, {"a": 1}, {"a": 1, "b": 2, "c": 3}]),
+        (
+            {"properties": {"a": {"type": "string"}}, "additionalProperties": False},
+            [{"a": "a"}, {"a": 1}, {"b": "b"}, {}],
+        ),
+        (
+            {"properties": {"a": {"type": "string"}}, "additionalProperties": {"type": "integer"}},
+            [{"a": "a", "b": 1}, {"b": "b"}],
+        ),
+        (
+            {"patternProperties": {"^x-": {"type": "string"}}, "additionalProperties": False},
+            [{"x-a": "a"}, {"x-a": 1}, {"a": "a"}],
+        ),
+        ({"propertyNames": {"enum": ["a", "b"]}}, [{"a": 1}, {"c": 1}]),
+        ({"dependencies": {"a": ["b"], "c": {"required": ["d"]}}}, [{"a": 1, "b": 1}, {"a": 1}, {"c": 1}]),
+        ({"items": {"type": "string"}, "minItems": 1, "maxItems": 2}, [["a"], [], ["a", "b", "c"], [1]]),
+        ({"items": [{"type": "string"}], "additionalItems": False}, [["a"], [1], ["a", "b"], []]),
+        ({"items": False}, [[], [1]]),
+        ({"uniqueItems": True}, [[1, 2], [1, 1], [1, True], [{"a": 1}, {"a": 1}]]),
+        ({"contains": {"const": "a"}}, [["a", "b"], ["b"], []]),
+        ({"minimum": 1, "maximum": 3}, [0, 1, 3, 4, "a"]),
+        ({"exclusiveMinimum": 1, "exclusiveMaximum": 3}, [1, 2, 3]),
+        ({"multipleOf": 2}, [4, 5]),
+        ({"multipleOf": 0.5}, [1.5, 1.25]),
+        ({"minLength": 2, "maxLength": 3, "pattern": "^a"}, ["ab", "a", "abcd", "bc"]),
+        (
+            {"type": "string", "maxLength": 10, "pattern": "^[0-9a-f-]+$"},
+            [date(2018, 1, 1), datetime(2018, 1, 1), UUID("b1a7d1b5-c419-41e7-9178-b1ffd76d5371")],
+        ),
+        ({"items": {"type": "string"}, "uniqueItems": True}, [("a", "b"), ("a", "a"), (1,)]),
+        ({"allOf": [{"type": "string"}, {"enum": ["a"]}]}, ["a", "b"]),
+        ({"anyOf": [{"type": "string"}, {"required": ["a"]}]}, ["a", {"a": 1}, {}]),
+        ({"oneOf": [{"type": "integer"}, {"minimum": 2}]}, [1, 3, 1.5]),
+        ({"not": {"type": "string"}}, ["a", 1]),
+        ({"properties": {"a": {"description": "any value"}}}, [{"a": 1}]),
+        ({"if": {"type": "string"}, "then": {"enum": ["a"]}, "else": {"type": "integer"}}, ["a", "b", 1, 1.5]),
+        (
+            {"definitions": {"a": {"type": "string"}}, "properties": {"a": {"$ref": "#/definitions/a"}}},
+            [{"a": "a"}, {"a": 1}],
+        ),
+        (
+            {
+                "definitions": {"node": {"type": "object", "properties": {"child": {"$ref": "#/definitions/node"}}}},
+                "$ref": "#/definitions/node",
+            },
+            [{"child": {"child": {}}}, {"child": {"child": 1}}],
+        ),
+    ],
+)
+def test_compiled_keywords(schema, instances):
+    validator = native_validator_class(Draft7Validator)(schema)
+    compiled = SchemaCompiler(resolver=RefResolver.from_schema(schema)).compile(schema=schema)
+    for instance in instances:
+        assert compiled(instance) == validator.is_valid(instance)
+
+
+def test_compiled_unsupported_draft():
+    with pytest.raises(ValueError) as e:
+        SchemaRegistry().compiled_validator(schema={"$schema": "http://json-schema.org/draft-04/schema#"})
+    assert "only JSON Schema draft 7 is" in str(e.value)
+
+
+def test_compiled_source():
+    schema = {"type": "object", "required": ["a"]}
+    compiler = SchemaCompiler(resolver=SchemaRegistry().resolver(schema=schema))
+    compiler.compile(schema=schema)
+    assert "if 'a' not in x: return False" in compiler.source()
+
+
+def test_compiled_validator_cached():
+    registry = SchemaRegistry(packages=bundled_schema_packages)
+    schema = load_schema(package=bundled_schema_packages[0])
+    compiled = registry.compiled_validator(schema=schema)
+    assert registry.compiled_validator(schema=schema) is compiled
+    registry.offline = True
+    assert registry.compiled_validator(schema=schema) is not compiled
+
+
+def test_compiled_validator_schema_without_identifier():
+    schema = {"type": "object"}
+    registry = SchemaRegistry()
+    assert registry.compiled_validator(schema=schema) is not registry.compiled_validator(schema=schema)
+
+
+def test_validation_engine_no_schema():
+    configuration = BaseMetadataRecordConfig()
+    configuration.validation_engine = "compiled"
+    assert configuration.is_valid()
+
+
+def test_validation_engine_jsonschema():
+    configuration = ISO19115_1_MetadataRecordConfig(**iso19115_1_configs["minimal"])
+    assert configuration.validation_engine == "jsonschema"
+    assert configuration.is_valid()
+
+
+def test_validation_engine_unsupported():
+    configuration = ISO19115_1_MetadataRecordConfig(**iso19115_1_configs["minimal"])
+    with pytest.raises(ValueError) as e:
+        configuration.validation_engine = "invalid"
+    assert "Validation engine 'invalid' is not supported" in str(e.value)
+    assert configuration.validation_engine == "jsonschema"
+
+
+def test_validation_engine_default():
+    class _MetadataRecordConfig(ISO19115_1_MetadataRecordConfig):
+        default_validation_engine = "compiled"
+
+    assert _MetadataRecordConfig(**iso19115_1_configs["minimal"]).validation_engine == "compiled"
+
+    _MetadataRecordConfig.default_validation_engine = "invalid"
+    with pytest.raises(ValueError) as e:
+        _MetadataRecordConfig(**iso19115_1_configs["minimal"])
+    assert "Validation engine 'invalid' is not supported" in str(e.value)
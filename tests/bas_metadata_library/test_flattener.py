@@ -0,0 +1,207 @@
+# noinspection PyUnresolvedReferences
+import pytest
+
+from jsonschema import Draft7Validator
+
+from bas_metadata_library.cache import ValidationCache
+from bas_metadata_library.flattener import SchemaFlattener, flattened_schema_id
+from bas_metadata_library.schemas import SchemaRegistry, bundled_schema_packages, load_schema, schema_registry
+
+from tests.resources.configs.mutations import (
+    add_property_invalid,
+    fixture_config,
+    fixture_configs,
+    remove_contact_email,
+    remove_creation_date,
+    remove_extent,
+    set_date_type_invalid,
+)
+
+profile_packages = [package for package in bundled_schema_packages if ".profiles." in package]
+
+
+def _errors(schema: dict, config: dict) -> set:
+    validator = schema_registry.validator(schema=schema)
+    return {(tuple(error.absolute_path), error.message) for error in validator.iter_errors(config)}
+
+
+def _remove_contact_role(config: dict):
+    for contact in config["resource"].get("contacts", []):
+        contact.pop("role", None)
+
+
+def _set_hierarchy_level_invalid(config: dict):
+    config["hierarchy_level"] = "attribute"
+
+
+def _set_identifiers_empty(config: dict):
+    config["resource"]["identifiers"] = []
+
+
+def _remove_required(config: dict):
+    config["resource"].pop("lineage", None)
+    config["resource"].pop("constraints", None)
+
+
+def _set_keyword_thesaurus_invalid(config: dict):
+    config["resource"]["keywords"] = [{"terms": [{"term": "foo"}], "thesaurus": {"title": {"value": 2018}}}]
+
+
+@pytest.mark.parametrize("package", profile_packages)
+def test_flattened_profile(package):
+    schema = load_schema(package=package)
+    flattened = schema_registry.flattened(schema=schema)
+    Draft7Validator.check_schema(flattened)
+    assert flattened["$id"] == flattened_schema_id(schema_id=schema["$id"])
+    assert flattened["$id"] != schema["$id"]
+    assert "definitions" not in flattened
+    assert all(not member.get("$ref", "").endswith(".json") for member in flattened.get("allOf", []))
+    assert schema_registry.flattened(schema=schema) is flattened
+
+
+@pytest.mark.parametrize("package", profile_packages)
+def test_flattened_profile_cached_separately(package):
+    schema = load_schema(package=package)
+    flattened = schema_registry.flattened(schema=schema)
+    validator = schema_registry.validator(schema=schema)
+    flattened_validator = schema_registry.validator(schema=flattened)
+    assert schema_registry.validator(schema=schema) is validator
+    assert schema_registry.validator(schema=flattened) is flattened_validator
+
+    cache = ValidationCache()
+    for _schema in [schema, flattened, schema, flattened]:
+        cache.result(schema=_schema, config={}, validate=lambda: None)
+    assert (cache.hits, cache.misses) == (2, 2)
+
+
+@pytest.mark.parametrize("package", profile_packages)
+@pytest.mark.parametrize(
+    "mutation",
+    [
+        None,
+        set_date_type_invalid,
+        remove_creation_date,
+        remove_contact_email,
+        _remove_contact_role,
+        add_property_invalid,
+        remove_extent,
+        _set_hierarchy_level_invalid,
+        _set_identifiers_empty,
+        _remove_required,
+        _set_keyword_thesaurus_invalid,
+    ],
+)
+def test_flattened_profile_results(package, mutation):
+    schema = load_schema(package=package)
+    flattened = schema_registry.flattened(schema=schema)
+    for standard, config_name in fixture_configs:
+        if f".{standard.replace('-', '_')}_v1." not in package:
+            continue
+        config = fixture_config(standard, config_name)
+        if mutation is not None:
+            mutation(config)
+        assert _errors(schema=flattened, config=config) == _errors(schema=schema, config=config)
+
+
+@pytest.mark.parametrize(
+    "schema,instances",
+    [
+        (
+            {
+                "allOf": [
+                    {"properties": {"a": {"type": "string"}}, "additionalProperties": False},
+                    {"properties": {"b": {}}},
+                ]
+            },
+            [{"a": "a"}, {"b": 1}],
+        ),
+        (
+            {"allOf": [{"properties": {"a": {}}}, {"properties": {"b": {}}, "additionalProperties": False}]},
+            [{"a": 1}, {"b": 1}],
+        ),
+        (
+            {"allOf": [{"properties": {"a": {}}, "additionalProperties": False}, {"additionalProperties": True}]},
+            [{"a": 1}, {"b": 1}],
+        ),
+        (
+            {"allOf": [{"patternProperties": {"^x-": {"type": "string"}}}, {"properties": {"x-a": {"enum": ["a"]}}}]},
+            [{"x-a": "a"}, {"x-a": "b"}, {"x-a": 1}],
+        ),
+        (
+            {"allOf": [{"items": [{"type": "string"}]}, {"items": {"enum": ["a"]}}]},
+            [["a"], ["b"], [1]],
+        ),
+        (
+            {"allOf": [{"items": {"type": "string"}, "minItems": 1}, {"items": {"enum": ["a"]}, "minItems": 2}]},
+            [["a"], ["a", "a"], ["a", "b"]],
+        ),
+        (
+            {"allOf": [{"required": ["a"], "type": "object"}, {"required": ["a", "b"], "allOf": [{"type": "object"}]}]},
+            [{"a": 1}, {"a": 1, "b": 1}],
+        ),
+        (
+            {"allOf": [{"enum": ["a", "b"], "title": "a"}, {"enum": ["b", "c"], "title": "b"}]},
+            ["a", "b", "c"],
+        ),
+        (
+            {"allOf": [{"allOf": [{"type": "string"}]}, {"allOf": [{"enum": ["a"]}]}]},
+            ["a", "b", 1],
+        ),
+        ({"allOf": [{"type": "string"}, False]}, ["a"]),
+        ({"allOf": [{"type": "string"}, True, {}]}, ["a", 1]),
+        ({"allOf": [True, {"type": "string"}]}, ["a", 1]),
+        (
+            {
+                "definitions": {"a": {"type": "string"}, "b": {"enum": ["a"]}},
+                "allOf": [
+                    {"properties": {"a": {"$ref": "#/definitions/a"}}},
+                    {"properties": {"a": {"$ref": "#/definitions/b"}}},
+                ],
+            },
+            [{"a": "a"}, {"a": "b"}, {"a": 1}],
+        ),
+    ],
+)
+def test_flattened_merge(schema, instances):
+    registry = SchemaRegistry()
+    flattened = registry.flattened(schema=schema)
+    assert not isinstance(flattened, dict) or flattened.get("allOf") != schema["allOf"]
+    for instance in instances:
+        assert registry.validator(schema=flattened).is_valid(instance) == registry.validator(schema=schema).is_valid(
+            instance
+        )
+
+
+def test_flattened_without_composition():
+    schema = load_schema(package=bundled_schema_packages[0])
+    assert SchemaRegistry().flattened(schema=schema) is schema
+
+
+def test_flattened_cache_reset():
+    registry = SchemaRegistry(packages=bundled_schema_packages)
+    schema = load_schema(package=profile_packages[0])
+    flattened = registry.flattened(schema=schema)
+    registry.register(schema=load_schema(package=bundled_schema_packages[0]))
+    assert registry.flattened(schema=schema) is not flattened
+
+
+def test_flattener_absolute_references():
+    schema = {
+        "$id": "https://example.com/schema.json",
+        "definitions": {"a": {"type": "string"}},
+        "properties": {
+            "a": {"$ref": "#/definitions/a"},
+            "b": {
+                "items": [{"$ref": "#/definitions/a"}],
+                "dependencies": {"c": ["d"], "e": {"$ref": "#/definitions/a"}},
+            },
+            "f": {"enum": [{"$ref": "#/definitions/a"}]},
+        },
+    }
+    flattener = SchemaFlattener(resolver=SchemaRegistry().resolver(schema=schema))
+    absolute = flattener._absolute(schema=schema, url="https://example.com/schema.json")
+    assert absolute["properties"]["a"]["$ref"] == "https://example.com/schema.json#/definitions/a"
+    assert absolute["properties"]["b"]["items"][0]["$ref"] == "https://example.com/schema.json#/definitions/a"
+    assert absolute["properties"]["b"]["dependencies"]["c"] == ["d"]
+    assert absolute["properties"]["b"]["dependencies"]["e"]["$ref"] == "https://example.com/schema.json#/definitions/a"
+    assert absolute["properties"]["f"]["enum"] == [{"$ref": "#/definitions/a"}]
@@ -0,0 +1,190 @@
+# noinspection PyUnresolvedReferences
+import pytest
+
+from copy import deepcopy
+from io import BytesIO
+from pathlib import Path
+
+# Exempting Bandit security issue (Using Element to parse untrusted XML data is known to be vulnerable to XML attacks)
+#
+# This is a testing environment, testing against static records, so the XML parsed should be safe.
+from lxml.etree import fromstring, tostring
+
+from bas_metadata_library.standards.iso_19115_1_v1 import (
+    MetadataRecord as ISO19115MetadataRecord,
+    MetadataRecordConfig as ISO19115MetadataRecordConfig,
+)
+from bas_metadata_library.standards.iso_19115_2_v1 import MetadataRecord, MetadataRecordConfig
+from bas_metadata_library.standards.iso_19115_common import tags
+from bas_metadata_library.standards.iso_19115_common.harvest import (
+    RecordHeader,
+    _discard_parsed,
+    iter_record_configs,
+    scan_header,
+    scan_headers,
+)
+
+standards = {
+    "iso-19115-1-v1": (ISO19115MetadataRecord, ISO19115MetadataRecordConfig),
+    "iso-19115-2-v1": (MetadataRecord, MetadataRecordConfig),
+}
+records = [
+    (standard, path)
+    for standard in standards
+    for path in sorted(Path(f"tests/resources/records/{standard}").glob("*.xml"))
+]
+
+
+def _record_element(path: Path) -> str:
+    return tostring(fromstring(path.read_bytes())).decode()
+
+
+def _harvest_document() -> bytes:
+    """
+    Generates an OAI-PMH style document containing each test record, with a header element before each record
+    """
+    items = [
+        f"<record><header><identifier>{index}</identifier></header>"
+        f"<metadata>{_record_element(path)}</metadata></record>"
+        for index, (_, path) in enumerate(records)
+    ]
+    return f"<OAI-PMH><ListRecords>{''.join(items)}</ListRecords></OAI-PMH>".encode()
+
+
+def test_iter_record_configs():
+    configs = list(iter_record_configs(BytesIO(_harvest_document())))
+    assert len(configs) == len(records)
+    for config, (standard, path) in zip(configs, records):
+        record_class, config_class = standards[standard]
+        assert type(config) == config_class
+        assert config.config == record_class(record=path.read_text()).make_config().config
+
+
+def test_iter_record_configs_fields():
+    fields = ["file_identifier", "resource.extent.geographic", "resource.keywords"]
+    configs = list(iter_record_configs(BytesIO(_harvest_document()), fields=fields))
+    assert len(configs) == len(records)
+    for config, (standard, path) in zip(configs, records):
+        record_class, config_class = standards[standard]
+        assert type(config) == config_class
+        assert config.config == record_class(record=path.read_text()).make_config(fields=fields).config
+
+
+def test_iter_record_configs_path(tmp_path):
+    path = tmp_path / "records.xml"
+    path.write_bytes(_harvest_document())
+    assert len(list(iter_record_configs(str(path)))) == len(records)
+
+
+def test_iter_record_configs_nested():
+    path = Path("tests/resources/records/iso-19115-2-v1/minimal-record.xml")
+    record = fromstring(path.read_bytes())
+    record.append(fromstring(path.read_bytes()))
+    configs = list(iter_record_configs(BytesIO(tostring(record))))
+    assert len(configs) == 1
+    assert type(configs[0]) == MetadataRecordConfig
+
+
+@pytest.mark.parametrize("prologue", [b"<!-- harvested records -->", b"<?xml-stylesheet href='records.xsl'?>"])
+def test_iter_record_configs_prologue(prologue):
+    configs = list(iter_record_configs(BytesIO(prologue + _harvest_document())))
+    assert len(configs) == len(records)
+
+    path = Path("tests/resources/records/iso-19115-2-v1/minimal-record.xml")
+    configs = list(iter_record_configs(BytesIO(prologue + tostring(fromstring(path.read_bytes())))))
+    assert [config.config for config in configs] == [MetadataRecord(record=path.read_text()).make_config().config]
+
+
+def test_iter_record_configs_no_records():
+    assert list(iter_record_configs(BytesIO(b"<OAI-PMH><ListRecords/></OAI-PMH>"))) == []
+
+
+def test_discard_parsed():
+    document = fromstring(b"<a><b/><c><d/><e/><f/></c><g/></a>")
+    _discard_parsed(element=document.find("c/e"))
+    assert tostring(document) == b"<a><c><e/><f/></c><g/></a>"
+
+
+def test_discard_parsed_root_siblings():
+    document = fromstring(b"<!-- comment --><a><b/><c/></a>")
+    _discard_parsed(element=document.find("c"))
+    assert tostring(document.getroottree()) == b"<!-- comment --><a><c/></a>"
+
+
+class _ReadCountingFile(BytesIO):
+    """
+    File object recording the number of bytes read from it
+    """
+
+    def __init__(self, *args):
+        super().__init__(*args)
+        self.bytes_read = 0
+
+    def read(self, *args) -> bytes:
+        data = super().read(*args)
+        self.bytes_read += len(data)
+        return data
+
+
+@pytest.mark.parametrize("standard,path", records, ids=[f"{standard}/{path.name}" for standard, path in records])
+def test_scan_header(standard, path):
+    config = standards[standard][0](record=path.read_text()).make_config().config
+    header = scan_header(path)
+    assert header == RecordHeader(
+        file_identifier=config.get("file_identifier"), date_stamp=config["date_stamp"], standard=standard
+    )
+    assert scan_header(str(path)) == header
+    assert scan_header(BytesIO(path.read_bytes())) == header
+
+
+def test_scan_header_stops_early():
+    record = fromstring(Path("tests/resources/records/iso-19115-2-v1/complete-record.xml").read_bytes())
+    keywords = record.find(f"{tags.gmd.identificationInfo}/*/{tags.gmd.descriptiveKeywords}")
+    for _ in range(0, 2000):
+        keywords.addnext(deepcopy(keywords))
+    document = tostring(record)
+
+    record_file = _ReadCountingFile(document)
+    assert scan_header(record_file).file_identifier == "b1a7d1b5-c419-41e7-9178-b1ffd76d5371"
+    assert record_file.bytes_read < len(document) / 10
+
+
+def test_scan_header_repeated_elements():
+    path = Path("tests/resources/records/iso-19115-2-v1/complete-record.xml")
+    record = fromstring(path.read_bytes())
+    for tag in [tags.gmd.fileIdentifier, tags.gmd.dateStamp]:
+        record.find(tag).addnext(deepcopy(record.find(tag)))
+    header = scan_header(BytesIO(tostring(record)))
+    assert header == RecordHeader(file_identifier=None, date_stamp=None, standard="iso-19115-2-v1")
+    assert MetadataRecord(record=tostring(record).decode()).make_config().config.get("file_identifier") is None
+
+
+def test_scan_header_invalid_date():
+    record = fromstring(Path("tests/resources/records/iso-19115-2-v1/complete-record.xml").read_bytes())
+    record.find(f"{tags.gmd.dateStamp}/{tags.gco.Date}").text = "invalid"
+    with pytest.raises(RuntimeError) as e:
+        scan_header(BytesIO(tostring(record)))
+    assert "Datestamp could not be parsed" in str(e.value)
+
+
+def test_scan_header_other_standard():
+    with pytest.raises(ValueError) as e:
+        scan_header(BytesIO(b"<OAI-PMH><ListRecords/></OAI-PMH>"))
+    assert "Record is not an ISO 19115 record, root element is 'OAI-PMH'" in str(e.value)
+
+
+@pytest.mark.parametrize("workers", [1, 4])
+def test_scan_headers(tmp_path, workers):
+    invalid_path = tmp_path / "invalid.xml"
+    invalid_path.write_text("invalid")
+    paths = [path for _, path in records] + [invalid_path]
+
+    results = list(scan_headers(paths=(path for path in paths), workers=workers, chunk_size=3))
+    assert [path for path, _, _ in results] == [str(path) for path in paths]
+    for (path, header, error), (_, record_path) in zip(results, records):
+        assert header == scan_header(record_path)
+        assert error is None
+
+    _, header, error = results[-1]
+    assert header is None
+    assert error["type"] == "XMLSyntaxError"
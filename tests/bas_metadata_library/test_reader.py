@@ -0,0 +1,363 @@
+import hashlib
+import json
+
+# noinspection PyUnresolvedReferences
+import pytest
+
+from copy import deepcopy
+from pathlib import Path
+
+# Exempting Bandit security issue (Using Element to parse untrusted XML data is known to be vulnerable to XML attacks)
+#
+# This is a testing environment, testing against static records, so the XML parsed should be safe.
+from lxml.etree import Comment, fromstring, tostring
+
+from bas_metadata_library.standards.iso_19115_1_v1 import MetadataRecord as ISO19115MetadataRecord
+from bas_metadata_library.standards.iso_19115_2_v1 import MetadataRecord, MetadataRecordConfig, Namespaces
+from bas_metadata_library.standards.iso_19115_common import MetadataRecordElement
+from bas_metadata_library.standards.iso_19115_common import (
+    base_elements,
+    common_elements,
+    data_distribution_elements,
+    data_identification_elements,
+    data_quality_elements,
+    root_element,
+)
+from bas_metadata_library.standards.iso_19115_common.base_elements import Contact
+from bas_metadata_library.standards.iso_19115_common.reader import LazyRecordConfig, read_record, read_record_lazy
+from tests.resources.configs import reader_parity
+from tests.resources.configs.iso19115_2_v1_standard import minimal_record
+
+standards = {"iso-19115-1-v1": ISO19115MetadataRecord, "iso-19115-2-v1": MetadataRecord}
+records = [
+    (standard, path.name)
+    for standard in standards
+    for path in sorted(Path(f"tests/resources/records/{standard}").glob("*.xml"))
+]
+namespaces = Namespaces()
+
+with open("tests/resources/records/iso-19115-2-v1/complete-record.xml") as _record_file:
+    complete_record = _record_file.read()
+
+
+def _element_paths(record: str) -> list:
+    """
+    Returns a path to the first instance of each distinct (ignoring position) element in a record
+    """
+    tree = fromstring(record.encode()).getroottree()
+    paths = {}
+    for element in tree.getroot().iterdescendants():
+        path = tree.getelementpath(element)
+        paths.setdefault("/".join(step.split("[")[0] for step in path.split("/")), path)
+    return list(paths.values())
+
+
+def _path_id(path: str) -> str:
+    for prefix, namespace in namespaces.nsmap().items():
+        path = path.replace(f"{{{namespace}}}", f"{prefix}:")
+    return path
+
+
+def _config_digest(record: MetadataRecord) -> str:
+    """
+    Returns a digest of the configuration converted from a record, or the exception raised where it can't be converted
+
+    Digests are generated in the same way as those in `tests.resources.configs.reader_parity`.
+    """
+    try:
+        config = record.make_config().config
+    except (KeyError, RuntimeError) as e:
+        return f"{type(e).__name__}: {e}"
+    return hashlib.sha256(json.dumps(config, default=str).encode()).hexdigest()
+
+
+def _assert_same_config(record: MetadataRecord):
+    """
+    Checks the reader returns the same configuration when read eagerly and lazily, including the order of properties
+
+    Where a record can't be read, the same exception should be raised either way.
+    """
+    try:
+        expected = record.make_config().config
+    except (KeyError, RuntimeError) as e:
+        with pytest.raises(type(e)) as _e:
+            record.make_config(lazy=True).to_dict()
+        assert str(_e.value) == str(e)
+        return
+
+    config = record.make_config(lazy=True).to_dict()
+    assert config == expected
+    assert json.dumps(config, default=str) == json.dumps(expected, default=str)
+
+
+@pytest.mark.parametrize("standard,record_name", records)
+def test_read_record(standard, record_name):
+    with open(f"tests/resources/records/{standard}/{record_name}") as record_file:
+        record = standards[standard](record=record_file.read())
+    assert _config_digest(record=record) == reader_parity.records[f"{standard}/{record_name}"]
+    _assert_same_config(record=record)
+
+
+@pytest.mark.parametrize("path", _element_paths(complete_record), ids=_path_id)
+def test_read_record_repeated_element(path):
+    record = MetadataRecord(record=complete_record)
+    element = record.record.getroottree().find(path)
+    element.addnext(deepcopy(element))
+    assert _config_digest(record=record) == reader_parity.repeated_elements[_path_id(path)]
+    _assert_same_config(record=record)
+
+
+@pytest.mark.parametrize(
+    "path,property_path",
+    [
+        ("gmd:fileIdentifier", ["file_identifier"]),
+        ("gmd:identificationInfo/gmd:MD_DataIdentification/gmd:abstract", ["resource", "abstract"]),
+        ("gmd:dateStamp", ["date_stamp"]),
+    ],
+)
+def test_read_record_repeated_single_value(path, property_path):
+    """
+    Values for elements expected once are ignored where the element is repeated
+    """
+    record = MetadataRecord(record=complete_record)
+    element = record.record.find(path, namespaces.nsmap())
+    element.addnext(deepcopy(element))
+    config = record.make_config().config
+    for key in property_path[:-1]:
+        config = config[key]
+    assert property_path[-1] not in config
+
+
+@pytest.mark.parametrize(
+    "path,property_path",
+    [
+        ("gmd:contact", ["contacts"]),
+        (
+            "gmd:identificationInfo/gmd:MD_DataIdentification/gmd:descriptiveKeywords/gmd:MD_Keywords/gmd:keyword",
+            ["resource", "keywords", 0, "terms"],
+        ),
+        ("gmd:identificationInfo/gmd:MD_DataIdentification/gmd:topicCategory", ["resource", "topics"]),
+    ],
+)
+def test_read_record_repeated_list_item(path, property_path):
+    """
+    Elements that can be repeated each add an item to a list, in the order they appear
+    """
+    expected = MetadataRecord(record=complete_record).make_config().config
+    record = MetadataRecord(record=complete_record)
+    element = record.record.find(path, namespaces.nsmap())
+    element.addnext(deepcopy(element))
+    config = record.make_config().config
+    for key in property_path:
+        expected = expected[key]
+        config = config[key]
+    assert config == [expected[0], *expected]
+
+
+def test_read_record_repeated_element_relative():
+    """
+    Values for repeated elements are read from within each element, rather than from other instances of the element
+    """
+    config = deepcopy(minimal_record)
+    config["contacts"] = [
+        {"organisation": {"name": "British Antarctic Survey"}, "role": ["author"]},
+        {
+            "organisation": {"name": "UK Polar Data Centre"},
+            "email": "polardatacentre@bas.ac.uk",
+            "role": ["pointOfContact"],
+        },
+    ]
+    config["resource"]["keywords"] = [
+        {"terms": [{"term": "Atmosphere"}], "type": "theme"},
+        {"terms": [{"term": "Antarctica"}], "type": "place", "thesaurus": {"title": {"value": "Place Names"}}},
+    ]
+    record = MetadataRecord(configuration=MetadataRecordConfig(**config))
+
+    assert MetadataRecord(record=record.generate_xml_document().decode()).make_config().config == config
+
+
+def test_read_record_mixed_content():
+    record = MetadataRecord(record=complete_record)
+    abstract = record.record.find(
+        "gmd:identificationInfo/gmd:MD_DataIdentification/gmd:abstract/gco:CharacterString", namespaces.nsmap()
+    )
+    abstract.append(Comment("comment"))
+    abstract[-1].tail = "tail"
+    _assert_same_config(record=record)
+    assert "abstract" not in record.make_config().config["resource"]
+
+
+def test_read_record_invalid_date():
+    record = MetadataRecord(record=complete_record)
+    record.record.find("gmd:dateStamp/gco:Date", namespaces.nsmap()).text = "invalid"
+    with pytest.raises(RuntimeError) as e:
+        record.make_config()
+    assert "Datestamp could not be parsed as an ISO datetime value" in str(e.value)
+    _assert_same_config(record=record)
+
+
+def test_read_record_other_standard():
+    record = ISO19115MetadataRecord(record=complete_record)
+    _assert_same_config(record=record)
+    assert record.make_config().config == {}
+
+
+def test_read_record_element():
+    record = fromstring(complete_record.encode())
+    expected = read_record(record=record, root_tag=record.tag)
+
+    document = fromstring(f"<records>{tostring(record).decode()}</records>".encode())
+    assert read_record(record=document[0], root_tag=record.tag) == expected
+
+
+def test_read_record_lazy():
+    record = MetadataRecord(record=complete_record)
+    expected = record.make_config().config
+    config = record.make_config(lazy=True)
+    assert isinstance(config, LazyRecordConfig)
+    assert repr(config) == "<LazyRecordConfig 0 of 10 sections parsed>"
+
+    assert config["file_identifier"] == expected["file_identifier"]
+    assert config["resource"]["title"] == expected["resource"]["title"]
+    assert config["resource"]["extent"] == expected["resource"]["extent"]
+    assert config["resource"] is config["resource"]
+    assert repr(config) == "<LazyRecordConfig 2 of 10 sections parsed>"
+    assert repr(config["resource"]) == "<LazyRecordConfig 2 of 16 sections parsed>"
+
+    assert "spatial_resolution" not in config["resource"]
+    assert config.get("invalid") is None
+    with pytest.raises(KeyError):
+        config["resource"]["invalid"]
+    with pytest.raises(TypeError):
+        config["file_identifier"] = "invalid"
+
+    assert len(config) == len(expected)
+    assert list(config["resource"]) == list(expected["resource"])
+    assert config == expected
+    assert type(config.to_dict()["resource"]) == dict
+
+
+def test_read_record_lazy_empty_resource():
+    record = MetadataRecord(record=complete_record)
+    identification = record.record.find("gmd:identificationInfo/gmd:MD_DataIdentification", namespaces.nsmap())
+    identification[:] = [identification.find("gmd:abstract", namespaces.nsmap())]
+    identification[0][:] = []
+    for path in ["gmd:distributionInfo", "gmd:dataQualityInfo"]:
+        record.record.remove(record.record.find(path, namespaces.nsmap()))
+
+    config = record.make_config(lazy=True)
+    assert len(config["resource"]) == 0
+    assert "resource" not in config.to_dict()
+    assert config.to_dict() == record.make_config().config
+
+
+fields = [
+    "file_identifier",
+    "date_stamp",
+    "maintenance.progress",
+    "resource.title",
+    "resource.extent.geographic",
+    "resource.keywords",
+    "resource.contacts",
+    "resource.lineage",
+]
+
+
+def _project(config: dict, fields: list) -> dict:
+    """
+    Builds a partial configuration from a full configuration, including only values selected by fields
+    """
+    _ = {}
+    for field in fields:
+        keys = field.split(".")
+        value = config
+        for key in keys:
+            if key not in value:
+                break
+            value = value[key]
+        else:
+            target = _
+            for key in keys[:-1]:
+                target = target.setdefault(key, {})
+            target[keys[-1]] = value
+    return _
+
+
+@pytest.mark.parametrize("standard,record_name", records)
+def test_read_record_fields(standard, record_name):
+    with open(f"tests/resources/records/{standard}/{record_name}") as record_file:
+        record = standards[standard](record=record_file.read())
+    expected = _project(config=record.make_config().config, fields=fields)
+
+    config = record.make_config(fields=fields)
+    assert type(config) == type(record.make_config())
+    assert config.config == expected
+    assert json.dumps(config.config, default=str) == json.dumps(expected, default=str)
+
+
+def test_read_record_fields_sections():
+    record = fromstring(complete_record.encode())
+    config = read_record_lazy(record=record, root_tag=record.tag)
+    expected = read_record(record=record, root_tag=record.tag)
+
+    assert config.select(fields=["resource.title", "date_stamp"]) == {
+        "resource": {"title": expected["resource"]["title"]},
+        "date_stamp": expected["date_stamp"],
+    }
+    assert repr(config) == "<LazyRecordConfig 2 of 10 sections parsed>"
+    assert repr(config["resource"]) == "<LazyRecordConfig 1 of 16 sections parsed>"
+
+    assert config.select(fields=["resource", "resource.title"]) == {"resource": expected["resource"]}
+    assert config.select(fields=["resource.spatial_resolution", "resource.extent.invalid"]) == {}
+    assert read_record(record=record, root_tag=record.tag, fields=[]) == {}
+
+
+def test_read_record_fields_other_standard():
+    record = ISO19115MetadataRecord(record=complete_record)
+    assert record.make_config(fields=["file_identifier", "resource"]).config == {}
+
+
+@pytest.mark.parametrize(
+    "field,message",
+    [
+        ("invalid", "'invalid' is not a known key"),
+        ("resource.invalid", "'invalid' is not a known key"),
+        ("resource.keywords.terms", "'resource.keywords' is not an object"),
+        ("file_identifier.invalid", "'file_identifier' is not an object"),
+    ],
+)
+def test_read_record_fields_invalid(field, message):
+    record = MetadataRecord(record=complete_record)
+    with pytest.raises(ValueError) as e:
+        record.make_config(fields=[field])
+    assert message in str(e.value)
+
+
+@pytest.mark.parametrize("standard", standards.keys())
+def test_read_record_fields_lazy(standard):
+    with pytest.raises(ValueError) as e:
+        standards[standard](record=complete_record).make_config(lazy=True, fields=["file_identifier"])
+    assert "Fields can't be set for a lazy configuration" in str(e.value)
+
+
+@pytest.mark.parametrize(
+    "module",
+    [
+        base_elements,
+        common_elements,
+        data_distribution_elements,
+        data_identification_elements,
+        data_quality_elements,
+        root_element,
+    ],
+)
+def test_element_slots(module):
+    element_classes = [
+        value for value in vars(module).values() if isinstance(value, type) and issubclass(value, MetadataRecordElement)
+    ]
+    assert len(element_classes) > 0
+    for element_class in element_classes:
+        assert "__slots__" in vars(element_class), element_class.__name__
+
+    contact = Contact(record=MetadataRecord().record, attributes={})
+    assert not hasattr(contact, "__dict__")
@@ -0,0 +1,351 @@
+import json
+
+# noinspection PyUnresolvedReferences
+import pytest
+
+from copy import deepcopy
+from datetime import date, datetime
+from threading import Thread
+from unittest.mock import patch
+from uuid import UUID
+
+from jsonschema import Draft7Validator, RefResolutionError, ValidationError, validate
+from jsonschema.exceptions import best_match
+
+from bas_metadata_library import MetadataRecordConfig as BaseMetadataRecordConfig
+from bas_metadata_library.schemas import (
+    SchemaRegistry,
+    bundled_schema_packages,
+    iter_changed_errors,
+    load_schema,
+    native_validator_class,
+    parse_json_pointer,
+    schema_registry,
+)
+from bas_metadata_library.standards.iso_19115_1_v1 import MetadataRecordConfig as ISO19115MetadataRecordConfig
+from bas_metadata_library.standards.iso_19115_1_v1.profiles.inspire_v1_3 import (
+    MetadataRecordConfig as INSPIREMetadataRecordConfig,
+)
+from bas_metadata_library.standards.iso_19115_1_v1.profiles.uk_pdc_discovery_v1 import (
+    MetadataRecordConfig as ISO19115UKPDCDiscoveryMetadataRecordConfig,
+)
+from bas_metadata_library.standards.iso_19115_2_v1 import MetadataRecordConfig
+from bas_metadata_library.standards.iso_19115_2_v1.profiles.uk_pdc_discovery_v1 import (
+    MetadataRecordConfig as UKPDCDiscoveryMetadataRecordConfig,
+)
+
+from tests.resources.configs.iso19115_1_v1_standard import configs_all as iso19115_1_configs
+from tests.resources.configs.iso19115_2_v1_standard import configs_all as configs
+from tests.resources.configs.mutations import remove_language, set_date_stamp_integer, set_date_type_invalid
+
+
+@pytest.mark.parametrize("package", bundled_schema_packages)
+def test_bundled_schema_registered(package):
+    schema = load_schema(package=package)
+    assert schema["$id"] in schema_registry
+    assert schema_registry.get(schema["$id"]) == schema
+
+
+def test_bundled_schema_identifiers_unique():
+    schema_ids = [load_schema(package=package)["$id"] for package in bundled_schema_packages]
+    assert len(schema_ids) == len(set(schema_ids))
+
+
+def test_register_schema_without_identifier():
+    registry = SchemaRegistry()
+    with pytest.raises(ValueError) as e:
+        registry.register(schema={"type": "object"})
+    assert "does not have an identifier" in str(e.value)
+
+
+def test_register_schema():
+    schema = {"$id": "https://example.com/schema.json#", "type": "object"}
+    registry = SchemaRegistry()
+    registry.register(schema=schema)
+    assert "https://example.com/schema.json" in registry
+    assert registry.get("https://example.com/schema.json#") == schema
+
+
+def test_validate_without_network():
+    config = UKPDCDiscoveryMetadataRecordConfig(**configs["uk-pdc-discovery-minimal"])
+    with patch("jsonschema.validators.urlopen") as urlopen, patch("requests.get") as requests_get:
+        config.validate()
+        urlopen.assert_not_called()
+        requests_get.assert_not_called()
+
+
+def test_offline_unregistered_schema():
+    registry = SchemaRegistry(offline=True)
+    schema = {
+        "$id": "https://example.com/profile.json",
+        "allOf": [{"$ref": "https://example.com/standard.json"}],
+    }
+    resolver = registry.resolver(schema=schema)
+    with pytest.raises(RefResolutionError) as e:
+        resolver.resolve("https://example.com/standard.json")
+    assert "remote resolution is disabled" in str(e.value)
+
+
+def test_validator_cached():
+    config = UKPDCDiscoveryMetadataRecordConfig(**configs["uk-pdc-discovery-minimal"])
+    config_ = UKPDCDiscoveryMetadataRecordConfig(**configs["uk-pdc-discovery-minimal"])
+    assert config.schema is config_.schema
+    assert schema_registry.validator(schema=config.schema) is schema_registry.validator(schema=config_.schema)
+
+
+def test_validator_schema_checked_once():
+    registry = SchemaRegistry(packages=bundled_schema_packages)
+    schema = load_schema(package=bundled_schema_packages[0])
+    with patch.object(native_validator_class(Draft7Validator), "check_schema") as check_schema:
+        registry.validator(schema=schema)
+        registry.offline = True
+        registry.validator(schema=schema)
+        check_schema.assert_called_once()
+
+
+def test_validator_reset_offline():
+    registry = SchemaRegistry(packages=bundled_schema_packages)
+    schema = load_schema(package=bundled_schema_packages[0])
+    validator = registry.validator(schema=schema)
+    registry.offline = True
+    assert registry.validator(schema=schema) is not validator
+
+
+def test_validator_per_thread():
+    schema = load_schema(package=bundled_schema_packages[0])
+    validators = []
+    thread = Thread(target=lambda: validators.append(schema_registry.validator(schema=schema)))
+    thread.start()
+    thread.join()
+    assert validators[0] is not schema_registry.validator(schema=schema)
+
+
+def test_validator_schema_without_identifier():
+    schema = {"type": "object"}
+    assert schema_registry.validator(schema=schema) is not schema_registry.validator(schema=schema)
+
+
+def _set_date_stamp_datetime(config: dict):
+    config["date_stamp"] = datetime(2018, 10, 18, 14, 40, 44)
+
+
+def _set_date_invalid(config: dict):
+    config["resource"]["dates"][0]["date"] = ["2018-01-01"]
+
+
+def _set_temporal_extent_invalid(config: dict):
+    config["resource"]["extent"]["temporal"]["period"]["start"] = 2018
+
+
+def _set_file_identifier_date(config: dict):
+    config["file_identifier"] = date(2020, 1, 1)
+
+
+def _set_file_identifier_uuid(config: dict):
+    config["file_identifier"] = UUID(config["file_identifier"])
+
+
+def _set_contact_role_tuple(config: dict):
+    config["contacts"][0]["role"] = tuple(config["contacts"][0]["role"])
+
+
+def _set_contact_role_tuple_invalid(config: dict):
+    config["contacts"][0]["role"] = ("invalid",)
+
+
+native_value_mutations = [_set_file_identifier_date, _set_file_identifier_uuid, _set_contact_role_tuple]
+
+
+@pytest.mark.parametrize(
+    "config_class,config,mutation",
+    [
+        *[
+            (MetadataRecordConfig, configs["complete"], mutation)
+            for mutation in [
+                set_date_stamp_integer,
+                _set_date_stamp_datetime,
+                set_date_type_invalid,
+                _set_date_invalid,
+                _set_temporal_extent_invalid,
+                remove_language,
+                *native_value_mutations,
+                _set_contact_role_tuple_invalid,
+            ]
+        ],
+        *[
+            (ISO19115UKPDCDiscoveryMetadataRecordConfig, iso19115_1_configs["uk-pdc-discovery-minimal"], mutation)
+            for mutation in native_value_mutations
+        ],
+    ],
+)
+def test_validate_native_dates(config_class, config, mutation):
+    config = deepcopy(config)
+    mutation(config)
+    configuration = config_class(**config)
+
+    expected_error = None
+    try:
+        _config = json.loads(json.dumps(config, default=str))
+        validate(instance=_config, schema=configuration.schema, resolver=schema_registry.resolver(configuration.schema))
+    except ValidationError as e:
+        expected_error = e
+
+    if expected_error is None:
+        configuration.validate()
+        assert configuration.is_valid()
+        assert list(configuration.iter_errors()) == []
+        return
+
+    with pytest.raises(ValidationError) as e:
+        configuration.validate()
+    assert e.value.message == expected_error.message
+    assert e.value.path == expected_error.path
+    assert e.value.schema_path == expected_error.schema_path
+    assert not configuration.is_valid()
+    assert len(list(configuration.iter_errors())) > 0
+
+
+def _change_abstract(config: dict):
+    config["resource"]["abstract"] = "Changed abstract"
+    return ["/resource/abstract"]
+
+
+def _change_abstract_invalid(config: dict):
+    config["resource"]["abstract"] = 2018
+    return ["/resource/abstract"]
+
+
+def _change_date_type_invalid(config: dict):
+    config["resource"]["dates"][0]["date_type"] = "invalid"
+    return ["/resource/dates/0/date_type"]
+
+
+def _change_date_type_contains(config: dict):
+    config["resource"]["dates"][0]["date_type"] = "publication"
+    return [["resource", "dates", 0, "date_type"]]
+
+
+def _remove_language_required(config: dict):
+    del config["language"]
+    return ["/language"]
+
+
+def _remove_contact_email_required(config: dict):
+    del config["contacts"][0]["email"]
+    return ["/contacts/0/email"]
+
+
+def _add_property_additional(config: dict):
+    config["invalid"] = "invalid"
+    return ["/invalid"]
+
+
+def _add_keyword(config: dict):
+    config["resource"]["keywords"].append({"terms": [{"term": 2018}]})
+    return ["/resource/keywords/1"]
+
+
+def _replace_resource(config: dict):
+    config["resource"] = {}
+    return ["/resource"]
+
+
+def _change_multiple(config: dict):
+    config["resource"]["abstract"] = 2018
+    config["resource"]["title"]["value"] = 2018
+    return ["/resource/abstract", "/resource/title/value", "/resource/abstract"]
+
+
+@pytest.mark.parametrize("config_class", [ISO19115MetadataRecordConfig, INSPIREMetadataRecordConfig])
+@pytest.mark.parametrize(
+    "change",
+    [
+        _change_abstract,
+        _change_abstract_invalid,
+        _change_date_type_invalid,
+        _change_date_type_contains,
+        _remove_language_required,
+        _remove_contact_email_required,
+        _add_property_additional,
+        _add_keyword,
+        _replace_resource,
+        _change_multiple,
+    ],
+)
+def test_validate_changes(config_class, change):
+    previous = iso19115_1_configs["inspire-minimal"]
+    config = deepcopy(previous)
+    changes = change(config)
+    configuration = config_class(**config)
+
+    expected_errors = {(tuple(error.absolute_path), error.message) for error in configuration.iter_errors()}
+    validator = schema_registry.validator(schema=configuration.schema)
+    errors = iter_changed_errors(validator, instance=configuration.config, previous=previous, changes=changes)
+    assert {(tuple(error.absolute_path), error.message) for error in errors} == expected_errors
+
+    if not expected_errors:
+        configuration.validate_changes(previous=previous, changes=changes)
+        return
+
+    with pytest.raises(ValidationError) as e:
+        configuration.validate_changes(previous=previous, changes=changes)
+    assert e.value.message == best_match(configuration.iter_errors()).message
+
+
+@pytest.mark.parametrize(
+    "changes,instance",
+    [
+        (["/pairs/0/1"], {"pairs": [["a", 2]], "x-a": "a"}),
+        (["/pairs/0/2"], {"pairs": [["a", 1, 3]], "x-a": "a"}),
+        (["/x-a"], {"pairs": [["a", 1]], "x-a": 1}),
+        (["/pairs/0"], {"pairs": [["a", 1], ["b", 2]], "x-a": "a"}),
+        (["/y"], {"pairs": [["a", 1]], "x-a": "a", "y": 1}),
+    ],
+)
+def test_validate_changes_member_schemas(changes, instance):
+    schema = {
+        "$id": "https://example.com/members.json",
+        "type": "object",
+        "properties": {
+            "pairs": {
+                "type": "array",
+                "items": {
+                    "type": "array",
+                    "items": [{"type": "string"}, {"type": "integer", "maximum": 1}],
+                    "additionalItems": {"type": "string"},
+                },
+            }
+        },
+        "patternProperties": {"^x-": {"type": "string"}},
+        "additionalProperties": {"type": "string"},
+    }
+    previous = {"pairs": [["a", 1, "b"] if len(instance["pairs"][0]) == 3 else ["a", 1]], "x-a": "a"}
+    validator = SchemaRegistry().validator(schema=schema)
+
+    expected_errors = {(tuple(error.absolute_path), error.message) for error in validator.iter_errors(instance)}
+    errors = iter_changed_errors(validator, instance=instance, previous=previous, changes=changes)
+    assert {(tuple(error.absolute_path), error.message) for error in errors} == expected_errors
+    assert len(expected_errors) == 1
+
+
+def test_validate_changes_no_schema():
+    BaseMetadataRecordConfig(invalid="invalid").validate_changes(previous={}, changes=["/invalid"])
+
+
+@pytest.mark.parametrize(
+    "pointer,tokens",
+    [
+        ("", []),
+        ("/resource/dates/0", ["resource", "dates", "0"]),
+        ("/a~1b/c~0d", ["a/b", "c~d"]),
+        (["a", 0], ["a", "0"]),
+    ],
+)
+def test_parse_json_pointer(pointer, tokens):
+    assert parse_json_pointer(pointer) == tokens
+
+
+def test_parse_json_pointer_invalid():
+    with pytest.raises(ValueError) as e:
+        parse_json_pointer("resource")
+    assert "must be empty or start with '/'" in str(e.value)
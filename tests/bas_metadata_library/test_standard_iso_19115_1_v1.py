@@ -1105,7 +1105,7 @@ def mock_response(*args, **kwargs):
 
 def test_edgecase_mocked_doi_lookup():
     with patch(
-        "bas_metadata_library.standards.iso_19115_common.data_identification_elements.requests.get",
+        "bas_metadata_library.citations.requests.get",
         side_effect=mock_response,
     ):
         config = deepcopy(unsafe_configs["minimal-required-doi-citation"])
@@ -0,0 +1,37 @@
+# noinspection PyUnresolvedReferences
+import pytest
+
+from bas_metadata_library.standards.iso_19115_common.utils import contacts_condense_roles
+
+
+def test_contacts_condense_roles():
+    contacts = [
+        {"organisation": {"name": "foo"}, "role": ["pointOfContact"]},
+        {"organisation": {"name": "bar"}, "role": ["author"]},
+        {"organisation": {"name": "foo"}, "role": ["distributor"]},
+        {"organisation": {"name": "bar"}, "role": ["author", "publisher"]},
+        {"role": ["custodian"], "organisation": {"name": "foo"}},
+    ]
+    assert contacts_condense_roles(contacts=contacts) == [
+        {"organisation": {"name": "foo"}, "role": ["pointOfContact", "distributor", "custodian"]},
+        {"organisation": {"name": "bar"}, "role": ["author", "publisher"]},
+    ]
+    assert contacts[0]["role"] == ["pointOfContact"]
+
+
+def test_contacts_condense_roles_structural_key():
+    contacts = [
+        {"individual": {"name": "foo"}, "address": {"city": "a", "country": "b"}, "role": ["author"]},
+        {"address": {"country": "b", "city": "a"}, "individual": {"name": "foo"}, "role": ["publisher"]},
+        {"individual": {"name": "foo"}, "address": {"city": "a"}, "role": ["custodian"]},
+        {"individual": {"name": "foo"}, "address": {"city": "a"}, "values": [{"a": 1}], "role": ["owner"]},
+        {"individual": {"name": "foo"}, "address": {"city": "a"}, "values": [{"a": 2}], "role": ["owner"]},
+    ]
+    condensed = contacts_condense_roles(contacts=contacts)
+    assert [contact["role"] for contact in condensed] == [["author", "publisher"], ["custodian"], ["owner"], ["owner"]]
+    assert list(condensed[0].keys()) == ["individual", "address", "role"]
+
+
+def test_contacts_condense_roles_no_role():
+    with pytest.raises(KeyError):
+        contacts_condense_roles(contacts=[{"individual": {"name": "foo"}}])
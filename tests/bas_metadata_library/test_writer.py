@@ -0,0 +1,97 @@
+# noinspection PyUnresolvedReferences
+import pytest
+
+from io import BytesIO
+
+# Exempting Bandit security issue (Using Element to parse untrusted XML data is known to be vulnerable to XML attacks)
+#
+# This is a testing environment, testing against generated records, so the XML parsed should be safe.
+from lxml.etree import fromstring, tostring
+
+from bas_metadata_library.standards.iso_19115_1_v1 import (
+    MetadataRecord as ISO19115MetadataRecord,
+    MetadataRecordConfig as ISO19115MetadataRecordConfig,
+)
+from bas_metadata_library.standards.iso_19115_2_v1 import MetadataRecord, MetadataRecordConfig
+from bas_metadata_library.writer import RecordsWriter
+
+from tests.resources.configs.iso19115_1_v1_standard import configs_all as iso19115_1_configs
+from tests.resources.configs.iso19115_2_v1_standard import configs_all as configs
+
+csw_namespace = "http://www.opengis.net/cat/csw/2.0.2"
+
+
+def _records() -> list:
+    return [
+        MetadataRecord(configuration=MetadataRecordConfig(**configs["complete"])),
+        ISO19115MetadataRecord(configuration=ISO19115MetadataRecordConfig(**iso19115_1_configs["minimal"])),
+        MetadataRecord(configuration=MetadataRecordConfig(**configs["minimal"])),
+    ]
+
+
+class _RecordingFile(BytesIO):
+    """
+    File object recording its contents each time it is flushed
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.flushed = []
+
+    def flush(self):
+        super().flush()
+        self.flushed.append(self.getvalue())
+
+
+@pytest.mark.parametrize("index", range(0, len(_records())))
+def test_write_to(index):
+    file = BytesIO()
+    _records()[index].write_to(file)
+    assert file.getvalue() == _records()[index].generate_xml_document()
+
+
+def test_records_writer():
+    file = BytesIO()
+    with RecordsWriter(output=file, container="records") as writer:
+        for record in _records():
+            writer.write(record)
+
+    document = fromstring(file.getvalue())
+    assert document.tag == "records"
+    assert [tostring(element, method="c14n") for element in document] == [
+        tostring(fromstring(record.generate_xml_document()), method="c14n") for record in _records()
+    ]
+
+
+def test_records_writer_container(tmp_path):
+    path = tmp_path / "records.xml"
+    with RecordsWriter(
+        output=str(path),
+        container=f"{{{csw_namespace}}}GetRecordsResponse",
+        container_attributes={"version": "2.0.2"},
+        nsmap={"csw": csw_namespace},
+    ) as writer:
+        writer.write(_records()[0])
+
+    document = fromstring(path.read_bytes())
+    assert document.tag == f"{{{csw_namespace}}}GetRecordsResponse"
+    assert document.get("version") == "2.0.2"
+    assert document.nsmap["csw"] == csw_namespace
+    assert len(document) == 1
+
+
+def test_records_writer_flushed():
+    file = _RecordingFile()
+    with RecordsWriter(output=file, container="records", pretty_print=False) as writer:
+        for count, record in enumerate(_records(), start=1):
+            writer.write(record)
+            assert file.flushed[-1].count(b"_Metadata>") == count
+
+    assert file.getvalue().endswith(b"</records>")
+
+
+def test_records_writer_not_entered():
+    writer = RecordsWriter(output=BytesIO(), container="records")
+    with pytest.raises(RuntimeError) as e:
+        writer.write(_records()[0])
+    assert "must be used as a context manager" in str(e.value)
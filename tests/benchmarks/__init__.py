@@ -0,0 +1,34 @@
+from timeit import repeat
+from typing import Callable
+
+
+def measure(function: Callable, number: int = 100, repetitions: int = 5) -> float:
+    """
+    Measures the time taken to call a function
+
+    The function is called `number` times, `repetitions` times over, with the fastest repetition used to minimise
+    noise from other processes.
+
+    :type function: callable
+    :param function: function to measure, called without arguments
+    :type number: int
+    :param number: number of calls per repetition
+    :type repetitions: int
+    :param repetitions: number of repetitions
+
+    :rtype float
+    :return: mean time per call in milliseconds
+    """
+    return min(repeat(function, number=number, repeat=repetitions)) / number * 1000
+
+
+def report(label: str, milliseconds: float) -> None:
+    """
+    Prints a benchmark measurement
+
+    :type label: str
+    :param label: description of what was measured
+    :type milliseconds: float
+    :param milliseconds: measurement in milliseconds
+    """
+    print(f"{label:<60} {milliseconds:>10.3f} ms")
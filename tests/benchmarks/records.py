@@ -0,0 +1,504 @@
+from copy import deepcopy
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from io import BytesIO
+from pathlib import Path
+from resource import RUSAGE_SELF, getrusage
+from socketserver import ThreadingMixIn
+from sys import getsizeof
+from tempfile import TemporaryDirectory
+from threading import Thread
+from time import sleep
+from tracemalloc import get_traced_memory, start as start_tracemalloc, stop as stop_tracemalloc
+from unittest.mock import patch
+
+# Exempting Bandit security issue (Using Element to parse untrusted XML data is known to be vulnerable to XML attacks)
+#
+# This is a testing environment, testing against generated records, so the XML parsed should be safe.
+from lxml.etree import Element, fromstring, tostring
+
+from bas_metadata_library import MetadataRecordElement, Namespaces
+from bas_metadata_library.citations import (
+    CachedCitationResolver,
+    CitationResolver,
+    CrossCiteCitationResolver,
+    StubCitationResolver,
+    citation_dois,
+    make_session,
+)
+from bas_metadata_library.standards.iso_19115_1_v1 import (
+    MetadataRecord as ISO19115MetadataRecord,
+    MetadataRecordConfig as ISO19115MetadataRecordConfig,
+)
+from bas_metadata_library.standards.iso_19115_2_v1 import MetadataRecord, MetadataRecordConfig
+from bas_metadata_library.standards.iso_19115_common import tags
+from bas_metadata_library.standards.iso_19115_common.harvest import iter_record_configs, scan_header, scan_headers
+from bas_metadata_library.standards.iso_19115_common.reader import read_record
+from bas_metadata_library.standards.iso_19115_common.root_element import ISOMetadataRecord
+from bas_metadata_library.standards.iso_19115_common.utils import contacts_condense_roles
+from bas_metadata_library.writer import RecordsWriter
+
+from tests.benchmarks import measure, report
+from tests.resources.configs.iso19115_1_v1_standard import configs_all as iso19115_1_configs
+from tests.resources.configs.iso19115_2_v1_standard import configs_all as configs
+
+
+def _large_record(keywords: int, contacts: int) -> str:
+    """
+    Generates a record from the 'complete' configuration with additional keywords and contacts
+
+    Additional keywords and contacts are copies of the first keyword and contact, with a unique term or name each.
+
+    :type keywords: int
+    :param keywords: number of additional keywords
+    :type contacts: int
+    :param contacts: number of additional contacts
+
+    :rtype str
+    :return: XML document string representing a record
+    """
+    config = deepcopy(configs["complete"])
+    for index in range(0, keywords):
+        keyword = deepcopy(config["resource"]["keywords"][0])
+        keyword["terms"] = [{"term": f"Term {index}"}]
+        config["resource"]["keywords"].append(keyword)
+    for index in range(0, contacts):
+        contact = deepcopy(config["resource"]["contacts"][0])
+        contact["individual"] = {"name": f"Contact {index}"}
+        config["resource"]["contacts"].append(contact)
+
+    return MetadataRecord(configuration=MetadataRecordConfig(**config)).generate_xml_document().decode()
+
+
+def benchmark_read_record():
+    """
+    Measures parsing records using the tree walking reader
+
+    Records are parsed from the 'complete' configuration, and from the same configuration with 200 extra keywords and
+    50 extra contacts.
+    """
+    records = {"complete": _large_record(keywords=0, contacts=0), "large": _large_record(keywords=200, contacts=50)}
+    for label, _record in records.items():
+        record = MetadataRecord(record=_record)
+        report(
+            label=f"make config ({label} record)",
+            milliseconds=measure(record.make_config, number=1, repetitions=3),
+        )
+
+
+def benchmark_record_scaling():
+    """
+    Checks the time to parse a record increases linearly with the number of repeated elements it contains
+
+    Records are parsed with 250, 500 and 1,000 additional keywords and contacts. The time per repeated element should
+    stay roughly the same as the number of elements increases.
+    """
+    for count in [250, 500, 1000]:
+        record = MetadataRecord(record=_large_record(keywords=count, contacts=count))
+        milliseconds = measure(record.make_config, number=1, repetitions=3)
+        report(label=f"make config ({count} keywords and contacts)", milliseconds=milliseconds)
+        report(
+            label=f"make config ({count} keywords and contacts, per element)", milliseconds=milliseconds / (count * 2)
+        )
+
+
+def benchmark_harvest():
+    """
+    Compares parsing a document containing many records incrementally against parsing the whole document at once
+
+    The document contains 2,000 copies of the 'complete' record. Peak memory use (resident set size) is measured as
+    the increase in the peak for this process, so the incremental parse is measured first.
+    """
+    record = tostring(fromstring(_large_record(keywords=0, contacts=0).encode())).decode()
+    document = f"<records>{record * 2000}</records>".encode()
+
+    def _parse_whole():
+        root = fromstring(document)
+        return [read_record(record=element, root_tag=element.tag) for element in root]
+
+    for label, parse in [
+        ("incremental", lambda: list(iter_record_configs(BytesIO(document)))),
+        ("whole document", _parse_whole),
+    ]:
+        peak = getrusage(RUSAGE_SELF).ru_maxrss
+        milliseconds = measure(parse, number=1, repetitions=1)
+        report(label=f"parse 2000 records ({label})", milliseconds=milliseconds)
+        print(f"{f'peak memory increase ({label})':<60} {getrusage(RUSAGE_SELF).ru_maxrss - peak:>10} KB")
+
+
+def benchmark_make_config_many():
+    """
+    Compares converting many record files one at a time against `make_config_many()` with different numbers of workers
+
+    Records are 2,000 copies of the 'complete' record, written to a temporary directory. Throughput is reported as the
+    number of records converted per second.
+    """
+    count = 2000
+    record = _large_record(keywords=0, contacts=0)
+    with TemporaryDirectory() as records_path:
+        paths = [Path(records_path) / f"record-{index}.xml" for index in range(0, count)]
+        for path in paths:
+            path.write_text(record)
+
+        def _sequential():
+            for _path in paths:
+                MetadataRecord(record=_path.read_text()).make_config()
+
+        milliseconds = measure(_sequential, number=1, repetitions=3)
+        report(label=f"convert {count} records (sequential)", milliseconds=milliseconds)
+        print(f"{'throughput (sequential)':<60} {count / milliseconds * 1000:>10.0f} records/s")
+        for workers in [1, 2, 4, 8]:
+            milliseconds = measure(
+                lambda: list(MetadataRecord.make_config_many(paths=paths, workers=workers)), number=1, repetitions=3
+            )
+            report(label=f"convert {count} records (make_config_many, {workers} workers)", milliseconds=milliseconds)
+            print(f"{f'throughput ({workers} workers)':<60} {count / milliseconds * 1000:>10.0f} records/s")
+
+
+def benchmark_generate_many():
+    """
+    Compares generating many records one at a time against `generate_many()` with different numbers of workers
+
+    Configurations are generated from the 'complete' configuration with a unique file identifier each. Records are
+    returned as bytes, and also written to files in a temporary directory.
+    """
+    count = 1000
+
+    def _configs():
+        for index in range(0, count):
+            yield {**configs["complete"], "file_identifier": f"record-{index}"}
+
+    def _sequential():
+        for _config in _configs():
+            MetadataRecord(configuration=MetadataRecordConfig(**_config)).generate_xml_document()
+
+    report(label=f"generate {count} records (sequential)", milliseconds=measure(_sequential, number=1, repetitions=3))
+    for workers in [1, 2, 4, 8]:
+        report(
+            label=f"generate {count} records (generate_many, {workers} workers)",
+            milliseconds=measure(
+                lambda: list(MetadataRecord.generate_many(configs=_configs(), workers=workers)), number=1, repetitions=3
+            ),
+        )
+    with TemporaryDirectory() as output_path:
+        report(
+            label=f"generate {count} records (generate_many, 4 workers, to files)",
+            milliseconds=measure(
+                lambda: list(MetadataRecord.generate_many(configs=_configs(), workers=4, output_path=output_path)),
+                number=1,
+                repetitions=3,
+            ),
+        )
+
+
+def benchmark_records_writer():
+    """
+    Compares exporting many records by concatenating generated documents against using a `RecordsWriter`
+
+    Records are generated from the 'complete' configuration with a unique file identifier each, written to a temporary
+    file. Peak memory use (resident set size) is measured as the increase in the peak for this process, so the writer
+    is measured first.
+    """
+    count = 2000
+    config = configs["complete"]
+
+    def _records():
+        for index in range(0, count):
+            yield MetadataRecord(configuration=MetadataRecordConfig(**{**config, "file_identifier": f"record-{index}"}))
+
+    def _writer(path: Path):
+        with RecordsWriter(output=str(path), container="records") as writer:
+            for record in _records():
+                writer.write(record)
+
+    def _concatenated(path: Path):
+        documents = [tostring(fromstring(record.generate_xml_document())) for record in _records()]
+        path.write_bytes(b"<records>" + b"".join(documents) + b"</records>")
+
+    with TemporaryDirectory() as output_path:
+        for label, export in [("records writer", _writer), ("concatenated", _concatenated)]:
+            peak = getrusage(RUSAGE_SELF).ru_maxrss
+            milliseconds = measure(lambda: export(Path(output_path) / "records.xml"), number=1, repetitions=1)
+            report(label=f"export {count} records ({label})", milliseconds=milliseconds)
+            print(f"{f'peak memory increase ({label})':<60} {getrusage(RUSAGE_SELF).ru_maxrss - peak:>10} KB")
+
+
+class _SlowCitationResolver(StubCitationResolver):
+    """
+    Stub citation resolver simulating the latency of requesting citations from the DOI resolver
+    """
+
+    def resolve(self, doi: str, style: str = "apa", locale: str = "en-GB") -> str:
+        sleep(0.05)
+        return super().resolve(doi=doi, style=style, locale=locale)
+
+
+def benchmark_citation_cache():
+    """
+    Compares generating records with a required citation DOI with and without caching citations
+
+    Records are generated from the minimal ISO 19115 configuration with a required citation, using 10 different DOIs.
+    Requesting a citation is simulated using a stub resolver with a delay of 50 ms. Records are generated without a
+    cache, with an empty cache (in memory and SQLite), and again with a new resolver using the same SQLite database.
+    """
+    count = 200
+    config = iso19115_1_configs["minimal-required-doi-citation"]
+
+    def _generate(resolver: CitationResolver):
+        for index in range(0, count):
+            _config = deepcopy(config)
+            _config["resource"]["constraints"]["usage"][0]["required_citation"]["doi"] += f"-{index % 10}"
+            ISO19115MetadataRecord(
+                configuration=ISO19115MetadataRecordConfig(**_config), citation_resolver=resolver
+            ).generate_xml_document()
+
+    stub = _SlowCitationResolver(default="Citation")
+    with TemporaryDirectory() as cache_path:
+        path = Path(cache_path) / "citations.db"
+        resolvers = {
+            "no cache": stub,
+            "empty cache": CachedCitationResolver(resolver=stub, path=path),
+            "persisted cache": CachedCitationResolver(resolver=stub, path=path),
+        }
+        for label, resolver in resolvers.items():
+            report(
+                label=f"generate {count} records with DOI citations ({label})",
+                milliseconds=measure(lambda: _generate(resolver), number=1, repetitions=1),
+            )
+
+
+class _ThreadingHTTPServer(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+
+
+class _SlowDOIResolverHandler(BaseHTTPRequestHandler):
+    """
+    Stand-in for the DOI resolver, returning a citation for each path after a delay of 50 ms
+    """
+
+    def do_GET(self):
+        sleep(0.05)
+        body = f"Citation for {self.path}".encode()
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def benchmark_citation_prefetch():
+    """
+    Compares generating records with required citation DOIs with and without prefetching citations
+
+    Records are generated from the minimal ISO 19115 configuration with a required citation, using a different DOI for
+    each record. Citations are requested from a local stand-in for the DOI resolver, which responds after 50 ms.
+    Without prefetching, citations are requested one at a time as each record is generated. With prefetching, DOIs
+    are collected from all configurations and citations requested concurrently, using a pooled session, before records
+    are generated.
+    """
+    count = 100
+    server = _ThreadingHTTPServer(("127.0.0.1", 0), _SlowDOIResolverHandler)
+    Thread(target=server.serve_forever, daemon=True).start()
+
+    _configs = []
+    for index in range(0, count):
+        _config = deepcopy(iso19115_1_configs["minimal-required-doi-citation"])
+        _config["resource"]["constraints"]["usage"][0]["required_citation"][
+            "doi"
+        ] = f"http://127.0.0.1:{server.server_address[1]}/10.1234/{index}"
+        _configs.append(_config)
+
+    def _generate(prefetch: bool):
+        resolver = CachedCitationResolver(resolver=CrossCiteCitationResolver(session=make_session()))
+        if prefetch:
+            resolver.prefetch(dois=citation_dois(_configs), workers=8)
+        for _ in ISO19115MetadataRecord.generate_many(configs=_configs, citation_resolver=resolver):
+            pass
+
+    try:
+        for prefetch in [False, True]:
+            report(
+                label=f"generate {count} records with new DOI citations ({'prefetched' if prefetch else 'serial'})",
+                milliseconds=measure(lambda: _generate(prefetch=prefetch), number=1, repetitions=3),
+            )
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def benchmark_record_allocations():
+    """
+    Measures the time, objects created and peak memory used to generate a record
+
+    Records are generated from the 'complete' configuration, both as a document (including validating the configuration
+    and serialising the record), and as just the tree of elements. Namespace and element objects are counted by
+    wrapping the constructors of the base `Namespaces` and `MetadataRecordElement` classes, with the size of each
+    element object (including any attributes dict) totalled. Peak memory is measured using `tracemalloc` (which slows
+    generation down, so it is measured separately from the time taken).
+    """
+    config = configs["complete"]
+    attributes = MetadataRecord(configuration=MetadataRecordConfig(**deepcopy(config))).attributes
+    namespaces_init = Namespaces.__init__
+    element_init = MetadataRecordElement.__init__
+    namespaces_created = []
+    elements_created = []
+
+    def _namespaces_init(self, *args, **kwargs):
+        namespaces_created.append(self)
+        namespaces_init(self, *args, **kwargs)
+
+    def _element_init(self, *args, **kwargs):
+        elements_created.append(self)
+        element_init(self, *args, **kwargs)
+
+    def _generate():
+        MetadataRecord(configuration=MetadataRecordConfig(**deepcopy(config))).generate_xml_document()
+
+    def _make_element():
+        root = Element(tags.gmi.MI_Metadata, nsmap=tags.nsmap)
+        ISOMetadataRecord(record=root, attributes=attributes).make_element()
+
+    report(label="generate record (complete)", milliseconds=measure(_generate, number=10, repetitions=5))
+    report(label="make element tree (complete)", milliseconds=measure(_make_element, number=10, repetitions=5))
+
+    with patch.object(Namespaces, "__init__", _namespaces_init), patch.object(
+        MetadataRecordElement, "__init__", _element_init
+    ):
+        _generate()
+    elements_size = sum(
+        getsizeof(element) + (getsizeof(element.__dict__) if hasattr(element, "__dict__") else 0)
+        for element in elements_created
+    )
+    print(f"{'namespace objects created per record (complete)':<60} {len(namespaces_created):>10}")
+    print(f"{'element objects created per record (complete)':<60} {len(elements_created):>10}")
+    print(f"{'size of element objects per record (complete)':<60} {elements_size / 1024:>10.1f} KB")
+
+    start_tracemalloc()
+    _generate()
+    peak = get_traced_memory()[1]
+    stop_tracemalloc()
+    print(f"{'peak memory per record (complete)':<60} {peak / 1024:>10.1f} KB")
+
+
+def benchmark_lazy_config():
+    """
+    Compares getting the values for a catalogue listing from records parsed eagerly and lazily
+
+    Listings use the file identifier, date stamp, title and bounding box of each record. Records are parsed from the
+    'complete' configuration with 200 extra keywords and 50 extra contacts, which a listing doesn't need.
+    """
+    records = [MetadataRecord(record=_large_record(keywords=200, contacts=50)) for _ in range(0, 100)]
+
+    def _listing(config) -> list:
+        return [
+            config["file_identifier"],
+            config["date_stamp"],
+            config["resource"]["title"]["value"],
+            config["resource"]["extent"]["geographic"]["bounding_box"],
+        ]
+
+    for label, make_config in [
+        ("eager", lambda record: record.make_config().config),
+        ("lazy", lambda record: record.make_config(lazy=True)),
+    ]:
+        report(
+            label=f"list 100 records ({label})",
+            milliseconds=measure(
+                lambda: [_listing(make_config(record)) for record in records], number=1, repetitions=3
+            ),
+        )
+
+
+def benchmark_config_fields():
+    """
+    Compares converting records in a harvested document fully against converting only some fields
+
+    The document contains 500 copies of the 'complete' record with 50 extra keywords and 20 extra contacts. Fields
+    selected are the file identifier, geographic extent and keywords.
+    """
+    record = tostring(fromstring(_large_record(keywords=50, contacts=20).encode())).decode()
+    document = f"<records>{record * 500}</records>".encode()
+    fields = ["file_identifier", "resource.extent.geographic", "resource.keywords"]
+
+    for label, _fields in [("full", None), ("fields", fields), ("fields, without keywords", fields[:2])]:
+        report(
+            label=f"parse 500 records ({label})",
+            milliseconds=measure(
+                lambda: list(iter_record_configs(BytesIO(document), fields=_fields)), number=1, repetitions=3
+            ),
+        )
+
+
+def benchmark_scan_headers():
+    """
+    Compares reading the file identifier and date stamp of records in a directory by parsing each record, and by
+    scanning the start of each record
+
+    The directory contains 2,000 copies of the 'complete' record with 200 extra keywords and 50 extra contacts.
+    Records are scanned in the current thread and using a pool of 8 threads.
+    """
+    record = _large_record(keywords=200, contacts=50)
+    with TemporaryDirectory() as records_path:
+        paths = []
+        for index in range(0, 2000):
+            path = Path(records_path).joinpath(f"{index}.xml")
+            path.write_text(record)
+            paths.append(path)
+
+        def _parse():
+            for _path in paths:
+                config = MetadataRecord(record=_path.read_text()).make_config(lazy=True)
+                (config.get("file_identifier"), config.get("date_stamp"))
+
+        for label, scan in [
+            ("parse records", _parse),
+            ("scan headers", lambda: [scan_header(_path) for _path in paths]),
+            ("scan headers, 8 threads", lambda: list(scan_headers(paths=paths, workers=8))),
+        ]:
+            report(label=f"read 2000 record headers ({label})", milliseconds=measure(scan, number=1, repetitions=3))
+
+
+def benchmark_condense_roles():
+    """
+    Checks the time to condense contact roles increases linearly with the number of contacts
+
+    Each contact has 10 roles, listed as separate contacts with a single role each, with all contacts listed for each
+    role in turn (as where distributors and points of contact are interleaved). Contacts are copies of the first
+    contact in the 'complete' configuration, with a unique name each.
+    """
+    contact = configs["complete"]["resource"]["contacts"][0]
+    roles = ["author", "custodian", "distributor", "originator", "owner", "pointOfContact", "principalInvestigator"]
+    roles += ["processor", "publisher", "resourceProvider"]
+
+    for count in [250, 500, 1000]:
+        contacts = [
+            {**deepcopy(contact), "individual": {"name": f"Contact {index}"}, "role": [role]}
+            for role in roles
+            for index in range(0, count)
+        ]
+        milliseconds = measure(lambda: contacts_condense_roles(contacts=contacts), number=1, repetitions=3)
+        report(label=f"condense roles ({count} contacts, {len(roles)} roles each)", milliseconds=milliseconds)
+        report(label=f"condense roles ({count} contacts, per contact role)", milliseconds=milliseconds / len(contacts))
+        condensed = len(contacts_condense_roles(contacts=contacts))
+        print(f"{f'contacts after condensing ({count} contacts)':<60} {condensed:>10}")
+
+
+def benchmark_config_fingerprint():
+    """
+    Compares computing the fingerprint of a configuration against generating a record from it
+
+    Records are generated from the 'complete' configuration, and from the same configuration with 200 extra keywords
+    and 50 extra contacts.
+    """
+
+    def _generate(config: dict):
+        MetadataRecord(configuration=MetadataRecordConfig(**config)).generate_xml_document()
+
+    record = MetadataRecord(record=_large_record(keywords=200, contacts=50))
+    for label, config in [("complete", configs["complete"]), ("large", record.make_config().config)]:
+        report(
+            label=f"fingerprint ({label} config)",
+            milliseconds=measure(lambda: MetadataRecordConfig(**config).fingerprint(), number=10, repetitions=3),
+        )
+        report(label=f"generate record ({label} config)", milliseconds=measure(lambda: _generate(config), number=1))
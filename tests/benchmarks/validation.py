@@ -0,0 +1,224 @@
+import json
+
+from copy import deepcopy
+
+from jsonschema import RefResolutionError, ValidationError, validate
+
+from bas_metadata_library.cache import ValidationCache, config_digest
+from bas_metadata_library.schemas import (
+    SchemaRegistry,
+    bundled_schema_packages,
+    load_schema,
+    parse_json_pointer,
+    schema_registry,
+)
+from bas_metadata_library.standards.iso_19115_1_v1.profiles.inspire_v1_3 import (
+    MetadataRecordConfig as INSPIREMetadataRecordConfig,
+)
+from bas_metadata_library.standards.iso_19115_2_v1 import MetadataRecordConfig as ISOMetadataRecordConfig
+from bas_metadata_library.standards.iso_19115_2_v1.profiles.uk_pdc_discovery_v1 import MetadataRecordConfig
+
+from tests.benchmarks import measure, report
+from tests.resources.configs.iso19115_1_v1_standard import configs_all as iso19115_1_configs
+from tests.resources.configs.iso19115_2_v1_standard import configs_all as configs
+
+
+def benchmark_schema_registry():
+    """
+    Compares the latency of validating a profile configuration with and without the bundled schema registry
+
+    Without the registry, the schemas a profile extends are fetched from the BAS Metadata Standards website for each
+    validation. This part of the benchmark is skipped where these schemas can't be fetched (e.g. when offline).
+    """
+    configuration = MetadataRecordConfig(**configs["uk-pdc-discovery-minimal"])
+
+    report(label="validate (schema registry)", milliseconds=measure(configuration.validate))
+
+    def _validate_remote():
+        _config = json.loads(json.dumps(configuration.config, default=str))
+        validate(instance=_config, schema=configuration.schema)
+
+    try:
+        report(label="validate (remote resolution)", milliseconds=measure(_validate_remote, number=5, repetitions=1))
+    except RefResolutionError:
+        print("validate (remote resolution): skipped, remote schemas are not available")
+
+
+def benchmark_validator_cache():
+    """
+    Compares the cost of creating and validating configurations with and without cached schemas and validators
+
+    The uncached path loads the schema for each configuration and validates it using `jsonschema.validate()`, which
+    checks the schema and creates a new validator for each call.
+    """
+    _config = configs["complete"]
+
+    def _uncached():
+        configuration = ISOMetadataRecordConfig(**_config)
+        schema = load_schema.__wrapped__(package="bas_metadata_library.standards_schemas.iso_19115_2_v1")
+        _instance = json.loads(json.dumps(configuration.config, default=str))
+        validate(instance=_instance, schema=schema, resolver=schema_registry.resolver(schema=schema))
+
+    def _cached():
+        configuration = ISOMetadataRecordConfig(**_config)
+        configuration.validate()
+
+    report(label="create and validate (uncached)", milliseconds=measure(_uncached))
+    report(label="create and validate (cached)", milliseconds=measure(_cached))
+
+
+def benchmark_native_dates():
+    """
+    Compares validating a configuration as is against validating it after serialising it to and from JSON
+
+    Configurations were previously serialised to JSON (and back) so that dates were encoded as strings.
+    """
+    configuration = ISOMetadataRecordConfig(**configs["complete"])
+    validator = schema_registry.validator(schema=configuration.schema)
+
+    def _json_round_trip():
+        _instance = json.loads(json.dumps(configuration.config, default=str))
+        validator.validate(_instance)
+
+    report(label="validate (JSON round trip)", milliseconds=measure(_json_round_trip))
+    report(label="validate (native dates)", milliseconds=measure(configuration.validate))
+
+
+def benchmark_validate_many():
+    """
+    Compares validating many configurations one at a time against `validate_many()` with different numbers of workers
+
+    Configurations are generated from the 'complete' configuration with a unique file identifier each.
+    """
+    count = 2000
+
+    def _configs():
+        for index in range(0, count):
+            yield {**configs["complete"], "file_identifier": f"record-{index}"}
+
+    def _sequential():
+        for _config in _configs():
+            list(ISOMetadataRecordConfig(**_config).iter_errors())
+
+    report(label=f"validate {count} configs (sequential)", milliseconds=measure(_sequential, number=1, repetitions=3))
+    for workers in [1, 2, 4, 8]:
+        report(
+            label=f"validate {count} configs (validate_many, {workers} workers)",
+            milliseconds=measure(
+                lambda: list(ISOMetadataRecordConfig.validate_many(configs=_configs(), workers=workers)),
+                number=1,
+                repetitions=3,
+            ),
+        )
+
+
+def benchmark_validate_changes():
+    """
+    Compares validating an edited configuration in full against validating only the changes made to it
+
+    A large configuration is used (the minimal ISO 19115-1 INSPIRE profile configuration with 1000 extra keywords and
+    contacts), with edits to a single value, and to an item in an array with a cross-field (`contains`) rule, which
+    requires validating the whole array.
+    """
+    previous = deepcopy(iso19115_1_configs["inspire-minimal"])
+    previous["resource"]["keywords"] += [{"terms": [{"term": f"Term {index}"}]} for index in range(0, 1000)]
+    previous["resource"]["contacts"] += [deepcopy(previous["resource"]["contacts"][0]) for _ in range(0, 1000)]
+
+    edits = {
+        "abstract": ("/resource/abstract", "Changed abstract"),
+        "contact email": ("/resource/contacts/0/email", "changed@example.com"),
+    }
+    for label, (pointer, value) in edits.items():
+        config = deepcopy(previous)
+        tokens = parse_json_pointer(pointer)
+        parent = config
+        for token in tokens[:-1]:
+            parent = parent[int(token)] if isinstance(parent, list) else parent[token]
+        parent[tokens[-1]] = value
+        configuration = INSPIREMetadataRecordConfig(**config)
+
+        report(label=f"validate edit to {label} (full)", milliseconds=measure(configuration.validate, number=10))
+        report(
+            label=f"validate edit to {label} (changes only)",
+            milliseconds=measure(
+                lambda: configuration.validate_changes(previous=previous, changes=[pointer]), number=10
+            ),
+        )
+
+
+def benchmark_validation_engines():
+    """
+    Compares the throughput of validating configurations using jsonschema against using compiled schemas
+
+    Both engines are compared for the 'complete' configuration, against the ISO 19115-2 standard and the UK PDC
+    Discovery profile (which extends the standard), and for an invalid configuration, where the compiled engine falls
+    back to jsonschema to determine the relevant error. The time taken to compile each schema is also measured.
+    """
+    invalid_config = deepcopy(configs["complete"])
+    invalid_config["resource"]["dates"][0]["date_type"] = "invalid"
+
+    cases = {
+        "standard": (ISOMetadataRecordConfig, configs["complete"]),
+        "profile": (MetadataRecordConfig, configs["complete"]),
+        "standard, invalid": (ISOMetadataRecordConfig, invalid_config),
+    }
+    for label, (config_class, config) in cases.items():
+        for engine in ["jsonschema", "compiled"]:
+            configuration = config_class(**config)
+            configuration.validation_engine = engine
+
+            def _validate():
+                try:
+                    configuration.validate()
+                except ValidationError:
+                    pass
+
+            milliseconds = measure(_validate)
+            report(label=f"validate ({label}, {engine})", milliseconds=milliseconds)
+            print(f"{'':<60} {1000 / milliseconds:>10.0f} configs/s")
+
+    for label, config_class in {"standard": ISOMetadataRecordConfig, "profile": MetadataRecordConfig}.items():
+        schema = config_class(**configs["complete"]).schema
+        report(
+            label=f"compile schema ({label})",
+            milliseconds=measure(
+                lambda: SchemaRegistry(packages=bundled_schema_packages).compiled_validator(schema=schema), number=5
+            ),
+        )
+
+
+def benchmark_validation_cache():
+    """
+    Compares validating a configuration without a validation cache against validating it with a (warm) cache
+
+    The time taken to compute the digest of the configuration, which is needed for each cache lookup, is also measured.
+    """
+    configuration = ISOMetadataRecordConfig(**configs["complete"])
+    report(label="validate (no cache)", milliseconds=measure(configuration.validate))
+
+    configuration.validation_cache = ValidationCache()
+    report(label="validate (cache hit)", milliseconds=measure(configuration.validate))
+    report(label="config digest", milliseconds=measure(lambda: config_digest(configuration.config)))
+
+
+def benchmark_flattened_schemas():
+    """
+    Compares validating profile configurations against composed and flattened profile schemas
+
+    Composed schemas extend the standard schema using `allOf`, flattened schemas merge these into a single schema.
+    """
+    profiles = {
+        "ISO 19115-1 INSPIRE": (
+            "bas_metadata_library.standards_schemas.iso_19115_1_v1.profiles.inspire_v1_3",
+            iso19115_1_configs["inspire-minimal"],
+        ),
+        "ISO 19115-1 UK PDC Discovery": (
+            "bas_metadata_library.standards_schemas.iso_19115_1_v1.profiles.uk_pdc_discovery_v1",
+            iso19115_1_configs["uk-pdc-discovery-minimal"],
+        ),
+    }
+    for label, (package, config) in profiles.items():
+        schema = load_schema(package=package)
+        for form, _schema in {"composed": schema, "flattened": schema_registry.flattened(schema=schema)}.items():
+            validator = schema_registry.validator(schema=_schema)
+            report(label=f"validate ({label}, {form})", milliseconds=measure(lambda: validator.validate(config)))
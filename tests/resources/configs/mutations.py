@@ -0,0 +1,62 @@
+from copy import deepcopy
+
+from tests.resources.configs.iso19115_1_v1_standard import configs_all as iso19115_1_configs
+from tests.resources.configs.iso19115_2_v1_standard import configs_all as iso19115_2_configs
+
+# Test configurations for the ISO 19115 standards, as standard and configuration name, see `fixture_config()`
+fixture_configs = [
+    *[("iso-19115-1", config_name) for config_name in iso19115_1_configs.keys()],
+    *[("iso-19115-2", config_name) for config_name in iso19115_2_configs.keys()],
+]
+
+
+def fixture_config(standard: str, config_name: str) -> dict:
+    """
+    Returns a copy of a test configuration, which can be changed (e.g. by a mutation) without affecting other tests
+
+    :type standard: str
+    :param standard: standard the configuration is for, as in `fixture_configs`
+    :type config_name: str
+    :param config_name: name of the configuration
+
+    :rtype dict
+    :return: configuration
+    """
+    if standard == "iso-19115-1":
+        return deepcopy(iso19115_1_configs[config_name])
+    return deepcopy(iso19115_2_configs[config_name])
+
+
+# Mutations
+#
+# Functions changing a test configuration in place, typically so it's no longer valid, for comparing how validation
+# methods (e.g. compiled or flattened schemas) report errors.
+
+
+def set_date_stamp_integer(config: dict):
+    config["date_stamp"] = 2018
+
+
+def set_date_type_invalid(config: dict):
+    config["resource"]["dates"][0]["date_type"] = "invalid"
+
+
+def remove_creation_date(config: dict):
+    config["resource"]["dates"][0]["date_type"] = "publication"
+
+
+def remove_language(config: dict):
+    del config["language"]
+
+
+def remove_contact_email(config: dict):
+    for contact in [*config.get("contacts", []), *config["resource"].get("contacts", [])]:
+        contact.pop("email", None)
+
+
+def add_property_invalid(config: dict):
+    config["resource"]["invalid"] = "invalid"
+
+
+def remove_extent(config: dict):
+    config["resource"]["extent"] = {}
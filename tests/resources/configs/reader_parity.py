@@ -0,0 +1,355 @@
+"""
+Digests of configurations converted from ISO 19115 records by the element classes the reader replaced
+
+Each digest is the SHA-256 hash of a configuration encoded as JSON (keeping the order of properties, with dates as
+strings). Digests were generated from the element classes before they were removed, for each test record and for
+the complete ISO 19115-2 test record with each distinct element repeated (keyed by the path to the repeated element).
+"""
+
+records = {
+    "iso-19115-1-v1/base-complex-record.xml": "ceab37b742cf7dd49f78c841ecd889f38bbc7154dd347b4cc930da63f304ddc7",
+    "iso-19115-1-v1/base-simple-record.xml": "43b585a5bc117aa2c1e55e5cd24b4ac8b58124e0d807694f890c52eb6ed0c97f",
+    "iso-19115-1-v1/complete-record.xml": "c0758ed24a1a9fedc28c1d08a6903e354d34e6b1fcdaf6f96644fdf5bfc37dd0",
+    "iso-19115-1-v1/inspire-minimal-record.xml": "0299d82125364ca2dc133381fd2b6daca5820e0a82dbdc98d241a564ed3050f0",
+    "iso-19115-1-v1/minimal-record.xml": "0a5457f682cc6a637a04e50bc86420e0bd4dddf14f38966ea469293e4c76e8b3",
+    "iso-19115-1-v1/minimal-required-doi-citation-record.xml": "556eb1c1d59de7534f796f36bcbb79c944d9830f55b67199b72bc86cdfdf34e7",
+    "iso-19115-1-v1/uk-pdc-discovery-minimal-record.xml": "3b24acaede502675c268306d66e34ed6bfe566d3dd00ce784fa6e5b208e401e4",
+    "iso-19115-2-v1/base-complex-record.xml": "ceab37b742cf7dd49f78c841ecd889f38bbc7154dd347b4cc930da63f304ddc7",
+    "iso-19115-2-v1/base-simple-record.xml": "43b585a5bc117aa2c1e55e5cd24b4ac8b58124e0d807694f890c52eb6ed0c97f",
+    "iso-19115-2-v1/complete-record.xml": "c0758ed24a1a9fedc28c1d08a6903e354d34e6b1fcdaf6f96644fdf5bfc37dd0",
+    "iso-19115-2-v1/inspire-minimal-record.xml": "0299d82125364ca2dc133381fd2b6daca5820e0a82dbdc98d241a564ed3050f0",
+    "iso-19115-2-v1/minimal-record.xml": "0a5457f682cc6a637a04e50bc86420e0bd4dddf14f38966ea469293e4c76e8b3",
+    "iso-19115-2-v1/uk-pdc-discovery-minimal-record.xml": "3b24acaede502675c268306d66e34ed6bfe566d3dd00ce784fa6e5b208e401e4",
+}  # type: dict
+
+repeated_elements = {
+    "gmd:fileIdentifier": "125e09917e81ba6a5703b882b986e7b21bb5f77be73b9695666cf53210c18bbf",
+    "gmd:fileIdentifier/gco:CharacterString": "125e09917e81ba6a5703b882b986e7b21bb5f77be73b9695666cf53210c18bbf",
+    "gmd:language": "485a9132fb5a4f8bd0573d9946a1b2e16ad92362c3e2978154b7b95fe2dd83b3",
+    "gmd:language/gmd:LanguageCode": "485a9132fb5a4f8bd0573d9946a1b2e16ad92362c3e2978154b7b95fe2dd83b3",
+    "gmd:characterSet": "6db2e469093a83091626bec93be7e261f9382476966a753c0df30028d07a7884",
+    "gmd:characterSet/gmd:MD_CharacterSetCode": "6db2e469093a83091626bec93be7e261f9382476966a753c0df30028d07a7884",
+    "gmd:hierarchyLevel": "0c44932ea3aa5394b33a65d35f9d0ae699a30e0ee40b29392c0c39394823fc2d",
+    "gmd:hierarchyLevel/gmd:MD_ScopeCode": "0c44932ea3aa5394b33a65d35f9d0ae699a30e0ee40b29392c0c39394823fc2d",
+    "gmd:hierarchyLevelName": "c0758ed24a1a9fedc28c1d08a6903e354d34e6b1fcdaf6f96644fdf5bfc37dd0",
+    "gmd:hierarchyLevelName/gco:CharacterString": "c0758ed24a1a9fedc28c1d08a6903e354d34e6b1fcdaf6f96644fdf5bfc37dd0",
+    "gmd:contact": "e8390280e37e51ac5bbc0ab5a72870b6f18772a19d370f074bd568b1af66e3a3",
+    "gmd:contact/gmd:CI_ResponsibleParty": "6e0a025e327d75ac53419ed2fbc82524f08770fe02959abdb39f2f1b1fb30220",
+    "gmd:contact/gmd:CI_ResponsibleParty/gmd:organisationName": "c0758ed24a1a9fedc28c1d08a6903e354d34e6b1fcdaf6f96644fdf5bfc37dd0",
+    "gmd:contact/gmd:CI_ResponsibleParty/gmd:organisationName/gmx:Anchor": "c0758ed24a1a9fedc28c1d08a6903e354d34e6b1fcdaf6f96644fdf5bfc37dd0",
+    "gmd:contact/gmd:CI_ResponsibleParty/gmd:contactInfo": "f225deec611757f23c974e900b6f5da9a97659d5291d22e22ed148eb3cb398a3",
+    "gmd:contact/gmd:CI_ResponsibleParty/gmd:contactInfo/gmd:CI_Contact": "f225deec611757f23c974e900b6f5da9a97659d5291d22e22ed148eb3cb398a3",
+    "gmd:contact/gmd:CI_ResponsibleParty/gmd:contactInfo/gmd:CI_Contact/gmd:phone": "c0758ed24a1a9fedc28c1d08a6903e354d34e6b1fcdaf6f96644fdf5bfc37dd0",
+    "gmd:contact/gmd:CI_ResponsibleParty/gmd:contactInfo/gmd:CI_Contact/gmd:phone/gmd:CI_Telephone": "c0758ed24a1a9fedc28c1d08a6903e354d34e6b1fcdaf6f96644fdf5bfc37dd0",
+    "gmd:contact/gmd:CI_ResponsibleParty/gmd:contactInfo/gmd:CI_Contact/gmd:phone/gmd:CI_Telephone/gmd:voice": "c0758ed24a1a9fedc28c1d08a6903e354d34e6b1fcdaf6f96644fdf5bfc37dd0",
+    "gmd:contact/gmd:CI_ResponsibleParty/gmd:contactInfo/gmd:CI_Contact/gmd:phone/gmd:CI_Telephone/gmd:voice/gco:CharacterString": "c0758ed24a1a9fedc28c1d08a6903e354d34e6b1fcdaf6f96644fdf5bfc37dd0",
+    "gmd:contact/gmd:CI_ResponsibleParty/gmd:contactInfo/gmd:CI_Contact/gmd:address": "c0758ed24a1a9fedc28c1d08a6903e354d34e6b1fcdaf6f96644fdf5bfc37dd0",
+    "gmd:contact/gmd:CI_ResponsibleParty/gmd:contactInfo/gmd:CI_Contact/gmd:address/gmd:CI_Address": "c0758ed24a1a9fedc28c1d08a6903e354d34e6b1fcdaf6f96644fdf5bfc37dd0",
+    "gmd:contact/gmd:CI_ResponsibleParty/gmd:contactInfo/gmd:CI_Contact/gmd:address/gmd:CI_Address/gmd:deliveryPoint": "c0758ed24a1a9fedc28c1d08a6903e354d34e6b1fcdaf6f96644fdf5bfc37dd0",
+    "gmd:contact/gmd:CI_ResponsibleParty/gmd:contactInfo/gmd:CI_Contact/gmd:address/gmd:CI_Address/gmd:deliveryPoint/gco:CharacterString": "c0758ed24a1a9fedc28c1d08a6903e354d34e6b1fcdaf6f96644fdf5bfc37dd0",
+    "gmd:contact/gmd:CI_ResponsibleParty/gmd:contactInfo/gmd:CI_Contact/gmd:address/gmd:CI_Address/gmd:city": "c0758ed24a1a9fedc28c1d08a6903e354d34e6b1fcdaf6f96644fdf5bfc37dd0",
+    "gmd:contact/gmd:CI_ResponsibleParty/gmd:contactInfo/gmd:CI_Contact/gmd:address/gmd:CI_Address/gmd:city/gco:CharacterString": "c0758ed24a1a9fedc28c1d08a6903e354d34e6b1fcdaf6f96644fdf5bfc37dd0",
+    "gmd:contact/gmd:CI_ResponsibleParty/gmd:contactInfo/gmd:CI_Contact/gmd:address/gmd:CI_Address/gmd:administrativeArea": "c0758ed24a1a9fedc28c1d08a6903e354d34e6b1fcdaf6f96644fdf5bfc37dd0",
+    "gmd:contact/gmd:CI_ResponsibleParty/gmd:contactInfo/gmd:CI_Contact/gmd:address/gmd:CI_Address/gmd:administrativeArea/gco:CharacterString": "c0758ed24a1a9fedc28c1d08a6903e354d34e6b1fcdaf6f96644fdf5bfc37dd0",
+    "gmd:contact/gmd:CI_ResponsibleParty/gmd:contactInfo/gmd:CI_Contact/gmd:address/gmd:CI_Address/gmd:postalCode": "c0758ed24a1a9fedc28c1d08a6903e354d34e6b1fcdaf6f96644fdf5bfc37dd0",
+    "gmd:contact/gmd:CI_ResponsibleParty/gmd:contactInfo/gmd:CI_Contact/gmd:address/gmd:CI_Address/gmd:postalCode/gco:CharacterString": "c0758ed24a1a9fedc28c1d08a6903e354d34e6b1fcdaf6f96644fdf5bfc37dd0",
+    "gmd:contact/gmd:CI_ResponsibleParty/gmd:contactInfo/gmd:CI_Contact/gmd:address/gmd:CI_Address/gmd:country": "c0758ed24a1a9fedc28c1d08a6903e354d34e6b1fcdaf6f96644fdf5bfc37dd0",
+    "gmd:contact/gmd:CI_ResponsibleParty/gmd:contactInfo/gmd:CI_Contact/gmd:address/gmd:CI_Address/gmd:country/gco:CharacterString": "c0758ed24a1a9fedc28c1d08a6903e354d34e6b1fcdaf6f96644fdf5bfc37dd0",
+    "gmd:contact/gmd:CI_ResponsibleParty/gmd:contactInfo/gmd:CI_Contact/gmd:address/gmd:CI_Address/gmd:electronicMailAddress": "c0758ed24a1a9fedc28c1d08a6903e354d34e6b1fcdaf6f96644fdf5bfc37dd0",
+    "gmd:contact/gmd:CI_ResponsibleParty/gmd:contactInfo/gmd:CI_Contact/gmd:address/gmd:CI_Address/gmd:electronicMailAddress/gco:CharacterString": "c0758ed24a1a9fedc28c1d08a6903e354d34e6b1fcdaf6f96644fdf5bfc37dd0",
+    "gmd:contact/gmd:CI_ResponsibleParty/gmd:contactInfo/gmd:CI_Contact/gmd:onlineResource": "f225deec611757f23c974e900b6f5da9a97659d5291d22e22ed148eb3cb398a3",
+    "gmd:contact/gmd:CI_ResponsibleParty/gmd:contactInfo/gmd:CI_Contact/gmd:onlineResource/gmd:CI_OnlineResource": "f225deec611757f23c974e900b6f5da9a97659d5291d22e22ed148eb3cb398a3",
+    "gmd:contact/gmd:CI_ResponsibleParty/gmd:contactInfo/gmd:CI_Contact/gmd:onlineResource/gmd:CI_OnlineResource/gmd:linkage": "c0758ed24a1a9fedc28c1d08a6903e354d34e6b1fcdaf6f96644fdf5bfc37dd0",
+    "gmd:contact/gmd:CI_ResponsibleParty/gmd:contactInfo/gmd:CI_Contact/gmd:onlineResource/gmd:CI_OnlineResource/gmd:linkage/gmd:URL": "c0758ed24a1a9fedc28c1d08a6903e354d34e6b1fcdaf6f96644fdf5bfc37dd0",
+    "gmd:contact/gmd:CI_ResponsibleParty/gmd:contactInfo/gmd:CI_Contact/gmd:onlineResource/gmd:CI_OnlineResource/gmd:function": "f225deec611757f23c974e900b6f5da9a97659d5291d22e22ed148eb3cb398a3",
+    "gmd:contact/gmd:CI_ResponsibleParty/gmd:contactInfo/gmd:CI_Contact/gmd:onlineResource/gmd:CI_OnlineResource/gmd:function/gmd:CI_OnLineFunctionCode": "f225deec611757f23c974e900b6f5da9a97659d5291d22e22ed148eb3cb398a3",
+    "gmd:contact/gmd:CI_ResponsibleParty/gmd:role": "33e77a123733484ebc369363ff645d7e3a202ea507a593e126efef729000e1dd",
+    "gmd:contact/gmd:CI_ResponsibleParty/gmd:role/gmd:CI_RoleCode": "33e77a123733484ebc369363ff645d7e3a202ea507a593e126efef729000e1dd",
+    "gmd:dateStamp": "5bcaf3afb08cbcd2e76d1dc4ac59578859051c81f41d2b63a7dfc2969f6f0a1e",
+    "gmd:dateStamp/gco:Date": "5bcaf3afb08cbcd2e76d1dc4ac59578859051c81f41d2b63a7dfc2969f6f0a1e",
+    "gmd:metadataStandardName": "b7ffbacfa36da706e76ca3196dcdb9155a8f789d00634b41c79a02f5ab6c6333",
+    "gmd:metadataStandardName/gco:CharacterString": "b7ffbacfa36da706e76ca3196dcdb9155a8f789d00634b41c79a02f5ab6c6333",
+    "gmd:metadataStandardVersion": "6ecedda8caf2bf0923b11a7c77e13446dcf547b51a4a6fe7928331c372c5976e",
+    "gmd:metadataStandardVersion/gco:CharacterString": "6ecedda8caf2bf0923b11a7c77e13446dcf547b51a4a6fe7928331c372c5976e",
+    "gmd:referenceSystemInfo": "a528a719998d07129f7edfffcfae8ac4d6b4ee8b8c63cfa3eb0c6dc384363f32",
+    "gmd:referenceSystemInfo/gmd:MD_ReferenceSystem": "a528a719998d07129f7edfffcfae8ac4d6b4ee8b8c63cfa3eb0c6dc384363f32",
+    "gmd:referenceSystemInfo/gmd:MD_ReferenceSystem/gmd:referenceSystemIdentifier": "a528a719998d07129f7edfffcfae8ac4d6b4ee8b8c63cfa3eb0c6dc384363f32",
+    "gmd:referenceSystemInfo/gmd:MD_ReferenceSystem/gmd:referenceSystemIdentifier/gmd:RS_Identifier": "a528a719998d07129f7edfffcfae8ac4d6b4ee8b8c63cfa3eb0c6dc384363f32",
+    "gmd:referenceSystemInfo/gmd:MD_ReferenceSystem/gmd:referenceSystemIdentifier/gmd:RS_Identifier/gmd:authority": "550eb9d453ee2c672ad66dd7f45cbf9ed5fada74727103939bec8ef9aee1e279",
+    "gmd:referenceSystemInfo/gmd:MD_ReferenceSystem/gmd:referenceSystemIdentifier/gmd:RS_Identifier/gmd:authority/gmd:CI_Citation": "550eb9d453ee2c672ad66dd7f45cbf9ed5fada74727103939bec8ef9aee1e279",
+    "gmd:referenceSystemInfo/gmd:MD_ReferenceSystem/gmd:referenceSystemIdentifier/gmd:RS_Identifier/gmd:authority/gmd:CI_Citation/gmd:title": "43b63a1b8ae74876abd0caadc5b5ac45201f3e7b896e54d0ee52e0fea072e26d",
+    "gmd:referenceSystemInfo/gmd:MD_ReferenceSystem/gmd:referenceSystemIdentifier/gmd:RS_Identifier/gmd:authority/gmd:CI_Citation/gmd:title/gco:CharacterString": "43b63a1b8ae74876abd0caadc5b5ac45201f3e7b896e54d0ee52e0fea072e26d",
+    "gmd:referenceSystemInfo/gmd:MD_ReferenceSystem/gmd:referenceSystemIdentifier/gmd:RS_Identifier/gmd:authority/gmd:CI_Citation/gmd:date": "d6e029c36e8ed0fcf7dfbfb84fceac96099c1395379bdb6713419b6b40d22759",
+    "gmd:referenceSystemInfo/gmd:MD_ReferenceSystem/gmd:referenceSystemIdentifier/gmd:RS_Identifier/gmd:authority/gmd:CI_Citation/gmd:date/gmd:CI_Date": "1edc8b70b7f04ba6a3c9a4d27c0b94b1dfc6ee16aa37048588b9f122185a7017",
+    "gmd:referenceSystemInfo/gmd:MD_ReferenceSystem/gmd:referenceSystemIdentifier/gmd:RS_Identifier/gmd:authority/gmd:CI_Citation/gmd:date/gmd:CI_Date/gmd:date": "50cd8b39bfaf617fa9bdb4e96f996e6c7f37327627347e257cafaff9bf715d25",
+    "gmd:referenceSystemInfo/gmd:MD_ReferenceSystem/gmd:referenceSystemIdentifier/gmd:RS_Identifier/gmd:authority/gmd:CI_Citation/gmd:date/gmd:CI_Date/gmd:date/gco:Date": "50cd8b39bfaf617fa9bdb4e96f996e6c7f37327627347e257cafaff9bf715d25",
+    "gmd:referenceSystemInfo/gmd:MD_ReferenceSystem/gmd:referenceSystemIdentifier/gmd:RS_Identifier/gmd:authority/gmd:CI_Citation/gmd:date/gmd:CI_Date/gmd:dateType": "cd1ffb07baf408db51c3c071855f0cb9130b6b4ba2c00b221a7cb07533b09392",
+    "gmd:referenceSystemInfo/gmd:MD_ReferenceSystem/gmd:referenceSystemIdentifier/gmd:RS_Identifier/gmd:authority/gmd:CI_Citation/gmd:date/gmd:CI_Date/gmd:dateType/gmd:CI_DateTypeCode": "cd1ffb07baf408db51c3c071855f0cb9130b6b4ba2c00b221a7cb07533b09392",
+    "gmd:referenceSystemInfo/gmd:MD_ReferenceSystem/gmd:referenceSystemIdentifier/gmd:RS_Identifier/gmd:authority/gmd:CI_Citation/gmd:citedResponsibleParty": "627757112250ee1027c3242384d0170ef4a510435e61ce920dfe4105bca79d75",
+    "gmd:referenceSystemInfo/gmd:MD_ReferenceSystem/gmd:referenceSystemIdentifier/gmd:RS_Identifier/gmd:authority/gmd:CI_Citation/gmd:citedResponsibleParty/gmd:CI_ResponsibleParty": "627757112250ee1027c3242384d0170ef4a510435e61ce920dfe4105bca79d75",
+    "gmd:referenceSystemInfo/gmd:MD_ReferenceSystem/gmd:referenceSystemIdentifier/gmd:RS_Identifier/gmd:authority/gmd:CI_Citation/gmd:citedResponsibleParty/gmd:CI_ResponsibleParty/gmd:organisationName": "c0758ed24a1a9fedc28c1d08a6903e354d34e6b1fcdaf6f96644fdf5bfc37dd0",
+    "gmd:referenceSystemInfo/gmd:MD_ReferenceSystem/gmd:referenceSystemIdentifier/gmd:RS_Identifier/gmd:authority/gmd:CI_Citation/gmd:citedResponsibleParty/gmd:CI_ResponsibleParty/gmd:organisationName/gco:CharacterString": "c0758ed24a1a9fedc28c1d08a6903e354d34e6b1fcdaf6f96644fdf5bfc37dd0",
+    "gmd:referenceSystemInfo/gmd:MD_ReferenceSystem/gmd:referenceSystemIdentifier/gmd:RS_Identifier/gmd:authority/gmd:CI_Citation/gmd:citedResponsibleParty/gmd:CI_ResponsibleParty/gmd:contactInfo": "9fd32d8562abd6182192ae74bec0f03f5a74407a65f1f23cea0236268a89f890",
+    "gmd:referenceSystemInfo/gmd:MD_ReferenceSystem/gmd:referenceSystemIdentifier/gmd:RS_Identifier/gmd:authority/gmd:CI_Citation/gmd:citedResponsibleParty/gmd:CI_ResponsibleParty/gmd:contactInfo/gmd:CI_Contact": "9fd32d8562abd6182192ae74bec0f03f5a74407a65f1f23cea0236268a89f890",
+    "gmd:referenceSystemInfo/gmd:MD_ReferenceSystem/gmd:referenceSystemIdentifier/gmd:RS_Identifier/gmd:authority/gmd:CI_Citation/gmd:citedResponsibleParty/gmd:CI_ResponsibleParty/gmd:contactInfo/gmd:CI_Contact/gmd:address": "c0758ed24a1a9fedc28c1d08a6903e354d34e6b1fcdaf6f96644fdf5bfc37dd0",
+    "gmd:referenceSystemInfo/gmd:MD_ReferenceSystem/gmd:referenceSystemIdentifier/gmd:RS_Identifier/gmd:authority/gmd:CI_Citation/gmd:citedResponsibleParty/gmd:CI_ResponsibleParty/gmd:contactInfo/gmd:CI_Contact/gmd:address/gmd:CI_Address": "c0758ed24a1a9fedc28c1d08a6903e354d34e6b1fcdaf6f96644fdf5bfc37dd0",
+    "gmd:referenceSystemInfo/gmd:MD_ReferenceSystem/gmd:referenceSystemIdentifier/gmd:RS_Identifier/gmd:authority/gmd:CI_Citation/gmd:citedResponsibleParty/gmd:CI_ResponsibleParty/gmd:contactInfo/gmd:CI_Contact/gmd:address/gmd:CI_Address/gmd:electronicMailAddress": "c0758ed24a1a9fedc28c1d08a6903e354d34e6b1fcdaf6f96644fdf5bfc37dd0",
+    "gmd:referenceSystemInfo/gmd:MD_ReferenceSystem/gmd:referenceSystemIdentifier/gmd:RS_Identifier/gmd:authority/gmd:CI_Citation/gmd:citedResponsibleParty/gmd:CI_ResponsibleParty/gmd:contactInfo/gmd:CI_Contact/gmd:address/gmd:CI_Address/gmd:electronicMailAddress/gco:CharacterString": "c0758ed24a1a9fedc28c1d08a6903e354d34e6b1fcdaf6f96644fdf5bfc37dd0",
+    "gmd:referenceSystemInfo/gmd:MD_ReferenceSystem/gmd:referenceSystemIdentifier/gmd:RS_Identifier/gmd:authority/gmd:CI_Citation/gmd:citedResponsibleParty/gmd:CI_ResponsibleParty/gmd:contactInfo/gmd:CI_Contact/gmd:onlineResource": "9fd32d8562abd6182192ae74bec0f03f5a74407a65f1f23cea0236268a89f890",
+    "gmd:referenceSystemInfo/gmd:MD_ReferenceSystem/gmd:referenceSystemIdentifier/gmd:RS_Identifier/gmd:authority/gmd:CI_Citation/gmd:citedResponsibleParty/gmd:CI_ResponsibleParty/gmd:contactInfo/gmd:CI_Contact/gmd:onlineResource/gmd:CI_OnlineResource": "9fd32d8562abd6182192ae74bec0f03f5a74407a65f1f23cea0236268a89f890",
+    "gmd:referenceSystemInfo/gmd:MD_ReferenceSystem/gmd:referenceSystemIdentifier/gmd:RS_Identifier/gmd:authority/gmd:CI_Citation/gmd:citedResponsibleParty/gmd:CI_ResponsibleParty/gmd:contactInfo/gmd:CI_Contact/gmd:onlineResource/gmd:CI_OnlineResource/gmd:linkage": "c0758ed24a1a9fedc28c1d08a6903e354d34e6b1fcdaf6f96644fdf5bfc37dd0",
+    "gmd:referenceSystemInfo/gmd:MD_ReferenceSystem/gmd:referenceSystemIdentifier/gmd:RS_Identifier/gmd:authority/gmd:CI_Citation/gmd:citedResponsibleParty/gmd:CI_ResponsibleParty/gmd:contactInfo/gmd:CI_Contact/gmd:onlineResource/gmd:CI_OnlineResource/gmd:linkage/gmd:URL": "c0758ed24a1a9fedc28c1d08a6903e354d34e6b1fcdaf6f96644fdf5bfc37dd0",
+    "gmd:referenceSystemInfo/gmd:MD_ReferenceSystem/gmd:referenceSystemIdentifier/gmd:RS_Identifier/gmd:authority/gmd:CI_Citation/gmd:citedResponsibleParty/gmd:CI_ResponsibleParty/gmd:contactInfo/gmd:CI_Contact/gmd:onlineResource/gmd:CI_OnlineResource/gmd:function": "9fd32d8562abd6182192ae74bec0f03f5a74407a65f1f23cea0236268a89f890",
+    "gmd:referenceSystemInfo/gmd:MD_ReferenceSystem/gmd:referenceSystemIdentifier/gmd:RS_Identifier/gmd:authority/gmd:CI_Citation/gmd:citedResponsibleParty/gmd:CI_ResponsibleParty/gmd:contactInfo/gmd:CI_Contact/gmd:onlineResource/gmd:CI_OnlineResource/gmd:function/gmd:CI_OnLineFunctionCode": "9fd32d8562abd6182192ae74bec0f03f5a74407a65f1f23cea0236268a89f890",
+    "gmd:referenceSystemInfo/gmd:MD_ReferenceSystem/gmd:referenceSystemIdentifier/gmd:RS_Identifier/gmd:authority/gmd:CI_Citation/gmd:citedResponsibleParty/gmd:CI_ResponsibleParty/gmd:role": "5c2e83fe4e1ca579a4953feb2d72f7993b75b04677f8bdf44474f4ec790c27f9",
+    "gmd:referenceSystemInfo/gmd:MD_ReferenceSystem/gmd:referenceSystemIdentifier/gmd:RS_Identifier/gmd:authority/gmd:CI_Citation/gmd:citedResponsibleParty/gmd:CI_ResponsibleParty/gmd:role/gmd:CI_RoleCode": "5c2e83fe4e1ca579a4953feb2d72f7993b75b04677f8bdf44474f4ec790c27f9",
+    "gmd:referenceSystemInfo/gmd:MD_ReferenceSystem/gmd:referenceSystemIdentifier/gmd:RS_Identifier/gmd:code": "55929daa1fc69da750de0b3d3376848b8fe351adc0a14fb223aca2f5e682eefe",
+    "gmd:referenceSystemInfo/gmd:MD_ReferenceSystem/gmd:referenceSystemIdentifier/gmd:RS_Identifier/gmd:code/gmx:Anchor": "55929daa1fc69da750de0b3d3376848b8fe351adc0a14fb223aca2f5e682eefe",
+    "gmd:referenceSystemInfo/gmd:MD_ReferenceSystem/gmd:referenceSystemIdentifier/gmd:RS_Identifier/gmd:version": "0060c37933098fc5c66890b3ef0716f6bfcf7b0a907e6193571136267ca29e9b",
+    "gmd:referenceSystemInfo/gmd:MD_ReferenceSystem/gmd:referenceSystemIdentifier/gmd:RS_Identifier/gmd:version/gco:CharacterString": "0060c37933098fc5c66890b3ef0716f6bfcf7b0a907e6193571136267ca29e9b",
+    "gmd:identificationInfo": "91df406f01e8ac4e0f742fff3c2e9021fc44729f89ab18abb26d3e9efe6f8ef8",
+    "gmd:identificationInfo/gmd:MD_DataIdentification": "91df406f01e8ac4e0f742fff3c2e9021fc44729f89ab18abb26d3e9efe6f8ef8",
+    "gmd:identificationInfo/gmd:MD_DataIdentification/gmd:citation": "b5e593356d16a0e9c5df11c256c4ca58f1514e21fde1482dde2cbebca1a729aa",
+    "gmd:identificationInfo/gmd:MD_DataIdentification/gmd:citation/gmd:CI_Citation": "b5e593356d16a0e9c5df11c256c4ca58f1514e21fde1482dde2cbebca1a729aa",
+    "gmd:identificationInfo/gmd:MD_DataIdentification/gmd:citation/gmd:CI_Citation/gmd:title": "96ad232f216990c8bcf24cd2ea0310c044efad3ffe21380e90033964fdc58bda",
+    "gmd:identificationInfo/gmd:MD_DataIdentification/gmd:citation/gmd:CI_Citation/gmd:title/gco:CharacterString": "96ad232f216990c8bcf24cd2ea0310c044efad3ffe21380e90033964fdc58bda",
+    "gmd:identificationInfo/gmd:MD_DataIdentification/gmd:citation/gmd:CI_Citation/gmd:date[1]": "34423b8a456b3a9d1fca7926d2169e959ea78dadd255b00b28f89ae3075a6412",
+    "gmd:identificationInfo/gmd:MD_DataIdentification/gmd:citation/gmd:CI_Citation/gmd:date[1]/gmd:CI_Date": "a4b6b94faa83e97dbc38990b7c014e9fc14b6b3afcbdc1139f94f0920d862151",
+    "gmd:identificationInfo/gmd:MD_DataIdentification/gmd:citation/gmd:CI_Citation/gmd:date[1]/gmd:CI_Date/gmd:date": "bf31467965b1469156d391393e340a520b01f86437141eb731a0c0ada4eb77e1",
+    "gmd:identificationInfo/gmd:MD_DataIdentification/gmd:citation/gmd:CI_Citation/gmd:date[1]/gmd:CI_Date/gmd:date/gco:Date": "bf31467965b1469156d391393e340a520b01f86437141eb731a0c0ada4eb77e1",
+    "gmd:identificationInfo/gmd:MD_DataIdentification/gmd:citation/gmd:CI_Citation/gmd:date[1]/gmd:CI_Date/gmd:dateType": "9b982f6acce3457c78ea28fe15791ccc34209507cb9f0b7004783fe0aea4068a",
+    "gmd:identificationInfo/gmd:MD_DataIdentification/gmd:citation/gmd:CI_Citation/gmd:date[1]/gmd:CI_Date/gmd:dateType/gmd:CI_DateTypeCode": "9b982f6acce3457c78ea28fe15791ccc34209507cb9f0b7004783fe0aea4068a",
+    "gmd:identificationInfo/gmd:MD_DataIdentification/gmd:citation/gmd:CI_Citation/gmd:date[3]/gmd:CI_Date/gmd:date/gco:DateTime": "664904b16538a000def81f8dff995ecd1d183a866a076db13642206a26cc3b97",
+    "gmd:identificationInfo/gmd:MD_DataIdentification/gmd:citation/gmd:CI_Citation/gmd:edition": "9ca0c5584196d05d6071564d7fb66fb17017f70d5b9cb36743423f610362fbd5",
+    "gmd:identificationInfo/gmd:MD_DataIdentification/gmd:citation/gmd:CI_Citation/gmd:edition/gco:CharacterString": "9ca0c5584196d05d6071564d7fb66fb17017f70d5b9cb36743423f610362fbd5",
+    "gmd:identificationInfo/gmd:MD_DataIdentification/gmd:citation/gmd:CI_Citation/gmd:identifier[1]": "edfefaeb5807aecc4ca7ce817e60f0d6d2275bede4dd06eac49418be69fd1077",
+    "gmd:identificationInfo/gmd:MD_DataIdentification/gmd:citation/gmd:CI_Citation/gmd:identifier[1]/gmd:MD_Identifier": "a7f4a483da361ccf6b42abdca5425803159e82bbc0fad45b5f8c2f445c56e6ae",
+    "gmd:identificationInfo/gmd:MD_DataIdentification/gmd:citation/gmd:CI_Citation/gmd:identifier[1]/gmd:MD_Identifier/gmd:code": "a7f4a483da361ccf6b42abdca5425803159e82bbc0fad45b5f8c2f445c56e6ae",
+    "gmd:identificationInfo/gmd:MD_DataIdentification/gmd:citation/gmd:CI_Citation/gmd:identifier[1]/gmd:MD_Identifier/gmd:code/gmx:Anchor": "a7f4a483da361ccf6b42abdca5425803159e82bbc0fad45b5f8c2f445c56e6ae",
+    "gmd:identificationInfo/gmd:MD_DataIdentification/gmd:abstract": "e4becbc92a6ebf6e4b1922ddba1fd8a8dd529600c26a527693d447c07cd05b2c",
+    "gmd:identificationInfo/gmd:MD_DataIdentification/gmd:abstract/gco:CharacterString": "e4becbc92a6ebf6e4b1922ddba1fd8a8dd529600c26a527693d447c07cd05b2c",
+    "gmd:identificationInfo/gmd:MD_DataIdentification/gmd:pointOfContact[1]": "a911f0f49b57055053261ea0c82c4d9c0b4a4e0414f22c8b9a731f013deb631b",
+    "gmd:identificationInfo/gmd:MD_DataIdentification/gmd:pointOfContact[1]/gmd:CI_ResponsibleParty": "KeyError: 'role'",
+    "gmd:identificationInfo/gmd:MD_DataIdentification/gmd:pointOfContact[1]/gmd:CI_ResponsibleParty/gmd:individualName": "c0758ed24a1a9fedc28c1d08a6903e354d34e6b1fcdaf6f96644fdf5bfc37dd0",
+    "gmd:identificationInfo/gmd:MD_DataIdentification/gmd:pointOfContact[1]/gmd:CI_ResponsibleParty/gmd:individualName/gmx:Anchor": "c0758ed24a1a9fedc28c1d08a6903e354d34e6b1fcdaf6f96644fdf5bfc37dd0",
+    "gmd:identificationInfo/gmd:MD_DataIdentification/gmd:pointOfContact[1]/gmd:CI_ResponsibleParty/gmd:organisationName": "c0758ed24a1a9fedc28c1d08a6903e354d34e6b1fcdaf6f96644fdf5bfc37dd0",
+    "gmd:identificationInfo/gmd:MD_DataIdentification/gmd:pointOfContact[1]/gmd:CI_ResponsibleParty/gmd:organisationName/gco:CharacterString": "c0758ed24a1a9fedc28c1d08a6903e354d34e6b1fcdaf6f96644fdf5bfc37dd0",
+    "gmd:identificationInfo/gmd:MD_DataIdentification/gmd:pointOfContact[1]/gmd:CI_ResponsibleParty/gmd:contactInfo": "10cd9f28fb3e142013c4b2406c15aa3ec5cf4010bdeb339f3229a2abf6f0fca7",
+    "gmd:identificationInfo/gmd:MD_DataIdentification/gmd:pointOfContact[1]/gmd:CI_ResponsibleParty/gmd:contactInfo/gmd:CI_Contact": "10cd9f28fb3e142013c4b2406c15aa3ec5cf4010bdeb339f3229a2abf6f0fca7",
+    "gmd:identificationInfo/gmd:MD_DataIdentification/gmd:pointOfContact[1]/gmd:CI_ResponsibleParty/gmd:contactInfo/gmd:CI_Contact/gmd:address": "c0758ed24a1a9fedc28c1d08a6903e354d34e6b1fcdaf6f96644fdf5bfc37dd0",
+    "gmd:identificationInfo/gmd:MD_DataIdentification/gmd:pointOfContact[1]/gmd:CI_ResponsibleParty/gmd:contactInfo/gmd:CI_Contact/gmd:address/gmd:CI_Address": "c0758ed24a1a9fedc28c1d08a6903e354d34e6b1fcdaf6f96644fdf5bfc37dd0",
+    "gmd:identificationInfo/gmd:MD_DataIdentification/gmd:pointOfContact[1]/gmd:CI_ResponsibleParty/gmd:contactInfo/gmd:CI_Contact/gmd:address/gmd:CI_Address/gmd:electronicMailAddress": "c0758ed24a1a9fedc28c1d08a6903e354d34e6b1fcdaf6f96644fdf5bfc37dd0",
+    "gmd:identificationInfo/gmd:MD_DataIdentification/gmd:pointOfContact[1]/gmd:CI_ResponsibleParty/gmd:contactInfo/gmd:CI_Contact/gmd:address/gmd:CI_Address/gmd:electronicMailAddress/gco:CharacterString": "c0758ed24a1a9fedc28c1d08a6903e354d34e6b1fcdaf6f96644fdf5bfc37dd0",
+    "gmd:identificationInfo/gmd:MD_DataIdentification/gmd:pointOfContact[1]/gmd:CI_ResponsibleParty/gmd:contactInfo/gmd:CI_Contact/gmd:onlineResource": "10cd9f28fb3e142013c4b2406c15aa3ec5cf4010bdeb339f3229a2abf6f0fca7",
+    "gmd:identificationInfo/gmd:MD_DataIdentification/gmd:pointOfContact[1]/gmd:CI_ResponsibleParty/gmd:contactInfo/gmd:CI_Contact/gmd:onlineResource/gmd:CI_OnlineResource": "10cd9f28fb3e142013c4b2406c15aa3ec5cf4010bdeb339f3229a2abf6f0fca7",
+    "gmd:identificationInfo/gmd:MD_DataIdentification/gmd:pointOfContact[1]/gmd:CI_ResponsibleParty/gmd:contactInfo/gmd:CI_Contact/gmd:onlineResource/gmd:CI_OnlineResource/gmd:linkage": "c0758ed24a1a9fedc28c1d08a6903e354d34e6b1fcdaf6f96644fdf5bfc37dd0",
+    "gmd:identificationInfo/gmd:MD_DataIdentification/gmd:pointOfContact[1]/gmd:CI_ResponsibleParty/gmd:contactInfo/gmd:CI_Contact/gmd:onlineResource/gmd:CI_OnlineResource/gmd:linkage/gmd:URL": "c0758ed24a1a9fedc28c1d08a6903e354d34e6b1fcdaf6f96644fdf5bfc37dd0",
+    "gmd:identificationInfo/gmd:MD_DataIdentification/gmd:pointOfContact[1]/gmd:CI_ResponsibleParty/gmd:contactInfo/gmd:CI_Contact/gmd:onlineResource/gmd:CI_OnlineResource/gmd:name": "c0758ed24a1a9fedc28c1d08a6903e354d34e6b1fcdaf6f96644fdf5bfc37dd0",
+    "gmd:identificationInfo/gmd:MD_DataIdentification/gmd:pointOfContact[1]/gmd:CI_ResponsibleParty/gmd:contactInfo/gmd:CI_Contact/gmd:onlineResource/gmd:CI_OnlineResource/gmd:name/gco:CharacterString": "c0758ed24a1a9fedc28c1d08a6903e354d34e6b1fcdaf6f96644fdf5bfc37dd0",
+    "gmd:identificationInfo/gmd:MD_DataIdentification/gmd:pointOfContact[1]/gmd:CI_ResponsibleParty/gmd:contactInfo/gmd:CI_Contact/gmd:onlineResource/gmd:CI_OnlineResource/gmd:description": "c0758ed24a1a9fedc28c1d08a6903e354d34e6b1fcdaf6f96644fdf5bfc37dd0",
+    "gmd:identificationInfo/gmd:MD_DataIdentification/gmd:pointOfContact[1]/gmd:CI_ResponsibleParty/gmd:contactInfo/gmd:CI_Contact/gmd:onlineResource/gmd:CI_OnlineResource/gmd:description/gco:CharacterString": "c0758ed24a1a9fedc28c1d08a6903e354d34e6b1fcdaf6f96644fdf5bfc37dd0",
+    "gmd:identificationInfo/gmd:MD_DataIdentification/gmd:pointOfContact[1]/gmd:CI_ResponsibleParty/gmd:contactInfo/gmd:CI_Contact/gmd:onlineResource/gmd:CI_OnlineResource/gmd:function": "10cd9f28fb3e142013c4b2406c15aa3ec5cf4010bdeb339f3229a2abf6f0fca7",
+    "gmd:identificationInfo/gmd:MD_DataIdentification/gmd:pointOfContact[1]/gmd:CI_ResponsibleParty/gmd:contactInfo/gmd:CI_Contact/gmd:onlineResource/gmd:CI_OnlineResource/gmd:function/gmd:CI_OnLineFunctionCode": "10cd9f28fb3e142013c4b2406c15aa3ec5cf4010bdeb339f3229a2abf6f0fca7",
+    "gmd:identificationInfo/gmd:MD_DataIdentification/gmd:pointOfContact[1]/gmd:CI_ResponsibleParty/gmd:role": "KeyError: 'role'",
+    "gmd:identificationInfo/gmd:MD_DataIdentification/gmd:pointOfContact[1]/gmd:CI_ResponsibleParty/gmd:role/gmd:CI_RoleCode": "KeyError: 'role'",
+    "gmd:identificationInfo/gmd:MD_DataIdentification/gmd:pointOfContact[3]/gmd:CI_ResponsibleParty/gmd:organisationName/gmx:Anchor": "c0758ed24a1a9fedc28c1d08a6903e354d34e6b1fcdaf6f96644fdf5bfc37dd0",
+    "gmd:identificationInfo/gmd:MD_DataIdentification/gmd:pointOfContact[3]/gmd:CI_ResponsibleParty/gmd:contactInfo/gmd:CI_Contact/gmd:phone": "c0758ed24a1a9fedc28c1d08a6903e354d34e6b1fcdaf6f96644fdf5bfc37dd0",
+    "gmd:identificationInfo/gmd:MD_DataIdentification/gmd:pointOfContact[3]/gmd:CI_ResponsibleParty/gmd:contactInfo/gmd:CI_Contact/gmd:phone/gmd:CI_Telephone": "c0758ed24a1a9fedc28c1d08a6903e354d34e6b1fcdaf6f96644fdf5bfc37dd0",
+    "gmd:identificationInfo/gmd:MD_DataIdentification/gmd:pointOfContact[3]/gmd:CI_ResponsibleParty/gmd:contactInfo/gmd:CI_Contact/gmd:phone/gmd:CI_Telephone/gmd:voice": "c0758ed24a1a9fedc28c1d08a6903e354d34e6b1fcdaf6f96644fdf5bfc37dd0",
+    "gmd:identificationInfo/gmd:MD_DataIdentification/gmd:pointOfContact[3]/gmd:CI_ResponsibleParty/gmd:contactInfo/gmd:CI_Contact/gmd:phone/gmd:CI_Telephone/gmd:voice/gco:CharacterString": "c0758ed24a1a9fedc28c1d08a6903e354d34e6b1fcdaf6f96644fdf5bfc37dd0",
+    "gmd:identificationInfo/gmd:MD_DataIdentification/gmd:pointOfContact[3]/gmd:CI_ResponsibleParty/gmd:contactInfo/gmd:CI_Contact/gmd:address/gmd:CI_Address/gmd:deliveryPoint": "c0758ed24a1a9fedc28c1d08a6903e354d34e6b1fcdaf6f96644fdf5bfc37dd0",
+    "gmd:identificationInfo/gmd:MD_DataIdentification/gmd:pointOfContact[3]/gmd:CI_ResponsibleParty/gmd:contactInfo/gmd:CI_Contact/gmd:address/gmd:CI_Address/gmd:deliveryPoint/gco:CharacterString": "c0758ed24a1a9fedc28c1d08a6903e354d34e6b1fcdaf6f96644fdf5bfc37dd0",
+    "gmd:identificationInfo/gmd:MD_DataIdentification/gmd:pointOfContact[3]/gmd:CI_ResponsibleParty/gmd:contactInfo/gmd:CI_Contact/gmd:address/gmd:CI_Address/gmd:city": "c0758ed24a1a9fedc28c1d08a6903e354d34e6b1fcdaf6f96644fdf5bfc37dd0",
+    "gmd:identificationInfo/gmd:MD_DataIdentification/gmd:pointOfContact[3]/gmd:CI_ResponsibleParty/gmd:contactInfo/gmd:CI_Contact/gmd:address/gmd:CI_Address/gmd:city/gco:CharacterString": "c0758ed24a1a9fedc28c1d08a6903e354d34e6b1fcdaf6f96644fdf5bfc37dd0",
+    "gmd:identificationInfo/gmd:MD_DataIdentification/gmd:pointOfContact[3]/gmd:CI_ResponsibleParty/gmd:contactInfo/gmd:CI_Contact/gmd:address/gmd:CI_Address/gmd:administrativeArea": "c0758ed24a1a9fedc28c1d08a6903e354d34e6b1fcdaf6f96644fdf5bfc37dd0",
+    "gmd:identificationInfo/gmd:MD_DataIdentification/gmd:pointOfContact[3]/gmd:CI_ResponsibleParty/gmd:contactInfo/gmd:CI_Contact/gmd:address/gmd:CI_Address/gmd:administrativeArea/gco:CharacterString": "c0758ed24a1a9fedc28c1d08a6903e354d34e6b1fcdaf6f96644fdf5bfc37dd0",
+    "gmd:identificationInfo/gmd:MD_DataIdentification/gmd:pointOfContact[3]/gmd:CI_ResponsibleParty/gmd:contactInfo/gmd:CI_Contact/gmd:address/gmd:CI_Address/gmd:postalCode": "c0758ed24a1a9fedc28c1d08a6903e354d34e6b1fcdaf6f96644fdf5bfc37dd0",
+    "gmd:identificationInfo/gmd:MD_DataIdentification/gmd:pointOfContact[3]/gmd:CI_ResponsibleParty/gmd:contactInfo/gmd:CI_Contact/gmd:address/gmd:CI_Address/gmd:postalCode/gco:CharacterString": "c0758ed24a1a9fedc28c1d08a6903e354d34e6b1fcdaf6f96644fdf5bfc37dd0",
+    "gmd:identificationInfo/gmd:MD_DataIdentification/gmd:pointOfContact[3]/gmd:CI_ResponsibleParty/gmd:contactInfo/gmd:CI_Contact/gmd:address/gmd:CI_Address/gmd:country": "c0758ed24a1a9fedc28c1d08a6903e354d34e6b1fcdaf6f96644fdf5bfc37dd0",
+    "gmd:identificationInfo/gmd:MD_DataIdentification/gmd:pointOfContact[3]/gmd:CI_ResponsibleParty/gmd:contactInfo/gmd:CI_Contact/gmd:address/gmd:CI_Address/gmd:country/gco:CharacterString": "c0758ed24a1a9fedc28c1d08a6903e354d34e6b1fcdaf6f96644fdf5bfc37dd0",
+    "gmd:identificationInfo/gmd:MD_DataIdentification/gmd:resourceMaintenance": "008da6347812df312179a11bc06e1bc0975d2e4baa677a743417475199ac8f8f",
+    "gmd:identificationInfo/gmd:MD_DataIdentification/gmd:resourceMaintenance/gmd:MD_MaintenanceInformation": "008da6347812df312179a11bc06e1bc0975d2e4baa677a743417475199ac8f8f",
+    "gmd:identificationInfo/gmd:MD_DataIdentification/gmd:resourceMaintenance/gmd:MD_MaintenanceInformation/gmd:maintenanceAndUpdateFrequency": "a6fdf7245817b3fd171f2bf811bc3ae9cb0a45dd49c57a30032b075502e1bf4f",
+    "gmd:identificationInfo/gmd:MD_DataIdentification/gmd:resourceMaintenance/gmd:MD_MaintenanceInformation/gmd:maintenanceAndUpdateFrequency/gmd:MD_MaintenanceFrequencyCode": "a6fdf7245817b3fd171f2bf811bc3ae9cb0a45dd49c57a30032b075502e1bf4f",
+    "gmd:identificationInfo/gmd:MD_DataIdentification/gmd:resourceMaintenance/gmd:MD_MaintenanceInformation/gmd:maintenanceNote": "8df80d968024f662020196f62b71ec7c4062584473a3aff24fd54f2e4f219643",
+    "gmd:identificationInfo/gmd:MD_DataIdentification/gmd:resourceMaintenance/gmd:MD_MaintenanceInformation/gmd:maintenanceNote/gmd:MD_ProgressCode": "8df80d968024f662020196f62b71ec7c4062584473a3aff24fd54f2e4f219643",
+    "gmd:identificationInfo/gmd:MD_DataIdentification/gmd:descriptiveKeywords": "23dfc93ce8a0cbddd3e62da566899cbb0a8a1eecd33b5036b240f2cff88be94b",
+    "gmd:identificationInfo/gmd:MD_DataIdentification/gmd:descriptiveKeywords/gmd:MD_Keywords": "1ab604a45c122deda911edf3793d13d4b7405c645efc438270848dc11a6f81f8",
+    "gmd:identificationInfo/gmd:MD_DataIdentification/gmd:descriptiveKeywords/gmd:MD_Keywords/gmd:keyword": "84c0a41d20d00551ffe76671bcfe398e4931d43ed7936916bd5d745c2ad42b43",
+    "gmd:identificationInfo/gmd:MD_DataIdentification/gmd:descriptiveKeywords/gmd:MD_Keywords/gmd:keyword/gmx:Anchor": "84c0a41d20d00551ffe76671bcfe398e4931d43ed7936916bd5d745c2ad42b43",
+    "gmd:identificationInfo/gmd:MD_DataIdentification/gmd:descriptiveKeywords/gmd:MD_Keywords/gmd:type": "07906714852ee3305de08fd79e066f612fab4ae4138c5d125c001ae33d981f03",
+    "gmd:identificationInfo/gmd:MD_DataIdentification/gmd:descriptiveKeywords/gmd:MD_Keywords/gmd:type/gmd:MD_KeywordTypeCode": "07906714852ee3305de08fd79e066f612fab4ae4138c5d125c001ae33d981f03",
+    "gmd:identificationInfo/gmd:MD_DataIdentification/gmd:descriptiveKeywords/gmd:MD_Keywords/gmd:thesaurusName": "85c3421c65d0b89c732bc1b4eb4a67b943481d800b6dd887c3de5f623f28a0c1",
+    "gmd:identificationInfo/gmd:MD_DataIdentification/gmd:descriptiveKeywords/gmd:MD_Keywords/gmd:thesaurusName/gmd:CI_Citation": "85c3421c65d0b89c732bc1b4eb4a67b943481d800b6dd887c3de5f623f28a0c1",
+    "gmd:identificationInfo/gmd:MD_DataIdentification/gmd:descriptiveKeywords/gmd:MD_Keywords/gmd:thesaurusName/gmd:CI_Citation/gmd:title": "f2ecaddad2224b1d9c38b19314b1334c7eb62701ef8040ebcd32e10534f0ce83",
+    "gmd:identificationInfo/gmd:MD_DataIdentification/gmd:descriptiveKeywords/gmd:MD_Keywords/gmd:thesaurusName/gmd:CI_Citation/gmd:title/gmx:Anchor": "f2ecaddad2224b1d9c38b19314b1334c7eb62701ef8040ebcd32e10534f0ce83",
+    "gmd:identificationInfo/gmd:MD_DataIdentification/gmd:descriptiveKeywords/gmd:MD_Keywords/gmd:thesaurusName/gmd:CI_Citation/gmd:date": "c35d87476080afffc43c0e9e8583b4b48a2b526aea765950681f1b152924a83b",
+    "gmd:identificationInfo/gmd:MD_DataIdentification/gmd:descriptiveKeywords/gmd:MD_Keywords/gmd:thesaurusName/gmd:CI_Citation/gmd:date/gmd:CI_Date": "eb1009aef28415b1ed0bd13e0dfe24e75a782d27846cc2438c245c6dc7ccf9f3",
+    "gmd:identificationInfo/gmd:MD_DataIdentification/gmd:descriptiveKeywords/gmd:MD_Keywords/gmd:thesaurusName/gmd:CI_Citation/gmd:date/gmd:CI_Date/gmd:date": "54f4f4bbd8fb295a1db00ef63272800815b31a41e1abb52aac1fb3e74ba46328",
+    "gmd:identificationInfo/gmd:MD_DataIdentification/gmd:descriptiveKeywords/gmd:MD_Keywords/gmd:thesaurusName/gmd:CI_Citation/gmd:date/gmd:CI_Date/gmd:date/gco:Date": "54f4f4bbd8fb295a1db00ef63272800815b31a41e1abb52aac1fb3e74ba46328",
+    "gmd:identificationInfo/gmd:MD_DataIdentification/gmd:descriptiveKeywords/gmd:MD_Keywords/gmd:thesaurusName/gmd:CI_Citation/gmd:date/gmd:CI_Date/gmd:dateType": "afc708961918cf93d8c984f754cb703e95598873a2251a0732e16f13273aa698",
+    "gmd:identificationInfo/gmd:MD_DataIdentification/gmd:descriptiveKeywords/gmd:MD_Keywords/gmd:thesaurusName/gmd:CI_Citation/gmd:date/gmd:CI_Date/gmd:dateType/gmd:CI_DateTypeCode": "afc708961918cf93d8c984f754cb703e95598873a2251a0732e16f13273aa698",
+    "gmd:identificationInfo/gmd:MD_DataIdentification/gmd:descriptiveKeywords/gmd:MD_Keywords/gmd:thesaurusName/gmd:CI_Citation/gmd:edition": "ba98bc5253da81d0f5aaecc91f960a7fcfc4ca923e42abefcb81cd557d261896",
+    "gmd:identificationInfo/gmd:MD_DataIdentification/gmd:descriptiveKeywords/gmd:MD_Keywords/gmd:thesaurusName/gmd:CI_Citation/gmd:edition/gco:CharacterString": "ba98bc5253da81d0f5aaecc91f960a7fcfc4ca923e42abefcb81cd557d261896",
+    "gmd:identificationInfo/gmd:MD_DataIdentification/gmd:descriptiveKeywords/gmd:MD_Keywords/gmd:thesaurusName/gmd:CI_Citation/gmd:citedResponsibleParty": "13d252a2401f5ea8bb974dc8bf9aab9e7a0f31397460c845f5604ab52d011d13",
+    "gmd:identificationInfo/gmd:MD_DataIdentification/gmd:descriptiveKeywords/gmd:MD_Keywords/gmd:thesaurusName/gmd:CI_Citation/gmd:citedResponsibleParty/gmd:CI_ResponsibleParty": "13d252a2401f5ea8bb974dc8bf9aab9e7a0f31397460c845f5604ab52d011d13",
+    "gmd:identificationInfo/gmd:MD_DataIdentification/gmd:descriptiveKeywords/gmd:MD_Keywords/gmd:thesaurusName/gmd:CI_Citation/gmd:citedResponsibleParty/gmd:CI_ResponsibleParty/gmd:organisationName": "c0758ed24a1a9fedc28c1d08a6903e354d34e6b1fcdaf6f96644fdf5bfc37dd0",
+    "gmd:identificationInfo/gmd:MD_DataIdentification/gmd:descriptiveKeywords/gmd:MD_Keywords/gmd:thesaurusName/gmd:CI_Citation/gmd:citedResponsibleParty/gmd:CI_ResponsibleParty/gmd:organisationName/gco:CharacterString": "c0758ed24a1a9fedc28c1d08a6903e354d34e6b1fcdaf6f96644fdf5bfc37dd0",
+    "gmd:identificationInfo/gmd:MD_DataIdentification/gmd:descriptiveKeywords/gmd:MD_Keywords/gmd:thesaurusName/gmd:CI_Citation/gmd:citedResponsibleParty/gmd:CI_ResponsibleParty/gmd:contactInfo": "483a9ab2dd2f936a1227d93f1d6ed62072c2a19dfa40b2fae9d9286d79605668",
+    "gmd:identificationInfo/gmd:MD_DataIdentification/gmd:descriptiveKeywords/gmd:MD_Keywords/gmd:thesaurusName/gmd:CI_Citation/gmd:citedResponsibleParty/gmd:CI_ResponsibleParty/gmd:contactInfo/gmd:CI_Contact": "483a9ab2dd2f936a1227d93f1d6ed62072c2a19dfa40b2fae9d9286d79605668",
+    "gmd:identificationInfo/gmd:MD_DataIdentification/gmd:descriptiveKeywords/gmd:MD_Keywords/gmd:thesaurusName/gmd:CI_Citation/gmd:citedResponsibleParty/gmd:CI_ResponsibleParty/gmd:contactInfo/gmd:CI_Contact/gmd:address": "c0758ed24a1a9fedc28c1d08a6903e354d34e6b1fcdaf6f96644fdf5bfc37dd0",
+    "gmd:identificationInfo/gmd:MD_DataIdentification/gmd:descriptiveKeywords/gmd:MD_Keywords/gmd:thesaurusName/gmd:CI_Citation/gmd:citedResponsibleParty/gmd:CI_ResponsibleParty/gmd:contactInfo/gmd:CI_Contact/gmd:address/gmd:CI_Address": "c0758ed24a1a9fedc28c1d08a6903e354d34e6b1fcdaf6f96644fdf5bfc37dd0",
+    "gmd:identificationInfo/gmd:MD_DataIdentification/gmd:descriptiveKeywords/gmd:MD_Keywords/gmd:thesaurusName/gmd:CI_Citation/gmd:citedResponsibleParty/gmd:CI_ResponsibleParty/gmd:contactInfo/gmd:CI_Contact/gmd:address/gmd:CI_Address/gmd:electronicMailAddress": "c0758ed24a1a9fedc28c1d08a6903e354d34e6b1fcdaf6f96644fdf5bfc37dd0",
+    "gmd:identificationInfo/gmd:MD_DataIdentification/gmd:descriptiveKeywords/gmd:MD_Keywords/gmd:thesaurusName/gmd:CI_Citation/gmd:citedResponsibleParty/gmd:CI_ResponsibleParty/gmd:contactInfo/gmd:CI_Contact/gmd:address/gmd:CI_Address/gmd:electronicMailAddress/gco:CharacterString": "c0758ed24a1a9fedc28c1d08a6903e354d34e6b1fcdaf6f96644fdf5bfc37dd0",
+    "gmd:identificationInfo/gmd:MD_DataIdentification/gmd:descriptiveKeywords/gmd:MD_Keywords/gmd:thesaurusName/gmd:CI_Citation/gmd:citedResponsibleParty/gmd:CI_ResponsibleParty/gmd:contactInfo/gmd:CI_Contact/gmd:onlineResource": "483a9ab2dd2f936a1227d93f1d6ed62072c2a19dfa40b2fae9d9286d79605668",
+    "gmd:identificationInfo/gmd:MD_DataIdentification/gmd:descriptiveKeywords/gmd:MD_Keywords/gmd:thesaurusName/gmd:CI_Citation/gmd:citedResponsibleParty/gmd:CI_ResponsibleParty/gmd:contactInfo/gmd:CI_Contact/gmd:onlineResource/gmd:CI_OnlineResource": "483a9ab2dd2f936a1227d93f1d6ed62072c2a19dfa40b2fae9d9286d79605668",
+    "gmd:identificationInfo/gmd:MD_DataIdentification/gmd:descriptiveKeywords/gmd:MD_Keywords/gmd:thesaurusName/gmd:CI_Citation/gmd:citedResponsibleParty/gmd:CI_ResponsibleParty/gmd:contactInfo/gmd:CI_Contact/gmd:onlineResource/gmd:CI_OnlineResource/gmd:linkage": "c0758ed24a1a9fedc28c1d08a6903e354d34e6b1fcdaf6f96644fdf5bfc37dd0",
+    "gmd:identificationInfo/gmd:MD_DataIdentification/gmd:descriptiveKeywords/gmd:MD_Keywords/gmd:thesaurusName/gmd:CI_Citation/gmd:citedResponsibleParty/gmd:CI_ResponsibleParty/gmd:contactInfo/gmd:CI_Contact/gmd:onlineResource/gmd:CI_OnlineResource/gmd:linkage/gmd:URL": "c0758ed24a1a9fedc28c1d08a6903e354d34e6b1fcdaf6f96644fdf5bfc37dd0",
+    "gmd:identificationInfo/gmd:MD_DataIdentification/gmd:descriptiveKeywords/gmd:MD_Keywords/gmd:thesaurusName/gmd:CI_Citation/gmd:citedResponsibleParty/gmd:CI_ResponsibleParty/gmd:contactInfo/gmd:CI_Contact/gmd:onlineResource/gmd:CI_OnlineResource/gmd:name": "c0758ed24a1a9fedc28c1d08a6903e354d34e6b1fcdaf6f96644fdf5bfc37dd0",
+    "gmd:identificationInfo/gmd:MD_DataIdentification/gmd:descriptiveKeywords/gmd:MD_Keywords/gmd:thesaurusName/gmd:CI_Citation/gmd:citedResponsibleParty/gmd:CI_ResponsibleParty/gmd:contactInfo/gmd:CI_Contact/gmd:onlineResource/gmd:CI_OnlineResource/gmd:name/gco:CharacterString": "c0758ed24a1a9fedc28c1d08a6903e354d34e6b1fcdaf6f96644fdf5bfc37dd0",
+    "gmd:identificationInfo/gmd:MD_DataIdentification/gmd:descriptiveKeywords/gmd:MD_Keywords/gmd:thesaurusName/gmd:CI_Citation/gmd:citedResponsibleParty/gmd:CI_ResponsibleParty/gmd:contactInfo/gmd:CI_Contact/gmd:onlineResource/gmd:CI_OnlineResource/gmd:function": "483a9ab2dd2f936a1227d93f1d6ed62072c2a19dfa40b2fae9d9286d79605668",
+    "gmd:identificationInfo/gmd:MD_DataIdentification/gmd:descriptiveKeywords/gmd:MD_Keywords/gmd:thesaurusName/gmd:CI_Citation/gmd:citedResponsibleParty/gmd:CI_ResponsibleParty/gmd:contactInfo/gmd:CI_Contact/gmd:onlineResource/gmd:CI_OnlineResource/gmd:function/gmd:CI_OnLineFunctionCode": "483a9ab2dd2f936a1227d93f1d6ed62072c2a19dfa40b2fae9d9286d79605668",
+    "gmd:identificationInfo/gmd:MD_DataIdentification/gmd:descriptiveKeywords/gmd:MD_Keywords/gmd:thesaurusName/gmd:CI_Citation/gmd:citedResponsibleParty/gmd:CI_ResponsibleParty/gmd:role": "d5ab3ebbd562f696ac01c4ca42145e7e88fb6159dd036f7614ee76441617551a",
+    "gmd:identificationInfo/gmd:MD_DataIdentification/gmd:descriptiveKeywords/gmd:MD_Keywords/gmd:thesaurusName/gmd:CI_Citation/gmd:citedResponsibleParty/gmd:CI_ResponsibleParty/gmd:role/gmd:CI_RoleCode": "d5ab3ebbd562f696ac01c4ca42145e7e88fb6159dd036f7614ee76441617551a",
+    "gmd:identificationInfo/gmd:MD_DataIdentification/gmd:resourceConstraints[1]": "757a7127846adb1a22d675c8953c870cf5c2c35dc8dd15d79a49bd1635cdf662",
+    "gmd:identificationInfo/gmd:MD_DataIdentification/gmd:resourceConstraints[1]/gmd:MD_LegalConstraints": "c99f1d938633f06cdceeaf45e5c20680e22d5ba60bea2e3962b20ba815ddb61d",
+    "gmd:identificationInfo/gmd:MD_DataIdentification/gmd:resourceConstraints[1]/gmd:MD_LegalConstraints/gmd:accessConstraints": "c99f1d938633f06cdceeaf45e5c20680e22d5ba60bea2e3962b20ba815ddb61d",
+    "gmd:identificationInfo/gmd:MD_DataIdentification/gmd:resourceConstraints[1]/gmd:MD_LegalConstraints/gmd:accessConstraints/gmd:MD_RestrictionCode": "c99f1d938633f06cdceeaf45e5c20680e22d5ba60bea2e3962b20ba815ddb61d",
+    "gmd:identificationInfo/gmd:MD_DataIdentification/gmd:resourceConstraints[1]/gmd:MD_LegalConstraints/gmd:otherConstraints": "e70670af53adb66c70390ea19466037e7d34f7530edbfd9cd6285fb0ea203dfd",
+    "gmd:identificationInfo/gmd:MD_DataIdentification/gmd:resourceConstraints[1]/gmd:MD_LegalConstraints/gmd:otherConstraints/gco:CharacterString": "e70670af53adb66c70390ea19466037e7d34f7530edbfd9cd6285fb0ea203dfd",
+    "gmd:identificationInfo/gmd:MD_DataIdentification/gmd:resourceConstraints[2]/gmd:MD_LegalConstraints/gmd:useLimitation": "a74ada9b4259b30b80d2f8080555b86303f3e9f3eeaffee3e8c5f1bc8171cfec",
+    "gmd:identificationInfo/gmd:MD_DataIdentification/gmd:resourceConstraints[2]/gmd:MD_LegalConstraints/gmd:useLimitation/gmx:Anchor": "a74ada9b4259b30b80d2f8080555b86303f3e9f3eeaffee3e8c5f1bc8171cfec",
+    "gmd:identificationInfo/gmd:MD_DataIdentification/gmd:resourceConstraints[3]/gmd:MD_LegalConstraints/gmd:useLimitation/gco:CharacterString": "d2ea1124d103a3fc78ba1bb630f33b496f659b21740026baef2946f284af122d",
+    "gmd:identificationInfo/gmd:MD_DataIdentification/gmd:spatialRepresentationType": "2946228e5c21af5e757e446e5f8ef94b8d29dfde10b01ca011140cee0fbd3fd0",
+    "gmd:identificationInfo/gmd:MD_DataIdentification/gmd:spatialRepresentationType/gmd:MD_SpatialRepresentationTypeCode": "2946228e5c21af5e757e446e5f8ef94b8d29dfde10b01ca011140cee0fbd3fd0",
+    "gmd:identificationInfo/gmd:MD_DataIdentification/gmd:characterSet": "a1418a8b331bd02912edd965e954628670894312add79fa6d2ecf41814604c9c",
+    "gmd:identificationInfo/gmd:MD_DataIdentification/gmd:characterSet/gmd:MD_CharacterSetCode": "a1418a8b331bd02912edd965e954628670894312add79fa6d2ecf41814604c9c",
+    "gmd:identificationInfo/gmd:MD_DataIdentification/gmd:language": "86c1c0d5ade54d85bfacf1278699a9241253df0ede68518349c6d33ce703d022",
+    "gmd:identificationInfo/gmd:MD_DataIdentification/gmd:language/gmd:LanguageCode": "86c1c0d5ade54d85bfacf1278699a9241253df0ede68518349c6d33ce703d022",
+    "gmd:identificationInfo/gmd:MD_DataIdentification/gmd:topicCategory[1]": "3d1e15e99c45708624a215603e2f1ff4c9fc8c4dccf79275d53f016a486d71d1",
+    "gmd:identificationInfo/gmd:MD_DataIdentification/gmd:topicCategory[1]/gmd:MD_TopicCategoryCode": "d9d046323cf4bbafed152c0a3817adf654fb6758c4352531ea7c6f940f32d5aa",
+    "gmd:identificationInfo/gmd:MD_DataIdentification/gmd:extent": "e27bf9c93281dabb07786db61ea6e2985d5151973e94aaef66a262d1785b3c3e",
+    "gmd:identificationInfo/gmd:MD_DataIdentification/gmd:extent/gmd:EX_Extent": "e27bf9c93281dabb07786db61ea6e2985d5151973e94aaef66a262d1785b3c3e",
+    "gmd:identificationInfo/gmd:MD_DataIdentification/gmd:extent/gmd:EX_Extent/gmd:geographicElement": "ea7e08d63f306ec7f4bdad4a8e5e812778a12a00696dc2f8772ff535ba5ee7f9",
+    "gmd:identificationInfo/gmd:MD_DataIdentification/gmd:extent/gmd:EX_Extent/gmd:geographicElement/gmd:EX_GeographicBoundingBox": "ea7e08d63f306ec7f4bdad4a8e5e812778a12a00696dc2f8772ff535ba5ee7f9",
+    "gmd:identificationInfo/gmd:MD_DataIdentification/gmd:extent/gmd:EX_Extent/gmd:geographicElement/gmd:EX_GeographicBoundingBox/gmd:westBoundLongitude": "14c75b40dbd055b97d7026a8d7d10bd6c6b8a63cf5657999c521b3d35e2f98fe",
+    "gmd:identificationInfo/gmd:MD_DataIdentification/gmd:extent/gmd:EX_Extent/gmd:geographicElement/gmd:EX_GeographicBoundingBox/gmd:westBoundLongitude/gco:Decimal": "14c75b40dbd055b97d7026a8d7d10bd6c6b8a63cf5657999c521b3d35e2f98fe",
+    "gmd:identificationInfo/gmd:MD_DataIdentification/gmd:extent/gmd:EX_Extent/gmd:geographicElement/gmd:EX_GeographicBoundingBox/gmd:eastBoundLongitude": "c3e0229810a645b56129323f72dc611746bd3f9357f8f1117e22559e75db4ced",
+    "gmd:identificationInfo/gmd:MD_DataIdentification/gmd:extent/gmd:EX_Extent/gmd:geographicElement/gmd:EX_GeographicBoundingBox/gmd:eastBoundLongitude/gco:Decimal": "c3e0229810a645b56129323f72dc611746bd3f9357f8f1117e22559e75db4ced",
+    "gmd:identificationInfo/gmd:MD_DataIdentification/gmd:extent/gmd:EX_Extent/gmd:geographicElement/gmd:EX_GeographicBoundingBox/gmd:southBoundLatitude": "040ff3c1461ac669664ca4f31a6458ec8ac7682d9d9fcdf63e695680fb0e616d",
+    "gmd:identificationInfo/gmd:MD_DataIdentification/gmd:extent/gmd:EX_Extent/gmd:geographicElement/gmd:EX_GeographicBoundingBox/gmd:southBoundLatitude/gco:Decimal": "040ff3c1461ac669664ca4f31a6458ec8ac7682d9d9fcdf63e695680fb0e616d",
+    "gmd:identificationInfo/gmd:MD_DataIdentification/gmd:extent/gmd:EX_Extent/gmd:geographicElement/gmd:EX_GeographicBoundingBox/gmd:northBoundLatitude": "a871d0aa5ad0ace23190ad210583a7388b0491fecf565a9652a8a361dab25cc1",
+    "gmd:identificationInfo/gmd:MD_DataIdentification/gmd:extent/gmd:EX_Extent/gmd:geographicElement/gmd:EX_GeographicBoundingBox/gmd:northBoundLatitude/gco:Decimal": "a871d0aa5ad0ace23190ad210583a7388b0491fecf565a9652a8a361dab25cc1",
+    "gmd:identificationInfo/gmd:MD_DataIdentification/gmd:extent/gmd:EX_Extent/gmd:temporalElement": "5681bfcc98ed948c5f3b6d51fc1e03d8b9e73c0c6379f747af24cdca4f10c300",
+    "gmd:identificationInfo/gmd:MD_DataIdentification/gmd:extent/gmd:EX_Extent/gmd:temporalElement/gmd:EX_TemporalExtent": "5681bfcc98ed948c5f3b6d51fc1e03d8b9e73c0c6379f747af24cdca4f10c300",
+    "gmd:identificationInfo/gmd:MD_DataIdentification/gmd:extent/gmd:EX_Extent/gmd:temporalElement/gmd:EX_TemporalExtent/gmd:extent": "5681bfcc98ed948c5f3b6d51fc1e03d8b9e73c0c6379f747af24cdca4f10c300",
+    "gmd:identificationInfo/gmd:MD_DataIdentification/gmd:extent/gmd:EX_Extent/gmd:temporalElement/gmd:EX_TemporalExtent/gmd:extent/gml:TimePeriod": "5681bfcc98ed948c5f3b6d51fc1e03d8b9e73c0c6379f747af24cdca4f10c300",
+    "gmd:identificationInfo/gmd:MD_DataIdentification/gmd:extent/gmd:EX_Extent/gmd:temporalElement/gmd:EX_TemporalExtent/gmd:extent/gml:TimePeriod/gml:beginPosition": "a364e93d2357bd4057f76fdce890f72e8481d90377410646c260827fad6bfaea",
+    "gmd:identificationInfo/gmd:MD_DataIdentification/gmd:extent/gmd:EX_Extent/gmd:temporalElement/gmd:EX_TemporalExtent/gmd:extent/gml:TimePeriod/gml:endPosition": "cd8d2d468d4e385aa8d93685d33602bc20f72639fc4a6d7b911e431bb6de2c57",
+    "gmd:identificationInfo/gmd:MD_DataIdentification/gmd:extent/gmd:EX_Extent/gmd:verticalElement": "484d034b57f9aaf75b053def2d1f5bdbf8fd66880ff2bb6e1d62be293fa6bfb1",
+    "gmd:identificationInfo/gmd:MD_DataIdentification/gmd:extent/gmd:EX_Extent/gmd:verticalElement/gmd:EX_VerticalExtent": "484d034b57f9aaf75b053def2d1f5bdbf8fd66880ff2bb6e1d62be293fa6bfb1",
+    "gmd:identificationInfo/gmd:MD_DataIdentification/gmd:extent/gmd:EX_Extent/gmd:verticalElement/gmd:EX_VerticalExtent/gmd:minimumValue": "cd7d86e1f400516930f2ad6415834da2ad192576b38f4450a38fd37a06552f75",
+    "gmd:identificationInfo/gmd:MD_DataIdentification/gmd:extent/gmd:EX_Extent/gmd:verticalElement/gmd:EX_VerticalExtent/gmd:minimumValue/gco:Real": "cd7d86e1f400516930f2ad6415834da2ad192576b38f4450a38fd37a06552f75",
+    "gmd:identificationInfo/gmd:MD_DataIdentification/gmd:extent/gmd:EX_Extent/gmd:verticalElement/gmd:EX_VerticalExtent/gmd:maximumValue": "d1a308744dc522fd26bf884bb57c997b0619a7c5cbd6c6869cce2d1c24c0b65f",
+    "gmd:identificationInfo/gmd:MD_DataIdentification/gmd:extent/gmd:EX_Extent/gmd:verticalElement/gmd:EX_VerticalExtent/gmd:maximumValue/gco:Real": "d1a308744dc522fd26bf884bb57c997b0619a7c5cbd6c6869cce2d1c24c0b65f",
+    "gmd:identificationInfo/gmd:MD_DataIdentification/gmd:extent/gmd:EX_Extent/gmd:verticalElement/gmd:EX_VerticalExtent/gmd:verticalCRS": "d0be57a3a52ba6a8e317656b4ba354ea9c9afb8ec646bbbd9d65c620e82a4c5e",
+    "gmd:identificationInfo/gmd:MD_DataIdentification/gmd:extent/gmd:EX_Extent/gmd:verticalElement/gmd:EX_VerticalExtent/gmd:verticalCRS/gml:VerticalCRS": "d0be57a3a52ba6a8e317656b4ba354ea9c9afb8ec646bbbd9d65c620e82a4c5e",
+    "gmd:identificationInfo/gmd:MD_DataIdentification/gmd:extent/gmd:EX_Extent/gmd:verticalElement/gmd:EX_VerticalExtent/gmd:verticalCRS/gml:VerticalCRS/gml:identifier": "7ddcf5b3b6978c7973bbdec54b25f032e1b53a4021e461ad5c6c50787a427924",
+    "gmd:identificationInfo/gmd:MD_DataIdentification/gmd:extent/gmd:EX_Extent/gmd:verticalElement/gmd:EX_VerticalExtent/gmd:verticalCRS/gml:VerticalCRS/gml:name": "ff1548982066826918ca973e65129f828ddaec7ae15cd7aa553da077f3f94aed",
+    "gmd:identificationInfo/gmd:MD_DataIdentification/gmd:extent/gmd:EX_Extent/gmd:verticalElement/gmd:EX_VerticalExtent/gmd:verticalCRS/gml:VerticalCRS/gml:remarks": "3f38b1fa9d21da1ebd87a144f79ab3451f80bdcf3035665c92d0a7f9c8d8cdd6",
+    "gmd:identificationInfo/gmd:MD_DataIdentification/gmd:extent/gmd:EX_Extent/gmd:verticalElement/gmd:EX_VerticalExtent/gmd:verticalCRS/gml:VerticalCRS/gml:domainOfValidity": "1eda46889306318c91a9f6f815a8db1a950a4ea369f76508a3c513587cfc15df",
+    "gmd:identificationInfo/gmd:MD_DataIdentification/gmd:extent/gmd:EX_Extent/gmd:verticalElement/gmd:EX_VerticalExtent/gmd:verticalCRS/gml:VerticalCRS/gml:scope": "eadf21ec53deca0ff2157227606cbc5c2f4b104b1eddb9ec871e257ee35c1161",
+    "gmd:identificationInfo/gmd:MD_DataIdentification/gmd:extent/gmd:EX_Extent/gmd:verticalElement/gmd:EX_VerticalExtent/gmd:verticalCRS/gml:VerticalCRS/gml:verticalCS": "c69b23861651f2ebcfb38c26101de2c9dc473f16a90962495cb9a248b3287d03",
+    "gmd:identificationInfo/gmd:MD_DataIdentification/gmd:extent/gmd:EX_Extent/gmd:verticalElement/gmd:EX_VerticalExtent/gmd:verticalCRS/gml:VerticalCRS/gml:verticalDatum": "dbe701514c63ac7a849c68fa9c01a2eac255c343bfc0a1e179272817c43881a6",
+    "gmd:identificationInfo/gmd:MD_DataIdentification/gmd:supplementalInformation": "712324268c3bb81e947d984bf8b6772fdf261e5ef79b1ad6a3ccd0ffd74ec6c4",
+    "gmd:identificationInfo/gmd:MD_DataIdentification/gmd:supplementalInformation/gco:CharacterString": "712324268c3bb81e947d984bf8b6772fdf261e5ef79b1ad6a3ccd0ffd74ec6c4",
+    "gmd:distributionInfo": "9467948f23f8a968bafa26b299c79da1ddd042704024d341a69de10e4bc4da8d",
+    "gmd:distributionInfo/gmd:MD_Distribution": "9467948f23f8a968bafa26b299c79da1ddd042704024d341a69de10e4bc4da8d",
+    "gmd:distributionInfo/gmd:MD_Distribution/gmd:distributionFormat": "0abfae9ef7b2a2bfe907ba4dd1893d1012a264630639894df016a8ffccb28b4a",
+    "gmd:distributionInfo/gmd:MD_Distribution/gmd:distributionFormat/gmd:MD_Format": "0178aa707360bd14c46b71fa8b2ef7d808e88efa6e7feed30f44e446d9b9a8ab",
+    "gmd:distributionInfo/gmd:MD_Distribution/gmd:distributionFormat/gmd:MD_Format/gmd:name": "0178aa707360bd14c46b71fa8b2ef7d808e88efa6e7feed30f44e446d9b9a8ab",
+    "gmd:distributionInfo/gmd:MD_Distribution/gmd:distributionFormat/gmd:MD_Format/gmd:name/gmx:Anchor": "0178aa707360bd14c46b71fa8b2ef7d808e88efa6e7feed30f44e446d9b9a8ab",
+    "gmd:distributionInfo/gmd:MD_Distribution/gmd:distributionFormat/gmd:MD_Format/gmd:version": "c0758ed24a1a9fedc28c1d08a6903e354d34e6b1fcdaf6f96644fdf5bfc37dd0",
+    "gmd:distributionInfo/gmd:MD_Distribution/gmd:distributor[1]": "c9e89b8efa7bef68ad39a4dbff85c261f80085a93bff7dfd885907472b167349",
+    "gmd:distributionInfo/gmd:MD_Distribution/gmd:distributor[1]/gmd:MD_Distributor": "c9e89b8efa7bef68ad39a4dbff85c261f80085a93bff7dfd885907472b167349",
+    "gmd:distributionInfo/gmd:MD_Distribution/gmd:distributor[1]/gmd:MD_Distributor/gmd:distributorContact": "c9e89b8efa7bef68ad39a4dbff85c261f80085a93bff7dfd885907472b167349",
+    "gmd:distributionInfo/gmd:MD_Distribution/gmd:distributor[1]/gmd:MD_Distributor/gmd:distributorContact/gmd:CI_ResponsibleParty": "KeyError: 'role'",
+    "gmd:distributionInfo/gmd:MD_Distribution/gmd:distributor[1]/gmd:MD_Distributor/gmd:distributorContact/gmd:CI_ResponsibleParty/gmd:organisationName": "c0758ed24a1a9fedc28c1d08a6903e354d34e6b1fcdaf6f96644fdf5bfc37dd0",
+    "gmd:distributionInfo/gmd:MD_Distribution/gmd:distributor[1]/gmd:MD_Distributor/gmd:distributorContact/gmd:CI_ResponsibleParty/gmd:organisationName/gmx:Anchor": "c0758ed24a1a9fedc28c1d08a6903e354d34e6b1fcdaf6f96644fdf5bfc37dd0",
+    "gmd:distributionInfo/gmd:MD_Distribution/gmd:distributor[1]/gmd:MD_Distributor/gmd:distributorContact/gmd:CI_ResponsibleParty/gmd:contactInfo": "33c6f1b8f2a3141d23ff426e8657ba0d58cebef0ef5e496af5a237c8226c8a38",
+    "gmd:distributionInfo/gmd:MD_Distribution/gmd:distributor[1]/gmd:MD_Distributor/gmd:distributorContact/gmd:CI_ResponsibleParty/gmd:contactInfo/gmd:CI_Contact": "33c6f1b8f2a3141d23ff426e8657ba0d58cebef0ef5e496af5a237c8226c8a38",
+    "gmd:distributionInfo/gmd:MD_Distribution/gmd:distributor[1]/gmd:MD_Distributor/gmd:distributorContact/gmd:CI_ResponsibleParty/gmd:contactInfo/gmd:CI_Contact/gmd:phone": "c0758ed24a1a9fedc28c1d08a6903e354d34e6b1fcdaf6f96644fdf5bfc37dd0",
+    "gmd:distributionInfo/gmd:MD_Distribution/gmd:distributor[1]/gmd:MD_Distributor/gmd:distributorContact/gmd:CI_ResponsibleParty/gmd:contactInfo/gmd:CI_Contact/gmd:phone/gmd:CI_Telephone": "c0758ed24a1a9fedc28c1d08a6903e354d34e6b1fcdaf6f96644fdf5bfc37dd0",
+    "gmd:distributionInfo/gmd:MD_Distribution/gmd:distributor[1]/gmd:MD_Distributor/gmd:distributorContact/gmd:CI_ResponsibleParty/gmd:contactInfo/gmd:CI_Contact/gmd:phone/gmd:CI_Telephone/gmd:voice": "c0758ed24a1a9fedc28c1d08a6903e354d34e6b1fcdaf6f96644fdf5bfc37dd0",
+    "gmd:distributionInfo/gmd:MD_Distribution/gmd:distributor[1]/gmd:MD_Distributor/gmd:distributorContact/gmd:CI_ResponsibleParty/gmd:contactInfo/gmd:CI_Contact/gmd:phone/gmd:CI_Telephone/gmd:voice/gco:CharacterString": "c0758ed24a1a9fedc28c1d08a6903e354d34e6b1fcdaf6f96644fdf5bfc37dd0",
+    "gmd:distributionInfo/gmd:MD_Distribution/gmd:distributor[1]/gmd:MD_Distributor/gmd:distributorContact/gmd:CI_ResponsibleParty/gmd:contactInfo/gmd:CI_Contact/gmd:address": "c0758ed24a1a9fedc28c1d08a6903e354d34e6b1fcdaf6f96644fdf5bfc37dd0",
+    "gmd:distributionInfo/gmd:MD_Distribution/gmd:distributor[1]/gmd:MD_Distributor/gmd:distributorContact/gmd:CI_ResponsibleParty/gmd:contactInfo/gmd:CI_Contact/gmd:address/gmd:CI_Address": "c0758ed24a1a9fedc28c1d08a6903e354d34e6b1fcdaf6f96644fdf5bfc37dd0",
+    "gmd:distributionInfo/gmd:MD_Distribution/gmd:distributor[1]/gmd:MD_Distributor/gmd:distributorContact/gmd:CI_ResponsibleParty/gmd:contactInfo/gmd:CI_Contact/gmd:address/gmd:CI_Address/gmd:deliveryPoint": "c0758ed24a1a9fedc28c1d08a6903e354d34e6b1fcdaf6f96644fdf5bfc37dd0",
+    "gmd:distributionInfo/gmd:MD_Distribution/gmd:distributor[1]/gmd:MD_Distributor/gmd:distributorContact/gmd:CI_ResponsibleParty/gmd:contactInfo/gmd:CI_Contact/gmd:address/gmd:CI_Address/gmd:deliveryPoint/gco:CharacterString": "c0758ed24a1a9fedc28c1d08a6903e354d34e6b1fcdaf6f96644fdf5bfc37dd0",
+    "gmd:distributionInfo/gmd:MD_Distribution/gmd:distributor[1]/gmd:MD_Distributor/gmd:distributorContact/gmd:CI_ResponsibleParty/gmd:contactInfo/gmd:CI_Contact/gmd:address/gmd:CI_Address/gmd:city": "c0758ed24a1a9fedc28c1d08a6903e354d34e6b1fcdaf6f96644fdf5bfc37dd0",
+    "gmd:distributionInfo/gmd:MD_Distribution/gmd:distributor[1]/gmd:MD_Distributor/gmd:distributorContact/gmd:CI_ResponsibleParty/gmd:contactInfo/gmd:CI_Contact/gmd:address/gmd:CI_Address/gmd:city/gco:CharacterString": "c0758ed24a1a9fedc28c1d08a6903e354d34e6b1fcdaf6f96644fdf5bfc37dd0",
+    "gmd:distributionInfo/gmd:MD_Distribution/gmd:distributor[1]/gmd:MD_Distributor/gmd:distributorContact/gmd:CI_ResponsibleParty/gmd:contactInfo/gmd:CI_Contact/gmd:address/gmd:CI_Address/gmd:administrativeArea": "c0758ed24a1a9fedc28c1d08a6903e354d34e6b1fcdaf6f96644fdf5bfc37dd0",
+    "gmd:distributionInfo/gmd:MD_Distribution/gmd:distributor[1]/gmd:MD_Distributor/gmd:distributorContact/gmd:CI_ResponsibleParty/gmd:contactInfo/gmd:CI_Contact/gmd:address/gmd:CI_Address/gmd:administrativeArea/gco:CharacterString": "c0758ed24a1a9fedc28c1d08a6903e354d34e6b1fcdaf6f96644fdf5bfc37dd0",
+    "gmd:distributionInfo/gmd:MD_Distribution/gmd:distributor[1]/gmd:MD_Distributor/gmd:distributorContact/gmd:CI_ResponsibleParty/gmd:contactInfo/gmd:CI_Contact/gmd:address/gmd:CI_Address/gmd:postalCode": "c0758ed24a1a9fedc28c1d08a6903e354d34e6b1fcdaf6f96644fdf5bfc37dd0",
+    "gmd:distributionInfo/gmd:MD_Distribution/gmd:distributor[1]/gmd:MD_Distributor/gmd:distributorContact/gmd:CI_ResponsibleParty/gmd:contactInfo/gmd:CI_Contact/gmd:address/gmd:CI_Address/gmd:postalCode/gco:CharacterString": "c0758ed24a1a9fedc28c1d08a6903e354d34e6b1fcdaf6f96644fdf5bfc37dd0",
+    "gmd:distributionInfo/gmd:MD_Distribution/gmd:distributor[1]/gmd:MD_Distributor/gmd:distributorContact/gmd:CI_ResponsibleParty/gmd:contactInfo/gmd:CI_Contact/gmd:address/gmd:CI_Address/gmd:country": "c0758ed24a1a9fedc28c1d08a6903e354d34e6b1fcdaf6f96644fdf5bfc37dd0",
+    "gmd:distributionInfo/gmd:MD_Distribution/gmd:distributor[1]/gmd:MD_Distributor/gmd:distributorContact/gmd:CI_ResponsibleParty/gmd:contactInfo/gmd:CI_Contact/gmd:address/gmd:CI_Address/gmd:country/gco:CharacterString": "c0758ed24a1a9fedc28c1d08a6903e354d34e6b1fcdaf6f96644fdf5bfc37dd0",
+    "gmd:distributionInfo/gmd:MD_Distribution/gmd:distributor[1]/gmd:MD_Distributor/gmd:distributorContact/gmd:CI_ResponsibleParty/gmd:contactInfo/gmd:CI_Contact/gmd:address/gmd:CI_Address/gmd:electronicMailAddress": "c0758ed24a1a9fedc28c1d08a6903e354d34e6b1fcdaf6f96644fdf5bfc37dd0",
+    "gmd:distributionInfo/gmd:MD_Distribution/gmd:distributor[1]/gmd:MD_Distributor/gmd:distributorContact/gmd:CI_ResponsibleParty/gmd:contactInfo/gmd:CI_Contact/gmd:address/gmd:CI_Address/gmd:electronicMailAddress/gco:CharacterString": "c0758ed24a1a9fedc28c1d08a6903e354d34e6b1fcdaf6f96644fdf5bfc37dd0",
+    "gmd:distributionInfo/gmd:MD_Distribution/gmd:distributor[1]/gmd:MD_Distributor/gmd:distributorContact/gmd:CI_ResponsibleParty/gmd:contactInfo/gmd:CI_Contact/gmd:onlineResource": "33c6f1b8f2a3141d23ff426e8657ba0d58cebef0ef5e496af5a237c8226c8a38",
+    "gmd:distributionInfo/gmd:MD_Distribution/gmd:distributor[1]/gmd:MD_Distributor/gmd:distributorContact/gmd:CI_ResponsibleParty/gmd:contactInfo/gmd:CI_Contact/gmd:onlineResource/gmd:CI_OnlineResource": "33c6f1b8f2a3141d23ff426e8657ba0d58cebef0ef5e496af5a237c8226c8a38",
+    "gmd:distributionInfo/gmd:MD_Distribution/gmd:distributor[1]/gmd:MD_Distributor/gmd:distributorContact/gmd:CI_ResponsibleParty/gmd:contactInfo/gmd:CI_Contact/gmd:onlineResource/gmd:CI_OnlineResource/gmd:linkage": "c0758ed24a1a9fedc28c1d08a6903e354d34e6b1fcdaf6f96644fdf5bfc37dd0",
+    "gmd:distributionInfo/gmd:MD_Distribution/gmd:distributor[1]/gmd:MD_Distributor/gmd:distributorContact/gmd:CI_ResponsibleParty/gmd:contactInfo/gmd:CI_Contact/gmd:onlineResource/gmd:CI_OnlineResource/gmd:linkage/gmd:URL": "c0758ed24a1a9fedc28c1d08a6903e354d34e6b1fcdaf6f96644fdf5bfc37dd0",
+    "gmd:distributionInfo/gmd:MD_Distribution/gmd:distributor[1]/gmd:MD_Distributor/gmd:distributorContact/gmd:CI_ResponsibleParty/gmd:contactInfo/gmd:CI_Contact/gmd:onlineResource/gmd:CI_OnlineResource/gmd:function": "33c6f1b8f2a3141d23ff426e8657ba0d58cebef0ef5e496af5a237c8226c8a38",
+    "gmd:distributionInfo/gmd:MD_Distribution/gmd:distributor[1]/gmd:MD_Distributor/gmd:distributorContact/gmd:CI_ResponsibleParty/gmd:contactInfo/gmd:CI_Contact/gmd:onlineResource/gmd:CI_OnlineResource/gmd:function/gmd:CI_OnLineFunctionCode": "33c6f1b8f2a3141d23ff426e8657ba0d58cebef0ef5e496af5a237c8226c8a38",
+    "gmd:distributionInfo/gmd:MD_Distribution/gmd:distributor[1]/gmd:MD_Distributor/gmd:distributorContact/gmd:CI_ResponsibleParty/gmd:role": "KeyError: 'role'",
+    "gmd:distributionInfo/gmd:MD_Distribution/gmd:distributor[1]/gmd:MD_Distributor/gmd:distributorContact/gmd:CI_ResponsibleParty/gmd:role/gmd:CI_RoleCode": "KeyError: 'role'",
+    "gmd:distributionInfo/gmd:MD_Distribution/gmd:distributor[2]/gmd:MD_Distributor/gmd:distributorContact/gmd:CI_ResponsibleParty/gmd:organisationName/gco:CharacterString": "c0758ed24a1a9fedc28c1d08a6903e354d34e6b1fcdaf6f96644fdf5bfc37dd0",
+    "gmd:distributionInfo/gmd:MD_Distribution/gmd:transferOptions[1]": "f938f1e5c1bb1c5a53d8a1b08f9e725a3a1d4dcfdf54d3731efbeadc47d59d87",
+    "gmd:distributionInfo/gmd:MD_Distribution/gmd:transferOptions[1]/gmd:MD_DigitalTransferOptions": "f8761f91eb442ba0ee615ab214bd83454c4f49c3dabff058f8e925881b992462",
+    "gmd:distributionInfo/gmd:MD_Distribution/gmd:transferOptions[1]/gmd:MD_DigitalTransferOptions/gmd:unitsOfDistribution": "b3f07f5cb37118637846bd2f9b2185dcd5359da820565e2f641b0eaefb6bd51a",
+    "gmd:distributionInfo/gmd:MD_Distribution/gmd:transferOptions[1]/gmd:MD_DigitalTransferOptions/gmd:unitsOfDistribution/gco:CharacterString": "b3f07f5cb37118637846bd2f9b2185dcd5359da820565e2f641b0eaefb6bd51a",
+    "gmd:distributionInfo/gmd:MD_Distribution/gmd:transferOptions[1]/gmd:MD_DigitalTransferOptions/gmd:transferSize": "00fb58e3b3a45bb9f1afd13c6cc331c530052c4e9ae9bd6cce3968351e94277f",
+    "gmd:distributionInfo/gmd:MD_Distribution/gmd:transferOptions[1]/gmd:MD_DigitalTransferOptions/gmd:transferSize/gco:Real": "00fb58e3b3a45bb9f1afd13c6cc331c530052c4e9ae9bd6cce3968351e94277f",
+    "gmd:distributionInfo/gmd:MD_Distribution/gmd:transferOptions[1]/gmd:MD_DigitalTransferOptions/gmd:onLine": "f9c8819272a2c16f72ffc141eced50b8fde4b0c400a61d8e2811b63278b830b3",
+    "gmd:distributionInfo/gmd:MD_Distribution/gmd:transferOptions[1]/gmd:MD_DigitalTransferOptions/gmd:onLine/gmd:CI_OnlineResource": "f9c8819272a2c16f72ffc141eced50b8fde4b0c400a61d8e2811b63278b830b3",
+    "gmd:distributionInfo/gmd:MD_Distribution/gmd:transferOptions[1]/gmd:MD_DigitalTransferOptions/gmd:onLine/gmd:CI_OnlineResource/gmd:linkage": "c0758ed24a1a9fedc28c1d08a6903e354d34e6b1fcdaf6f96644fdf5bfc37dd0",
+    "gmd:distributionInfo/gmd:MD_Distribution/gmd:transferOptions[1]/gmd:MD_DigitalTransferOptions/gmd:onLine/gmd:CI_OnlineResource/gmd:linkage/gmd:URL": "c0758ed24a1a9fedc28c1d08a6903e354d34e6b1fcdaf6f96644fdf5bfc37dd0",
+    "gmd:distributionInfo/gmd:MD_Distribution/gmd:transferOptions[1]/gmd:MD_DigitalTransferOptions/gmd:onLine/gmd:CI_OnlineResource/gmd:name": "c0758ed24a1a9fedc28c1d08a6903e354d34e6b1fcdaf6f96644fdf5bfc37dd0",
+    "gmd:distributionInfo/gmd:MD_Distribution/gmd:transferOptions[1]/gmd:MD_DigitalTransferOptions/gmd:onLine/gmd:CI_OnlineResource/gmd:name/gco:CharacterString": "c0758ed24a1a9fedc28c1d08a6903e354d34e6b1fcdaf6f96644fdf5bfc37dd0",
+    "gmd:distributionInfo/gmd:MD_Distribution/gmd:transferOptions[1]/gmd:MD_DigitalTransferOptions/gmd:onLine/gmd:CI_OnlineResource/gmd:description": "c0758ed24a1a9fedc28c1d08a6903e354d34e6b1fcdaf6f96644fdf5bfc37dd0",
+    "gmd:distributionInfo/gmd:MD_Distribution/gmd:transferOptions[1]/gmd:MD_DigitalTransferOptions/gmd:onLine/gmd:CI_OnlineResource/gmd:description/gco:CharacterString": "c0758ed24a1a9fedc28c1d08a6903e354d34e6b1fcdaf6f96644fdf5bfc37dd0",
+    "gmd:distributionInfo/gmd:MD_Distribution/gmd:transferOptions[1]/gmd:MD_DigitalTransferOptions/gmd:onLine/gmd:CI_OnlineResource/gmd:function": "f9c8819272a2c16f72ffc141eced50b8fde4b0c400a61d8e2811b63278b830b3",
+    "gmd:distributionInfo/gmd:MD_Distribution/gmd:transferOptions[1]/gmd:MD_DigitalTransferOptions/gmd:onLine/gmd:CI_OnlineResource/gmd:function/gmd:CI_OnLineFunctionCode": "f9c8819272a2c16f72ffc141eced50b8fde4b0c400a61d8e2811b63278b830b3",
+    "gmd:dataQualityInfo": "8e4639a69b7ec173282cd77de041b32d93658fe9b52a913bb7d1d3f8ee24c2f1",
+    "gmd:dataQualityInfo/gmd:DQ_DataQuality": "8e4639a69b7ec173282cd77de041b32d93658fe9b52a913bb7d1d3f8ee24c2f1",
+    "gmd:dataQualityInfo/gmd:DQ_DataQuality/gmd:scope": "c0758ed24a1a9fedc28c1d08a6903e354d34e6b1fcdaf6f96644fdf5bfc37dd0",
+    "gmd:dataQualityInfo/gmd:DQ_DataQuality/gmd:scope/gmd:DQ_Scope": "c0758ed24a1a9fedc28c1d08a6903e354d34e6b1fcdaf6f96644fdf5bfc37dd0",
+    "gmd:dataQualityInfo/gmd:DQ_DataQuality/gmd:scope/gmd:DQ_Scope/gmd:level": "c0758ed24a1a9fedc28c1d08a6903e354d34e6b1fcdaf6f96644fdf5bfc37dd0",
+    "gmd:dataQualityInfo/gmd:DQ_DataQuality/gmd:scope/gmd:DQ_Scope/gmd:level/gmd:MD_ScopeCode": "c0758ed24a1a9fedc28c1d08a6903e354d34e6b1fcdaf6f96644fdf5bfc37dd0",
+    "gmd:dataQualityInfo/gmd:DQ_DataQuality/gmd:lineage": "8e4639a69b7ec173282cd77de041b32d93658fe9b52a913bb7d1d3f8ee24c2f1",
+    "gmd:dataQualityInfo/gmd:DQ_DataQuality/gmd:lineage/gmd:LI_Lineage": "8e4639a69b7ec173282cd77de041b32d93658fe9b52a913bb7d1d3f8ee24c2f1",
+    "gmd:dataQualityInfo/gmd:DQ_DataQuality/gmd:lineage/gmd:LI_Lineage/gmd:statement": "8e4639a69b7ec173282cd77de041b32d93658fe9b52a913bb7d1d3f8ee24c2f1",
+    "gmd:dataQualityInfo/gmd:DQ_DataQuality/gmd:lineage/gmd:LI_Lineage/gmd:statement/gco:CharacterString": "8e4639a69b7ec173282cd77de041b32d93658fe9b52a913bb7d1d3f8ee24c2f1",
+    "gmd:metadataMaintenance": "129fb0db207733f4a20e1f47e2b614aa73fe632799def085d4c5faab91678a02",
+    "gmd:metadataMaintenance/gmd:MD_MaintenanceInformation": "129fb0db207733f4a20e1f47e2b614aa73fe632799def085d4c5faab91678a02",
+    "gmd:metadataMaintenance/gmd:MD_MaintenanceInformation/gmd:maintenanceAndUpdateFrequency": "d95c17e8fdfad6dc0d682c663fab32b0b4bf5e1935fa3e38fedfc093b0a131f8",
+    "gmd:metadataMaintenance/gmd:MD_MaintenanceInformation/gmd:maintenanceAndUpdateFrequency/gmd:MD_MaintenanceFrequencyCode": "d95c17e8fdfad6dc0d682c663fab32b0b4bf5e1935fa3e38fedfc093b0a131f8",
+    "gmd:metadataMaintenance/gmd:MD_MaintenanceInformation/gmd:maintenanceNote": "3046f87a290d5f779e93acd7caeb08c75572fd636c1cd793a5182a2ff2a45e89",
+    "gmd:metadataMaintenance/gmd:MD_MaintenanceInformation/gmd:maintenanceNote/gmd:MD_ProgressCode": "3046f87a290d5f779e93acd7caeb08c75572fd636c1cd793a5182a2ff2a45e89",
+}  # type: dict
+
+# Contacts with multiple roles are condensed wherever they appear in a record, rather than only where adjacent, which
+# changes the configurations for records where contacts are repeated or interleaved with other contacts.
+repeated_elements.update(
+    {
+        "gmd:identificationInfo": "b5878e207035d21d181da826f123709ea83c0860f407b2652a3fe439023811d7",
+        "gmd:identificationInfo/gmd:MD_DataIdentification": "b5878e207035d21d181da826f123709ea83c0860f407b2652a3fe439023811d7",
+        "gmd:identificationInfo/gmd:MD_DataIdentification/gmd:pointOfContact[1]": "c0758ed24a1a9fedc28c1d08a6903e354d34e6b1fcdaf6f96644fdf5bfc37dd0",
+        "gmd:distributionInfo": "64f663d4c6dd3af3c92ae6a06234b3cd03743efff89f5680ddb0a2bd9933854c",
+        "gmd:distributionInfo/gmd:MD_Distribution": "64f663d4c6dd3af3c92ae6a06234b3cd03743efff89f5680ddb0a2bd9933854c",
+        "gmd:distributionInfo/gmd:MD_Distribution/gmd:distributor[1]": "c0758ed24a1a9fedc28c1d08a6903e354d34e6b1fcdaf6f96644fdf5bfc37dd0",
+        "gmd:distributionInfo/gmd:MD_Distribution/gmd:distributor[1]/gmd:MD_Distributor": "c0758ed24a1a9fedc28c1d08a6903e354d34e6b1fcdaf6f96644fdf5bfc37dd0",
+        "gmd:distributionInfo/gmd:MD_Distribution/gmd:distributor[1]/gmd:MD_Distributor/gmd:distributorContact": "c0758ed24a1a9fedc28c1d08a6903e354d34e6b1fcdaf6f96644fdf5bfc37dd0",
+    }
+)